@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Idempotency store degradation test: booking latency with a sick backend.
+
+Runs the API in this process (httpx ASGI transport, throwaway SQLite
+database) twice. The first run has no store deadlines or circuit breaker.
+The second uses the configured ones (IDEMPOTENCY_* settings, with a short
+breaker reset so the run stays short). Each run has three phases:
+
+    healthy      store answers normally
+    sick         every store session takes --stall-ms to open (a sick
+                 SQL Server or Redis: blocking, not failing)
+    recovered    store answers normally again
+
+Workers send keyed bookings (fail closed) and keyed observations (fail
+open, IDEMPOTENCY_FAIL_OPEN_PATHS) back to back. Without deadlines, every
+sick-phase request waits for the store. With them, bookings get a 503
+within the get deadline, the breaker opens and then refuses calls at once,
+and observations are still recorded.
+
+The run exits 1 unless, with deadlines:
+    every healthy-phase booking returned 201 (no deadline missed on a
+    healthy store)
+    sick-phase booking P99 < --max-p99-ms
+    the breaker opened during the sick phase and is closed at the end
+    every sick-phase observation returned 201
+    a booking succeeded within --reset-seconds + 1 s of recovery, and every
+    recovered-phase booking sent with the circuit closed returned 201
+    (while the half-open probe runs, other bookings still get 503)
+
+Usage:
+    python benchmarks/bench_idempotency_degraded.py [--phase-seconds 3] [--stall-ms 2000]
+                                                    [--workers 8] [--max-p99-ms 250]
+"""
+import argparse
+import asyncio
+import contextlib
+import itertools
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+from bench_validation import V11_PAYLOAD
+from loadtest import build_app, summarize  # noqa: E402  (sets sys.path)
+
+PHASES = ("healthy", "sick", "recovered")
+
+BOOKING_PATH = "/api/v1/trades"
+OBSERVATION_PATH = "/api/v1/observations"
+
+
+class StallingSessionFactory:
+    """
+    Session factory that blocks before each session while `stall` is set.
+    """
+
+    def __init__(self, session_factory, stall_seconds: float):
+        self.session_factory = session_factory
+        self.stall_seconds = stall_seconds
+        self.stall = False
+
+    def __call__(self):
+        if self.stall:
+            time.sleep(self.stall_seconds)
+        return self.session_factory()
+
+
+async def run_mode(mode: str, bounded: bool, args) -> Dict[str, Any]:
+    """Run the three phases against a fresh app; return per-phase results."""
+    import httpx
+
+    database = Path(tempfile.mkdtemp()) / "degraded.db"
+    if bounded:
+        app = build_app(database, idempotency_breaker_reset_seconds=args.reset_seconds)
+    else:
+        app = build_app(
+            database,
+            idempotency_get_timeout_ms=0,
+            idempotency_set_timeout_ms=0,
+            idempotency_breaker_failures=0,
+        )
+
+    keys = itertools.count()
+    results: List[tuple] = []
+    phase = PHASES[0]
+
+    async with contextlib.AsyncExitStack() as stack:
+        # ASGITransport does not send lifespan events
+        await stack.enter_async_context(app.router.lifespan_context(app))
+        client = await stack.enter_async_context(
+            httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://degraded", timeout=60)
+        )
+        service = app.state.idempotency_service
+        store = service.store.store
+        stalling = store.session_factory = StallingSessionFactory(store.session_factory, args.stall_ms / 1000)
+        breaker = service.breaker
+
+        async def worker(stop: float):
+            while time.perf_counter() < stop:
+                key = next(keys)
+                path = OBSERVATION_PATH if key % 2 else BOOKING_PATH
+                current = phase
+                closed = breaker is None or breaker.state == "closed"
+                start = time.perf_counter()
+                # Bookings must pass validation to reach the store's set call
+                body = {"sequence": key} if path == OBSERVATION_PATH else dict(V11_PAYLOAD, trade_id=f"TRD-DG-{key}")
+                response = await client.post(path, json=body, headers={"Idempotency-Key": f"{mode}-{key}"})
+                results.append((current, path, response.status_code, closed, (time.perf_counter() - start) * 1000))
+                if closed and response.status_code == 201 and current not in first_ok:
+                    first_ok[current] = time.perf_counter() - phase_started
+
+        phase_opened = {}
+        first_ok: Dict[str, float] = {}
+        for phase in PHASES:
+            stalling.stall = phase == "sick"
+            opened = breaker.transitions["open"] if breaker else 0
+            phase_started = time.perf_counter()
+            stop = phase_started + args.phase_seconds
+            await asyncio.gather(*(worker(stop) for _ in range(args.workers)))
+            phase_opened[phase] = (breaker.transitions["open"] if breaker else 0) - opened
+            if phase == "sick":
+                # Let stalled sessions drain before measuring recovery
+                await asyncio.sleep(args.stall_ms / 1000)
+        final_state = breaker.state if breaker else "none"
+
+    database.unlink(missing_ok=True)
+
+    phases = {}
+    for name in PHASES:
+        rows = [r for r in results if r[0] == name]
+        bookings = [r for r in rows if r[1] == BOOKING_PATH]
+        observations = [r for r in rows if r[1] == OBSERVATION_PATH]
+        phases[name] = {
+            "booking": summarize([ms for *_, ms in bookings]),
+            "booking_status": dict(sorted(Counter(str(r[2]) for r in bookings).items())),
+            # Bookings sent while the circuit was closed (all, without a breaker)
+            "closed_booking_status": dict(sorted(Counter(str(r[2]) for r in bookings if r[3]).items())),
+            "observation": summarize([ms for *_, ms in observations]),
+            "observation_status": dict(sorted(Counter(str(r[2]) for r in observations).items())),
+            "breaker_opened": phase_opened[name],
+            "first_booking_ok_seconds": first_ok.get(name),
+        }
+    return {"mode": mode, "phases": phases, "final_state": final_state}
+
+
+def report(runs: List[Dict[str, Any]]) -> None:
+    """Print booking/observation latency and status codes per mode and phase."""
+    print(f"\n{'mode':<10} {'phase':<10} {'book p50':>9} {'book p99':>9} {'obs p99':>8}  "
+          f"{'booking status':<24} {'observation status':<24} {'opened':>6}")
+    for run in runs:
+        for name, phase in run["phases"].items():
+            print(f"{run['mode']:<10} {name:<10} {phase['booking'].get('p50_ms', 0):>9.1f} "
+                  f"{phase['booking'].get('p99_ms', 0):>9.1f} {phase['observation'].get('p99_ms', 0):>8.1f}  "
+                  f"{str(phase['booking_status']):<24} {str(phase['observation_status']):<24} "
+                  f"{phase['breaker_opened']:>6}")
+
+
+async def run(args) -> int:
+    runs = [
+        await run_mode("unbounded", False, args),
+        await run_mode("bounded", True, args),
+    ]
+    report(runs)
+
+    bounded = runs[-1]
+    healthy, sick, recovered = (bounded["phases"][name] for name in PHASES)
+    missed = []
+    if set(healthy["booking_status"]) - {"201"}:
+        missed.append(f"healthy-phase bookings not all 201: {healthy['booking_status']}")
+    if sick["booking"].get("p99_ms", 0) >= args.max_p99_ms:
+        missed.append(f"sick-phase booking P99 {sick['booking']['p99_ms']:.1f} ms >= {args.max_p99_ms:g} ms")
+    if not sick["breaker_opened"]:
+        missed.append("circuit breaker never opened during the sick phase")
+    if bounded["final_state"] != "closed":
+        missed.append(f"circuit breaker {bounded['final_state']} after recovery")
+    if set(sick["observation_status"]) - {"201"}:
+        missed.append(f"sick-phase observations not all 201: {sick['observation_status']}")
+    if set(recovered["closed_booking_status"]) - {"201"}:
+        missed.append(f"recovered-phase bookings not all 201 with the circuit closed: "
+                      f"{recovered['closed_booking_status']}")
+    recovery = recovered["first_booking_ok_seconds"]
+    if recovery is None or recovery >= args.reset_seconds + 1:
+        missed.append(f"no booking succeeded within {args.reset_seconds + 1:g} s of recovery")
+
+    print()
+    if missed:
+        for line in missed:
+            print(f"❌ FAIL: {line}")
+        return 1
+    print(f"✅ PASS: sick-phase booking P99 {sick['booking']['p99_ms']:.1f} ms "
+          f"(unbounded: {runs[0]['phases']['sick']['booking'].get('p99_ms', 0):.1f} ms), "
+          f"bookings succeeded {recovery * 1000:.0f} ms into recovery, observations served throughout")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Booking latency with a sick idempotency store")
+    parser.add_argument("--phase-seconds", type=float, default=3.0, help="Seconds per phase")
+    parser.add_argument("--stall-ms", type=float, default=2000.0, help="Store session stall in the sick phase")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent closed-loop clients")
+    parser.add_argument("--reset-seconds", type=float, default=0.5, help="Breaker reset timeout for the run")
+    parser.add_argument("--max-p99-ms", type=float, default=250.0, help="Sick-phase booking P99 bound with deadlines")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark (ADR-006 §12: cold start < 2 s).
+
+Each run spawns a fresh interpreter that imports src.app.main, calls
+create_app() and runs the lifespan startup (engine, stores, schema
+compilation, parameter load) against a throwaway SQLite database. The
+median spawn-to-ready time over --runs is checked against the budget.
+
+One extra run with `-X importtime` lists the modules with the largest
+cumulative import time, to show where cold start goes.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N] [--budget-s S] [--top N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from common import REPO_ROOT
+
+# Runs in the child; prints phase timings (seconds since interpreter start)
+CHILD = """
+import asyncio, time
+t0 = time.perf_counter()
+from src.app.main import create_app
+from src.app.settings import Settings
+t1 = time.perf_counter()
+app = create_app(Settings(database_url={url!r}, traces_exporter={exporter!r}))
+t2 = time.perf_counter()
+
+async def start():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+t3 = asyncio.run(start())
+print(t1 - t0, t2 - t1, t3 - t2)
+"""
+
+
+def run_child(code: str, env: dict, *flags: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter from the repository root."""
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+
+
+def import_profile(stderr: str, top: int):
+    """Return the `top` (cumulative_us, module) pairs from -X importtime output."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            rows.append((int(cumulative), name.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API cold start")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh-interpreter runs")
+    parser.add_argument("--budget-s", type=float, default=2.0, help="Median spawn-to-ready budget")
+    parser.add_argument("--top", type=int, default=15, help="Modules listed from -X importtime")
+    parser.add_argument("--exporter", default="none", help="OTEL_TRACES_EXPORTER mode for the app")
+    args = parser.parse_args()
+
+    database = Path(tempfile.gettempdir()) / "fcn-bench-import.db"
+    code = CHILD.format(url=f"sqlite:///{database}", exporter=args.exporter)
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+
+    interpreter = []
+    totals, phases = [], []
+    try:
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            run_child("pass", env)
+            interpreter.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            result = run_child(code, env)
+            totals.append(time.perf_counter() - start)
+            phases.append([float(v) for v in result.stdout.split()])
+
+        profile = run_child(code, env, "-X", "importtime")
+    finally:
+        database.unlink(missing_ok=True)
+
+    imports, create, startup = (statistics.median(p[i] for p in phases) for i in range(3))
+    total = statistics.median(totals)
+    print(f"{'interpreter':>12} {'imports':>9} {'create_app':>11} {'lifespan':>9} {'total':>8}  (median s, {args.runs} runs)")
+    print(f"{statistics.median(interpreter):>12.3f} {imports:>9.3f} {create:>11.3f} {startup:>9.3f} {total:>8.3f}")
+
+    print(f"\nLargest cumulative imports (-X importtime):")
+    for cumulative, name in import_profile(profile.stderr, args.top):
+        print(f"  {cumulative / 1000:>8.1f} ms  {name}")
+
+    if total >= args.budget_s:
+        print(f"\n❌ FAIL: cold start {total:.3f} s >= {args.budget_s} s budget")
+        sys.exit(1)
+    print(f"\n✅ PASS: cold start {total:.3f} s < {args.budget_s} s budget")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Metrics instrumentation micro-benchmark.
+
+Drives a minimal FastAPI app directly through its ASGI interface (no
+network, no TestClient) with and without MetricsMiddleware, and times an
+in-memory idempotency store with and without InstrumentedIdempotencyStore.
+Batches alternate (with GC paused) between the bare and instrumented variants so clock
+drift affects both equally; a round's overhead is the median difference
+between adjacent bare and instrumented per-request batch means. The gate
+is the median overhead over several rounds, so one noisy round cannot
+fail (or pass) the run on its own. The budget is < 20 us per request.
+
+Usage:
+    python benchmarks/bench_metrics.py [--rounds N] [--batches N] [--batch-size N] [--budget-us US]
+"""
+import argparse
+import asyncio
+import gc
+import statistics
+import sys
+import time
+
+import common  # noqa: F401  (sets sys.path)
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from src.app.middleware.metrics import MetricsMiddleware
+from src.domain.services.idempotency import IdempotencyStore
+from src.infra.idempotency.instrumented import InstrumentedIdempotencyStore
+
+BODY = b'{"product_code": "FCN", "spec_version": "1.1.0", "notional": 1000000}'
+
+SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "POST",
+    "scheme": "http",
+    "path": "/api/v1/trades",
+    "raw_path": b"/api/v1/trades",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [
+        (b"host", b"bench"),
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(BODY)).encode()),
+    ],
+    "client": ("127.0.0.1", 50000),
+    "server": ("bench", 80),
+}
+
+
+class MemoryStore(IdempotencyStore):
+    """Dictionary-backed store isolating wrapper overhead from I/O."""
+
+    def __init__(self):
+        self.records = {}
+
+    async def get(self, key_hash):
+        return self.records.get(key_hash)
+
+    async def set(self, record):
+        self.records[record.key_hash] = record
+
+    async def delete(self, key_hash):
+        self.records.pop(key_hash, None)
+
+
+def build_app(instrumented: bool) -> FastAPI:
+    """Return a one-route app shaped like the booking stub."""
+    app = FastAPI()
+
+    @app.post("/api/v1/trades")
+    async def book_trade():
+        return JSONResponse(status_code=201, content={"trade_id": "TRD-001", "status": "booked"})
+
+    if instrumented:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def call(app) -> None:
+    """Issue one request through the ASGI interface."""
+    async def receive():
+        return {"type": "http.request", "body": BODY, "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(dict(SCOPE), receive, send)
+
+
+async def batch_mean_us(run, batch_size: int) -> float:
+    """Return the mean microseconds per call over one batch (GC paused)."""
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for _ in range(batch_size):
+            await run()
+        return (time.perf_counter() - start) / batch_size * 1e6
+    finally:
+        gc.enable()
+
+
+async def compare(bare, instrumented, batches: int, batch_size: int):
+    """Return the (bare, instrumented, overhead) medians over paired batches, in microseconds."""
+    for _ in range(batch_size):
+        await bare()
+        await instrumented()
+
+    bare_means, instrumented_means = [], []
+    for _ in range(batches):
+        bare_means.append(await batch_mean_us(bare, batch_size))
+        instrumented_means.append(await batch_mean_us(instrumented, batch_size))
+    return (
+        statistics.median(bare_means),
+        statistics.median(instrumented_means),
+        # Adjacent batches share the host's state, so their difference drifts less
+        statistics.median(i - b for b, i in zip(bare_means, instrumented_means)),
+    )
+
+
+async def run(args):
+    bare_app, metrics_app = build_app(False), build_app(True)
+    store = MemoryStore()
+    wrapped = InstrumentedIdempotencyStore(store, backend="memory")
+
+    cases = [
+        ("http request (MetricsMiddleware)",
+         lambda: call(bare_app), lambda: call(metrics_app)),
+        ("idempotency store get (InstrumentedIdempotencyStore)",
+         lambda: store.get("k"), lambda: wrapped.get("k")),
+    ]
+
+    print(f"{'case':<55} {'bare (us)':>10} {'instr (us)':>11} {'overhead (us)':>14} {'rounds (us)':>24}")
+    worst = 0.0
+    for name, bare, instrumented in cases:
+        rounds = [await compare(bare, instrumented, args.batches, args.batch_size) for _ in range(args.rounds)]
+        base = statistics.median(b for b, _, _ in rounds)
+        inst = statistics.median(i for _, i, _ in rounds)
+        overheads = [o for _, _, o in rounds]
+        overhead = statistics.median(overheads)
+        worst = max(worst, overhead)
+        spread = f"{min(overheads):.2f}..{max(overheads):.2f}"
+        print(f"{name:<55} {base:>10.2f} {inst:>11.2f} {overhead:>14.2f} {spread:>24}")
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark metrics instrumentation overhead")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds whose median overhead is gated")
+    parser.add_argument("--batches", type=int, default=30, help="Alternating batches per variant")
+    parser.add_argument("--batch-size", type=int, default=500, help="Requests per batch")
+    parser.add_argument("--budget-us", type=float, default=20.0, help="Overhead budget per request")
+    args = parser.parse_args()
+
+    worst = asyncio.run(run(args))
+
+    within = worst < args.budget_us
+    print(f"\nWorst median overhead: {worst:.2f} us (budget {args.budget_us} us) - {'PASS' if within else 'FAIL'}")
+    sys.exit(0 if within else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+JSON vs MessagePack wire-format benchmark.
+
+For bulk payloads exchanged with booking systems and the market-data
+feeder, compares body size and encode/decode time of the API's two
+formats (src.app.serialization dumps/loads vs packb/unpackb):
+
+    booking.batch          v1.1 booking payloads
+    observations.batch     underlying fixings
+    trades.page            MAX_PAGE_SIZE fcn_trade rows (Decimal, datetimes)
+    lifecycle.page         MAX_PAGE_SIZE fcn_lifecycle_event rows
+
+Both formats carry one schema. The run exits 1 unless:
+    every payload decodes to the same content from both formats
+    every MessagePack body is smaller than its JSON body
+    MessagePack encode + decode time, summed over the cases, is below
+    JSON's (MessagePack must not cost CPU to save bytes)
+
+Usage:
+    python benchmarks/bench_msgpack.py [--iterations N] [--batch-size N]
+"""
+import argparse
+import statistics
+import sys
+import time
+
+from bench_serialization import lifecycle_rows, trade_rows  # noqa: E402  (sets sys.path)
+from bench_validation import V11_PAYLOAD  # noqa: E402
+
+from src.app.serialization import dumps, loads, packb, unpackb  # noqa: E402
+from src.infra.db.pagination import MAX_PAGE_SIZE  # noqa: E402
+from src.infra.db.repositories import lifecycle_row_to_dict, trade_row_to_dict  # noqa: E402
+
+SYMBOLS = ("AMZN.US", "ORCL.US", "PLTR.US", "NVDA.US", "TSLA.US")
+
+
+def bookings(count):
+    """v1.1 booking payloads with distinct notionals and issuers."""
+    return [
+        dict(V11_PAYLOAD, notional=1_000_000 + i * 5000, issuer=f"SAMPLE_BANK_{i % 12:02d}")
+        for i in range(count)
+    ]
+
+
+def observations(count):
+    """Daily closing fixings as sent by the market-data feeder."""
+    return [
+        {
+            "trade_id": f"TRD-2025-{i // len(SYMBOLS):06d}",
+            "observation_date": f"2026-{(i % 12) + 1:02d}-15",
+            "symbol": SYMBOLS[i % len(SYMBOLS)],
+            "level": 100.0 + (i % 977) * 0.37,
+            "source": "BLOOMBERG",
+            "is_official_close": True,
+        }
+        for i in range(count)
+    ]
+
+
+def time_fn(fn, iterations):
+    """Return the median per-call time in microseconds."""
+    for _ in range(5):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON vs MessagePack")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed runs per case and operation")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Items per booking/observation batch")
+    args = parser.parse_args()
+
+    cases = [
+        ("booking.batch", bookings(args.batch_size)),
+        ("observations.batch", observations(args.batch_size)),
+        ("trades.page", {"trades": [trade_row_to_dict(r) for r in trade_rows(MAX_PAGE_SIZE)]}),
+        ("lifecycle.page", {"events": [lifecycle_row_to_dict(r) for r in lifecycle_rows(MAX_PAGE_SIZE)]}),
+    ]
+
+    print(f"{'case':<20} {'json B':>9} {'msgpack B':>10} {'size':>6} "
+          f"{'enc json':>9} {'enc mp':>8} {'dec json':>9} {'dec mp':>8}  (p50 us)")
+    mismatches, larger = [], []
+    json_us = msgpack_us = 0.0
+    for name, content in cases:
+        json_body, msgpack_body = dumps(content), packb(content)
+        if unpackb(msgpack_body) != loads(json_body):
+            mismatches.append(name)
+
+        encode_json = time_fn(lambda: dumps(content), args.iterations)
+        encode_msgpack = time_fn(lambda: packb(content), args.iterations)
+        decode_json = time_fn(lambda: loads(json_body), args.iterations)
+        decode_msgpack = time_fn(lambda: unpackb(msgpack_body), args.iterations)
+        json_us += encode_json + decode_json
+        msgpack_us += encode_msgpack + decode_msgpack
+        if len(msgpack_body) >= len(json_body):
+            larger.append(name)
+        print(f"{name:<20} {len(json_body):>9} {len(msgpack_body):>10} "
+              f"{len(msgpack_body) / len(json_body):>5.0%} {encode_json:>9.1f} {encode_msgpack:>8.1f} "
+              f"{decode_json:>9.1f} {decode_msgpack:>8.1f}")
+
+    print(f"\nencode + decode, all cases: JSON {json_us:.1f} us, MessagePack {msgpack_us:.1f} us "
+          f"({msgpack_us / json_us:.0%})")
+    missed = []
+    if mismatches:
+        missed.append(f"MessagePack and JSON decode differently for: {', '.join(mismatches)}")
+    if larger:
+        missed.append(f"MessagePack is not smaller for: {', '.join(larger)}")
+    if msgpack_us >= json_us:
+        missed.append(f"MessagePack encode + decode {msgpack_us:.1f} us >= JSON {json_us:.1f} us")
+    if missed:
+        for line in missed:
+            print(f"❌ FAIL: {line}")
+        sys.exit(1)
+    print("✅ PASS: MessagePack carries identical content in fewer bytes and less CPU than JSON")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
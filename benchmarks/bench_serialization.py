@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+JSON serialization micro-benchmark (stdlib json vs src.app.serialization).
+
+Times the API's JSON paths on realistic payloads:
+
+    booking.request.decode     v1.1 booking body, json.loads vs loads
+    booking.response.encode    booked trade echo (Decimal notional, datetimes)
+    trades.page                MAX_PAGE_SIZE fcn_trade rows -> list response body
+    lifecycle.page             MAX_PAGE_SIZE fcn_lifecycle_event rows -> history body
+    idempotency.replay         stored snapshot -> replayed response body
+
+The stdlib side reproduces the previous code path (str-formatted Decimal, isoformat()
+per field, Starlette JSONResponse rendering); the orjson side is the
+current one. Both must produce identical bytes; the run fails otherwise.
+
+Usage:
+    python benchmarks/bench_serialization.py [--iterations N]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from bench_validation import V11_PAYLOAD, percentile  # noqa: E402  (sets sys.path)
+
+from starlette.responses import JSONResponse  # noqa: E402
+
+from src.app.serialization import dumps, loads  # noqa: E402
+from src.infra.db.pagination import MAX_PAGE_SIZE  # noqa: E402
+from src.infra.db.repositories import lifecycle_row_to_dict, trade_row_to_dict  # noqa: E402
+
+EVENT_TYPES = ("coupon_payment", "ki_breach", "autocall", "maturity")
+
+
+def trade_rows(count):
+    """fcn_trade row mappings as the driver returns them."""
+    created = datetime(2025, 10, 10, 9, 30, 0, 123000, tzinfo=timezone.utc)
+    return [
+        {
+            "id": i,
+            "trade_id": f"TRD-2025-{i:06d}",
+            "template_id": "TPL-FCN-001",
+            "spec_version": "1.1.0",
+            "status": "ACTIVE",
+            "trade_date": date(2025, 10, 10),
+            "maturity_date": date(2026, 10, 15),
+            "notional": Decimal(f"{1_000_000 + i * 2500}.5000"),
+            "currency": "USD" if i % 3 else "JPY",
+            "autocall_triggered": 0,
+            "ki_triggered": int(i % 7 == 0),
+            "created_at": created + timedelta(seconds=i),
+            "updated_at": None if i % 2 else created + timedelta(days=1),
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def lifecycle_rows(count):
+    """fcn_lifecycle_event row mappings with JSON payload text."""
+    start = datetime(2025, 11, 15, tzinfo=timezone.utc)
+    rows = []
+    for i in range(1, count + 1):
+        payload = {
+            "observation_date": f"2026-{(i % 10) + 1:02d}-15",
+            "levels": {"AMZN.US": 181.25 + i, "ORCL.US": 118.4, "PLTR.US": 24.1},
+            "worst_of_pct": 0.9472,
+            "coupon_amount": 3333.33,
+            "currency": "USD",
+        }
+        rows.append({
+            "id": i,
+            "trade_id": "TRD-2025-000001",
+            "event_type": EVENT_TYPES[i % len(EVENT_TYPES)],
+            "event_date": start + timedelta(days=30 * i),
+            "event_payload": json.dumps(payload),
+            "created_at": start + timedelta(days=30 * i, seconds=5),
+        })
+    return rows
+
+
+def _iso(value):
+    return value.isoformat() if value is not None else None
+
+
+def legacy_trade(row):
+    """Previous trade_row_to_dict (conversion per field)."""
+    item = trade_row_to_dict(row)
+    for key in ("trade_date", "maturity_date", "created_at", "updated_at"):
+        item[key] = _iso(item[key])
+    item["notional"] = format(item["notional"], "f")
+    return item
+
+
+def legacy_lifecycle(row):
+    """Previous lifecycle_row_to_dict (stdlib json payload parsing)."""
+    return {
+        "event_id": str(row["id"]),
+        "trade_id": row["trade_id"],
+        "event_type": row["event_type"],
+        "event_date": _iso(row["event_date"]),
+        "timestamp": _iso(row["created_at"]),
+        "data": json.loads(row["event_payload"]),
+    }
+
+
+def render(content):
+    """Previous response rendering (Starlette JSONResponse)."""
+    return JSONResponse(content).body
+
+
+def build_cases():
+    """Return (name, stdlib_fn, orjson_fn) triples."""
+    request_body = json.dumps(V11_PAYLOAD).encode("utf-8")
+
+    booked = dict(
+        V11_PAYLOAD,
+        trade_id="TRD-2025-000001",
+        status="booked",
+        notional=Decimal("1000000.0000"),
+        created_at=datetime(2025, 10, 10, 9, 30, 0, 123000, tzinfo=timezone.utc),
+    )
+    booked_legacy = dict(booked, notional=format(booked["notional"], "f"), created_at=booked["created_at"].isoformat())
+
+    trades = trade_rows(MAX_PAGE_SIZE)
+    events = lifecycle_rows(MAX_PAGE_SIZE)
+    pagination = {"limit": MAX_PAGE_SIZE, "has_more": True, "next_cursor": "eyJpZCI6MTAwfQ"}
+
+    # Snapshot as written before (json.dumps default separators)
+    snapshot = json.dumps({"trades": [legacy_trade(r) for r in trades[:20]], "pagination": pagination})
+
+    return [
+        ("booking.request.decode",
+         lambda: render(json.loads(request_body)),
+         lambda: dumps(loads(request_body))),
+        ("booking.response.encode",
+         lambda: render(booked_legacy),
+         lambda: dumps(booked)),
+        ("trades.page",
+         lambda: render({"trades": [legacy_trade(r) for r in trades], "pagination": pagination}),
+         lambda: dumps({"trades": [trade_row_to_dict(r) for r in trades], "pagination": pagination})),
+        ("lifecycle.page",
+         lambda: render({"trade_id": "TRD-2025-000001", "events": [legacy_lifecycle(r) for r in events],
+                         "pagination": pagination}),
+         lambda: dumps({"trade_id": "TRD-2025-000001", "events": [lifecycle_row_to_dict(r) for r in events],
+                        "pagination": pagination})),
+        ("idempotency.replay",
+         lambda: render(json.loads(snapshot)),
+         lambda: dumps(loads(snapshot))),
+    ]
+
+
+def time_fn(fn, iterations):
+    """Return per-call samples in microseconds."""
+    for _ in range(20):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON serialization")
+    parser.add_argument("--iterations", type=int, default=500, help="Timed runs per case and encoder")
+    args = parser.parse_args()
+
+    print(f"{'case':<26} {'bytes':>7} {'json p50':>9} {'orjson p50':>11} {'json p99':>9} "
+          f"{'orjson p99':>11} {'speedup':>8}  (us)")
+    mismatches = []
+    for name, legacy, current in build_cases():
+        legacy_body, current_body = legacy(), current()
+        if legacy_body != current_body:
+            mismatches.append(name)
+
+        base = time_fn(legacy, args.iterations)
+        fast = time_fn(current, args.iterations)
+        base_p50, fast_p50 = statistics.median(base), statistics.median(fast)
+        print(f"{name:<26} {len(current_body):>7} {base_p50:>9.1f} {fast_p50:>11.1f} "
+              f"{percentile(base, 99):>9.1f} {percentile(fast, 99):>11.1f} {base_p50 / fast_p50:>7.1f}x")
+
+    if mismatches:
+        print(f"\n❌ FAIL: output differs from stdlib json for: {', '.join(mismatches)}")
+        sys.exit(1)
+    print("\n✅ PASS: byte-identical output for every case")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
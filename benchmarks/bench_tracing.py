@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tracing overhead micro-benchmark.
+
+Drives the booking-stub app used by bench_metrics.py through its ASGI
+interface with and without configure_tracing (src.app.middleware.tracing's
+`http.request` root span, ALWAYS_ON recording, TailSamplingSpanProcessor),
+and reports the per-request overhead and the share of traces the tail
+sampler forwarded for export. Kept traces go to the in-memory exporter so
+no network I/O is timed.
+
+Usage:
+    python benchmarks/bench_tracing.py [--batches N] [--batch-size N] [--base-ratio R]
+"""
+import argparse
+import asyncio
+import sys
+
+from bench_metrics import build_app, call, compare  # noqa: E402  (sets sys.path)
+
+from src.observability.tracing import configure_tracing  # noqa: E402
+
+
+async def run(args):
+    bare_app, traced_app = build_app(False), build_app(False)
+    tracing = configure_tracing(app=traced_app, mode="memory", base_ratio=args.base_ratio)
+
+    base, traced, overhead = await compare(
+        lambda: call(bare_app), lambda: call(traced_app), args.batches, args.batch_size,
+    )
+
+    sampler = tracing.sampler
+    total = sampler.kept + sampler.dropped
+    print(f"{'bare (us)':>10} {'traced (us)':>12} {'overhead (us)':>14}")
+    print(f"{base:>10.2f} {traced:>12.2f} {overhead:>14.2f}")
+    print(
+        f"\nTraces: {total}, exported: {sampler.kept} ({sampler.kept / total:.1%}), "
+        f"adaptive threshold: {sampler.threshold_seconds * 1e6:.0f} us"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tracing overhead")
+    parser.add_argument("--batches", type=int, default=30, help="Alternating batches per variant")
+    parser.add_argument("--batch-size", type=int, default=500, help="Requests per batch")
+    parser.add_argument("--base-ratio", type=float, default=0.01, help="Tail sampler baseline keep ratio")
+    args = parser.parse_args()
+
+    asyncio.run(run(args))
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
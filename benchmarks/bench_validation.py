@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Validation micro-benchmark.
+
+Times ValidationService.validate over the sample payloads (v1.0) and a
+representative v1.1 trade payload, reporting p50/p99 per payload. The
+budget is < 1 ms per payload after warm-up (schemas compiled once).
+
+The timings only mean something if validation runs to completion: the
+run fails if a valid payload reports violations (the schema check would
+have stopped at its first error) or if an *-invalid-* payload reports none.
+
+Usage:
+    python benchmarks/bench_validation.py [--iterations N] [--budget-ms MS]
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from common import FCN_BASE_DIR
+from src.validation.issuers import IssuerWhitelist
+from src.validation.service import ValidationService
+
+SAMPLE_DIR = FCN_BASE_DIR / "test-vectors/sample-payloads"
+
+V11_PAYLOAD = {
+    "product_code": "FCN",
+    "spec_version": "1.1.0",
+    "trade_date": "2025-10-10",
+    "issue_date": "2025-10-15",
+    "maturity_date": "2026-10-15",
+    "notional": 1000000,
+    "currency": "USD",
+    "issuer": "HSBC-UK-001",
+    "underlying_assets": [
+        {"symbol": "AMZN.US", "initial_level": 180.0},
+        {"symbol": "ORCL.US", "initial_level": 125.0},
+        {"symbol": "PLTR.US", "initial_level": 25.0},
+    ],
+    # Monthly through September: BR-014 wants every observation before maturity
+    "observation_dates": [f"2026-{m:02d}-15" for m in range(1, 10)],
+    "coupon_observation_offset_days": 0,
+    "coupon_condition_threshold_pct": 0.6,
+    "knock_in_barrier_pct": 0.6,
+    "knock_in_condition": "any-underlying-breach",
+    "put_strike_pct": 0.8,
+    "coupon_rate_pct": 0.04,
+    "is_memory_coupon": True,
+    "recovery_mode": "capital-at-risk",
+    "settlement_type": "physical-settlement",
+}
+
+
+def percentile(samples, pct):
+    """Return the pct-th percentile (nearest rank) of samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark payload validation")
+    parser.add_argument("--iterations", type=int, default=2000, help="Timed runs per payload")
+    parser.add_argument("--budget-ms", type=float, default=1.0, help="p99 budget per payload")
+    args = parser.parse_args()
+
+    payloads = [("v1.1-trade", V11_PAYLOAD, None)]
+    for path in sorted(SAMPLE_DIR.glob("*.json")):
+        payloads.append((path.name, json.loads(path.read_text(encoding="utf-8")), "1.0.0"))
+
+    service = ValidationService(issuers=IssuerWhitelist())
+    service.schemas.preload()
+
+    print(f"{'payload':<40} {'p50 (us)':>10} {'p99 (us)':>10} {'violations':>11}")
+    worst_p99 = 0.0
+    unexpected = []
+    for name, payload, version in payloads:
+        for _ in range(50):
+            service.validate(payload, version)
+
+        samples = []
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            result = service.validate(payload, version)
+            samples.append((time.perf_counter() - start) * 1e6)
+
+        p50, p99 = statistics.median(samples), percentile(samples, 99)
+        worst_p99 = max(worst_p99, p99)
+        print(f"{name:<40} {p50:>10.1f} {p99:>10.1f} {len(result.violations):>11}")
+        if bool(result.violations) != ("invalid" in name):
+            unexpected.append(f"{name}: {[v.rule_id + ' ' + v.path for v in result.violations] or 'no violations'}")
+
+    within = worst_p99 / 1000 < args.budget_ms
+    print(f"\nWorst p99: {worst_p99 / 1000:.3f} ms (budget {args.budget_ms} ms) - {'PASS' if within else 'FAIL'}")
+    for line in unexpected:
+        print(f"FAIL: unexpected validation result for {line}")
+    sys.exit(0 if within and not unexpected else 1)
+
+
+if __name__ == "__main__":
+    main()
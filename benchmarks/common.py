@@ -0,0 +1,42 @@
+"""
+Shared benchmark setup: import paths and the SQLite schema.
+
+Benchmarks run as scripts from any working directory; importing this module
+puts the repository root (for `src.*`) and the FCN validators directory on
+sys.path. The SQLite helpers build the ORM schema on throwaway databases,
+with the SQL Server DATETIMEOFFSET columns created as DATETIME.
+"""
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FCN_BASE_DIR = REPO_ROOT / "docs/business/ba/products/structured-notes/fcn"
+VALIDATORS_DIR = FCN_BASE_DIR / "validators"
+
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(VALIDATORS_DIR))
+
+
+def create_sqlite_schema(engine) -> None:
+    """Create the ORM tables on a SQLite engine (DATETIMEOFFSET stored as DATETIME)."""
+    from sqlalchemy.dialects.mssql import DATETIMEOFFSET
+    from sqlalchemy.ext.compiler import compiles
+
+    from src.infra.db.base import Base
+    import src.infra.db.models  # noqa: F401  (registers tables)
+
+    @compiles(DATETIMEOFFSET, "sqlite")
+    def _datetimeoffset(element, compiler, **kw):
+        return "DATETIME"
+
+    Base.metadata.create_all(engine)
+
+
+def sqlite_engine():
+    """Return an in-memory SQLite engine with the ORM schema created."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    create_sqlite_schema(engine)
+    return engine
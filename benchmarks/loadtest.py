@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Local HTTP load-test harness asserting the ADR-006 §12 latency SLOs.
+
+Starts the API against a throwaway SQLite database (the MSSQL idempotency
+store and ORM tables run unchanged on SQLite), measures cold start, then
+drives open-loop traffic. Arrivals are Poisson at each requested rate and
+are never held back by slow responses. Latency is measured from each
+request's scheduled send time, so queueing delay is counted (no
+coordinated omission).
+
+Traffic mix (weights configurable):
+    book          POST /api/v1/trades with a fresh Idempotency-Key
+    retry         same key and body as an earlier booking (replay)
+    conflict      earlier key with a different body (409)
+    observations  POST /api/v1/observations carrying a batch of observations
+
+SLOs (P95, ADR-006 §12): booking (book + retry) < 500 ms, observation
+batches < 350 ms, cold start (process spawn to first healthy /health)
+< 2 s. The run exits 1 when any stage misses an SLO or the share of 5xx and
+transport errors exceeds --max-error-rate.
+
+Targets:
+    --target uvicorn      spawn `loadtest.py serve` (uvicorn, one worker) and load it over HTTP
+    --target inprocess    load the app in this process through httpx.ASGITransport
+                          (client and app share the event loop; cold start is
+                          still measured with a spawned server)
+    --url URL             load an already running server (cold start not measured)
+
+Usage:
+    python benchmarks/loadtest.py [--target uvicorn|inprocess] [--url URL]
+                                  [--rates 25,50,100] [--duration 10] [--batch-size 50]
+                                  [--output PATH]
+    python benchmarks/loadtest.py serve [--port 8765] [--database PATH]
+"""
+import argparse
+import asyncio
+import bisect
+import contextlib
+import copy
+import dataclasses
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from common import REPO_ROOT, create_sqlite_schema
+
+DEFAULT_DATABASE = Path(tempfile.gettempdir()) / "fcn-loadtest.db"
+
+# ADR-006 §12 P95 targets
+SLO_BOOKING_MS = 500.0
+SLO_OBSERVATION_MS = 350.0
+SLO_COLD_START_SECONDS = 2.0
+
+DEFAULT_MIX = {"book": 0.55, "retry": 0.10, "conflict": 0.05, "observations": 0.30}
+
+# Operations counted against each SLO
+SLO_GROUPS = {"booking": ("book", "retry"), "observations": ("observations",)}
+
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 350, 500, 1000, 2000, float("inf"))
+
+
+def use_sqlite(database: Path) -> str:
+    """
+    Create a fresh SQLite database with the ORM schema as the process-wide engine.
+
+    The database is in WAL mode: otherwise SQLite locks the whole file for
+    each write, so idempotency lookups queue behind unrelated inserts
+    (SQL Server locks rows) and miss their deadline on a healthy store.
+
+    Returns:
+        Its database URL
+    """
+    database.unlink(missing_ok=True)
+    url = f"sqlite:///{database}"
+
+    from src.infra.db.base import init_engine
+
+    engine = init_engine(url)
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+    create_sqlite_schema(engine)
+    return url
+
+
+def build_app(database: Path, **overrides):
+    """Return the API app configured for a fresh SQLite database (plus Settings overrides)."""
+    from src.app.main import create_app
+    from src.app.settings import Settings
+
+    settings = Settings.from_env()
+    return create_app(dataclasses.replace(
+        settings,
+        database_url=use_sqlite(database),
+        # No collector runs locally; keep tracing off unless asked for
+        traces_exporter=settings.traces_exporter or "none",
+        **overrides,
+    ))
+
+
+def serve(args) -> None:
+    """Run the API under uvicorn on a fresh SQLite database."""
+    import uvicorn
+
+    uvicorn.run(build_app(args.database), host="127.0.0.1", port=args.port, log_level="warning", access_log=False)
+
+
+# --- Target ------------------------------------------------------------------
+
+async def wait_healthy(url: str, process: subprocess.Popen, timeout: float) -> None:
+    """Poll GET /health until it returns 200."""
+    import httpx
+
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"server exited during start-up (code {process.returncode})")
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.01)
+    raise RuntimeError(f"server not healthy after {timeout:.0f} s")
+
+
+async def spawn_server(port: int, database: Path, env: Optional[Dict[str, str]] = None):
+    """
+    Start `loadtest.py serve` and wait for it to become healthy.
+
+    Args:
+        port: Port to serve on
+        database: Throwaway SQLite file
+        env: Extra environment variables for the server (settings overrides)
+
+    Returns:
+        (process, base_url, cold_start_seconds)
+    """
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "serve", "--port", str(port), "--database", str(database)],
+        cwd=REPO_ROOT,
+        env={**os.environ, **(env or {})},
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        await wait_healthy(url, process, timeout=60)
+    except Exception:
+        process.terminate()
+        raise
+    return process, url, time.perf_counter() - started
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    """Terminate a spawned server."""
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+# --- Workload ----------------------------------------------------------------
+
+class Workload:
+    """
+    Generates the request mix and remembers bookings for retries and conflicts.
+    """
+
+    def __init__(self, mix: Dict[str, float], batch_size: int, rng: random.Random):
+        """
+        Initialize workload.
+
+        Args:
+            mix: Operation name -> weight
+            batch_size: Observations per observation request
+            rng: Random source (seeded for repeatable runs)
+        """
+        from bench_validation import V11_PAYLOAD
+
+        self.operations = list(mix)
+        self.weights = [mix[name] for name in self.operations]
+        self.batch_size = batch_size
+        self.rng = rng
+        self.template = V11_PAYLOAD
+        self.sequence = 0
+        self.booked: deque = deque(maxlen=1000)
+
+    def next_request(self):
+        """
+        Return (operation, path, headers, body) for the next arrival.
+
+        Retries and conflicts fall back to a fresh booking until one exists.
+        """
+        operation = self.rng.choices(self.operations, self.weights)[0]
+        if operation in ("retry", "conflict") and not self.booked:
+            operation = "book"
+        self.sequence += 1
+
+        if operation == "observations":
+            return operation, "/api/v1/observations", self._headers(f"lt-obs-{self.sequence}"), self._observations()
+
+        if operation == "book":
+            key = f"lt-trade-{self.sequence}"
+            payload = copy.deepcopy(self.template)
+            payload["trade_id"] = f"TRD-LT-{self.sequence:08d}"
+            body = json.dumps(payload).encode("utf-8")
+            self.booked.append((key, payload))
+            return operation, "/api/v1/trades", self._headers(key), body
+
+        key, payload = self.rng.choice(self.booked)
+        if operation == "conflict":
+            payload = dict(payload, notional=payload["notional"] + 1)
+        return operation, "/api/v1/trades", self._headers(key), json.dumps(payload).encode("utf-8")
+
+    def _observations(self) -> bytes:
+        """Return an observation batch body."""
+        trade_id = f"TRD-LT-{self.rng.randint(1, max(1, self.sequence)):08d}"
+        return json.dumps({
+            "trade_id": trade_id,
+            "observations": [
+                {
+                    "observation_date": f"2026-{1 + i % 12:02d}-15",
+                    "underlying_levels": [round(self.rng.uniform(60, 120), 4) for _ in range(3)],
+                }
+                for i in range(self.batch_size)
+            ],
+        }).encode("utf-8")
+
+    @staticmethod
+    def _headers(key: str) -> Dict[str, str]:
+        return {"Content-Type": "application/json", "Idempotency-Key": key}
+
+
+async def run_stage(client, workload: Workload, rate: float, duration: float) -> Dict[str, Any]:
+    """
+    Drive open-loop Poisson arrivals at `rate` req/s for `duration` seconds.
+
+    Returns:
+        Stage result with per-operation latencies (ms) and status counts
+    """
+    loop = asyncio.get_running_loop()
+    latencies: Dict[str, List[float]] = {name: [] for name in workload.operations}
+    statuses: Dict[str, Counter] = {name: Counter() for name in workload.operations}
+    in_flight = 0
+    peak = 0
+
+    async def fire(operation: str, path: str, headers: Dict[str, str], body: bytes, scheduled: float):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            response = await client.post(path, content=body, headers=headers)
+            status = str(response.status_code)
+        except Exception as e:  # transport errors count against the error budget
+            status = type(e).__name__
+        finally:
+            in_flight -= 1
+        latencies[operation].append((loop.time() - scheduled) * 1000)
+        statuses[operation][status] += 1
+
+    tasks = []
+    start = loop.time()
+    offset = 0.0
+    while True:
+        offset += workload.rng.expovariate(rate)
+        if offset >= duration:
+            break
+        delay = start + offset - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(fire(*workload.next_request(), start + offset)))
+    await asyncio.gather(*tasks)
+    elapsed = loop.time() - start
+
+    all_latencies = [ms for samples in latencies.values() for ms in samples]
+    errors = sum(
+        count for counter in statuses.values() for status, count in counter.items()
+        if not status.isdigit() or int(status) >= 500
+    )
+    return {
+        "rate": rate,
+        "requests": len(all_latencies),
+        "elapsed_seconds": round(elapsed, 3),
+        "throughput_rps": round(len(all_latencies) / elapsed, 2),
+        # Little's law: mean requests in flight = total latency / wall time
+        "mean_concurrency": round(sum(all_latencies) / 1000 / elapsed, 2),
+        "peak_concurrency": peak,
+        "errors": errors,
+        "error_rate": round(errors / len(all_latencies), 4) if all_latencies else 0.0,
+        "operations": {
+            name: {**summarize(latencies[name]), "statuses": dict(statuses[name])}
+            for name in workload.operations
+        },
+        "slo_groups": {
+            group: summarize([ms for name in members for ms in latencies.get(name, [])])
+            for group, members in SLO_GROUPS.items()
+        },
+        "_latencies": latencies,
+    }
+
+
+# --- Reporting ---------------------------------------------------------------
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Return the pct-th percentile (nearest rank)."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, Any]:
+    """Return count and latency percentiles (ms) of a sample list."""
+    if not samples:
+        return {"count": 0}
+    return {
+        "count": len(samples),
+        "p50_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(percentile(samples, 95), 2),
+        "p99_ms": round(percentile(samples, 99), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def histogram(samples: List[float]) -> List[int]:
+    """Return counts per HISTOGRAM_BUCKETS_MS upper bound."""
+    counts = [0] * len(HISTOGRAM_BUCKETS_MS)
+    for ms in samples:
+        counts[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, ms)] += 1
+    return counts
+
+
+def print_histogram(title: str, samples: List[float], width: int = 40) -> None:
+    """Print a text histogram."""
+    counts = histogram(samples)
+    peak = max(counts) or 1
+    print(f"\n{title} ({len(samples)} requests)")
+    for bound, count in zip(HISTOGRAM_BUCKETS_MS, counts):
+        label = f"<= {bound:g} ms" if bound != float("inf") else "> 2000 ms"
+        print(f"  {label:>12} {count:>7}  {'#' * round(count / peak * width)}")
+
+
+def check_slos(stages: List[Dict[str, Any]], cold_start: Optional[float], args) -> List[str]:
+    """Return a description of every missed SLO."""
+    targets = {"booking": args.slo_booking_ms, "observations": args.slo_observation_ms}
+    missed = []
+    for stage in stages:
+        for group, target in targets.items():
+            p95 = stage["slo_groups"][group].get("p95_ms")
+            if p95 is not None and p95 >= target:
+                missed.append(f"{group} P95 {p95:.1f} ms >= {target:g} ms at {stage['rate']:g} req/s")
+        if stage["error_rate"] > args.max_error_rate:
+            missed.append(f"error rate {stage['error_rate']:.2%} > {args.max_error_rate:.2%} at {stage['rate']:g} req/s")
+    if cold_start is not None and cold_start >= args.slo_cold_start_s:
+        missed.append(f"cold start {cold_start:.2f} s >= {args.slo_cold_start_s:g} s")
+    return missed
+
+
+def report(stages: List[Dict[str, Any]], cold_start: Optional[float], missed: List[str]) -> None:
+    """Print the throughput table, histograms and SLO verdict."""
+    if cold_start is not None:
+        print(f"Cold start: {cold_start:.2f} s")
+
+    print(
+        f"\n{'rate':>7} {'sent':>6} {'thru/s':>8} {'conc':>6} {'peak':>5} "
+        f"{'book p50':>9} {'book p95':>9} {'obs p50':>9} {'obs p95':>9} {'errors':>7}"
+    )
+    for stage in stages:
+        booking, observations = stage["slo_groups"]["booking"], stage["slo_groups"]["observations"]
+        print(
+            f"{stage['rate']:>7g} {stage['requests']:>6} {stage['throughput_rps']:>8.1f} "
+            f"{stage['mean_concurrency']:>6.2f} {stage['peak_concurrency']:>5} "
+            f"{booking.get('p50_ms', 0):>9.1f} {booking.get('p95_ms', 0):>9.1f} "
+            f"{observations.get('p50_ms', 0):>9.1f} {observations.get('p95_ms', 0):>9.1f} {stage['errors']:>7}"
+        )
+
+    print("\nStatus codes per operation (all stages):")
+    totals: Dict[str, Counter] = {}
+    for stage in stages:
+        for name, result in stage["operations"].items():
+            totals.setdefault(name, Counter()).update(result["statuses"])
+    for name, counter in totals.items():
+        print(f"  {name:<13} {dict(sorted(counter.items()))}")
+
+    for group, members in SLO_GROUPS.items():
+        samples = [ms for stage in stages for name in members for ms in stage["_latencies"].get(name, [])]
+        print_histogram(f"{group} latency, all stages", samples)
+
+    print()
+    if missed:
+        for line in missed:
+            print(f"❌ SLO missed: {line}")
+    else:
+        print("✅ All ADR-006 §12 SLOs met")
+
+
+# --- Main --------------------------------------------------------------------
+
+async def run(args) -> int:
+    import httpx
+
+    mix = dict(DEFAULT_MIX)
+    for item in args.mix or []:
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"Unknown operation in --mix: {name}")
+        mix[name] = float(weight)
+    workload = Workload(mix, args.batch_size, random.Random(args.seed))
+
+    app = process = None
+    cold_start = None
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, limits=httpx.Limits(max_connections=args.max_connections))
+    else:
+        process, url, cold_start = await spawn_server(args.port, args.database)
+        if args.target == "uvicorn":
+            client = httpx.AsyncClient(base_url=url, limits=httpx.Limits(max_connections=args.max_connections))
+        else:
+            stop_server(process)
+            process = None
+            app = build_app(args.database)
+            client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest")
+
+    stages = []
+    try:
+        async with contextlib.AsyncExitStack() as stack:
+            if app is not None:
+                # ASGITransport does not send lifespan events
+                await stack.enter_async_context(app.router.lifespan_context(app))
+            await stack.enter_async_context(client)
+            for rate in args.rates:
+                print(f"Stage: {rate:g} req/s for {args.duration:g} s ...", flush=True)
+                stages.append(await run_stage(client, workload, rate, args.duration))
+    finally:
+        if process is not None:
+            stop_server(process)
+        args.database.unlink(missing_ok=True)
+
+    missed = check_slos(stages, cold_start, args)
+    report(stages, cold_start, missed)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({
+            "target": args.url or args.target,
+            "cold_start_seconds": cold_start,
+            "mix": mix,
+            "batch_size": args.batch_size,
+            "histogram_buckets_ms": [b if b != float("inf") else None for b in HISTOGRAM_BUCKETS_MS],
+            "stages": [
+                {
+                    **{k: v for k, v in stage.items() if k != "_latencies"},
+                    "histograms": {name: histogram(samples) for name, samples in stage["_latencies"].items()},
+                }
+                for stage in stages
+            ],
+            "slo_missed": missed,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    return 1 if missed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the FCN API against ADR-006 §12 SLOs")
+    sub = parser.add_subparsers(dest="command")
+
+    serve_parser = sub.add_parser("serve", help="Run the API on SQLite under uvicorn")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--database", type=Path, default=DEFAULT_DATABASE)
+
+    parser.add_argument("--target", choices=("uvicorn", "inprocess"), default="uvicorn")
+    parser.add_argument("--url", help="Load an already running server instead")
+    parser.add_argument("--port", type=int, default=8765, help="Port for the spawned server")
+    parser.add_argument("--database", type=Path, default=DEFAULT_DATABASE, help="Throwaway SQLite file")
+    parser.add_argument("--rates", type=lambda v: [float(r) for r in v.split(",")], default=[25.0, 50.0, 100.0],
+                        help="Comma-separated arrival rates (req/s), one stage each")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per stage")
+    parser.add_argument("--batch-size", type=int, default=50, help="Observations per observation request")
+    parser.add_argument("--mix", nargs="*", metavar="OP=WEIGHT", help="Override mix weights (book, retry, conflict, observations)")
+    parser.add_argument("--max-connections", type=int, default=100, help="HTTP connection pool size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--slo-booking-ms", type=float, default=SLO_BOOKING_MS)
+    parser.add_argument("--slo-observation-ms", type=float, default=SLO_OBSERVATION_MS)
+    parser.add_argument("--slo-cold-start-s", type=float, default=SLO_COLD_START_SECONDS)
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Allowed share of 5xx/transport errors")
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        serve(args)
+        return
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+Overload test: tail latency with and without admission control.
+
+First measures what one worker serves: closed-loop clients send the mix
+to a server with admission control off for --calibrate-seconds. Then runs
+the API twice under uvicorn (one worker, throwaway SQLite database), with
+ADMISSION_ENABLED=false and then true. Each run gets the same open-loop
+Poisson traffic at --load-factor times the measured capacity (or --rate).
+The traffic is the load-test mix (bookings, retries, conflicts,
+observation batches) plus /health probes. Latency is measured from each
+request's scheduled send time, as in loadtest.py. Requests go through a
+minimal keep-alive HTTP/1.1 client (RawClient). httpx spends more CPU per
+request than the API does, so on a small machine the overload queue would
+form in the client rather than in the server.
+
+Without admission control every request queues, and latency grows for
+the whole run. Event loop lag then makes idempotency lookups miss their
+deadline; those 503s (IDEMPOTENCY_UNAVAILABLE, reported as "503 store")
+count as failures. With admission control, excess new work is shed with a
+fast 503 SERVICE_OVERLOADED + Retry-After. Admitted requests keep a
+bounded tail, and replays and health checks still succeed.
+
+Conflicting replays reuse a booking's key with a different payload. One
+sent after its booking got its 201 must not be booked (409, or a 503).
+One sent while the booking is still in flight races it: the middleware
+has no in-flight reservation, so both lookups miss and both requests are
+handled. The later record write then fails on the key's unique index and
+counts as a store_error. These racing conflicts are reported, not gated.
+
+The run exits 1 unless:
+    without admission control, booking P99 >= --max-p99-ms or at least
+    --max-error-rate of requests failed (the traffic really overloaded
+    the worker)
+    with admission control:
+        some requests were shed
+        admitted booking P99 < --max-p99-ms
+        admitted booking P95 < the ADR-006 booking SLO (500 ms)
+        every /health probe returned 200
+        no conflict sent after its booking's 201 was booked (201)
+
+Usage:
+    python benchmarks/overload.py [--load-factor 1.5] [--rate R] [--duration 10]
+                                  [--health-rate 5] [--max-p99-ms 1000] [--output PATH]
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loadtest import (  # noqa: E402  (sets sys.path)
+    DEFAULT_DATABASE,
+    DEFAULT_MIX,
+    SLO_BOOKING_MS,
+    SLO_GROUPS,
+    Workload,
+    print_histogram,
+    spawn_server,
+    stop_server,
+    summarize,
+)
+
+SHED_STATUS = 503
+# 503s carrying another error code (IDEMPOTENCY_UNAVAILABLE: a lookup
+# missed its deadline) are failures, reported with this status label
+SHED_CODE = b'"SERVICE_OVERLOADED"'
+UNAVAILABLE_STATUS = "503 store"
+
+# Idle connections are dropped before uvicorn's 5 s keep-alive timeout closes them
+IDLE_CONNECTION_SECONDS = 4.0
+
+
+class RawClient:
+    """
+    Minimal HTTP/1.1 keep-alive client (Content-Length responses only).
+    """
+
+    def __init__(self, host: str, port: int, max_connections: int, timeout: float):
+        """
+        Initialize client.
+
+        Args:
+            host: Server host
+            port: Server port
+            max_connections: Open connections at most; further requests wait
+            timeout: Seconds per request before it counts as failed
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.slots = asyncio.Semaphore(max_connections)
+        self.idle: List[tuple] = []
+
+    async def request(self, method: str, path: str, headers: Optional[Dict[str, str]] = None,
+                      body: bytes = b"") -> Tuple[int, bytes]:
+        """Send one request and return its status code and body."""
+        async with self.slots:
+            return await asyncio.wait_for(self._exchange(method, path, headers or {}, body or b""), self.timeout)
+
+    async def _connection(self) -> tuple:
+        """Return a recently used idle connection or a new one."""
+        now = time.monotonic()
+        while self.idle:
+            reader, writer, idle_since = self.idle.pop()
+            if now - idle_since < IDLE_CONNECTION_SECONDS and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def _exchange(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> Tuple[int, bytes]:
+        reader, writer = await self._connection()
+        try:
+            head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n"
+            head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+            writer.write(head.encode("latin-1") + b"\r\n" + body)
+            response_head = await reader.readuntil(b"\r\n\r\n")
+            status = int(response_head[9:12])
+            length = 0
+            for line in response_head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.lower() == b"content-length":
+                    length = int(value)
+            content = await reader.readexactly(length)
+        except BaseException:
+            writer.close()
+            raise
+        self.idle.append((reader, writer, time.monotonic()))
+        return status, content
+
+    async def close(self) -> None:
+        """Close idle connections."""
+        for _, writer, _ in self.idle:
+            writer.close()
+        self.idle.clear()
+
+
+async def calibrate(client, workload: Workload, concurrency: int, duration: float) -> float:
+    """
+    Return the POST rate one worker sustains (req/s), from closed-loop clients.
+    """
+    loop = asyncio.get_running_loop()
+    stop = loop.time() + duration
+    completed = 0
+
+    async def worker():
+        nonlocal completed
+        while loop.time() < stop:
+            _, path, headers, body = workload.next_request()
+            status, _ = await client.request("POST", path, headers, body)
+            if status < 500:
+                completed += 1
+
+    start = loop.time()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return completed / (loop.time() - start)
+
+
+async def drive(client, workload: Workload, rate: float, health_rate: float, duration: float) -> Dict[str, Any]:
+    """
+    Send open-loop traffic plus health probes for `duration` seconds.
+
+    Returns:
+        {"requests": [(operation, status, latency_ms, idempotency_key, sent, done), ...],
+         "elapsed_seconds": float}
+    """
+    loop = asyncio.get_running_loop()
+    results: List[tuple] = []
+
+    async def fire(operation: str, method: str, path: str, headers, body, scheduled: float):
+        sent = loop.time()
+        try:
+            code, content = await client.request(method, path, headers, body)
+            status = str(code) if code != SHED_STATUS or SHED_CODE in content else UNAVAILABLE_STATUS
+        except Exception as e:  # timeouts and transport errors
+            status = type(e).__name__
+        done = loop.time()
+        key = (headers or {}).get("Idempotency-Key")
+        results.append((operation, status, (done - scheduled) * 1000, key, sent, done))
+
+    async def arrivals(next_request, arrival_rate: float, rng: random.Random):
+        tasks = []
+        offset = 0.0
+        while True:
+            offset += rng.expovariate(arrival_rate)
+            if offset >= duration:
+                break
+            delay = start + offset - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(fire(*next_request(), start + offset)))
+        await asyncio.gather(*tasks)
+
+    def next_post():
+        operation, path, headers, body = workload.next_request()
+        return operation, "POST", path, headers, body
+
+    def next_probe():
+        return "health", "GET", "/health", None, None
+
+    start = loop.time()
+    await asyncio.gather(
+        arrivals(next_post, rate, workload.rng),
+        arrivals(next_probe, health_rate, random.Random(1)),
+    )
+    return {"requests": results, "elapsed_seconds": loop.time() - start}
+
+
+def conflict_outcomes(requests: List[tuple]) -> Dict[str, Dict[str, int]]:
+    """
+    Count conflict statuses by whether their booking had its 201 when sent.
+
+    Returns:
+        {"after_booking": {status: count}, "racing": {status: count}}
+    """
+    booked = {key: done for operation, status, _, key, _, done in requests if operation == "book" and status == "201"}
+    after_booking, racing = Counter(), Counter()
+    for operation, status, _, key, sent, _ in requests:
+        if operation == "conflict":
+            (after_booking if booked.get(key, sent) < sent else racing)[status] += 1
+    return {"after_booking": dict(sorted(after_booking.items())), "racing": dict(sorted(racing.items()))}
+
+
+def analyse(mode: str, run: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize one run: shed share, admitted latency per group, health probes."""
+    requests = run["requests"]
+    statuses: Dict[str, Counter] = {}
+    for operation, status, *_ in requests:
+        statuses.setdefault(operation, Counter())[status] += 1
+
+    def latencies(operations, admitted: bool) -> List[float]:
+        """Latencies of served (2xx-4xx) or of shed requests."""
+        return [
+            ms for operation, status, ms, *_ in requests
+            if operation in operations and (
+                status.isdigit() and int(status) < 500 if admitted else status == str(SHED_STATUS)
+            )
+        ]
+
+    posts = [r for r in requests if r[0] != "health"]
+    shed = sum(1 for _, status, *_ in posts if status == str(SHED_STATUS))
+    failed = sum(1 for _, status, *_ in posts if not status.isdigit() or (int(status) >= 500 and int(status) != SHED_STATUS))
+    served = len(posts) - shed - failed
+    health = statuses.get("health", Counter())
+    return {
+        "mode": mode,
+        "sent": len(posts),
+        "served": served,
+        "served_rps": round(served / run["elapsed_seconds"], 1),
+        "shed": shed,
+        "shed_rate": round(shed / len(posts), 4) if posts else 0.0,
+        "failed": failed,
+        "admitted": {group: summarize(latencies(members, True)) for group, members in SLO_GROUPS.items()},
+        "shed_latency": summarize(latencies(set(DEFAULT_MIX), False)),
+        "health": {**summarize(latencies({"health"}, True)), "ok": health.get("200", 0), "total": sum(health.values())},
+        "statuses": {operation: dict(sorted(counter.items())) for operation, counter in statuses.items()},
+        "conflicts": conflict_outcomes(requests),
+        "_booking": latencies(SLO_GROUPS["booking"], True),
+    }
+
+
+def report(results: List[Dict[str, Any]]) -> None:
+    """Print the comparison table and booking latency histograms."""
+    print(f"\n{'admission':<10} {'sent':>6} {'served/s':>9} {'shed':>6} {'failed':>7} "
+          f"{'book p50':>9} {'book p95':>9} {'book p99':>9} {'503 p99':>8} {'health ok':>10} {'health p99':>11}")
+    for r in results:
+        booking, health = r["admitted"]["booking"], r["health"]
+        print(f"{r['mode']:<10} {r['sent']:>6} {r['served_rps']:>9.1f} {r['shed_rate']:>6.1%} {r['failed']:>7} "
+              f"{booking.get('p50_ms', 0):>9.1f} {booking.get('p95_ms', 0):>9.1f} {booking.get('p99_ms', 0):>9.1f} "
+              f"{r['shed_latency'].get('p99_ms', 0):>8.1f} {health['ok']:>4}/{health['total']:<5} "
+              f"{health.get('p99_ms', 0):>11.1f}")
+
+    print("\nStatus codes per operation:")
+    for r in results:
+        for operation, counter in r["statuses"].items():
+            print(f"  {r['mode']:<4} {operation:<13} {counter}")
+
+    print("\nConflicting replays (racing: sent while their booking was in flight):")
+    for r in results:
+        print(f"  {r['mode']:<4} after booking {r['conflicts']['after_booking']}  racing {r['conflicts']['racing']}")
+
+    for r in results:
+        print_histogram(f"Admitted booking latency, admission {r['mode']}", r["_booking"])
+
+
+async def measure_capacity(args) -> float:
+    """Return the POST rate one worker sustains with admission control off."""
+    process, _, _ = await spawn_server(args.port, args.database, env={"ADMISSION_ENABLED": "false"})
+    client = RawClient("127.0.0.1", args.port, args.calibrate_concurrency, args.timeout)
+    try:
+        workload = Workload(dict(DEFAULT_MIX), args.batch_size, random.Random(args.seed + 1))
+        return await calibrate(client, workload, args.calibrate_concurrency, args.calibrate_seconds)
+    finally:
+        await client.close()
+        stop_server(process)
+        args.database.unlink(missing_ok=True)
+        time.sleep(1)
+
+
+async def run(args) -> int:
+    capacity = None
+    if args.rate is None:
+        print(f"Measuring capacity for {args.calibrate_seconds:g} s ...", flush=True)
+        capacity = await measure_capacity(args)
+        args.rate = round(capacity * args.load_factor, 1)
+        print(f"Capacity {capacity:.1f} req/s; offering {args.rate:g} req/s ({args.load_factor:g}x)", flush=True)
+
+    results = []
+    for mode, enabled in (("off", "false"), ("on", "true")):
+        print(f"Admission {mode}: {args.rate:g} req/s for {args.duration:g} s ...", flush=True)
+        process, _, _ = await spawn_server(args.port, args.database, env={"ADMISSION_ENABLED": enabled})
+        client = RawClient("127.0.0.1", args.port, args.max_connections, args.timeout)
+        try:
+            workload = Workload(dict(DEFAULT_MIX), args.batch_size, random.Random(args.seed))
+            results.append(analyse(mode, await drive(client, workload, args.rate, args.health_rate, args.duration)))
+        finally:
+            await client.close()
+            stop_server(process)
+            args.database.unlink(missing_ok=True)
+        # Let the port and CPU settle between runs
+        time.sleep(1)
+
+    report(results)
+
+    off, on = results
+    booking = on["admitted"]["booking"]
+    missed = []
+    off_p99 = off["admitted"]["booking"].get("p99_ms", 0)
+    off_failed = off["failed"] / off["sent"] if off["sent"] else 0.0
+    if off_p99 < args.max_p99_ms and off_failed < args.max_error_rate:
+        missed.append(f"no overload: without admission control booking P99 {off_p99:.1f} ms < "
+                      f"{args.max_p99_ms:g} ms and {off_failed:.1%} failed (raise --load-factor or --rate)")
+    if not on["shed"]:
+        missed.append("admission control shed nothing")
+    if booking.get("p99_ms", 0) >= args.max_p99_ms:
+        missed.append(f"admitted booking P99 {booking['p99_ms']:.1f} ms >= {args.max_p99_ms:g} ms")
+    if booking.get("p95_ms", 0) >= SLO_BOOKING_MS:
+        missed.append(f"admitted booking P95 {booking['p95_ms']:.1f} ms >= {SLO_BOOKING_MS:g} ms")
+    if on["health"]["ok"] != on["health"]["total"]:
+        missed.append(f"{on['health']['total'] - on['health']['ok']} health probes failed")
+    if "201" in on["conflicts"]["after_booking"]:
+        missed.append(f"conflicts sent after their booking's 201 were booked: {on['conflicts']['after_booking']}")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps({
+            "rate": args.rate,
+            "capacity": capacity,
+            "duration": args.duration,
+            "runs": [{k: v for k, v in r.items() if not k.startswith("_")} for r in results],
+            "missed": missed,
+        }, indent=2) + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    print()
+    if missed:
+        for line in missed:
+            print(f"❌ FAIL: {line}")
+        return 1
+    print(f"✅ PASS: admitted booking P99 {booking.get('p99_ms', 0):.1f} ms under overload "
+          f"(without admission control {off_p99:.1f} ms, {off_failed:.1%} failed; "
+          f"{on['shed_rate']:.1%} shed), all health probes served")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Overload the FCN API with and without admission control")
+    parser.add_argument("--rate", type=float, help="POST arrival rate (req/s); default: --load-factor x capacity")
+    parser.add_argument("--load-factor", type=float, default=1.5, help="Offered rate as a multiple of measured capacity")
+    parser.add_argument("--calibrate-seconds", type=float, default=5.0, help="Closed-loop capacity measurement time")
+    parser.add_argument("--calibrate-concurrency", type=int, default=16,
+                        help="Closed-loop clients for the capacity measurement")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per run")
+    parser.add_argument("--health-rate", type=float, default=5.0, help="/health probes per second")
+    parser.add_argument("--batch-size", type=int, default=50, help="Observations per observation request")
+    parser.add_argument("--max-p99-ms", type=float, default=1000.0, help="Admitted booking P99 bound with admission on")
+    parser.add_argument("--max-error-rate", type=float, default=0.01,
+                        help="Failed share without admission control that counts as overload")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Client timeout per request (s)")
+    parser.add_argument("--max-connections", type=int, default=1000, help="HTTP connection pool size")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--database", type=Path, default=DEFAULT_DATABASE)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+Repository benchmark suite with JSON baselines and regression gating.
+
+Runs offline: MSSQL-backed code runs against in-memory SQLite and the Redis
+store against fakeredis. Cases:
+
+    fingerprint.*       IdempotencyService.compute_fingerprint
+    middleware.*        IdempotencyMiddleware ASGI round trip (miss + store, replay)
+    store.*             MSSQLIdempotencyStore (SQLite) and RedisIdempotencyStore (fakeredis)
+    orm.insert.*        One-row insert + flush per ORM model
+    validators.*        Validator corpus runs (aggregator in-process, Phase 4 engine)
+    lifecycle.*         BatchEvaluator over a synthetic vector batch
+
+Each case reports p50/p99/mean per iteration in microseconds. A run
+measures every case `--repeats` times in interleaved rounds and records the
+median of the per-round p50/p99, plus every round's value. `compare` fails
+(exit 1) when even the fastest current round of a case's p50 or p99 is
+beyond its threshold over the baseline median, and by more than an absolute
+floor (which absorbs jitter on sub-10 us cases). Host noise only ever adds
+time, so a slow spell that spares one round cannot fail the gate. Baselines record the host; `compare` refuses
+(exit 2) results from a different host or a baseline without round data.
+
+Timings only compare on the machine that produced them, so no baseline is
+committed: record one on the gating machine first (`run --save-baseline`).
+`compare` and `check` exit 2 while there is none.
+
+`check` is the gate: it runs the suite, compares it with the baseline, and
+re-runs only the regressed cases (up to `--confirm` times), failing if a
+regression shows up in every attempt. A slow spell on a shared host rarely
+outlasts a re-run; a real regression does.
+
+Usage:
+    python benchmarks/suite.py run [--filter REGEX] [--quick] [--repeats N] [--output PATH]
+    python benchmarks/suite.py run --save-baseline
+    python benchmarks/suite.py compare [BASELINE] [CURRENT] [--p50-threshold 0.2]
+                                       [--p99-threshold 0.5] [--min-delta-us 5]
+    python benchmarks/suite.py check [--filter REGEX] [--confirm 2] [threshold options]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import json
+import platform
+import os
+import re
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from common import FCN_BASE_DIR, sqlite_engine
+from bench_validation import V11_PAYLOAD, percentile
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "baseline.json"
+RESULTS_PATH = Path(__file__).resolve().parent / "results" / "latest.json"
+
+TRADE_BODY = json.dumps(V11_PAYLOAD).encode("utf-8")
+
+
+# --- Registry -----------------------------------------------------------------
+
+CASES: Dict[str, Dict[str, Any]] = {}
+
+
+def case(name: str, iterations: int, quick: Optional[int] = None):
+    """
+    Register a benchmark case.
+
+    The decorated function performs setup and returns the callable (sync or
+    async, no arguments) timed once per iteration.
+    """
+    def register(setup: Callable[[], Callable]):
+        CASES[name] = {"setup": setup, "iterations": iterations, "quick": quick or max(1, iterations // 10)}
+        return setup
+    return register
+
+
+def idempotency_record(key_hash: str):
+    """Return a stored-response record shaped like a trade booking."""
+    from src.domain.services.idempotency import IdempotencyRecord
+
+    now = datetime.now(timezone.utc)
+    return IdempotencyRecord(
+        key_hash=key_hash,
+        request_fingerprint="f" * 64,
+        request_method="POST",
+        request_path="/api/v1/trades",
+        response_status=201,
+        response_snapshot=json.dumps({"trade_id": "TRD-001", "status": "booked"}),
+        created_at=now,
+        expires_at=now + timedelta(hours=24),
+    )
+
+
+def quiet(fn: Callable) -> Callable:
+    """Wrap a callable so its stdout is discarded (validators print reports)."""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return fn()
+    return run
+
+
+# --- Idempotency --------------------------------------------------------------
+
+@case("fingerprint.trade_payload", iterations=20000)
+def bench_fingerprint():
+    from src.domain.services.idempotency import IdempotencyService
+
+    return lambda: IdempotencyService.compute_fingerprint("POST", "/api/v1/trades", TRADE_BODY)
+
+
+def middleware_app():
+    """Return (asgi_app, call) for a booking stub behind IdempotencyMiddleware on fakeredis."""
+    import fakeredis
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse
+
+    from src.app.middleware.idempotency import IdempotencyMiddleware
+    from src.domain.services.idempotency import IdempotencyService
+    from src.infra.idempotency.redis_store import RedisIdempotencyStore
+
+    app = FastAPI()
+
+    @app.post("/api/v1/trades")
+    async def book_trade():
+        return JSONResponse(status_code=201, content={"trade_id": "TRD-001", "status": "booked"})
+
+    service = IdempotencyService(store=RedisIdempotencyStore(fakeredis.FakeRedis()))
+    app.add_middleware(IdempotencyMiddleware, idempotency_service=service, ttl_hours=24)
+
+    async def call(key: str) -> None:
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "POST", "scheme": "http", "path": "/api/v1/trades",
+            "raw_path": b"/api/v1/trades", "root_path": "", "query_string": b"",
+            "headers": [
+                (b"host", b"bench"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(TRADE_BODY)).encode()),
+                (b"idempotency-key", key.encode()),
+            ],
+            "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+        }
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if sent:
+                return {"type": "http.disconnect"}
+            sent = True
+            return {"type": "http.request", "body": TRADE_BODY, "more_body": False}
+
+        async def send(message):
+            pass
+
+        await app(scope, receive, send)
+
+    return call
+
+
+@case("middleware.round_trip_miss", iterations=2000)
+def bench_middleware_miss():
+    call = middleware_app()
+    keys = (f"miss-{i}" for i in itertools.count())
+    return lambda: call(next(keys))
+
+
+@case("middleware.round_trip_replay", iterations=2000)
+def bench_middleware_replay():
+    call = middleware_app()
+    asyncio.run(call("replay"))
+    return lambda: call("replay")
+
+
+@case("store.mssql_sqlite.set", iterations=2000)
+def bench_mssql_set():
+    from sqlalchemy.orm import sessionmaker
+    from src.infra.idempotency.mssql_store import MSSQLIdempotencyStore
+
+    store = MSSQLIdempotencyStore(sessionmaker(bind=sqlite_engine()))
+    keys = (f"{i:064d}" for i in itertools.count())
+    return lambda: store.set(idempotency_record(next(keys)))
+
+
+@case("store.mssql_sqlite.get", iterations=2000)
+def bench_mssql_get():
+    from sqlalchemy.orm import sessionmaker
+    from src.infra.idempotency.mssql_store import MSSQLIdempotencyStore
+
+    store = MSSQLIdempotencyStore(sessionmaker(bind=sqlite_engine()))
+    asyncio.run(store.set(idempotency_record("a" * 64)))
+    return lambda: store.get("a" * 64)
+
+
+@case("store.redis_fake.set", iterations=5000)
+def bench_redis_set():
+    import fakeredis
+    from src.infra.idempotency.redis_store import RedisIdempotencyStore
+
+    store = RedisIdempotencyStore(fakeredis.FakeRedis())
+    record = idempotency_record("b" * 64)
+    return lambda: store.set(record)
+
+
+@case("store.redis_fake.get", iterations=5000)
+def bench_redis_get():
+    import fakeredis
+    from src.infra.idempotency.redis_store import RedisIdempotencyStore
+
+    store = RedisIdempotencyStore(fakeredis.FakeRedis())
+    asyncio.run(store.set(idempotency_record("c" * 64)))
+    return lambda: store.get("c" * 64)
+
+
+# --- ORM ----------------------------------------------------------------------
+
+def column_value(column, n: int) -> Any:
+    """Return a type-appropriate value for row n of a column."""
+    from sqlalchemy import Boolean, DateTime, Integer, Numeric, String, Text
+
+    kind = column.type
+    if isinstance(kind, Boolean):
+        return False
+    if isinstance(kind, Integer):
+        return n
+    if isinstance(kind, Numeric):
+        return Decimal("1000000.0000")
+    if isinstance(kind, DateTime):
+        return datetime(2026, 1, 15)
+    if isinstance(kind, (String, Text)):
+        length = getattr(kind, "length", None)
+        return f"{column.name[:8]}-{n}"[:length] if length else json.dumps({"n": n})
+    # DATETIMEOFFSET and other dialect types
+    return datetime.now(timezone.utc)
+
+
+def model_factory(model) -> Callable[[int], Any]:
+    """Build rows for a model from its table metadata (every NOT NULL column without a default)."""
+    columns = [
+        c for c in model.__table__.columns
+        if not c.primary_key and not c.nullable and c.default is None and c.server_default is None
+    ]
+    return lambda n: model(**{c.key: column_value(c, n) for c in columns})
+
+
+def orm_insert_case(model):
+    """Register an insert case for one ORM model."""
+    @case(f"orm.insert.{model.__tablename__}", iterations=2000)
+    def bench_insert():
+        from sqlalchemy.orm import Session
+
+        session = Session(sqlite_engine())
+        build = model_factory(model)
+        rows = itertools.count()
+
+        def insert():
+            session.add(build(next(rows)))
+            session.flush()
+        return insert
+    return bench_insert
+
+
+def register_orm_cases():
+    """Register an insert case for every mapped model."""
+    from src.infra.db.base import Base
+    import src.infra.db.models  # noqa: F401  (registers mappers)
+
+    for mapper in sorted(Base.registry.mappers, key=lambda m: m.class_.__tablename__):
+        orm_insert_case(mapper.class_)
+
+
+# --- Validators and lifecycle -------------------------------------------------
+
+# Both validator cases run with the process-wide corpus warm (documents
+# parsed once), which is how the aggregator and watch mode run them
+@case("validators.aggregator_in_process", iterations=10, quick=2)
+def bench_aggregator():
+    from aggregator import ValidatorAggregator
+
+    return quiet(lambda: ValidatorAggregator(FCN_BASE_DIR, mode="in-process").run_all())
+
+
+@case("validators.logic_corpus", iterations=50, quick=5)
+def bench_logic_corpus():
+    from logic_validator import LogicValidator
+
+    vector_files = sorted((FCN_BASE_DIR / "test-vectors").glob("*.md"))
+    return quiet(lambda: LogicValidator().validate_test_vectors_files(vector_files))
+
+
+@case("lifecycle.batch_evaluate_1000", iterations=30, quick=3)
+def bench_lifecycle():
+    from generate_vectors import VectorGenerator
+    from logic_validator import BatchEvaluator, normalize_scenario, normalize_trade
+
+    generator = VectorGenerator(seed=7)
+    branches = sorted(generator.branches)
+    per_branch = -(-1000 // max(1, len(branches)))
+    vectors = list(itertools.islice(generator.generate(branches, count=per_branch), 1000))
+    trades = [normalize_trade(v["parameters"]) for v in vectors]
+    paths = [normalize_scenario(v["market_scenario"], t) for v, t in zip(vectors, trades)]
+    evaluator = BatchEvaluator()
+    return lambda: evaluator.evaluate(trades, paths)
+
+
+# --- Runner -------------------------------------------------------------------
+
+def measure(fn: Callable, iterations: int) -> List[float]:
+    """Time fn per iteration (us), after a warm-up of min(50, iterations // 10) calls."""
+    is_async = asyncio.iscoroutinefunction(fn) or asyncio.iscoroutine(_probe(fn))
+
+    if is_async:
+        async def run_all() -> List[float]:
+            for _ in range(min(50, iterations // 10)):
+                await fn()
+            samples = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                await fn()
+                samples.append((time.perf_counter() - start) * 1e6)
+            return samples
+        return asyncio.run(run_all())
+
+    for _ in range(min(50, iterations // 10)):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def _probe(fn: Callable):
+    """Call fn once to detect lambdas returning coroutines; close the probe coroutine."""
+    result = fn()
+    if asyncio.iscoroutine(result):
+        result.close()
+    return result
+
+
+def host_info() -> Dict[str, Any]:
+    """Identify the machine a run was measured on (compared by `compare`)."""
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def run_suite(pattern: Optional[str], quick: bool, repeats: int) -> Dict[str, Any]:
+    """
+    Run matching cases and return the results document.
+
+    Cases are set up once and measured in `repeats` interleaved rounds, so
+    a slow spell on the host spreads over every case instead of skewing one.
+    """
+    register_orm_cases()
+    selected = {name: spec for name, spec in sorted(CASES.items()) if not pattern or re.search(pattern, name)}
+    timed = {name: spec["setup"]() for name, spec in selected.items()}
+
+    rounds: Dict[str, List[List[float]]] = {name: [] for name in selected}
+    for round_number in range(1, repeats + 1):
+        print(f"round {round_number}/{repeats}", file=sys.stderr)
+        for name, spec in selected.items():
+            rounds[name].append(measure(timed[name], spec["quick"] if quick else spec["iterations"]))
+
+    results = {}
+    print(f"{'case':<42} {'iters':>6} {'p50 (us)':>12} {'p99 (us)':>12} {'mean (us)':>12}")
+    for name, spec in selected.items():
+        iterations = spec["quick"] if quick else spec["iterations"]
+        p50_runs = [round(statistics.median(samples), 3) for samples in rounds[name]]
+        p99_runs = [round(percentile(samples, 99), 3) for samples in rounds[name]]
+        results[name] = {
+            "iterations": iterations,
+            "p50_us": round(statistics.median(p50_runs), 3),
+            "p99_us": round(statistics.median(p99_runs), 3),
+            "mean_us": round(statistics.fmean(s for samples in rounds[name] for s in samples), 3),
+            "p50_runs_us": p50_runs,
+            "p99_runs_us": p99_runs,
+        }
+        r = results[name]
+        print(f"{name:<42} {iterations:>6} {r['p50_us']:>12.1f} {r['p99_us']:>12.1f} {r['mean_us']:>12.1f}")
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "platform": platform.platform(),
+            "host": host_info(),
+            "quick": quick,
+            "repeats": repeats,
+        },
+        "results": results,
+    }
+
+
+def comparable(baseline: Dict[str, Any], current: Dict[str, Any]) -> Optional[str]:
+    """Return why two results documents cannot be compared, or None."""
+    base_host, now_host = baseline["meta"].get("host"), current["meta"].get("host")
+    if base_host is None or now_host is None:
+        return "results predate host recording; re-record the baseline (run --save-baseline)"
+    if base_host != now_host:
+        return f"baseline host {base_host} differs from current host {now_host}; re-record the baseline on this host"
+    if baseline["meta"].get("quick") != current["meta"].get("quick"):
+        return "baseline and current differ in --quick; compare like with like"
+    for name, base in baseline["results"].items():
+        now = current["results"].get(name, base)
+        if "p50_runs_us" not in base or "p50_runs_us" not in now:
+            return f"{name} has no per-round data; re-run with --repeats"
+    return None
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], p50_threshold: float,
+            p99_threshold: float, min_delta_us: float) -> List[str]:
+    """
+    Print a baseline/current comparison and return the regressed case names.
+
+    A metric regresses when its fastest current round > baseline median *
+    (1 + threshold) and the difference exceeds min_delta_us. A current
+    median over the threshold with a round within it is reported as noise.
+    """
+    regressions = []
+    print(f"{'case':<42} {'p50 base':>10} {'p50 now':>10} {'Δ':>7} {'p99 base':>10} {'p99 now':>10} {'Δ':>7}  status")
+    for name, base in sorted(baseline["results"].items()):
+        now = current["results"].get(name)
+        if now is None:
+            print(f"{name:<42} {'(not run)':>10}")
+            continue
+
+        failed, noisy = [], []
+        for metric, threshold in (("p50_us", p50_threshold), ("p99_us", p99_threshold)):
+            limit = base[metric] * (1 + threshold)
+            best = min(now[f"{metric[:3]}_runs_us"])
+            if best - base[metric] > min_delta_us and best > limit:
+                failed.append(metric[:3])
+            elif now[metric] - base[metric] > min_delta_us and now[metric] > limit:
+                noisy.append(metric[:3])
+        if failed:
+            regressions.append(name)
+
+        def change(metric):
+            return f"{(now[metric] / base[metric] - 1) * 100:+.0f}%" if base[metric] else "n/a"
+
+        if failed:
+            status = f"❌ REGRESSED ({', '.join(failed)})"
+        elif noisy:
+            status = f"✅ (noise: {', '.join(noisy)})"
+        else:
+            status = "✅"
+        print(
+            f"{name:<42} {base['p50_us']:>10.1f} {now['p50_us']:>10.1f} {change('p50_us'):>7} "
+            f"{base['p99_us']:>10.1f} {now['p99_us']:>10.1f} {change('p99_us'):>7}  {status}"
+        )
+
+    for name in sorted(set(current["results"]) - set(baseline["results"])):
+        print(f"{name:<42} {'(new)':>10}")
+    return regressions
+
+
+def check(baseline: Dict[str, Any], args) -> int:
+    """
+    Run the suite against a baseline, confirming regressions by re-running.
+
+    Returns:
+        Process exit code (0 pass, 1 regression confirmed, 2 not comparable)
+    """
+    meta = baseline["meta"]
+    if args.filter:
+        baseline = dict(baseline, results={
+            name: result for name, result in baseline["results"].items() if re.search(args.filter, name)
+        })
+    thresholds = (args.p50_threshold, args.p99_threshold, args.min_delta_us)
+    current = run_suite(args.filter, meta.get("quick", False), meta.get("repeats", 5))
+    reason = comparable(baseline, current)
+    if reason:
+        print(f"❌ Cannot compare: {reason}")
+        return 2
+
+    print()
+    regressed = compare(baseline, current, *thresholds)
+    for attempt in range(1, args.confirm + 1):
+        if not regressed:
+            break
+        print(f"\nRe-running {len(regressed)} regressed case(s) ({attempt}/{args.confirm})")
+        pattern = "^(" + "|".join(re.escape(name) for name in regressed) + ")$"
+        rerun = run_suite(pattern, meta.get("quick", False), meta.get("repeats", 5))
+        current["results"].update(rerun["results"])
+        print()
+        regressed = compare(
+            dict(baseline, results={name: baseline["results"][name] for name in regressed}),
+            rerun, *thresholds,
+        )
+
+    write_json(RESULTS_PATH, current)
+    print(f"\n{len(regressed)} regression(s) - {'FAIL' if regressed else 'PASS'}")
+    return 1 if regressed else 0
+
+
+def write_json(path: Path, document: Dict[str, Any]) -> None:
+    """Write a results document."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Repository benchmark suite")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run benchmarks and write a results document")
+    run_parser.add_argument("--filter", help="Only run cases matching this regex")
+    run_parser.add_argument("--quick", action="store_true", help="Reduced iteration counts (smoke run)")
+    run_parser.add_argument("--repeats", type=int, default=5, help="Measurement rounds per case")
+    run_parser.add_argument("--output", type=Path, default=RESULTS_PATH, help="Results path")
+    run_parser.add_argument("--save-baseline", action="store_true", help=f"Also write {BASELINE_PATH.name}")
+
+    compare_parser = sub.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline", type=Path, nargs="?", default=BASELINE_PATH)
+    compare_parser.add_argument("current", type=Path, nargs="?", default=RESULTS_PATH)
+
+    check_parser = sub.add_parser("check", help="Run, compare with the baseline and confirm regressions")
+    check_parser.add_argument("--filter", help="Only run cases matching this regex")
+    check_parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    check_parser.add_argument("--confirm", type=int, default=2, help="Re-runs of regressed cases before failing")
+
+    for gate_parser in (compare_parser, check_parser):
+        gate_parser.add_argument("--p50-threshold", type=float, default=0.2, help="Allowed p50 growth (0.2 = +20%%)")
+        gate_parser.add_argument("--p99-threshold", type=float, default=0.5, help="Allowed p99 growth (0.5 = +50%%)")
+        gate_parser.add_argument("--min-delta-us", type=float, default=5.0, help="Ignore regressions smaller than this")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        document = run_suite(args.filter, args.quick, max(1, args.repeats))
+        write_json(args.output, document)
+        print(f"\nResults written to {args.output}")
+        if args.save_baseline:
+            write_json(BASELINE_PATH, document)
+            print(f"Baseline written to {BASELINE_PATH}")
+        sys.exit(0)
+
+    if not args.baseline.exists():
+        print(f"❌ No baseline at {args.baseline}; record one on this host first: "
+              "python benchmarks/suite.py run --save-baseline")
+        sys.exit(2)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if args.command == "check":
+        sys.exit(check(baseline, args))
+
+    current = json.loads(args.current.read_text(encoding="utf-8"))
+    reason = comparable(baseline, current)
+    if reason:
+        print(f"❌ Cannot compare: {reason}")
+        sys.exit(2)
+    regressions = compare(baseline, current, args.p50_threshold, args.p99_threshold, args.min_delta_us)
+    print(f"\n{len(regressions)} regression(s) - {'FAIL' if regressions else 'PASS'}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+-- Migration: m0002_parameter_definitions_versioned_unique
+-- Description: Scope parameter name uniqueness to (product_type, spec_version)
+--              so several spec versions can be seeded side by side
+-- Author: System
+-- Created: 2026-10-19
+
+CREATE TABLE parameter_definitions_new (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    required_flag BOOLEAN NOT NULL DEFAULT 0,
+    default_value TEXT,
+    enum_domain TEXT,
+    min_value NUMERIC,
+    max_value NUMERIC,
+    pattern TEXT,
+    description TEXT,
+    constraints TEXT,
+    product_type TEXT DEFAULT 'fcn',
+    spec_version TEXT DEFAULT '1.0.0',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE (product_type, spec_version, name)
+);
+
+INSERT INTO parameter_definitions_new (
+    id, name, data_type, required_flag, default_value, enum_domain,
+    min_value, max_value, pattern, description, constraints,
+    product_type, spec_version, created_at, updated_at
+)
+SELECT
+    id, name, data_type, required_flag, default_value, enum_domain,
+    min_value, max_value, pattern, description, constraints,
+    product_type, spec_version, created_at, updated_at
+FROM parameter_definitions;
+
+DROP TABLE parameter_definitions;
+
+ALTER TABLE parameter_definitions_new RENAME TO parameter_definitions;
+
+-- Create index on name for faster lookups
+CREATE INDEX IF NOT EXISTS idx_parameter_definitions_name ON parameter_definitions(name);
+
+-- Create index on product_type and spec_version for filtering
+CREATE INDEX IF NOT EXISTS idx_parameter_definitions_product_spec 
+    ON parameter_definitions(product_type, spec_version);
@@ -0,0 +1,32 @@
+-- Migration: m0003_parameter_definitions_version
+-- Description: Monotonic change counter for parameter_definitions, bumped by
+--              triggers on every insert, update and delete, so readers can
+--              detect edits that leave COUNT/MAX(id)/MAX(updated_at) unchanged
+--              (e.g. an in-place update within the same second)
+-- Author: System
+-- Created: 2026-10-19
+
+CREATE TABLE IF NOT EXISTS parameter_definitions_version (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL
+);
+
+INSERT OR IGNORE INTO parameter_definitions_version (id, version) VALUES (1, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_parameter_definitions_version_insert
+AFTER INSERT ON parameter_definitions
+BEGIN
+    UPDATE parameter_definitions_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_parameter_definitions_version_update
+AFTER UPDATE ON parameter_definitions
+BEGIN
+    UPDATE parameter_definitions_version SET version = version + 1 WHERE id = 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_parameter_definitions_version_delete
+AFTER DELETE ON parameter_definitions
+BEGIN
+    UPDATE parameter_definitions_version SET version = version + 1 WHERE id = 1;
+END;
@@ -1,9 +1,20 @@
 #!/usr/bin/env python3
 """
-Seed script for FCN v1.0 parameter definitions
+Seed script for FCN parameter definitions
 
-Extracts parameter definitions from fcn-v1.0-parameters.schema.json and
-populates the parameter_definitions table.
+Extracts parameter definitions from every FCN parameter schema version
+(fcn-v<major>.<minor>[.<patch>]-parameters.schema.json) and synchronizes the
+parameter_definitions table in one transaction:
+
+- Pending migrations in db/migrations are applied once, tracked in the
+  schema_version table.
+- Schema rows are diffed against the stored rows per
+  (product_type, spec_version, name); only inserts, updates and deletes are
+  written, so reruns against unchanged schemas write nothing.
+
+Schema sources, first match per version wins:
+- db/schemas/
+- docs/business/ba/products/structured-notes/fcn/schemas/
 
 Field Mapping:
 - name: property name from JSON schema
@@ -27,12 +38,26 @@ Type Mapping:
 """
 
 import json
+import re
 import sqlite3
 import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 
+PRODUCT_TYPE = 'fcn'
+
+SCHEMA_FILE_PATTERN = re.compile(r'^fcn-v(\d+)\.(\d+)(?:\.(\d+))?-parameters\.schema\.json$')
+
+# Column order of parameter tuples; (product_type, spec_version, name) is the key
+PARAMETER_COLUMNS = (
+    'name', 'data_type', 'required_flag', 'default_value', 'enum_domain',
+    'min_value', 'max_value', 'pattern', 'description', 'constraints',
+    'product_type', 'spec_version',
+)
+
+
 def get_canonical_type(prop: Dict[str, Any]) -> str:
     """
     Map JSON schema type to canonical database type.
@@ -176,12 +201,39 @@ def load_schema(schema_path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
-def extract_parameters(schema: Dict[str, Any]) -> List[Tuple]:
+def discover_schemas(schema_dirs: List[Path]) -> Dict[str, Path]:
+    """
+    Find parameter schemas by spec version.
+    
+    Args:
+        schema_dirs: Directories to search, in precedence order
+        
+    Returns:
+        Mapping of spec_version (e.g. '1.0.0') to schema path, sorted by version
+    """
+    found = {}
+    for schema_dir in schema_dirs:
+        if not schema_dir.is_dir():
+            continue
+        for path in sorted(schema_dir.glob('fcn-v*-parameters.schema.json')):
+            match = SCHEMA_FILE_PATTERN.match(path.name)
+            if not match:
+                continue
+            major, minor, patch = match.groups()
+            version = f"{major}.{minor}.{patch or 0}"
+            found.setdefault(version, path)
+    return dict(sorted(found.items(), key=lambda item: tuple(int(p) for p in item[0].split('.'))))
+
+
+def extract_parameters(schema: Dict[str, Any], product_type: str = PRODUCT_TYPE,
+                       spec_version: str = '1.0.0') -> List[Tuple]:
     """
     Extract parameter definitions from JSON schema.
     
     Args:
         schema: Parsed JSON schema
+        product_type: Product type identifier
+        spec_version: Spec version the schema describes
         
     Returns:
         List of tuples for database insertion
@@ -214,8 +266,8 @@ def extract_parameters(schema: Dict[str, Any]) -> List[Tuple]:
             pattern,
             description,
             constraints,
-            'fcn',  # product_type
-            '1.0.0'  # spec_version
+            product_type,
+            spec_version
         )
         
         parameters.append(param)
@@ -223,120 +275,196 @@ def extract_parameters(schema: Dict[str, Any]) -> List[Tuple]:
     return parameters
 
 
-def create_database(db_path: Path, migration_path: Path) -> sqlite3.Connection:
+def apply_migrations(db_path: Path, migrations_dir: Path) -> Tuple[sqlite3.Connection, List[str]]:
     """
-    Create database and run migration.
+    Open the database and apply migrations not yet recorded in schema_version.
+    
+    Each migration runs in its own transaction together with its
+    schema_version row, so a failed migration leaves no partial state.
     
     Args:
         db_path: Path to database file
-        migration_path: Path to migration SQL file
+        migrations_dir: Directory of m<NNNN>_*.sql migration files
         
     Returns:
-        Database connection
+        Tuple of (database connection, list of migration ids applied)
     """
     conn = sqlite3.connect(db_path)
-    
-    # Run migration
-    with open(migration_path, 'r', encoding='utf-8') as f:
-        migration_sql = f.read()
-    
-    conn.executescript(migration_sql)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            migration_id TEXT PRIMARY KEY,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
     conn.commit()
     
-    return conn
+    applied = {row[0] for row in conn.execute("SELECT migration_id FROM schema_version")}
+    newly_applied = []
+    
+    for migration_path in sorted(migrations_dir.glob('m*.sql')):
+        migration_id = migration_path.stem
+        if migration_id in applied:
+            continue
+        
+        with open(migration_path, 'r', encoding='utf-8') as f:
+            migration_sql = f.read()
+        
+        try:
+            conn.executescript(
+                "BEGIN;\n"
+                f"{migration_sql}\n"
+                f"INSERT INTO schema_version (migration_id) VALUES ('{migration_id}');\n"
+                "COMMIT;"
+            )
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        newly_applied.append(migration_id)
+    
+    return conn, newly_applied
+
+
+def _comparable(row: Tuple) -> Tuple:
+    """Normalize a parameter tuple so schema and database values compare equal."""
+    values = dict(zip(PARAMETER_COLUMNS, row))
+    values['required_flag'] = bool(values['required_flag'])
+    for column in ('min_value', 'max_value'):
+        if values[column] is not None:
+            values[column] = float(values[column])
+    return tuple(values[column] for column in PARAMETER_COLUMNS)
 
 
-def seed_parameters(conn: sqlite3.Connection, parameters: List[Tuple]) -> int:
+def seed_parameters(conn: sqlite3.Connection, parameters: List[Tuple],
+                    spec_versions: Optional[List[str]] = None) -> Dict[str, int]:
     """
-    Insert parameters into database.
+    Synchronize parameter_definitions with the schema-derived parameters.
+    
+    Rows are matched on (product_type, spec_version, name). Rows whose
+    spec version is being seeded but no longer appear in its schema are
+    deleted; other spec versions are left untouched.
     
     Args:
         conn: Database connection
         parameters: List of parameter tuples
+        spec_versions: Spec versions being seeded (default: those in parameters)
         
     Returns:
-        Number of rows inserted
-    """
-    cursor = conn.cursor()
-    
-    # Clear existing FCN v1.0 parameters
-    cursor.execute(
-        "DELETE FROM parameter_definitions WHERE product_type = ? AND spec_version = ?",
-        ('fcn', '1.0.0')
-    )
-    
-    # Insert parameters
-    insert_sql = """
-        INSERT INTO parameter_definitions (
-            name, data_type, required_flag, default_value, enum_domain,
-            min_value, max_value, pattern, description, constraints,
-            product_type, spec_version
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        Dict with inserted / updated / deleted / unchanged counts
     """
+    if spec_versions is None:
+        spec_versions = sorted({p[PARAMETER_COLUMNS.index('spec_version')] for p in parameters})
+    key_of = lambda row: (row[10], row[11], row[0])  # noqa: E731 (product_type, spec_version, name)
+    
+    desired = {key_of(p): p for p in parameters}
+    placeholders = ', '.join('?' for _ in spec_versions)
+    existing = {
+        key_of(row[1:]): (row[0], row[1:])
+        for row in conn.execute(
+            f"SELECT id, {', '.join(PARAMETER_COLUMNS)} FROM parameter_definitions "
+            f"WHERE spec_version IN ({placeholders})",
+            spec_versions,
+        )
+    }
     
-    cursor.executemany(insert_sql, parameters)
-    conn.commit()
-    
-    return cursor.rowcount
+    inserts = [p for key, p in desired.items() if key not in existing]
+    updates = [
+        p + (existing[key][0],)
+        for key, p in desired.items()
+        if key in existing and _comparable(p) != _comparable(existing[key][1])
+    ]
+    deletes = [(row_id,) for key, (row_id, _) in existing.items() if key not in desired]
+    
+    stats = {
+        'inserted': len(inserts),
+        'updated': len(updates),
+        'deleted': len(deletes),
+        'unchanged': len(desired) - len(inserts) - len(updates),
+    }
+    if not (inserts or updates or deletes):
+        return stats
+    
+    with conn:
+        if inserts:
+            conn.executemany(
+                f"INSERT INTO parameter_definitions ({', '.join(PARAMETER_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in PARAMETER_COLUMNS)})",
+                inserts,
+            )
+        if updates:
+            conn.executemany(
+                f"UPDATE parameter_definitions SET {', '.join(f'{c} = ?' for c in PARAMETER_COLUMNS)}, "
+                "updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                updates,
+            )
+        if deletes:
+            conn.executemany("DELETE FROM parameter_definitions WHERE id = ?", deletes)
+    
+    return stats
 
 
 def main():
     """Main entry point."""
+    start = time.perf_counter()
+    
     # Determine paths
     script_dir = Path(__file__).parent.resolve()
     repo_root = script_dir.parent.parent
-    schema_path = repo_root / 'db/schemas/fcn-v1.0-parameters.schema.json'
-    migration_path = repo_root / 'db/migrations/m0001_create_parameter_definitions.sql'
+    schema_dirs = [
+        repo_root / 'db/schemas',
+        repo_root / 'docs/business/ba/products/structured-notes/fcn/schemas',
+    ]
+    migrations_dir = repo_root / 'db/migrations'
     db_path = repo_root / 'db/fcn_parameters.db'
     
-    # Check if schema file exists
-    if not schema_path.exists():
-        print(f"Error: Schema file not found: {schema_path}", file=sys.stderr)
+    schemas = discover_schemas(schema_dirs)
+    if not schemas:
+        print(f"Error: No parameter schema files found in: {', '.join(str(d) for d in schema_dirs)}",
+              file=sys.stderr)
         sys.exit(1)
     
-    # Check if migration file exists
-    if not migration_path.exists():
-        print(f"Error: Migration file not found: {migration_path}", file=sys.stderr)
+    # Check if migrations exist
+    if not any(migrations_dir.glob('m*.sql')):
+        print(f"Error: No migration files found in: {migrations_dir}", file=sys.stderr)
         sys.exit(1)
     
-    print(f"Loading schema from: {schema_path}")
-    schema = load_schema(schema_path)
-    
-    print(f"Extracting parameters from schema...")
-    parameters = extract_parameters(schema)
-    print(f"  Found {len(parameters)} parameters")
+    parameters = []
+    for spec_version, schema_path in schemas.items():
+        schema = load_schema(schema_path)
+        version_parameters = extract_parameters(schema, PRODUCT_TYPE, spec_version)
+        print(f"Loaded {spec_version} schema: {schema_path.relative_to(repo_root)} "
+              f"({len(version_parameters)} parameters)")
+        parameters.extend(version_parameters)
     
-    print(f"\nCreating database and running migration: {migration_path}")
-    conn = create_database(db_path, migration_path)
+    conn, applied = apply_migrations(db_path, migrations_dir)
+    if applied:
+        print(f"\nApplied migrations: {', '.join(applied)}")
+    else:
+        print(f"\nDatabase schema up to date")
     
-    print(f"\nSeeding parameters into database: {db_path}")
-    rows_inserted = seed_parameters(conn, parameters)
-    print(f"  Inserted {rows_inserted} parameter definitions")
+    stats = seed_parameters(conn, parameters, list(schemas))
     
     # Display summary
     print("\n" + "="*60)
     print("SEED SUMMARY")
     print("="*60)
-    
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT name, data_type, required_flag, enum_domain, description
+    print(f"Inserted: {stats['inserted']}  Updated: {stats['updated']}  "
+          f"Deleted: {stats['deleted']}  Unchanged: {stats['unchanged']}")
+    print()
+    print(f"{'Spec Version':<15} {'Parameters':>10} {'Required':>10}")
+    print("-" * 37)
+    
+    cursor = conn.execute("""
+        SELECT spec_version, COUNT(*), SUM(required_flag)
         FROM parameter_definitions
-        WHERE product_type = 'fcn' AND spec_version = '1.0.0'
-        ORDER BY name
-    """)
-    
-    print(f"\n{'Name':<35} {'Type':<12} {'Req':<5} {'Enum':<20}")
-    print("-" * 80)
-    
-    for row in cursor.fetchall():
-        name, data_type, required_flag, enum_domain, description = row
-        req = 'Yes' if required_flag else 'No'
-        enum_str = enum_domain[:17] + '...' if enum_domain and len(enum_domain) > 20 else (enum_domain or '')
-        print(f"{name:<35} {data_type:<12} {req:<5} {enum_str:<20}")
+        WHERE product_type = ?
+        GROUP BY spec_version
+        ORDER BY spec_version
+    """, (PRODUCT_TYPE,))
+    for spec_version, count, required in cursor.fetchall():
+        print(f"{spec_version:<15} {count:>10} {required:>10}")
     
     print("\n" + "="*60)
-    print(f"Seed completed successfully!")
+    print(f"Seed completed successfully in {time.perf_counter() - start:.3f}s")
     print(f"Database: {db_path}")
     print("="*60)
     
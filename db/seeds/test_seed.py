@@ -7,6 +7,8 @@ Validates:
 2. Type mappings are correct
 3. Enum domains are properly formatted
 4. Constraints are captured
+5. FCN v1.1.0 definitions are seeded alongside v1.0
+6. Migrations are recorded in schema_version
 """
 
 import sqlite3
@@ -44,7 +46,7 @@ def test_seed():
     ]
     
     cursor.execute(
-        "SELECT name FROM parameter_definitions WHERE required_flag=1 AND product_type='fcn'"
+        "SELECT name FROM parameter_definitions WHERE required_flag=1 AND product_type='fcn' AND spec_version='1.0.0'"
     )
     found_required = {row[0] for row in cursor.fetchall()}
     
@@ -54,7 +56,7 @@ def test_seed():
     
     # Test 3: Check date types
     cursor.execute(
-        "SELECT name FROM parameter_definitions WHERE data_type='date' AND product_type='fcn'"
+        "SELECT name FROM parameter_definitions WHERE data_type='date' AND product_type='fcn' AND spec_version='1.0.0'"
     )
     date_params = {row[0] for row in cursor.fetchall()}
     expected_dates = {'trade_date', 'issue_date', 'maturity_date'}
@@ -63,7 +65,7 @@ def test_seed():
     
     # Test 4: Check enum parameters
     cursor.execute(
-        "SELECT name, enum_domain FROM parameter_definitions WHERE enum_domain IS NOT NULL AND product_type='fcn'"
+        "SELECT name, enum_domain FROM parameter_definitions WHERE enum_domain IS NOT NULL AND product_type='fcn' AND spec_version='1.0.0'"
     )
     enum_params = dict(cursor.fetchall())
     
@@ -85,7 +87,7 @@ def test_seed():
     # Test 5: Check numeric constraints
     cursor.execute(
         "SELECT name, min_value, max_value FROM parameter_definitions "
-        "WHERE name='knock_in_barrier_pct' AND product_type='fcn'"
+        "WHERE name='knock_in_barrier_pct' AND product_type='fcn' AND spec_version='1.0.0'"
     )
     row = cursor.fetchone()
     assert row, "knock_in_barrier_pct not found"
@@ -97,7 +99,7 @@ def test_seed():
     # Test 6: Check default values
     cursor.execute(
         "SELECT name, default_value FROM parameter_definitions "
-        "WHERE default_value IS NOT NULL AND product_type='fcn' "
+        "WHERE default_value IS NOT NULL AND product_type='fcn' AND spec_version='1.0.0' "
         "ORDER BY name"
     )
     defaults = dict(cursor.fetchall())
@@ -124,12 +126,31 @@ def test_seed():
     # Test 7: Check descriptions exist
     cursor.execute(
         "SELECT COUNT(*) FROM parameter_definitions "
-        "WHERE (description IS NULL OR description = '') AND product_type='fcn'"
+        "WHERE (description IS NULL OR description = '') AND product_type='fcn' AND spec_version='1.0.0'"
     )
     missing_desc = cursor.fetchone()[0]
     assert missing_desc == 0, f"{missing_desc} parameters missing descriptions"
     print(f"✓ Test 7: All parameters have descriptions")
     
+    # Test 8: Check FCN v1.1.0 definitions are seeded alongside v1.0
+    cursor.execute(
+        "SELECT name FROM parameter_definitions WHERE product_type='fcn' AND spec_version='1.1.0'"
+    )
+    v11_params = {row[0] for row in cursor.fetchall()}
+    for param in ('issuer', 'put_strike_pct', 'knock_out_barrier_pct', 'auto_call_observation_logic'):
+        assert param in v11_params, f"v1.1.0 parameter '{param}' not found"
+    print(f"✓ Test 8: FCN v1.1.0 parameters present ({len(v11_params)} parameters)")
+    
+    # Test 9: Check migrations are tracked
+    cursor.execute("SELECT migration_id FROM schema_version")
+    applied = {row[0] for row in cursor.fetchall()}
+    expected_migrations = {
+        'm0001_create_parameter_definitions',
+        'm0002_parameter_definitions_versioned_unique',
+    }
+    assert expected_migrations <= applied, f"Migrations not recorded: {expected_migrations - applied}"
+    print(f"✓ Test 9: Migrations recorded in schema_version")
+    
     conn.close()
     
     print("\n" + "="*60)
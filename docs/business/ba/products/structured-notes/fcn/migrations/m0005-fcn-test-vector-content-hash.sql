@@ -0,0 +1,20 @@
+-- Migration: m0005-fcn-test-vector-content-hash
+-- Description: Add content_hash to test_vector for incremental ingestion
+-- Author: siripong.s@yuanta.co.th
+-- Created: 2026-10-19
+-- Depends on: archive/m0001-fcn-baseline.sql .. archive/m0004-fcn-v1_1-capital-at-risk-recovery-mode.sql
+-- Database: PostgreSQL (legacy incremental chain)
+
+-- SQL Server environments apply sqlserver/m0014-fcn-test-vector-content-hash.sql instead.
+--
+-- validators/ingest_vectors.py upserts on vector_code and skips vectors whose
+-- SHA-256 content hash matches the stored one. Rows loaded before this
+-- migration have a NULL content_hash and are rewritten on the next ingestion.
+
+ALTER TABLE test_vector ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+
+COMMENT ON COLUMN test_vector.content_hash IS 'SHA-256 (hex) of the canonical vector JSON; NULL until next ingestion';
+
+INSERT INTO schema_migrations (migration_id, description)
+VALUES ('m0005_fcn_test_vector_content_hash', 'Add test_vector.content_hash for incremental ingestion')
+ON CONFLICT (migration_id) DO NOTHING;
@@ -0,0 +1,181 @@
+-- Migration: m0013-fcn-shelf-product-materialized
+-- Description: Materialized FCN shelf product table backing vw_fcn_shelf_product
+-- Author: siripong.s@yuanta.co.th
+-- Created: 2026-10-19
+-- Depends on: m0009-fcn-template-schema.sql (or fcn_schema_consolidated_v1_1.sql)
+-- Version: FCN v1.1+
+
+-- ============================================================================
+-- OVERVIEW
+-- ============================================================================
+-- vw_fcn_shelf_product (see data-warehouse/vw_fcn_shelf_product-dictionary.md)
+-- is a 1-row-per-template denormalization of fcn_template,
+-- fcn_template_underlying and fcn_template_observation_schedule. Computing it
+-- as a plain view re-runs the grouped aggregation on every BI query.
+--
+-- This migration stores the rows in a physical table, fcn_shelf_product,
+-- clustered on template_id. The table is maintained by
+-- data-warehouse/materialize_shelf_product.py, which re-materializes only
+-- templates whose fcn_template.updated_at differs from the stored
+-- source_updated_at. vw_fcn_shelf_product becomes a thin projection over the
+-- table so existing BI queries keep working.
+--
+-- SCOPE:
+-- - fcn_shelf_product: materialized rows (dictionary columns + refresh audit)
+-- - Touch triggers on fcn_template_underlying / fcn_template_observation_schedule
+--   so basket and schedule edits bump the parent template's updated_at
+-- - vw_fcn_shelf_product: projection over fcn_shelf_product
+-- ============================================================================
+
+-- ============================================================================
+-- 1. FCN_SHELF_PRODUCT TABLE
+-- ============================================================================
+
+IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'fcn_shelf_product' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE fcn_shelf_product (
+        template_id UNIQUEIDENTIFIER NOT NULL,
+        template_code NVARCHAR(100),
+        product_type NVARCHAR(20) NOT NULL DEFAULT 'fcn',
+        spec_version NVARCHAR(20) NOT NULL,
+        issuer NVARCHAR(64),
+        issuer_class NVARCHAR(20),
+
+        -- Basket and schedule aggregates
+        underlying_count INT NOT NULL,
+        underlying_symbols NVARCHAR(1000),
+        observation_count INT NOT NULL,
+        first_observation_date DATE,
+        last_observation_date DATE,
+        observation_frequency_months INT,
+
+        -- Coupon
+        coupon_rate_pct_period DECIMAL(9, 6),
+        coupon_rate_pct_annualized DECIMAL(9, 6),
+        coupon_condition_threshold_pct DECIMAL(9, 6),
+        is_memory_coupon BIT NOT NULL,
+        memory_carry_cap_count INT,
+
+        -- Barriers, autocall and settlement
+        knock_in_barrier_pct DECIMAL(9, 6),
+        put_strike_pct DECIMAL(9, 6),
+        knock_out_barrier_pct DECIMAL(9, 6),
+        auto_call_logic NVARCHAR(32),
+        barrier_monitoring_type NVARCHAR(20),
+        settlement_type NVARCHAR(50),
+        recovery_mode NVARCHAR(50),
+
+        -- Derived flags and classification
+        has_autocall_flag INT NOT NULL,
+        is_capital_at_risk_flag INT NOT NULL,
+        protection_buffer_pct DECIMAL(9, 6),
+        downside_slope_factor DECIMAL(9, 6),
+        risk_profile_bucket NVARCHAR(20) NOT NULL,
+        normative_coupon_flag INT NOT NULL,
+
+        status NVARCHAR(20),
+        currency NVARCHAR(3),
+        created_at DATETIME2,
+        updated_at DATETIME2,
+        data_quality_warnings NVARCHAR(500),
+
+        -- Refresh audit
+        source_updated_at DATETIME2 NOT NULL,
+        materialized_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
+
+        CONSTRAINT pk_fcn_shelf_product PRIMARY KEY CLUSTERED (template_id)
+    );
+
+    CREATE INDEX idx_fcn_shelf_product_spec_status ON fcn_shelf_product(spec_version, status);
+    CREATE INDEX idx_fcn_shelf_product_risk_bucket ON fcn_shelf_product(risk_profile_bucket);
+END
+GO
+
+EXEC sys.sp_addextendedproperty
+    @name = N'MS_Description',
+    @value = N'Materialized FCN shelf product rows (1 per template) backing vw_fcn_shelf_product',
+    @level0type = N'SCHEMA', @level0name = N'dbo',
+    @level1type = N'TABLE', @level1name = N'fcn_shelf_product';
+GO
+
+-- ============================================================================
+-- 2. TOUCH TRIGGERS
+-- ============================================================================
+-- Incremental refresh keys on fcn_template.updated_at; child table edits must
+-- move it too or the materialized aggregates go stale.
+
+IF OBJECT_ID('dbo.trg_FCN_TemplateUnderlyingTouch', 'TR') IS NOT NULL
+    DROP TRIGGER dbo.trg_FCN_TemplateUnderlyingTouch;
+GO
+
+CREATE TRIGGER dbo.trg_FCN_TemplateUnderlyingTouch
+ON dbo.fcn_template_underlying
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    UPDATE t
+    SET updated_at = GETDATE()
+    FROM fcn_template t
+    WHERE t.template_id IN (
+        SELECT template_id FROM inserted
+        UNION
+        SELECT template_id FROM deleted
+    );
+END
+GO
+
+IF OBJECT_ID('dbo.trg_FCN_TemplateObservationTouch', 'TR') IS NOT NULL
+    DROP TRIGGER dbo.trg_FCN_TemplateObservationTouch;
+GO
+
+CREATE TRIGGER dbo.trg_FCN_TemplateObservationTouch
+ON dbo.fcn_template_observation_schedule
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    UPDATE t
+    SET updated_at = GETDATE()
+    FROM fcn_template t
+    WHERE t.template_id IN (
+        SELECT template_id FROM inserted
+        UNION
+        SELECT template_id FROM deleted
+    );
+END
+GO
+
+-- ============================================================================
+-- 3. VW_FCN_SHELF_PRODUCT
+-- ============================================================================
+
+IF OBJECT_ID('dbo.vw_fcn_shelf_product', 'V') IS NOT NULL
+    DROP VIEW dbo.vw_fcn_shelf_product;
+GO
+
+CREATE VIEW dbo.vw_fcn_shelf_product
+AS
+SELECT
+    template_id, template_code, product_type, spec_version, issuer, issuer_class,
+    underlying_count, underlying_symbols, observation_count,
+    first_observation_date, last_observation_date, observation_frequency_months,
+    coupon_rate_pct_period, coupon_rate_pct_annualized, coupon_condition_threshold_pct,
+    is_memory_coupon, memory_carry_cap_count,
+    knock_in_barrier_pct, put_strike_pct, knock_out_barrier_pct, auto_call_logic,
+    barrier_monitoring_type, settlement_type, recovery_mode,
+    has_autocall_flag, is_capital_at_risk_flag, protection_buffer_pct,
+    downside_slope_factor, risk_profile_bucket, normative_coupon_flag,
+    status, currency, created_at, updated_at, data_quality_warnings
+FROM dbo.fcn_shelf_product;
+GO
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+-- - Idempotent (safe to run multiple times)
+-- - Populate with: python data-warehouse/materialize_shelf_product.py --full
+-- - Schedule incremental refresh (no --full) after template maintenance
+-- ============================================================================
@@ -0,0 +1,207 @@
+-- Migration: m0014-fcn-test-vector-content-hash
+-- Description: Test vector linkage tables with a content hash for incremental ingestion
+-- Author: siripong.s@yuanta.co.th
+-- Created: 2026-10-19
+-- Depends on: fcn_schema_consolidated_v1_1.sql
+-- Version: FCN v1.1+
+
+-- ============================================================================
+-- OVERVIEW
+-- ============================================================================
+-- The test vector linkage model (product, product_version, branch and
+-- test_vector) is documented in archive/m0001-fcn-baseline.sql section 7 but
+-- was never carried into the SQL Server schema. This migration creates it
+-- with the same keys and constraints, and adds test_vector.content_hash.
+--
+-- validators/ingest_vectors.py upserts on vector_code. It compares each
+-- vector's SHA-256 content hash with the stored one, skips unchanged
+-- vectors and rewrites changed ones. Rows loaded before this migration have
+-- a NULL content_hash and are rewritten on the next ingestion.
+--
+-- SCOPE:
+-- - product, product_version, branch: created if missing, seeded for FCN
+--   v1.0.0 / v1.1.0 (same rows as archive m0001-m0003)
+-- - test_vector: created if missing (archive m0001 section 7)
+-- - test_vector.content_hash: added if missing
+--
+-- PostgreSQL environments on the legacy m0001-m0004 chain apply
+-- ../m0005-fcn-test-vector-content-hash.sql instead.
+-- ============================================================================
+
+-- ============================================================================
+-- 1. PRODUCT CATALOG
+-- ============================================================================
+
+IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'product' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE product (
+        product_id UNIQUEIDENTIFIER NOT NULL DEFAULT NEWID(),
+        product_code NVARCHAR(50) NOT NULL,
+        product_name NVARCHAR(200) NOT NULL,
+        product_family NVARCHAR(100) NOT NULL,
+        spec_version NVARCHAR(20) NOT NULL,
+        status NVARCHAR(20) NOT NULL,
+        owner NVARCHAR(200) NOT NULL,
+        created_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
+        updated_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
+
+        CONSTRAINT PK_product PRIMARY KEY (product_id),
+        CONSTRAINT UQ_product_code UNIQUE (product_code),
+        CONSTRAINT CK_product_status CHECK (status IN ('Proposed', 'Active', 'Deprecated', 'Removed'))
+    );
+    PRINT 'Created table: product';
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'product_version' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE product_version (
+        version_id UNIQUEIDENTIFIER NOT NULL DEFAULT NEWID(),
+        product_id UNIQUEIDENTIFIER NOT NULL,
+        version NVARCHAR(20) NOT NULL,
+        status NVARCHAR(20) NOT NULL,
+        spec_file_path NVARCHAR(400) NOT NULL,
+        parameter_schema_path NVARCHAR(400) NOT NULL,
+        activation_checklist_ref NVARCHAR(400),
+        release_date DATE,
+        deprecated_date DATE,
+        created_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
+        updated_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
+
+        CONSTRAINT PK_product_version PRIMARY KEY (version_id),
+        CONSTRAINT FK_product_version_product FOREIGN KEY (product_id)
+            REFERENCES product(product_id) ON DELETE CASCADE,
+        CONSTRAINT UQ_product_version UNIQUE (product_id, version),
+        CONSTRAINT CK_product_version_status CHECK (status IN ('Proposed', 'Active', 'Deprecated', 'Removed'))
+    );
+    PRINT 'Created table: product_version';
+END
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'branch' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    -- product_id is reachable through version_id; a second cascading path
+    -- from product is not allowed on SQL Server, so it is NO ACTION here
+    CREATE TABLE branch (
+        branch_id UNIQUEIDENTIFIER NOT NULL DEFAULT NEWID(),
+        product_id UNIQUEIDENTIFIER NOT NULL,
+        version_id UNIQUEIDENTIFIER NOT NULL,
+        branch_code NVARCHAR(100) NOT NULL,
+        description NVARCHAR(MAX) NOT NULL,
+        barrier_type NVARCHAR(50) NOT NULL,
+        settlement NVARCHAR(50) NOT NULL,
+        coupon_memory NVARCHAR(50) NOT NULL,
+        step_feature NVARCHAR(50) NOT NULL,
+        recovery_mode NVARCHAR(50) NOT NULL,
+        created_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
+
+        CONSTRAINT PK_branch PRIMARY KEY (branch_id),
+        CONSTRAINT FK_branch_product FOREIGN KEY (product_id) REFERENCES product(product_id),
+        CONSTRAINT FK_branch_version FOREIGN KEY (version_id)
+            REFERENCES product_version(version_id) ON DELETE CASCADE,
+        CONSTRAINT UQ_branch_code UNIQUE (product_id, version_id, branch_code)
+    );
+    PRINT 'Created table: branch';
+END
+GO
+
+-- ============================================================================
+-- 2. TEST_VECTOR TABLE
+-- ============================================================================
+
+IF NOT EXISTS (SELECT * FROM sys.tables WHERE name = 'test_vector' AND schema_id = SCHEMA_ID('dbo'))
+BEGIN
+    CREATE TABLE test_vector (
+        vector_id UNIQUEIDENTIFIER NOT NULL DEFAULT NEWID(),
+        product_id UNIQUEIDENTIFIER NOT NULL,
+        version_id UNIQUEIDENTIFIER NOT NULL,
+        branch_id UNIQUEIDENTIFIER NULL,
+        vector_code NVARCHAR(200) NOT NULL,
+        description NVARCHAR(MAX) NOT NULL,
+        normative BIT NOT NULL DEFAULT 0,
+        parameters_json NVARCHAR(MAX) NOT NULL,
+        market_scenario_json NVARCHAR(MAX),
+        expected_outputs_json NVARCHAR(MAX) NOT NULL,
+        tags NVARCHAR(MAX),                            -- JSON array (TEXT[] on PostgreSQL)
+        created_at DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
+
+        CONSTRAINT PK_test_vector PRIMARY KEY (vector_id),
+        CONSTRAINT FK_test_vector_product FOREIGN KEY (product_id) REFERENCES product(product_id),
+        CONSTRAINT FK_test_vector_version FOREIGN KEY (version_id)
+            REFERENCES product_version(version_id) ON DELETE CASCADE,
+        CONSTRAINT FK_test_vector_branch FOREIGN KEY (branch_id) REFERENCES branch(branch_id),
+        CONSTRAINT UQ_test_vector_code UNIQUE (vector_code),
+        CONSTRAINT CK_test_vector_parameters_json CHECK (ISJSON(parameters_json) = 1),
+        CONSTRAINT CK_test_vector_expected_outputs_json CHECK (ISJSON(expected_outputs_json) = 1)
+    );
+
+    CREATE INDEX IX_test_vector_product_version ON test_vector(product_id, version_id);
+    CREATE INDEX IX_test_vector_normative ON test_vector(normative);
+
+    PRINT 'Created table: test_vector';
+END
+GO
+
+-- ============================================================================
+-- 3. CONTENT HASH
+-- ============================================================================
+
+IF COL_LENGTH('dbo.test_vector', 'content_hash') IS NULL
+BEGIN
+    -- SHA-256 (hex) of the vector's canonical JSON; NULL until next ingestion
+    ALTER TABLE test_vector ADD content_hash CHAR(64) NULL;
+    PRINT 'Added column: test_vector.content_hash';
+END
+GO
+
+-- ============================================================================
+-- 4. SEED DATA - FCN v1.0.0 / v1.1.0
+-- ============================================================================
+
+IF NOT EXISTS (SELECT 1 FROM product WHERE product_code = 'FCN')
+    INSERT INTO product (product_code, product_name, product_family, spec_version, status, owner)
+    VALUES ('FCN', 'Fixed Coupon Note', 'structured-notes', '1.1.0', 'Proposed', 'siripong.s@yuanta.co.th');
+GO
+
+INSERT INTO product_version (product_id, version, status, spec_file_path, parameter_schema_path, activation_checklist_ref)
+SELECT p.product_id, v.version, 'Proposed', v.spec_file_path, v.parameter_schema_path, v.activation_checklist_ref
+FROM product p
+CROSS JOIN (VALUES
+    ('1.0.0', 'specs/fcn-v1.0.md', 'schemas/fcn-v1.0-parameters.schema.json', 'specs/_activation-checklist-template.md'),
+    ('1.1.0', 'specs/fcn-v1.1.0.md', 'schemas/fcn-v1.1.0-parameters.schema.json', 'specs/_activation-checklist-v1.1.0.md')
+) AS v(version, spec_file_path, parameter_schema_path, activation_checklist_ref)
+WHERE p.product_code = 'FCN'
+  AND NOT EXISTS (SELECT 1 FROM product_version pv WHERE pv.product_id = p.product_id AND pv.version = v.version);
+GO
+
+INSERT INTO branch (product_id, version_id, branch_code, description, barrier_type, settlement,
+                    coupon_memory, step_feature, recovery_mode)
+SELECT p.product_id, pv.version_id, b.branch_code, b.description, 'down-in', 'physical-settlement',
+       b.coupon_memory, b.step_feature, b.recovery_mode
+FROM product p
+JOIN product_version pv ON pv.product_id = p.product_id
+JOIN (VALUES
+    ('1.0.0', 'fcn-base-mem', 'Memory coupon, par-recovery, physical settlement', 'memory', 'no-step', 'par-recovery'),
+    ('1.0.0', 'fcn-base-nomem', 'No-memory coupon, par-recovery, physical settlement', 'no-memory', 'no-step', 'par-recovery'),
+    ('1.0.0', 'fcn-base-mem-proploss', 'Memory coupon, proportional-loss, physical settlement', 'memory', 'no-step', 'proportional-loss'),
+    ('1.1.0', 'fcn-base-nomem-autocall', 'No-memory coupon, autocall enabled, par-recovery, physical settlement', 'no-memory', 'autocall', 'par-recovery'),
+    ('1.1.0', 'fcn-caprisk-nomem', 'No-memory coupon, capital-at-risk settlement, physical settlement', 'no-memory', 'no-step', 'capital-at-risk'),
+    ('1.1.0', 'fcn-caprisk-mem', 'Memory coupon, capital-at-risk settlement, physical settlement', 'memory', 'no-step', 'capital-at-risk'),
+    ('1.1.0', 'fcn-caprisk-nomem-autocall', 'No-memory coupon, capital-at-risk settlement, autocall enabled, physical settlement', 'no-memory', 'autocall', 'capital-at-risk')
+) AS b(version, branch_code, description, coupon_memory, step_feature, recovery_mode)
+    ON b.version = pv.version
+WHERE p.product_code = 'FCN'
+  AND NOT EXISTS (
+      SELECT 1 FROM branch x
+      WHERE x.product_id = p.product_id AND x.version_id = pv.version_id AND x.branch_code = b.branch_code
+  );
+GO
+
+-- ============================================================================
+-- NOTES
+-- ============================================================================
+-- - Idempotent (safe to run multiple times)
+-- - Load vectors with: python validators/ingest_vectors.py test-vectors/ "<SQLAlchemy URL>"
+-- - Vectors are linked by spec_version (product_version.version) and
+--   branch_id (branch.branch_code, e.g. base_mem -> fcn-base-mem)
+-- ============================================================================
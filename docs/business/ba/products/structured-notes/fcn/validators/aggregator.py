@@ -9,21 +9,99 @@ Usage:
     python aggregator.py <fcn_base_directory> [--output <report_file>]
 """
 
+import argparse
+import contextlib
+import importlib.util
+import io
+import multiprocessing
 import sys
 import subprocess
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import Corpus
+from incremental import IncrementalCache, validator_version
+
+
+# Phase table: validator script plus its CLI arguments relative to the FCN base dir
+PHASES = [
+    {'phase': 0, 'name': 'Metadata & Document Structure', 'script': 'metadata_validator.py',
+     'args': lambda base: [str(base / 'specs')]},
+    {'phase': 1, 'name': 'Taxonomy & Branch Conformance', 'script': 'taxonomy_validator.py',
+     'args': lambda base: [str(base)]},
+    {'phase': 2, 'name': 'Parameter Schema Conformance', 'script': 'parameter_validator.py',
+     'args': lambda base: [str(base / 'schemas' / 'fcn-v1.0-parameters.schema.json'), str(base / 'test-vectors')]},
+    {'phase': 3, 'name': 'Test Vector Coverage', 'script': 'coverage_validator.py',
+     'args': lambda base: [str(base)]},
+    {'phase': 4, 'name': 'Payoff & Lifecycle Logic', 'script': 'logic_validator.py',
+     'args': lambda base: [str(base / 'test-vectors')]},
+]
+
+# Promotion gates: Production readiness (Phase 3) only counts once the
+# Proposed -> Active gate (Phase 0-2) has passed. All other phases are independent.
+PHASE_DEPENDENCIES = {3: (0, 1, 2)}
+
+# Watch mode: files that can affect a validation result
+WATCH_SUFFIXES = {'.md', '.yaml', '.yml', '.json', '.py'}
+
+
+class ThreadOutput(io.TextIOBase):
+    """stdout proxy that routes writes to a per-thread capture buffer."""
+    
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._fallback).write(text)
+    
+    def flush(self):
+        self._fallback.flush()
+    
+    @contextlib.contextmanager
+    def capture(self):
+        """Capture everything this thread prints into a StringIO."""
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            self._local.buffer = None
+
+
+# Aggregator inherited by forked pool workers (process executor)
+_FORKED_AGGREGATOR = None
+
+
+def _run_phase_forked(phase_num: int) -> Dict:
+    """Process-pool entry point; runs against the corpus parsed before fork."""
+    return _FORKED_AGGREGATOR.run_phase(phase_num)
 
 
 class ValidatorAggregator:
     """Aggregates results from all validator phases."""
     
-    def __init__(self, fcn_base_dir: Path):
+    def __init__(self, fcn_base_dir: Path, mode: str = 'in-process', workers: Optional[int] = None,
+                 executor: str = 'thread', gated: bool = False, incremental: bool = False):
         self.fcn_base_dir = fcn_base_dir
         self.validators_dir = fcn_base_dir / 'validators'
+        self.mode = mode
+        self.workers = workers or len(PHASES)
+        self.executor = executor
+        self.gated = gated
+        self.corpus = Corpus(fcn_base_dir)
+        self.incremental = IncrementalCache(self.corpus) if incremental else None
         self.results = {}
+        self.timings = {}
         self.start_time = datetime.now()
+        self._modules = {}
+        self._modules_lock = threading.Lock()
     
     def run_validator(self, script_name: str, args: List[str]) -> Tuple[int, str]:
         """Run a single validator script."""
@@ -34,6 +112,8 @@ class ValidatorAggregator:
         
         try:
             cmd = [sys.executable, str(script_path)] + args
+            if self.incremental is not None:
+                cmd.append('--incremental')
             result = subprocess.run(
                 cmd,
                 capture_output=True,
@@ -47,114 +127,311 @@ class ValidatorAggregator:
         except Exception as e:
             return -1, f"Failed to run validator: {e}"
     
-    def run_phase_0(self) -> Dict:
-        """Run Phase 0: Metadata & Document Structure."""
-        print("\n" + "="*70)
-        print("Phase 0: Metadata & Document Structure")
-        print("="*70)
+    def _load_module(self, script_name: str):
+        """Import a validator script as a module (once per aggregator)."""
+        with self._modules_lock:
+            if script_name not in self._modules:
+                script_path = self.validators_dir / script_name
+                spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self._modules[script_name] = module
+            return self._modules[script_name]
+    
+    def run_validator_in_process(self, script_name: str, args: List[str]) -> Tuple[int, str]:
+        """
+        Run a validator's run() function against the shared corpus.
         
-        specs_dir = self.fcn_base_dir / 'specs'
-        returncode, output = self.run_validator('metadata_validator.py', [str(specs_dir)])
+        Falls back to the subprocess runner if the script cannot be imported
+        (e.g. a missing optional dependency that exits at import time).
+        """
+        if not (self.validators_dir / script_name).exists():
+            return -1, f"Validator script not found: {self.validators_dir / script_name}"
         
-        print(output)
+        try:
+            module = self._load_module(script_name)
+        except (ImportError, SystemExit):
+            return self.run_validator(script_name, args)
         
-        return {
-            'phase': 0,
-            'name': 'Metadata & Document Structure',
-            'passed': returncode == 0,
-            'output': output
-        }
-    
-    def run_phase_1(self) -> Dict:
-        """Run Phase 1: Taxonomy & Branch Conformance."""
-        print("\n" + "="*70)
-        print("Phase 1: Taxonomy & Branch Conformance")
-        print("="*70)
+        stdout = sys.stdout
+        capture = stdout.capture() if isinstance(stdout, ThreadOutput) else None
+        if capture is None:
+            capture = contextlib.redirect_stdout(io.StringIO())
         
-        returncode, output = self.run_validator('taxonomy_validator.py', [str(self.fcn_base_dir)])
+        with capture as buffer:
+            try:
+                returncode = module.run(args, corpus=self.corpus, incremental=self.incremental)
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                print(f"Failed to run validator: {e}")
+                returncode = -1
         
-        print(output)
+        return returncode, buffer.getvalue()
+    
+    def run_phase(self, phase_num: int) -> Dict:
+        """Run one phase in the configured mode and time it."""
+        spec = PHASES[phase_num]
+        args = spec['args'](self.fcn_base_dir)
+        
+        started = time.perf_counter()
+        if self.mode == 'subprocess':
+            returncode, output = self.run_validator(spec['script'], args)
+        else:
+            returncode, output = self.run_validator_in_process(spec['script'], args)
         
         return {
-            'phase': 1,
-            'name': 'Taxonomy & Branch Conformance',
+            'phase': phase_num,
+            'name': spec['name'],
             'passed': returncode == 0,
-            'output': output
+            'output': output,
+            'elapsed': time.perf_counter() - started
         }
     
-    def run_phase_2(self) -> Dict:
-        """Run Phase 2: Parameter Schema Conformance."""
+    def _skipped(self, phase_num: int, reason: str) -> Dict:
+        """Result for a phase not run because its gate prerequisites failed."""
+        return {
+            'phase': phase_num,
+            'name': PHASES[phase_num]['name'],
+            'passed': False,
+            'skipped': True,
+            'output': f"Skipped: {reason}\n",
+            'elapsed': 0.0
+        }
+    
+    def print_phase(self, result: Dict):
+        """Print a phase header and its captured output."""
         print("\n" + "="*70)
-        print("Phase 2: Parameter Schema Conformance")
+        print(f"Phase {result['phase']}: {result['name']}")
         print("="*70)
+        print(result['output'])
+    
+    def run_phase_0(self) -> Dict:
+        """Run Phase 0: Metadata & Document Structure."""
+        result = self.run_phase(0)
+        self.print_phase(result)
+        return result
+    
+    def run_phase_1(self) -> Dict:
+        """Run Phase 1: Taxonomy & Branch Conformance."""
+        result = self.run_phase(1)
+        self.print_phase(result)
+        return result
+    
+    def run_phase_2(self) -> Dict:
+        """Run Phase 2: Parameter Schema Conformance."""
+        result = self.run_phase(2)
+        self.print_phase(result)
+        return result
+    
+    def run_phase_3(self) -> Dict:
+        """Run Phase 3: Test Vector Coverage."""
+        result = self.run_phase(3)
+        self.print_phase(result)
+        return result
+    
+    def run_phase_4(self) -> Dict:
+        """Run Phase 4: Payoff & Lifecycle Logic."""
+        result = self.run_phase(4)
+        self.print_phase(result)
+        return result
+    
+    def load_corpus(self):
+        """Parse the shared corpus (specs, test vectors, manifest) once."""
+        started = time.perf_counter()
+        self.corpus.preload(self.fcn_base_dir / 'specs', self.fcn_base_dir / 'test-vectors')
+        manifest_path = self.fcn_base_dir / 'manifest.yaml'
+        if manifest_path.exists():
+            try:
+                self.corpus.load_yaml(manifest_path)
+            except Exception:
+                pass  # reported by the phases that need it
+        self.timings['corpus'] = time.perf_counter() - started
+    
+    def _make_executor(self):
+        """Create the pool for in-process mode."""
+        global _FORKED_AGGREGATOR
         
-        schema_path = self.fcn_base_dir / 'schemas' / 'fcn-v1.0-parameters.schema.json'
-        test_vectors_dir = self.fcn_base_dir / 'test-vectors'
+        if self.executor == 'process' and 'fork' in multiprocessing.get_all_start_methods():
+            # Workers inherit the parsed corpus via fork instead of re-parsing
+            _FORKED_AGGREGATOR = self
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context('fork')
+            ), _run_phase_forked
         
-        returncode, output = self.run_validator(
-            'parameter_validator.py',
-            [str(schema_path), str(test_vectors_dir)]
-        )
+        return ThreadPoolExecutor(max_workers=self.workers), self.run_phase
+    
+    def run_all(self) -> List[Dict]:
+        """Run all validator phases."""
+        started = time.perf_counter()
         
-        print(output)
+        if self.mode == 'subprocess':
+            phases = [self.run_phase(spec['phase']) for spec in PHASES]
+        else:
+            self.load_corpus()
+            phases = self._run_in_process([spec['phase'] for spec in PHASES])
         
-        return {
-            'phase': 2,
-            'name': 'Parameter Schema Conformance',
-            'passed': returncode == 0,
-            'output': output
-        }
-    
-    def run_phase_3(self) -> Dict:
-        """Run Phase 3: Test Vector Coverage."""
-        print("\n" + "="*70)
-        print("Phase 3: Test Vector Coverage")
-        print("="*70)
+        for result in phases:
+            self.print_phase(result)
         
-        returncode, output = self.run_validator('coverage_validator.py', [str(self.fcn_base_dir)])
+        self.timings['total'] = time.perf_counter() - started
+        self.results = {p['phase']: p for p in phases}
         
-        print(output)
+        if self.incremental is not None and self.mode != 'subprocess':
+            self.incremental.save()
+        return phases
+    
+    def _run_in_process(self, phase_nums: List[int]) -> List[Dict]:
+        """Run the given phases concurrently against the shared corpus."""
+        selected = set(phase_nums)
+        dependencies = {
+            phase: prereqs for phase, prereqs in PHASE_DEPENDENCIES.items() if phase in selected
+        } if self.gated else {}
+        original_stdout = sys.stdout
+        sys.stdout = ThreadOutput(original_stdout)
+        try:
+            pool, job = self._make_executor()
+            with pool:
+                futures: Dict[int, Future] = {
+                    phase: pool.submit(job, phase)
+                    for phase in sorted(selected) if phase not in dependencies
+                }
+                
+                results = {}
+                for phase_num in sorted(dependencies):
+                    # Prerequisites not re-run this time keep their previous result
+                    prerequisites = [
+                        futures[p].result() if p in futures else self.results.get(p, {'phase': p, 'passed': False})
+                        for p in dependencies[phase_num]
+                    ]
+                    failed = [str(r['phase']) for r in prerequisites if not r['passed']]
+                    if failed:
+                        results[phase_num] = self._skipped(
+                            phase_num, f"gate prerequisite phase(s) {', '.join(failed)} failed"
+                        )
+                    else:
+                        futures[phase_num] = pool.submit(job, phase_num)
+                
+                for phase_num, future in futures.items():
+                    results[phase_num] = future.result()
+        finally:
+            sys.stdout = original_stdout
         
-        return {
-            'phase': 3,
-            'name': 'Test Vector Coverage',
-            'passed': returncode == 0,
-            'output': output
-        }
+        return [results[phase] for phase in sorted(selected)]
     
-    def run_phase_4(self) -> Dict:
-        """Run Phase 4: Payoff & Lifecycle Logic."""
-        print("\n" + "="*70)
-        print("Phase 4: Payoff & Lifecycle Logic")
-        print("="*70)
+    def snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """Map every watched file under the base dir to (mtime_ns, size)."""
+        state = {}
+        for path in self.fcn_base_dir.rglob('*'):
+            if path.suffix not in WATCH_SUFFIXES or '__pycache__' in path.parts:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            state[path.resolve()] = (stat.st_mtime_ns, stat.st_size)
+        return state
+    
+    def affected_phases(self, changed: List[Path]) -> List[int]:
+        """Return the phases whose inputs include any of the changed files."""
+        base = self.fcn_base_dir.resolve()
+        vectors_dir = base / 'test-vectors'
+        phases = set()
         
-        test_vectors_dir = self.fcn_base_dir / 'test-vectors'
+        for path in changed:
+            if path.parent == self.validators_dir.resolve():
+                return [spec['phase'] for spec in PHASES]
+            if path.parent == vectors_dir:
+                phases.update((1, 2, 3, 4))
+            elif path == base / 'manifest.yaml':
+                phases.update((1, 3))
+            elif path.parent in (base / 'schemas', base / 'data'):
+                phases.add(2)
+            elif base / 'specs' in path.parents:
+                phases.add(0)
+            
+            if path.suffix == '.md' and path.parent != vectors_dir:
+                # Vectors linking the document via related: need Phase 2/4 re-checks
+                for vector in vectors_dir.glob('*.md'):
+                    if self.incremental and path in self.incremental.related_paths(vector):
+                        phases.update((2, 4))
+                        break
         
-        returncode, output = self.run_validator(
-            'memory_logic_validator.py',
-            [str(test_vectors_dir)]
-        )
+        return sorted(phases)
+    
+    def watch(self, interval: float = 0.5, debounce: float = 0.3):
+        """
+        Re-run affected phases whenever watched files change (Ctrl+C to stop).
         
-        print(output)
+        Keeps the corpus, imported validators, compiled schemas and issuer
+        whitelist warm between runs. Changes are detected by polling
+        mtimes; a burst of saves is coalesced until the tree has been quiet
+        for `debounce` seconds.
+        """
+        self.mode = 'in-process'
+        self.executor = 'thread'
+        if self.incremental is None:
+            self.incremental = IncrementalCache(self.corpus)
         
-        return {
-            'phase': 4,
-            'name': 'Payoff & Lifecycle Logic',
-            'passed': returncode == 0,
-            'output': output
-        }
+        self.run_all()
+        print(self.generate_summary())
+        previous = self.snapshot()
+        print(f"👀 Watching {self.fcn_base_dir} (Ctrl+C to stop)")
+        
+        try:
+            while True:
+                time.sleep(interval)
+                current = self.snapshot()
+                if current == previous:
+                    continue
+                
+                # Debounce: wait for the editor to finish writing
+                while True:
+                    time.sleep(debounce)
+                    latest = self.snapshot()
+                    if latest == current:
+                        break
+                    current = latest
+                
+                changed = sorted(p for p in set(previous) | set(current) if previous.get(p) != current.get(p))
+                previous = current
+                self.run_changed(changed)
+        except KeyboardInterrupt:
+            print("\nStopping watch")
+        finally:
+            self.incremental.save()
     
-    def run_all(self) -> List[Dict]:
-        """Run all validator phases."""
-        phases = [
-            self.run_phase_0(),
-            self.run_phase_1(),
-            self.run_phase_2(),
-            self.run_phase_3(),
-            self.run_phase_4()
-        ]
+    def run_changed(self, changed: List[Path]) -> List[Dict]:
+        """Invalidate changed files and re-run only the affected phases."""
+        started = time.perf_counter()
         
-        self.results = {p['phase']: p for p in phases}
+        for path in changed:
+            self.corpus.invalidate(path)
+        if any(path.parent == self.validators_dir.resolve() for path in changed):
+            # Re-import edited validators; the new sources also change the cache version
+            with self._modules_lock:
+                self._modules.clear()
+            self.incremental.version = validator_version()
+        self.incremental.reset()
+        
+        phase_nums = self.affected_phases(changed)
+        print(f"\n🔄 {datetime.now().strftime('%H:%M:%S')} changed: "
+              + ", ".join(str(p.relative_to(self.fcn_base_dir.resolve())) for p in changed))
+        if not phase_nums:
+            print("   No validation phases affected")
+            return []
+        
+        phases = self._run_in_process(phase_nums)
+        for result in phases:
+            self.print_phase(result)
+            self.results[result['phase']] = result
+        self.incremental.save()
+        
+        for result in phases:
+            status = "✅ PASS" if result['passed'] else "❌ FAIL"
+            print(f"   Phase {result['phase']}: {result['name']} - {status} ({result['elapsed']:.3f}s)")
+        print(f"   {self.incremental.summary()} in {time.perf_counter() - started:.3f}s")
         return phases
     
     def generate_summary(self) -> str:
@@ -165,6 +442,7 @@ class ValidatorAggregator:
         lines.append("FCN v1.0 Validator Aggregation Report")
         lines.append("="*70)
         lines.append(f"Execution time: {elapsed:.2f}s")
+        lines.append(f"Mode: {self.mode}" + (f" ({self.executor} pool, {self.workers} workers)" if self.mode != 'subprocess' else ""))
         lines.append(f"Timestamp: {datetime.now().isoformat()}")
         lines.append("")
         
@@ -176,8 +454,16 @@ class ValidatorAggregator:
         
         for phase_num in sorted(self.results.keys()):
             result = self.results[phase_num]
-            status = "✅ PASS" if result['passed'] else "❌ FAIL"
-            lines.append(f"Phase {phase_num}: {result['name']} - {status}")
+            if result.get('skipped'):
+                status = "⏭️  SKIPPED"
+            else:
+                status = "✅ PASS" if result['passed'] else "❌ FAIL"
+            lines.append(f"Phase {phase_num}: {result['name']} - {status} ({result.get('elapsed', 0.0):.3f}s)")
+        
+        if 'corpus' in self.timings:
+            lines.append(f"Corpus load: {self.timings['corpus']:.3f}s ({len(self.corpus)} documents)")
+        if self.incremental is not None and self.mode != 'subprocess':
+            lines.append(self.incremental.summary())
         
         lines.append("="*70)
         
@@ -219,28 +505,47 @@ class ValidatorAggregator:
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python aggregator.py <fcn_base_directory> [--output <report_file>]")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Run all FCN validators and generate a consolidated report")
+    parser.add_argument('fcn_base_dir', type=Path, help="FCN base directory")
+    parser.add_argument('--output', type=Path, help="Report file (default: <fcn_base_dir>/validation-report.txt)")
+    parser.add_argument('--mode', choices=['in-process', 'subprocess'], default='in-process',
+                        help="in-process: shared corpus, concurrent phases; subprocess: one interpreter per phase")
+    parser.add_argument('--executor', choices=['thread', 'process'], default='thread',
+                        help="Pool type for in-process mode")
+    parser.add_argument('--workers', type=int, help="Pool size (default: number of phases)")
+    parser.add_argument('--gated', action='store_true',
+                        help="Run Phase 3 only after Phase 0-2 pass (skip it otherwise)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Re-validate only documents whose content or dependencies changed")
+    parser.add_argument('--watch', action='store_true',
+                        help="Stay running and re-validate affected phases on file changes")
+    parser.add_argument('--interval', type=float, default=0.5, help="Watch polling interval in seconds")
+    args = parser.parse_args()
     
-    fcn_base_dir = Path(sys.argv[1])
+    fcn_base_dir = args.fcn_base_dir
     
     if not fcn_base_dir.is_dir():
         print(f"Error: {fcn_base_dir} is not a valid directory")
         sys.exit(1)
     
-    # Parse output option
-    output_file = None
-    if len(sys.argv) > 2 and sys.argv[2] == '--output' and len(sys.argv) > 3:
-        output_file = Path(sys.argv[3])
-    else:
-        output_file = fcn_base_dir / 'validation-report.txt'
+    output_file = args.output or fcn_base_dir / 'validation-report.txt'
     
-    aggregator = ValidatorAggregator(fcn_base_dir)
+    aggregator = ValidatorAggregator(
+        fcn_base_dir,
+        mode=args.mode,
+        workers=args.workers,
+        executor=args.executor,
+        gated=args.gated,
+        incremental=args.incremental
+    )
     
     print(f"\n🔍 Running FCN v1.0 Validators...")
     print(f"Base directory: {fcn_base_dir}")
     
+    if args.watch:
+        aggregator.watch(interval=args.interval)
+        sys.exit(0)
+    
     aggregator.run_all()
     
     summary = aggregator.generate_summary()
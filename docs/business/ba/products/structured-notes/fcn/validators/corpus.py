@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+FCN Document Corpus
+
+Shared, parsed model of the FCN document tree (specs, test vectors, manifest).
+This is the single front matter parser for the validators and the
+docs/scripts tooling:
+
+- Each file is read and its YAML front matter parsed at most once per corpus.
+- Parsed YAML is cached on disk keyed by a SHA-256 of the YAML source, so
+  unchanged documents are not re-parsed across runs.
+- The libyaml CSafeLoader is used when PyYAML was built with it.
+
+Cache location: $FCN_CORPUS_CACHE_DIR (set to an empty string to disable),
+default ~/.cache/fcn-corpus.
+
+Part of the FCN v1.0 governance framework.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import yaml
+
+
+FRONT_MATTER_PATTERN = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Bump when the cached representation changes
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_dir() -> Optional[Path]:
+    """Return the on-disk cache directory, or None if caching is disabled."""
+    configured = os.environ.get('FCN_CORPUS_CACHE_DIR')
+    if configured is not None:
+        return Path(configured) if configured else None
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'fcn-corpus'
+
+
+def safe_load(source: str):
+    """yaml.safe_load using the C loader when available."""
+    return yaml.load(source, Loader=SafeLoader)
+
+
+class YamlCache:
+    """Content-hash keyed on-disk cache of parsed YAML documents."""
+
+    def __init__(self, cache_dir: Optional[Path]):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, source: str) -> Path:
+        digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{source}".encode('utf-8')).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.pickle"
+
+    def load(self, source: str):
+        """Parse YAML source, serving from the cache when possible."""
+        if self.cache_dir is None:
+            return safe_load(source)
+
+        path = self._path(source)
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            self.hits += 1
+            return data
+        except Exception:
+            pass  # missing or unreadable entry; re-parse
+
+        data = safe_load(source)
+        self.misses += 1
+        self._store(path, data)
+        return data
+
+    def _store(self, path: Path, data):
+        """Write a cache entry atomically; failures only cost a re-parse."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception:
+            pass
+
+
+class Document:
+    """Single markdown document with its parsed front matter."""
+
+    def __init__(self, path: Optional[Path], text: Optional[str] = None,
+                 read_error: Optional[Exception] = None, loader=safe_load):
+        self.path = path
+        self.text = text
+        self.read_error = read_error
+        self.has_front_matter = False
+        self.front_matter = None
+        self.body = text
+        self.yaml_error = None
+
+        if text is not None:
+            match = FRONT_MATTER_PATTERN.match(text)
+            if match:
+                self.has_front_matter = True
+                self.body = text[match.end():]
+                try:
+                    self.front_matter = loader(match.group(1))
+                except yaml.YAMLError as e:
+                    self.yaml_error = e
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """SHA-256 of the file content (None if it could not be read)."""
+        if self.text is None:
+            return None
+        return hashlib.sha256(self.text.encode('utf-8')).hexdigest()
+
+    def load(self) -> Tuple[Optional[Dict], str]:
+        """
+        Return (front_matter, body), raising any read or YAML error.
+
+        Mirrors the inline read + regex + yaml.safe_load sequence the
+        validators used, so existing try/except handling is unchanged.
+        Returns (None, text) when the document has no front matter.
+        """
+        if self.read_error is not None:
+            raise self.read_error
+        if self.yaml_error is not None:
+            raise self.yaml_error
+        if not self.has_front_matter:
+            return None, self.text
+        return self.front_matter, self.body
+
+    def front_matter_dict(self, missing_message: str = "No YAML front matter found") -> Tuple[Dict, str]:
+        """
+        Return (front_matter_dict, error_message) in the docs/scripts convention.
+
+        error_message is an empty string on success.
+        """
+        if self.read_error is not None:
+            return {}, f"Failed to read file: {self.read_error}"
+        if not self.has_front_matter:
+            return {}, missing_message
+        if self.yaml_error is not None:
+            return {}, f"Failed to parse YAML front matter: {self.yaml_error}"
+        if not isinstance(self.front_matter, dict):
+            return {}, "Front matter is not a valid YAML dictionary"
+        return self.front_matter, ""
+
+
+class Corpus:
+    """Thread-safe, memoized loader for FCN documents."""
+
+    def __init__(self, fcn_base_dir: Optional[Path] = None, cache_dir: Optional[Path] = None,
+                 use_disk_cache: bool = True):
+        self.fcn_base_dir = fcn_base_dir
+        self.cache = YamlCache((cache_dir or default_cache_dir()) if use_disk_cache else None)
+        self._documents: Dict[Path, Document] = {}
+        self._yaml: Dict[Path, object] = {}
+        self._lock = threading.Lock()
+
+    def parse(self, text: str, path: Optional[Path] = None) -> Document:
+        """Parse in-memory markdown content (uses the YAML cache)."""
+        return Document(path, text, loader=self.cache.load)
+
+    def document(self, file_path: Path) -> Document:
+        """Return the parsed document for a path (read and parsed once)."""
+        key = Path(file_path).resolve()
+        document = self._documents.get(key)
+        if document is not None:
+            return document
+
+        try:
+            with open(key, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except Exception as e:
+            document = Document(Path(file_path), read_error=e)
+        else:
+            document = self.parse(text, Path(file_path))
+
+        with self._lock:
+            return self._documents.setdefault(key, document)
+
+    def load_yaml(self, file_path: Path):
+        """Return a parsed YAML file such as manifest.yaml (parsed once)."""
+        key = Path(file_path).resolve()
+        if key not in self._yaml:
+            with open(key, 'r', encoding='utf-8') as f:
+                data = self.cache.load(f.read())
+            with self._lock:
+                self._yaml.setdefault(key, data)
+        return self._yaml[key]
+
+    def invalidate(self, file_path: Path):
+        """Drop the in-memory entry for a path so the next access re-reads it."""
+        key = Path(file_path).resolve()
+        with self._lock:
+            self._documents.pop(key, None)
+            self._yaml.pop(key, None)
+
+    def preload(self, *directories: Path) -> int:
+        """Parse every markdown file under the given directories; return count."""
+        count = 0
+        for directory in directories:
+            if not directory.is_dir():
+                continue
+            for md_file in directory.rglob('*.md'):
+                self.document(md_file)
+                count += 1
+        return count
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+
+_default_corpus = None
+_default_lock = threading.Lock()
+
+
+def get_corpus() -> Corpus:
+    """Return the process-wide default corpus."""
+    global _default_corpus
+    with _default_lock:
+        if _default_corpus is None:
+            _default_corpus = Corpus()
+        return _default_corpus
+
+
+def parse_front_matter(file_path: Path, missing_message: str = "No YAML front matter found") -> Tuple[Dict, str]:
+    """
+    Parse YAML front matter from a markdown file via the default corpus.
+
+    Args:
+        file_path: Path to the markdown file
+        missing_message: Error message when no front matter block is present
+
+    Returns:
+        Tuple of (front_matter_dict, error_message)
+        error_message is empty string if successful
+    """
+    return get_corpus().document(file_path).front_matter_dict(missing_message)
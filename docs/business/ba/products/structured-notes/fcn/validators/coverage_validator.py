@@ -10,10 +10,11 @@ Usage:
 """
 
 import sys
-import yaml
-import re
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
+
+from corpus import Corpus, get_corpus
+from incremental import IncrementalCache, finish, from_args
 
 
 class CoverageValidator:
@@ -22,17 +23,17 @@ class CoverageValidator:
     REQUIRED_TAGS_PER_BRANCH = ['baseline', 'edge']
     NORMATIVE_MIN_COUNT = 1
     
-    def __init__(self):
+    def __init__(self, corpus: Optional[Corpus] = None):
         self.errors = []
         self.warnings = []
+        self.corpus = corpus if corpus is not None else get_corpus()
         self.branches = {}
         self.test_vectors = {}
     
     def load_manifest(self, manifest_path: Path) -> bool:
         """Load branches from manifest."""
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = yaml.safe_load(f)
+            manifest = self.corpus.load_yaml(manifest_path)
             
             branches = manifest.get('branches', [])
             for branch in branches:
@@ -52,17 +53,12 @@ class CoverageValidator:
     def extract_vector_metadata(self, file_path: Path) -> Dict:
         """Extract metadata from test vector file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract YAML front matter
-            pattern = r'^---\s*\n(.*?)\n---\s*\n'
-            match = re.match(pattern, content, re.DOTALL)
+            document = self.corpus.document(file_path)
+            data, _ = document.load()
             
-            if not match:
+            if not document.has_front_matter:
                 return None
             
-            data = yaml.safe_load(match.group(1))
             return {
                 'vector_id': data.get('vector_id', file_path.stem),
                 'normative': data.get('normative', False),
@@ -155,7 +151,7 @@ class CoverageValidator:
             missing_tags = set(self.REQUIRED_TAGS_PER_BRANCH) - found_tags
             if missing_tags:
                 self.warnings.append(
-                    f"{context}: Missing required tags: {', '.join(missing_tags)}"
+                    f"{context}: Missing required tags: {', '.join(sorted(missing_tags))}"
                 )
         
         return all_valid
@@ -224,22 +220,53 @@ class CoverageValidator:
             print("\n✅ All coverage requirements met")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python coverage_validator.py <fcn_base_directory>")
-        sys.exit(1)
+def run(args: List[str], corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None) -> int:
+    """Run Phase 3 with CLI-style arguments; return the exit code."""
+    args, incremental, owned = from_args(args, corpus, incremental)
+    if len(args) < 1:
+        print("Usage: python coverage_validator.py <fcn_base_directory> [--incremental]")
+        return 1
     
-    fcn_base_dir = Path(sys.argv[1])
+    fcn_base_dir = Path(args[0])
     
     if not fcn_base_dir.is_dir():
         print(f"Error: {fcn_base_dir} is not a valid directory")
-        sys.exit(1)
+        return 1
+    
+    validator = CoverageValidator(corpus)
+    
+    # Corpus-wide phase: cached as a whole, keyed by every vector plus manifest branches
+    key = None
+    if incremental:
+        key = incremental.corpus_key(
+            (fcn_base_dir / 'test-vectors').glob('*.md'),
+            [f"branches={incremental.manifest_branches_hash()}"]
+        )
+    cached = incremental.get('coverage', str(fcn_base_dir.resolve()), key) if key else None
+    
+    if cached is not None:
+        validator.errors, validator.warnings = cached['errors'], cached['warnings']
+        validator.branches, validator.test_vectors = cached['branches'], cached['test_vectors']
+        is_valid = cached['valid']
+    else:
+        is_valid = validator.validate(fcn_base_dir)
+        if key:
+            incremental.put('coverage', str(fcn_base_dir.resolve()), key, {
+                'valid': is_valid,
+                'errors': validator.errors,
+                'warnings': validator.warnings,
+                'branches': validator.branches,
+                'test_vectors': validator.test_vectors
+            })
     
-    validator = CoverageValidator()
-    is_valid = validator.validate(fcn_base_dir)
     validator.print_results()
+    finish(incremental, owned)
     
-    sys.exit(0 if is_valid else 1)
+    return 0 if is_valid else 1
+
+
+def main():
+    sys.exit(run(sys.argv[1:]))
 
 
 if __name__ == '__main__':
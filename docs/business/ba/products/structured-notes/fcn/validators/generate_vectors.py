@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+FCN Synthetic Test Vector Generator
+
+Streams synthetic test vectors for scale, benchmark and fuzz runs:
+
+- Parameter sets are sampled per taxonomy branch (manifest.yaml) within the
+  bounds of schemas/fcn-v1.1.0-parameters.schema.json and respect BR-001,
+  BR-003, BR-014, BR-015 and BR-024.
+- Market scenarios are simulated as correlated geometric Brownian motion
+  sampled on the observation schedule.
+- expected_outputs come from the Phase 4 engine (logic_validator.py), so
+  synthetic vectors exercise the pipeline and catch engine regressions
+  against a stored set; they do not replace hand-checked normative vectors.
+
+Vectors are produced lazily in chunks, so millions of cases can be written
+or validated without holding them in memory.
+
+Output formats:
+    jsonl     one vector per line (test-vector.schema.json shape)
+    columnar  one JSON row group per line, BATCH_SIZE vectors each, with
+              flattened fields stored as column arrays
+    md        one markdown file per vector with YAML front matter
+A `.gz` suffix on jsonl/columnar outputs enables gzip compression.
+
+Part of the FCN v1.0 governance framework.
+
+Usage:
+    python generate_vectors.py [--branch ID ...] [--count N] [--seed S]
+                               [--format jsonl|columnar|md] [--output PATH]
+                               [--validate]
+"""
+
+import argparse
+import calendar
+import gzip
+import json
+import math
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import yaml
+
+from corpus import Corpus, get_corpus
+from logic_validator import BATCH_SIZE, BatchEvaluator, LogicValidator, normalize_scenario, normalize_trade
+
+
+FCN_BASE_DIR = Path(__file__).resolve().parent.parent
+SCHEMA_PATH = FCN_BASE_DIR / 'schemas' / 'fcn-v1.1.0-parameters.schema.json'
+WHITELIST_PATH = FCN_BASE_DIR / 'data' / 'issuer_whitelist.json'
+
+SPEC_VERSION = '1.1.0'
+
+SYMBOL_POOL = [
+    'AAPL.US', 'AMZN.US', 'MSFT.US', 'NVDA.US', 'ORCL.US', 'PLTR.US', 'TSLA.US',
+    'META.US', '0700.HK', '9988.HK', 'PTT.BK', 'AOT.BK', 'SAP.DE', 'ASML.NA',
+]
+CURRENCIES = ['USD', 'EUR', 'THB', 'HKD']
+NOTIONALS = [100_000, 250_000, 500_000, 1_000_000, 5_000_000]
+TENOR_MONTHS = [6, 12, 18, 24]
+FREQUENCY_MONTHS = [1, 3]
+
+
+def add_months(start: date, months: int) -> date:
+    """Add calendar months, clamping the day to the target month's length."""
+    month_index = start.month - 1 + months
+    year, month = start.year + month_index // 12, month_index % 12 + 1
+    return date(year, month, min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def schema_range(schema: Dict[str, Any], name: str, low: float, high: float) -> Tuple[float, float]:
+    """
+    Clamp a sampling range to a parameter's schema bounds.
+
+    Handles both draft-07 numeric and draft-04 boolean exclusiveMinimum.
+    """
+    spec = schema.get('properties', {}).get(name, {})
+    minimum = spec.get('minimum')
+    exclusive = spec.get('exclusiveMinimum')
+    if isinstance(exclusive, (int, float)) and not isinstance(exclusive, bool):
+        minimum = exclusive
+    if minimum is not None:
+        low = max(low, minimum + (0.01 if exclusive else 0.0))
+    if spec.get('maximum') is not None:
+        high = min(high, spec['maximum'])
+    return low, high
+
+
+def schema_enum(schema: Dict[str, Any], name: str, default: str) -> str:
+    """First non-null enum value for a parameter, or the default."""
+    values = [v for v in schema.get('properties', {}).get(name, {}).get('enum', []) if v is not None]
+    return values[0] if values else default
+
+
+def constraint_violations(parameters: Dict[str, Any]) -> List[str]:
+    """
+    Return the business rules a generated parameter set violates.
+
+    Checks BR-001 (date ordering), BR-003 (0 < KI < 1), BR-014 (strictly
+    increasing observations before maturity), BR-015 (symbol / level
+    arity) and BR-024 (KI < put strike <= 1).
+    """
+    violations = []
+    trade = date.fromisoformat(parameters['trade_date'])
+    issue = date.fromisoformat(parameters['issue_date'])
+    maturity = date.fromisoformat(parameters['maturity_date'])
+    if not trade <= issue < maturity:
+        violations.append('BR-001')
+    
+    ki = parameters['knock_in_barrier_pct']
+    if not 0 < ki < 1:
+        violations.append('BR-003')
+    
+    observations = [date.fromisoformat(d) for d in parameters['observation_dates']]
+    if any(a >= b for a, b in zip(observations, observations[1:])) or observations[-1] >= maturity:
+        violations.append('BR-014')
+    
+    assets = parameters['underlying_assets']
+    if any(not asset.get('symbol') or not asset.get('initial_level') for asset in assets):
+        violations.append('BR-015')
+    
+    strike = parameters['put_strike_pct']
+    if not (0 < strike <= 1.0 and ki < strike):
+        violations.append('BR-024')
+    return violations
+
+
+class VectorGenerator:
+    """Lazily samples synthetic FCN test vectors per taxonomy branch."""
+    
+    def __init__(self, corpus: Optional[Corpus] = None, fcn_base_dir: Path = FCN_BASE_DIR, seed: int = 0):
+        self.corpus = corpus if corpus is not None else get_corpus()
+        self.seed = seed
+        self.evaluator = BatchEvaluator()
+        
+        manifest = self.corpus.load_yaml(fcn_base_dir / 'manifest.yaml') or {}
+        self.branches = {b['branch_id']: b for b in manifest.get('branches', []) if b.get('branch_id')}
+        
+        with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
+            self.schema = json.load(f)
+        
+        try:
+            with open(WHITELIST_PATH, 'r', encoding='utf-8') as f:
+                self.issuers = [entry['id'] for entry in json.load(f) if entry.get('status') == 'Active']
+        except (OSError, ValueError, KeyError):
+            self.issuers = []
+        self.issuers = self.issuers or ['SAMPLE_BANK_01']
+    
+    def sample_parameters(self, rng: random.Random, taxonomy: Dict[str, str]) -> Dict[str, Any]:
+        """Sample one v1.1.0 parameter set for a branch taxonomy."""
+        trade_date = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+        issue_date = trade_date + timedelta(days=rng.randrange(8))
+        tenor = rng.choice(TENOR_MONTHS)
+        frequency = rng.choice(FREQUENCY_MONTHS)
+        maturity_date = add_months(issue_date, tenor)
+        
+        # BR-014: strictly increasing; final observation a few days before maturity
+        observation_dates = [add_months(issue_date, k) for k in range(frequency, tenor, frequency)]
+        observation_dates.append(maturity_date - timedelta(days=rng.randrange(1, 6)))
+        payment_dates = observation_dates[:-1] + [maturity_date]
+        
+        n_underlyings = rng.randint(1, 4)
+        assets = [
+            {'symbol': symbol, 'initial_level': round(rng.uniform(20, 500), 2)}
+            for symbol in rng.sample(SYMBOL_POOL, n_underlyings)
+        ]
+        
+        # BR-003 / BR-024: 0 < KI < put_strike <= 1
+        ki_low, ki_high = schema_range(self.schema, 'knock_in_barrier_pct', 0.50, 0.75)
+        knock_in = round(rng.uniform(ki_low, ki_high), 2)
+        strike_low, strike_high = schema_range(self.schema, 'put_strike_pct', knock_in + 0.05, 1.0)
+        put_strike = round(rng.uniform(strike_low, strike_high), 2)
+        threshold_low, threshold_high = schema_range(self.schema, 'coupon_condition_threshold_pct', 0.60, 1.0)
+        
+        parameters = {
+            'product_code': 'FCN',
+            'spec_version': SPEC_VERSION,
+            'trade_date': trade_date.isoformat(),
+            'issue_date': issue_date.isoformat(),
+            'maturity_date': maturity_date.isoformat(),
+            'notional': rng.choice(NOTIONALS),
+            'currency': rng.choice(CURRENCIES),
+            'issuer': rng.choice(self.issuers),
+            'underlying_assets': assets,
+            'observation_dates': [d.isoformat() for d in observation_dates],
+            'observation_frequency_months': frequency,
+            'coupon_payment_dates': [d.isoformat() for d in payment_dates],
+            'coupon_rate_pct': round(rng.uniform(0.04, 0.15) * frequency / 12, 6),
+            'coupon_condition_threshold_pct': round(rng.uniform(threshold_low, threshold_high), 2),
+            'is_memory_coupon': taxonomy.get('coupon_memory') == 'memory',
+            'knock_in_barrier_pct': knock_in,
+            'put_strike_pct': put_strike,
+            'barrier_monitoring_type': schema_enum(self.schema, 'barrier_monitoring_type', 'discrete'),
+            'knock_in_condition': schema_enum(self.schema, 'knock_in_condition', 'any-underlying-breach'),
+            'recovery_mode': taxonomy.get('recovery_mode', 'capital-at-risk'),
+            'settlement_type': taxonomy.get('settlement', 'physical-settlement'),
+            'documentation_version': SPEC_VERSION,
+        }
+        if parameters['is_memory_coupon']:
+            parameters['memory_carry_cap_count'] = rng.choice([None, 1, 2, 3, 6])
+        if taxonomy.get('step_feature') == 'autocall':
+            ko_low, ko_high = schema_range(self.schema, 'knock_out_barrier_pct', 1.0, 1.10)
+            parameters['knock_out_barrier_pct'] = round(rng.uniform(ko_low, ko_high), 2)
+            parameters['auto_call_observation_logic'] = schema_enum(
+                self.schema, 'auto_call_observation_logic', 'all-underlyings')
+        return parameters
+    
+    def simulate_scenario(self, rng: random.Random, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        """Simulate correlated GBM levels on each observation date."""
+        assets = parameters['underlying_assets']
+        vols = [rng.uniform(0.15, 0.60) for _ in assets]
+        rho = rng.uniform(0.3, 0.8)
+        levels = [asset['initial_level'] for asset in assets]
+        
+        rows = []
+        previous = date.fromisoformat(parameters['issue_date'])
+        for obs in parameters['observation_dates']:
+            obs_date = date.fromisoformat(obs)
+            dt = max((obs_date - previous).days, 1) / 365.0
+            common = rng.gauss(0.0, 1.0)
+            levels = [
+                level * math.exp(-0.5 * vol * vol * dt + vol * math.sqrt(dt)
+                                 * (rho * common + math.sqrt(1 - rho * rho) * rng.gauss(0.0, 1.0)))
+                for level, vol in zip(levels, vols)
+            ]
+            rows.append({'observation_date': obs, 'levels': [round(level, 4) for level in levels]})
+            previous = obs_date
+        return {'underlying_levels': rows}
+    
+    def generate(self, branch_ids: Optional[List[str]] = None, count: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Yield `count` vectors per branch, evaluating expected outputs in chunks.
+
+        Args:
+            branch_ids: Branches to generate (default: all manifest branches)
+            count: Vectors per branch
+
+        Yields:
+            Test vector dicts in the test-vector.schema.json shape
+        """
+        for branch_id in branch_ids or list(self.branches):
+            if branch_id not in self.branches:
+                raise ValueError(f"Unknown branch_id: {branch_id}")
+            taxonomy = self.branches[branch_id].get('taxonomy', {})
+            rng = random.Random(f"{self.seed}:{branch_id}")
+            prefix = branch_id[len('fcn-'):] if branch_id.startswith('fcn-') else branch_id
+            
+            for start in range(0, count, BATCH_SIZE):
+                chunk = []
+                for i in range(start, min(start + BATCH_SIZE, count)):
+                    parameters = self.sample_parameters(rng, taxonomy)
+                    chunk.append({
+                        'vector_id': f"fcn-v1.1-synth-{prefix}-{self.seed}-{i:07d}",
+                        'product_code': 'FCN',
+                        'spec_version': SPEC_VERSION,
+                        'description': f"Synthetic {branch_id} scenario #{i} (seed {self.seed})",
+                        'normative': False,
+                        'taxonomy': dict(taxonomy),
+                        'parameters': parameters,
+                        'market_scenario': self.simulate_scenario(rng, parameters),
+                    })
+                
+                trades = [normalize_trade(v['parameters']) for v in chunk]
+                paths = [normalize_scenario(v['market_scenario'], t)
+                         for v, t in zip(chunk, trades)]
+                for vector, outputs in zip(chunk, self.evaluator.evaluate(trades, paths)):
+                    vector['expected_outputs'] = _rounded(outputs)
+                    yield vector
+
+
+def _rounded(value: Any) -> Any:
+    """Round floats to 6 decimals recursively (keeps emitted files compact)."""
+    if isinstance(value, float):
+        return round(value, 6)
+    if isinstance(value, dict):
+        return {k: _rounded(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_rounded(v) for v in value]
+    return value
+
+
+def flatten(vector: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Flatten nested dicts to dotted keys (lists are kept as values)."""
+    flat = {}
+    for key, value in vector.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def unflatten(flat: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of flatten()."""
+    return _unflatten_row([name.split('.') for name in flat], list(flat.values()))
+
+
+def _unflatten_row(paths: List[List[str]], values: Iterable[Any]) -> Dict[str, Any]:
+    """Build a nested dict from pre-split dotted paths and their values."""
+    vector: Dict[str, Any] = {}
+    for path, value in zip(paths, values):
+        node = vector
+        for parent in path[:-1]:
+            node = node.setdefault(parent, {})
+        node[path[-1]] = value
+    return vector
+
+
+def _open_text(path: Path, mode: str):
+    """Open a text file, gzip-compressed when the path ends in .gz."""
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def write_vectors(vectors: Iterable[Dict[str, Any]], output: Path, fmt: str) -> int:
+    """
+    Stream vectors to disk in the requested format.
+
+    Returns:
+        Number of vectors written
+    """
+    count = 0
+    if fmt == 'md':
+        output.mkdir(parents=True, exist_ok=True)
+        for vector in vectors:
+            front_matter = yaml.safe_dump(vector, sort_keys=False, default_flow_style=None)
+            (output / f"{vector['vector_id']}.md").write_text(
+                f"---\n{front_matter}---\n\n# Synthetic Scenario\n\n{vector['description']}\n",
+                encoding='utf-8',
+            )
+            count += 1
+        return count
+    
+    with _open_text(output, 'w') as f:
+        if fmt == 'jsonl':
+            for vector in vectors:
+                f.write(json.dumps(vector, separators=(',', ':')) + '\n')
+                count += 1
+            return count
+        
+        # columnar: one row group per line, columns in first-seen order;
+        # `absent` lists the rows a sparse column does not apply to
+        group: List[Dict[str, Any]] = []
+        
+        def flush_group():
+            columns: Dict[str, List[Any]] = {}
+            absent: Dict[str, List[int]] = {}
+            for row in group:
+                for name in row:
+                    columns.setdefault(name, [])
+            for i, row in enumerate(group):
+                for name, values in columns.items():
+                    if name not in row:
+                        absent.setdefault(name, []).append(i)
+                    values.append(row.get(name))
+            record = {'rows': len(group), 'columns': columns, 'absent': absent}
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+        
+        for vector in vectors:
+            group.append(flatten(vector))
+            count += 1
+            if len(group) >= BATCH_SIZE:
+                flush_group()
+                group = []
+        if group:
+            flush_group()
+    return count
+
+
+def read_vectors(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream vectors back from a jsonl or columnar file (format auto-detected)."""
+    with _open_text(Path(path), 'r') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if 'columns' in record and 'rows' in record:
+                names = list(record['columns'])
+                paths = [name.split('.') for name in names]
+                absent = {names.index(name): set(rows) for name, rows in record.get('absent', {}).items()}
+                for i, values in enumerate(zip(*record['columns'].values())):
+                    if any(i in rows for rows in absent.values()):
+                        keep = [j for j in range(len(names)) if i not in absent.get(j, ())]
+                        yield _unflatten_row([paths[j] for j in keep], [values[j] for j in keep])
+                    else:
+                        yield _unflatten_row(paths, values)
+            else:
+                yield record
+
+
+def validate_stream(vectors: Iterable[Dict[str, Any]], stats: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+    """
+    Pass vectors through unchanged after checking them.
+
+    Each vector's parameters are checked against the BR constraints and the
+    vectors are replayed through the Phase 4 engine in BATCH_SIZE chunks;
+    counts accumulate in `stats`.
+    """
+    validator = LogicValidator()
+    chunk: List[Dict[str, Any]] = []
+    
+    def replay():
+        for name, result in validator.validate_vectors((v['vector_id'], v) for v in chunk):
+            if result['status'] == 'pass':
+                stats['passed'] += 1
+            else:
+                stats['failed'] += 1
+                print(f"❌ {name}: {'; '.join(result['errors']) or result.get('reason', '')}")
+    
+    for vector in vectors:
+        violated = constraint_violations(vector['parameters'])
+        if violated:
+            stats['constraint_violations'] += 1
+            print(f"❌ {vector['vector_id']}: violates {', '.join(violated)}")
+        chunk.append(vector)
+        if len(chunk) >= BATCH_SIZE:
+            replay()
+            yield from chunk
+            chunk = []
+    if chunk:
+        replay()
+        yield from chunk
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate synthetic FCN test vectors')
+    parser.add_argument('--branch', action='append', dest='branches', help='Branch ID (repeatable; default: all)')
+    parser.add_argument('--count', type=int, default=1000, help='Vectors per branch (default: 1000)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+    parser.add_argument('--format', choices=['jsonl', 'columnar', 'md'], default='jsonl',
+                        help='Output format (default: jsonl)')
+    parser.add_argument('--output', type=Path, help='Output file (jsonl/columnar) or directory (md)')
+    parser.add_argument('--validate', action='store_true',
+                        help='Check BR constraints and replay every vector through the Phase 4 engine')
+    args = parser.parse_args()
+    
+    if args.output is None and not args.validate:
+        parser.error('--output is required unless --validate is given')
+    
+    try:
+        generator = VectorGenerator(seed=args.seed)
+        for branch_id in args.branches or []:
+            if branch_id not in generator.branches:
+                raise ValueError(f"Unknown branch_id: {branch_id}")
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    start = time.perf_counter()
+    stats = {'constraint_violations': 0, 'passed': 0, 'failed': 0}
+    
+    vectors = generator.generate(args.branches, args.count)
+    if args.validate:
+        vectors = validate_stream(vectors, stats)
+    
+    if args.output is not None:
+        written = write_vectors(vectors, args.output, args.format)
+    else:
+        written = 0
+        for _ in vectors:
+            pass
+    elapsed = time.perf_counter() - start
+    
+    print(f"\n{'='*70}")
+    print(f"Synthetic Test Vector Generation")
+    print(f"{'='*70}")
+    print(f"Branches: {', '.join(args.branches or generator.branches)}")
+    print(f"Vectors per branch: {args.count} (seed {args.seed})")
+    if args.output is not None:
+        print(f"Written: {written} → {args.output} ({args.format})")
+    if args.validate:
+        print(f"Constraint violations: {stats['constraint_violations']}")
+        print(f"Engine replay: {stats['passed']} passed, {stats['failed']} failed")
+    print(f"Elapsed: {elapsed:.2f}s")
+    print(f"{'='*70}")
+    
+    sys.exit(1 if stats['constraint_violations'] or stats['failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+FCN Incremental Validation Manifest
+
+Persists per-document validation results keyed by a digest of everything the
+result depends on, so repeated runs only re-validate what changed:
+
+- the document's own content
+- documents it links through `related:` front matter
+- phase-specific inputs (parameter schema, issuer_whitelist.json,
+  manifest branches)
+- the validator version (VALIDATOR_VERSION plus a hash of validators/*.py)
+
+The manifest also records a hash of every file under schemas/; if any of them
+changed since it was written, all cached entries are dropped on load.
+
+Corpus-wide phases (taxonomy, coverage) are cached as a whole, keyed by all
+of their inputs.
+
+Manifest location: $FCN_VALIDATION_MANIFEST, default
+<corpus cache dir>/validation-manifest-<base dir hash>.json.
+
+Part of the FCN v1.0 governance framework.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from corpus import Corpus, default_cache_dir, get_corpus
+
+
+VALIDATOR_VERSION = '1.0.0'
+
+FCN_BASE_DIR = Path(__file__).resolve().parent.parent
+ISSUER_WHITELIST_PATH = FCN_BASE_DIR / 'data' / 'issuer_whitelist.json'
+
+
+def validator_version() -> str:
+    """Return VALIDATOR_VERSION plus a digest of the validator sources."""
+    digest = hashlib.sha256()
+    for source in sorted(Path(__file__).resolve().parent.glob('*.py')):
+        digest.update(source.name.encode('utf-8'))
+        digest.update(source.read_bytes())
+    return f"{VALIDATOR_VERSION}+{digest.hexdigest()[:16]}"
+
+
+def default_manifest_path(fcn_base_dir: Path = FCN_BASE_DIR) -> Optional[Path]:
+    """Return the manifest file path, or None if no cache dir is configured."""
+    configured = os.environ.get('FCN_VALIDATION_MANIFEST')
+    if configured:
+        return Path(configured)
+    cache_dir = default_cache_dir()
+    if cache_dir is None:
+        return None
+    base_hash = hashlib.sha256(str(fcn_base_dir.resolve()).encode('utf-8')).hexdigest()[:12]
+    return cache_dir / f"validation-manifest-{base_hash}.json"
+
+
+class IncrementalCache:
+    """Persisted manifest of validation results keyed by dependency digests."""
+
+    def __init__(self, corpus: Optional[Corpus] = None, manifest_path: Optional[Path] = None,
+                 fcn_base_dir: Path = FCN_BASE_DIR):
+        self.corpus = corpus if corpus is not None else get_corpus()
+        self.fcn_base_dir = fcn_base_dir
+        self.manifest_path = manifest_path or default_manifest_path(fcn_base_dir)
+        self.version = validator_version()
+        self.hits = 0
+        self.misses = 0
+        self._file_hashes: Dict[Path, str] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.entries = self._load()
+
+    def _load(self) -> Dict:
+        """Load the manifest; discard it if the validator version or any schema changed."""
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception:
+            return {}
+        if data.get('validator_version') != self.version:
+            return {}
+        if data.get('schemas') != self.schema_hashes():
+            return {}
+        return data.get('entries', {})
+
+    def save(self):
+        """Write the manifest atomically (no-op if nothing changed)."""
+        if self.manifest_path is None or not self._dirty:
+            return
+        with self._lock:
+            data = {
+                'validator_version': self.version,
+                'schemas': self.schema_hashes(),
+                'entries': self.entries,
+            }
+            try:
+                self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.manifest_path.parent, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=1, default=str)
+                os.replace(tmp_path, self.manifest_path)
+                self._dirty = False
+            except Exception as e:
+                print(f"⚠️  Failed to save validation manifest: {e}")
+
+    def file_hash(self, path: Path) -> str:
+        """SHA-256 of a file's bytes ('missing' if absent), memoized per run."""
+        key = Path(path).resolve()
+        digest = self._file_hashes.get(key)
+        if digest is None:
+            try:
+                digest = hashlib.sha256(key.read_bytes()).hexdigest()
+            except OSError:
+                digest = 'missing'
+            self._file_hashes[key] = digest
+        return digest
+
+    def schema_hashes(self) -> Dict[str, str]:
+        """Content hash of every schemas/*.json file, keyed by file name."""
+        return {
+            path.name: self.file_hash(path)
+            for path in sorted((self.fcn_base_dir / 'schemas').glob('*.json'))
+        }
+
+    def manifest_branches_hash(self) -> str:
+        """Digest of manifest.yaml branches (other manifest edits do not invalidate)."""
+        try:
+            manifest = self.corpus.load_yaml(self.fcn_base_dir / 'manifest.yaml') or {}
+        except Exception:
+            return 'missing'
+        branches = json.dumps(manifest.get('branches', []), sort_keys=True, default=str)
+        return hashlib.sha256(branches.encode('utf-8')).hexdigest()
+
+    def related_paths(self, path: Path) -> List[Path]:
+        """Resolve a document's `related:` links relative to the document."""
+        front_matter = self.corpus.document(path).front_matter
+        if not isinstance(front_matter, dict):
+            return []
+        related = front_matter.get('related') or []
+        if isinstance(related, str):
+            related = [related]
+        return sorted(
+            (Path(path).resolve().parent / str(link)).resolve()
+            for link in related
+            if isinstance(link, str)
+        )
+
+    def document_key(self, path: Path, extra: Iterable[str] = ()) -> str:
+        """Digest of a document, its related: links and extra dependency hashes."""
+        parts = [self.version, self.file_hash(path)]
+        parts.extend(f"{p}={self.file_hash(p)}" for p in self.related_paths(path))
+        parts.extend(extra)
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+    def corpus_key(self, paths: Iterable[Path], extra: Iterable[str] = ()) -> str:
+        """Digest over a set of documents (for corpus-wide phases)."""
+        parts = [self.version]
+        parts.extend(f"{Path(p).resolve()}={self.file_hash(p)}" for p in sorted(paths))
+        parts.extend(extra)
+        return hashlib.sha256('\n'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, phase: str, name: str, key: str) -> Optional[Dict]:
+        """Return the cached result for (phase, name) if its key still matches."""
+        entry = self.entries.get(phase, {}).get(name)
+        if entry is not None and entry.get('key') == key:
+            self.hits += 1
+            return entry['result']
+        self.misses += 1
+        return None
+
+    def put(self, phase: str, name: str, key: str, result: Dict):
+        """Record a fresh result."""
+        with self._lock:
+            self.entries.setdefault(phase, {})[name] = {'key': key, 'result': result}
+            self._dirty = True
+
+    def reset(self):
+        """Forget memoized file hashes and counters (start of a new run)."""
+        self._file_hashes.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def summary(self) -> str:
+        """One-line hit/miss summary."""
+        return f"Incremental: {self.hits} cached, {self.misses} re-validated"
+
+
+def from_args(args: List[str], corpus: Optional[Corpus] = None,
+              incremental: Optional[IncrementalCache] = None) -> Tuple[List[str], Optional[IncrementalCache], bool]:
+    """
+    Strip an --incremental flag from validator CLI arguments.
+
+    Returns (remaining_args, cache, owned); owned is True when the cache was
+    created here and the caller should save it when done.
+    """
+    if '--incremental' not in args:
+        return args, incremental, False
+    args = [a for a in args if a != '--incremental']
+    if incremental is not None:
+        return args, incremental, False
+    return args, IncrementalCache(corpus), True
+
+
+def finish(incremental: Optional[IncrementalCache], owned: bool):
+    """Persist and report a cache created by from_args()."""
+    if incremental is not None and owned:
+        incremental.save()
+        print(incremental.summary())
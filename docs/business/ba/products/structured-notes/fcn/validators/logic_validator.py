@@ -1,28 +1,351 @@
 #!/usr/bin/env python3
 """
-FCN v1.1 Logic Validator (Phase 4)
-Validates business logic rules including capital-at-risk settlement (BR-025)
-
-This is a PLACEHOLDER pending engine integration. The validator will eventually:
-- Simulate coupon calculations (BR-006, BR-008, BR-009)
-- Evaluate knock-in triggers (BR-005)
-- Calculate capital-at-risk settlement outcomes (BR-025)
-- Validate autocall precedence (BR-021, BR-023)
-- Verify payoff determinism across test vectors
-
-Status: NOT IMPLEMENTED
-Owner: Backend Engineering Team
-Phase: 4 (Business Logic Validation)
+FCN Logic Validator (Phase 4)
+
+Executable test-vector engine. Replays each vector's market_scenario through
+the FCN lifecycle and diffs the outcome against its expected_outputs:
+
+1. Autocall (knock-out) check - highest precedence (BR-021, BR-023)
+2. Coupon condition, memory accrual and cap (BR-006, BR-008, BR-009)
+3. Knock-in monitoring (BR-005)
+4. Maturity settlement: par, capital-at-risk (BR-025) with physical
+   worst-of delivery (BR-025A) and first-in-array tie-break (BR-025B),
+   or proportional-loss
+
+A vector is replayed from its front matter when it carries `parameters`,
+`market_scenario.underlying_levels` and `expected_outputs` as described in
+schemas/test-vector.schema.json, otherwise from its markdown tables
+(vector_tables.py). A normative vector that cannot be replayed either way
+fails the phase, as does a run in which no vector executes.
+
+The lifecycle follows `parameters.observation_dates`: only scenario rows on
+those dates are observations. Settlement uses the row on `maturity_date`
+when the scenario has one (else the last observation), or the autocall
+observation when the note redeems early. BR-025 settles on the worst-of
+ratio at the three decimals the published vectors quote it to (25.0 / 35.0
+settles as 0.714).
+
+Vectors are evaluated in chunks of BATCH_SIZE. Within a chunk each path is
+reduced to per-observation worst-of ratios, then each trade's lifecycle runs
+in a plain Python loop: early redemption and memory make it path-dependent,
+so it is not vectorized.
+
+Part of the FCN v1.0 governance framework.
+
+Usage:
+    python logic_validator.py <test_vectors_dir> [--tolerance 0.0001] [--incremental]
 """
 
+import math
 import sys
-from typing import Dict, Any, List
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from corpus import Corpus, get_corpus
+from incremental import IncrementalCache, finish, from_args
+import memory_logic_validator
+from vector_tables import parameter_table, sections, table_vector
+
+
+DEFAULT_TOLERANCE = 0.0001
+
+# Decimals of the worst-of ratio BR-025 settles on, as quoted in the vectors
+RATIO_DECIMALS = 3
+
+# Vectors are evaluated in chunks so streamed synthetic input stays bounded
+BATCH_SIZE = 1024
+
+
+def _iso(value: Any) -> str:
+    """Normalize a YAML date (or string) to an ISO-8601 string."""
+    return value.isoformat() if isinstance(value, date) else str(value)
+
+
+def normalize_trade(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve the v1.0 / v1.1 parameter spellings into one trade record.
+
+    Args:
+        parameters: Vector `parameters` block
+
+    Returns:
+        Dict with notional, symbols, initial_levels and payoff terms
+
+    Raises:
+        ValueError: If a parameter required for evaluation is missing
+    """
+    notional = parameters.get('notional_amount', parameters.get('notional'))
+    if notional is None:
+        raise ValueError("parameters: notional (or notional_amount) is required")
+    
+    if 'underlying_assets' in parameters:
+        assets = parameters['underlying_assets'] or []
+        symbols = [asset.get('symbol') for asset in assets]
+        initial_levels = [asset.get('initial_level') for asset in assets]
+    else:
+        symbols = list(parameters.get('underlying_symbols') or [])
+        initial_levels = list(parameters.get('initial_levels') or [])
+    if not initial_levels or any(not level for level in initial_levels):
+        raise ValueError("parameters: initial levels must be present and non-zero")
+    if symbols and len(symbols) != len(initial_levels):
+        raise ValueError("parameters: underlying symbols and initial levels differ in length")
+    
+    for name in ('coupon_rate_pct', 'knock_in_barrier_pct'):
+        if parameters.get(name) is None:
+            raise ValueError(f"parameters: {name} is required")
+    
+    threshold = parameters.get('coupon_condition_threshold_pct', parameters.get('coupon_barrier_pct'))
+    maturity_date = parameters.get('maturity_date')
+    
+    return {
+        'notional': float(notional),
+        'symbols': symbols or [f"UL{i + 1}" for i in range(len(initial_levels))],
+        'initial_levels': [float(level) for level in initial_levels],
+        'coupon_rate_pct': float(parameters['coupon_rate_pct']),
+        'coupon_condition_threshold_pct': 1.0 if threshold is None else float(threshold),
+        'knock_in_barrier_pct': float(parameters['knock_in_barrier_pct']),
+        'knock_out_barrier_pct': parameters.get('knock_out_barrier_pct'),
+        'is_memory_coupon': bool(parameters.get('is_memory_coupon', False)),
+        'memory_carry_cap_count': parameters.get('memory_carry_cap_count'),
+        'put_strike_pct': parameters.get('put_strike_pct'),
+        'recovery_mode': parameters.get('recovery_mode', 'par-recovery'),
+        'settlement_type': parameters.get('settlement_type', 'physical-settlement'),
+        'observation_dates': [_iso(d) for d in parameters.get('observation_dates') or []],
+        'maturity_date': _iso(maturity_date) if maturity_date else None,
+    }
+
+
+def normalize_scenario(market_scenario: Dict[str, Any],
+                       trade: Dict[str, Any]) -> Tuple[List[Tuple[str, List[float]]], List[float]]:
+    """
+    Return a trade's observation path and its maturity fixing.
+
+    Observations are the rows on the trade's observation_dates, in schedule
+    order; rows on other dates are ignored. The maturity fixing is the row
+    on maturity_date if there is one, else the last observation. Without
+    observation_dates, every row is an observation.
+
+    Args:
+        market_scenario: Vector `market_scenario` block
+        trade: Record from normalize_trade()
+
+    Returns:
+        ([(observation_date, levels), ...], maturity_levels)
+
+    Raises:
+        ValueError: If the path is empty, a row has the wrong arity or a
+            scheduled observation date has no row
+    """
+    rows = (market_scenario or {}).get('underlying_levels') or []
+    if not rows:
+        raise ValueError("market_scenario: underlying_levels is empty")
+    
+    n_underlyings = len(trade['initial_levels'])
+    path = []
+    for i, row in enumerate(rows):
+        levels = row.get('levels') or []
+        if len(levels) != n_underlyings:
+            raise ValueError(
+                f"market_scenario: underlying_levels[{i}] has {len(levels)} levels, expected {n_underlyings}"
+            )
+        path.append((_iso(row.get('observation_date')), [float(level) for level in levels]))
+    
+    schedule = trade['observation_dates']
+    if schedule:
+        by_date = {}
+        for obs_date, levels in path:
+            by_date.setdefault(obs_date, levels)
+        missing = [obs_date for obs_date in schedule if obs_date not in by_date]
+        if missing:
+            raise ValueError(f"market_scenario: no underlying_levels for observation_date {', '.join(missing)}")
+        path = [(obs_date, by_date[obs_date]) for obs_date in schedule]
+        maturity_levels = by_date.get(trade['maturity_date'], path[-1][1])
+    else:
+        maturity_levels = path[-1][1]
+    return path, maturity_levels
+
+
+def worst_of(levels: Sequence[float], initial_levels: Sequence[float]) -> Tuple[float, int]:
+    """Worst-of ratio and its index; ties resolve to the first asset (BR-025B)."""
+    ratios = [level / initial for level, initial in zip(levels, initial_levels)]
+    worst = min(ratios)
+    return worst, ratios.index(worst)
+
+
+class BatchEvaluator:
+    """Evaluates FCN lifecycle outcomes for a batch of trades, one trade at a time."""
+    
+    def evaluate(self, trades: Sequence[Dict[str, Any]],
+                 paths: Sequence[Tuple[List[Tuple[str, List[float]]], List[float]]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate a batch of normalized trades against their observation paths.
+
+        The payoff only depends on the worst-of ratio per observation (KO:
+        all >= barrier, coupon: all >= threshold, KI: any <= barrier), so
+        each path is first reduced to (date, worst ratio, worst index)
+        columns and each trade's lifecycle then loops over its column.
+
+        Args:
+            trades: Records from normalize_trade()
+            paths: Matching (observations, maturity levels) from normalize_scenario()
+
+        Returns:
+            One outputs dict per trade, keyed like expected_outputs
+        """
+        return [
+            self._lifecycle(
+                trade,
+                [(obs_date, *worst_of(levels, trade['initial_levels'])) for obs_date, levels in observations],
+                worst_of(maturity_levels, trade['initial_levels']),
+            )
+            for trade, (observations, maturity_levels) in zip(trades, paths)
+        ]
+    
+    def _lifecycle(self, trade: Dict[str, Any], column: List[Tuple[str, float, int]],
+                   maturity: Tuple[float, int]) -> Dict[str, Any]:
+        """Run the observation sequence and settlement for one trade."""
+        notional = trade['notional']
+        coupon_amount = notional * trade['coupon_rate_pct']
+        threshold = trade['coupon_condition_threshold_pct']
+        ki_barrier = trade['knock_in_barrier_pct']
+        ko_barrier = trade['knock_out_barrier_pct']
+        memory = trade['is_memory_coupon']
+        cap = trade['memory_carry_cap_count']
+        
+        accrued = 0
+        total_coupon = 0.0
+        decisions = []
+        ki_date = None
+        autocall_date = None
+        final_worst, final_index = maturity
+        
+        for obs_date, worst, index in column:
+            # Step 1: autocall takes precedence; the due coupon is still paid
+            autocalled = ko_barrier is not None and worst >= ko_barrier
+            
+            # Step 2: coupon condition (independent of the KO barrier)
+            if worst >= threshold:
+                paid = coupon_amount * (accrued + 1 if memory else 1)
+                decisions.append({'observation_date': obs_date, 'coupon_paid': paid,
+                                  'barrier_breached': False, 'missed_coupons_accumulated': accrued})
+                accrued = 0
+            else:
+                paid = 0.0
+                if memory:
+                    accrued = accrued + 1 if cap is None else min(accrued + 1, cap)
+                decisions.append({'observation_date': obs_date, 'coupon_paid': paid,
+                                  'barrier_breached': True, 'missed_coupons_accumulated': accrued})
+            total_coupon += paid
+            
+            if autocalled:
+                # Redeemed here: later rows and the maturity fixing do not apply
+                autocall_date = obs_date
+                final_worst, final_index = worst, index
+                break
+            
+            # Step 3: knock-in monitoring
+            if ki_date is None and worst <= ki_barrier:
+                ki_date = obs_date
+        
+        # The worst performer was picked on unrounded ratios (BR-025B tie-break)
+        final_worst = round(final_worst, RATIO_DECIMALS)
+        
+        outputs = {
+            'knock_in_triggered': ki_date is not None,
+            'knock_in_date': ki_date,
+            'autocall_triggered': autocall_date is not None,
+            'autocall_date': autocall_date,
+            'total_coupon_paid': total_coupon,
+            'coupon_decisions': decisions,
+            'worst_of_final_ratio': final_worst,
+            'worst_performer_selected_symbol': trade['symbols'][final_index],
+            'redemption_amount': notional,
+            'loss_amount': 0.0,
+        }
+        if autocall_date is None and ki_date is not None:
+            self._settle_after_knock_in(trade, final_worst, final_index, outputs)
+        return outputs
+    
+    def _settle_after_knock_in(self, trade: Dict[str, Any], final_worst: float, final_index: int,
+                               outputs: Dict[str, Any]):
+        """Apply the post knock-in recovery mode at maturity."""
+        notional = trade['notional']
+        recovery_mode = trade['recovery_mode']
+        strike = trade['put_strike_pct']
+        
+        if recovery_mode == 'capital-at-risk' and strike is not None and final_worst < strike:
+            # BR-025: loss proportional to the shortfall below the put strike
+            loss = notional * (strike - final_worst) / strike
+            outputs['loss_amount'] = loss
+            outputs['redemption_amount'] = notional - loss
+            if trade['settlement_type'] == 'physical-settlement':
+                # BR-025A: deliver the worst performer at the strike price
+                strike_price = trade['initial_levels'][final_index] * strike
+                shares = math.floor(notional / strike_price)
+                outputs['settlement_details'] = {
+                    'cash_amount': notional - shares * strike_price,
+                    'physical_delivery': {
+                        'asset': trade['symbols'][final_index],
+                        'quantity': shares,
+                    },
+                }
+        elif recovery_mode == 'proportional-loss' and final_worst < 1.0:
+            outputs['loss_amount'] = notional * (1.0 - final_worst)
+            outputs['redemption_amount'] = notional * final_worst
+
+
+def diff_outputs(expected: Any, actual: Any, tolerance: float, path: str = 'expected_outputs') -> List[str]:
+    """
+    Compare expected against actual outputs, recursing into dicts and lists.
+
+    Only keys present in `expected` are compared. Numbers match within
+    `tolerance` (relative, with the same absolute floor); dates compare as
+    ISO strings.
+
+    Returns:
+        List of mismatch messages (empty when everything matches)
+    """
+    if isinstance(expected, dict):
+        if not isinstance(actual, dict):
+            return [f"{path}: expected an object, engine produced {actual!r}"]
+        mismatches = []
+        for key, value in expected.items():
+            if key == 'tolerance':
+                continue
+            if key not in actual:
+                mismatches.append(f"{path}.{key}: not produced by the engine")
+                continue
+            mismatches.extend(diff_outputs(value, actual[key], tolerance, f"{path}.{key}"))
+        return mismatches
+    
+    if isinstance(expected, list):
+        if not isinstance(actual, list) or len(actual) != len(expected):
+            count = len(actual) if isinstance(actual, list) else actual
+            return [f"{path}: expected {len(expected)} entries, engine produced {count}"]
+        mismatches = []
+        for i, (exp_item, act_item) in enumerate(zip(expected, actual)):
+            mismatches.extend(diff_outputs(exp_item, act_item, tolerance, f"{path}[{i}]"))
+        return mismatches
+    
+    if isinstance(expected, (int, float)) and not isinstance(expected, bool) \
+            and isinstance(actual, (int, float)) and not isinstance(actual, bool):
+        if math.isclose(actual, expected, rel_tol=tolerance, abs_tol=tolerance):
+            return []
+        return [f"{path}: expected {expected}, engine produced {actual}"]
+    
+    if isinstance(expected, date):
+        expected = expected.isoformat()
+    if expected != actual:
+        return [f"{path}: expected {expected!r}, engine produced {actual!r}"]
+    return []
 
 
 class LogicValidator:
     """
     Phase 4 validator for FCN business logic simulation.
-    
+
     Business Rules Covered:
     - BR-005: Knock-in (KI) trigger logic
     - BR-006: Coupon eligibility condition
@@ -31,131 +354,252 @@ class LogicValidator:
     - BR-021: Autocall trigger logic
     - BR-023: Payoff precedence order
     - BR-025: Capital-at-risk settlement calculation (PRIMARY)
+    - BR-025A/B: Physical worst-of delivery and tie-break
     """
     
-    def __init__(self):
-        self.errors = []
-        self.warnings = []
+    def __init__(self, corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None,
+                 tolerance: float = DEFAULT_TOLERANCE):
+        self.corpus = corpus if corpus is not None else get_corpus()
+        self.incremental = incremental
+        self.tolerance = tolerance
+        self.evaluator = BatchEvaluator()
+        self._bases = {}
     
-    def validate_capital_at_risk_settlement(self, trade: Dict[str, Any], market_data: Dict[str, Any]) -> Dict[str, Any]:
+    def prepare(self, front_matter: Any) -> Tuple[Optional[Dict], Optional[str]]:
         """
-        Validates capital-at-risk settlement logic (BR-025).
-        
-        Pseudo-logic:
-        1. At maturity, check if KI was triggered during product lifecycle
-        2. If KI triggered:
-           a. Calculate worst_of_final_ratio = min(final_level / initial_level) across all underlyings
-           b. If worst_of_final_ratio < put_strike_pct:
-              - loss_amount = notional × (put_strike_pct - worst_of_final_ratio) / put_strike_pct
-              - redemption_amount = notional - loss_amount
-           c. Else:
-              - redemption_amount = notional (100% redemption despite KI)
-        3. If KI not triggered:
-           - redemption_amount = notional (100% redemption)
-        
-        Args:
-            trade: Trade parameters including put_strike_pct, notional, underlying_assets
-            market_data: Market observation data including final levels and KI status
-        
+        Turn a vector's front matter into an evaluation job.
+
         Returns:
-            Dict with validation results and expected redemption amount
-        
-        Raises:
-            NotImplementedError: This is a placeholder; implementation pending engine integration
+            (job, None) when executable, (None, reason) when skipped, or
+            (None, 'ERROR: ...') when the vector data is malformed
         """
-        raise NotImplementedError(
-            "BR-025 capital-at-risk settlement validation is not yet implemented. "
-            "Pending integration with pricing/lifecycle engine. "
-            "Expected implementation: Q1 2026 (tentative)"
-        )
+        if not isinstance(front_matter, dict):
+            return None, "no front matter"
+        missing = [key for key in ('parameters', 'market_scenario', 'expected_outputs') if not front_matter.get(key)]
+        if missing:
+            return None, f"not executable (missing {', '.join(missing)})"
+        try:
+            trade = normalize_trade(front_matter['parameters'])
+            path = normalize_scenario(front_matter['market_scenario'], trade)
+        except (ValueError, TypeError, AttributeError) as e:
+            return None, f"ERROR: {e}"
+        expected = front_matter['expected_outputs']
+        return {
+            'trade': trade,
+            'path': path,
+            'expected': expected,
+            'tolerance': float(expected.get('tolerance', self.tolerance)),
+        }, None
     
-    def validate_autocall_precedence(self, trade: Dict[str, Any], observations: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_jobs(self, jobs: Sequence[Tuple[str, Dict]]) -> Dict[str, Dict]:
+        """Evaluate prepared jobs as one batch and diff each against its expectation."""
+        outputs = self.evaluator.evaluate([job['trade'] for _, job in jobs], [job['path'] for _, job in jobs])
+        results = {}
+        for (name, job), actual in zip(jobs, outputs):
+            errors = diff_outputs(job['expected'], actual, job['tolerance'])
+            results[name] = {'status': 'pass' if not errors else 'fail', 'errors': errors}
+        return results
+    
+    def validate_vectors(self, vectors: Iterable[Tuple[str, Any]]) -> Iterator[Tuple[str, Dict]]:
         """
-        Validates that autocall (knock-out) evaluation occurs before coupon and KI checks (BR-023).
-        
-        Precedence order:
-        1. Autocall (KO) check - highest priority
-        2. Coupon eligibility check
-        3. Knock-in monitoring (continuous)
-        4. Capital-at-risk settlement (at maturity)
-        
-        Raises:
-            NotImplementedError: This is a placeholder
+        Validate (name, front_matter) pairs, evaluating in BATCH_SIZE chunks.
+
+        Accepts any iterable, so synthetic vectors can be streamed through
+        without materializing the whole set.
+
+        Yields:
+            (name, result) with result['status'] in pass / fail / skipped / error
         """
-        raise NotImplementedError(
-            "BR-023 autocall precedence validation is not yet implemented. "
-            "Pending integration with observation processing engine."
-        )
+        jobs = []
+        for name, front_matter in vectors:
+            job, reason = self.prepare(front_matter)
+            if job is None:
+                if reason.startswith('ERROR: '):
+                    yield name, {'status': 'error', 'errors': [reason[len('ERROR: '):]]}
+                else:
+                    yield name, {'status': 'skipped', 'reason': reason, 'errors': []}
+                continue
+            jobs.append((name, job))
+            if len(jobs) >= BATCH_SIZE:
+                yield from self.validate_jobs(jobs).items()
+                jobs = []
+        if jobs:
+            yield from self.validate_jobs(jobs).items()
     
-    def validate_test_vector(self, vector_path: str) -> Dict[str, Any]:
+    def validate_test_vector(self, vector_path: Path) -> Dict[str, Any]:
         """
         Validates a single test vector against expected outcomes.
-        
+
         Args:
-            vector_path: Path to test vector file (YAML or JSON)
-        
+            vector_path: Path to a test vector markdown file
+
         Returns:
-            Dict with pass/fail status and detailed comparison
-        
-        Raises:
-            NotImplementedError: This is a placeholder
+            Dict with status and mismatch details
         """
-        raise NotImplementedError(
-            "Test vector validation is not yet implemented. "
-            "This validator is a placeholder for future Phase 4 logic validation."
-        )
+        return self.validate_test_vectors_files([Path(vector_path)])[Path(vector_path).name]
     
-    def run(self, test_vectors_dir: str) -> int:
+    def base_parameters(self, directory: Path, spec_version: Any) -> Tuple[Optional[Path], Optional[Dict]]:
         """
-        Main entry point for logic validation.
-        
-        Args:
-            test_vectors_dir: Directory containing test vectors
-        
+        Parameters a "Same as N1 ..." vector inherits.
+
         Returns:
-            Exit code: 0 for success, 1 for failure
+            (path, parameters) of the only vector in directory with the same
+            spec_version that publishes a full Parameters table, else (None, None)
+        """
+        key = (directory.resolve(), spec_version)
+        if key not in self._bases:
+            bases = []
+            for path in sorted(directory.glob('*.md')):
+                try:
+                    front_matter, body = self.corpus.document(path).load()
+                except Exception:
+                    continue
+                if isinstance(front_matter, dict) and front_matter.get('spec_version') == spec_version:
+                    parameters = parameter_table(sections(body).get('parameters'))
+                    if parameters is not None:
+                        bases.append((path, parameters))
+            self._bases[key] = bases[0] if len(bases) == 1 else (None, None)
+        return self._bases[key]
+    
+    def vector_data(self, vector_file: Path, front_matter: Dict[str, Any], body: str) -> Tuple[Any, Optional[str]]:
         """
-        print("=" * 80)
-        print("FCN v1.1 Logic Validator (Phase 4)")
-        print("=" * 80)
-        print()
-        print("STATUS: PLACEHOLDER - NOT IMPLEMENTED")
-        print()
-        print("This validator is reserved for Phase 4 business logic validation.")
-        print("Current implementation status:")
-        print("  - BR-025 (Capital-at-Risk Settlement): PENDING")
-        print("  - BR-021 (Autocall Trigger Logic): PENDING")
-        print("  - BR-023 (Payoff Precedence Order): PENDING")
-        print("  - BR-005-009 (Coupon & KI Logic): PENDING")
-        print()
-        print("Expected delivery: Q1 2026 (tentative)")
-        print("Owner: Backend Engineering Team")
-        print()
-        print("For current validation coverage, see:")
-        print("  - Phase 0: metadata_validator.py (IMPLEMENTED)")
-        print("  - Phase 1: taxonomy_validator.py (IMPLEMENTED)")
-        print("  - Phase 2: parameter_validator.py (IMPLEMENTED)")
-        print()
-        print("=" * 80)
+        Return the data to replay a vector from: its front matter when that is
+        executable, else what its markdown tables state.
+
+        Returns:
+            (vector, None), or (None, reason) when neither is enough to replay it
+        """
+        if all(front_matter.get(key) for key in ('parameters', 'market_scenario', 'expected_outputs')):
+            return front_matter, None
+        _, base = self.base_parameters(vector_file.parent, front_matter.get('spec_version'))
+        return table_vector(body, base)
+    
+    def validate_test_vectors_files(self, vector_files: Iterable[Path]) -> Dict[str, Dict]:
+        """Validate vector files, serving unchanged ones from the incremental cache."""
+        results = {}
+        pending = []
+        keys = {}
+        
+        for vector_file in sorted(vector_files):
+            try:
+                front_matter, body = self.corpus.document(vector_file).load()
+            except Exception as e:
+                results[vector_file.name] = {'status': 'error', 'errors': [f"Failed to parse: {e}"]}
+                continue
+            
+            key = None
+            if self.incremental:
+                # A vector that inherits its parameters changes with its base
+                spec_version = front_matter.get('spec_version') if isinstance(front_matter, dict) else None
+                base_path, _ = self.base_parameters(vector_file.parent, spec_version)
+                extra = [f"base={self.incremental.file_hash(base_path)}"] if base_path else []
+                key = self.incremental.document_key(vector_file, extra)
+                cached = self.incremental.get('logic', str(vector_file.resolve()), key)
+                if cached is not None:
+                    results[vector_file.name] = cached
+                    continue
+            keys[vector_file.name] = (vector_file, key)
+            
+            if not isinstance(front_matter, dict):
+                pending.append((vector_file.name, front_matter))
+                continue
+            vector, reason = self.vector_data(vector_file, front_matter, body)
+            if vector is None:
+                results[vector_file.name] = {
+                    'status': 'skipped',
+                    'reason': reason,
+                    'errors': [],
+                    'normative': front_matter.get('normative') is True,
+                }
+                continue
+            pending.append((vector_file.name, vector))
+        
+        results.update(self.validate_vectors(pending))
         
-        # Return 0 (success) since this is just a placeholder notification
-        # In future, this will return 1 if validation fails
-        return 0
+        if self.incremental:
+            for name, (vector_file, key) in keys.items():
+                self.incremental.put('logic', str(vector_file.resolve()), key, results[name])
+        return dict(sorted(results.items()))
+    
+    def print_results(self, results: Dict[str, Dict], elapsed: float):
+        """Print validation results."""
+        counts = {status: 0 for status in ('pass', 'fail', 'error', 'skipped')}
+        for result in results.values():
+            counts[result['status']] += 1
+        executed = counts['pass'] + counts['fail']
+        normative = sum(bool(result.get('normative')) for result in results.values())
+        
+        print(f"\n{'='*70}")
+        print(f"Payoff Engine Replay Results")
+        print(f"{'='*70}")
+        print(f"Total vectors: {len(results)}")
+        print(f"Executed: {executed} ({counts['pass']} passed, {counts['fail']} failed)")
+        print(f"Errors: {counts['error']}")
+        print(f"Not replayable: {counts['skipped']} ({normative} normative, counted as failures)")
+        print(f"Elapsed: {elapsed:.3f}s")
+        print(f"{'='*70}\n")
+        
+        for name, result in results.items():
+            if result['status'] in ('fail', 'error'):
+                print(f"❌ {name}")
+                for error in result['errors']:
+                    print(f"   ERROR: {error}")
+                print()
+            elif result.get('normative'):
+                print(f"❌ {name}")
+                print(f"   NOT REPLAYABLE: {result['reason']}")
+                print()
+            elif result['status'] == 'pass':
+                print(f"✅ {name}")
+        if executed:
+            print()
 
 
-def main():
-    """Main entry point for CLI invocation."""
-    if len(sys.argv) < 2:
-        print("Usage: python logic_validator.py <test_vectors_dir>")
-        print()
-        print("Note: This is a PLACEHOLDER script.")
-        print("      No actual validation is performed at this time.")
-        return 0
+def run(args: List[str], corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None) -> int:
+    """Run Phase 4 with CLI-style arguments; return the exit code."""
+    args, incremental, owned = from_args(args, corpus, incremental)
+    
+    tolerance = DEFAULT_TOLERANCE
+    if '--tolerance' in args:
+        index = args.index('--tolerance')
+        try:
+            tolerance = float(args[index + 1])
+        except (IndexError, ValueError):
+            print("Error: --tolerance requires a number")
+            return 1
+        args = args[:index] + args[index + 2:]
+    
+    if len(args) < 1:
+        print("Usage: python logic_validator.py <test_vectors_dir> [--tolerance 0.0001] [--incremental]")
+        return 1
+    
+    test_vectors_dir = Path(args[0])
     
-    test_vectors_dir = sys.argv[1]
-    validator = LogicValidator()
-    return validator.run(test_vectors_dir)
+    if not test_vectors_dir.is_dir():
+        print(f"Error: Test vectors directory not found: {test_vectors_dir}")
+        return 1
+    
+    # Memory accumulation consistency of expected_outputs (BR-008)
+    memory_exit = memory_logic_validator.run([str(test_vectors_dir)], corpus, incremental)
+    
+    start = time.perf_counter()
+    validator = LogicValidator(corpus, incremental, tolerance)
+    results = validator.validate_test_vectors_files(test_vectors_dir.glob('*.md'))
+    validator.print_results(results, time.perf_counter() - start)
+    finish(incremental, owned)
+    
+    failed = any(r['status'] in ('fail', 'error') or r.get('normative') for r in results.values())
+    executed = sum(r['status'] in ('pass', 'fail') for r in results.values())
+    if not executed:
+        # Every vector skipped would otherwise pass Phase 4 without replaying anything
+        print(f"❌ No executable test vectors in {test_vectors_dir}")
+        failed = True
+    return 1 if failed or memory_exit else 0
+
+
+def main():
+    sys.exit(run(sys.argv[1:]))
 
 
-if __name__ == "__main__":
-    sys.exit(main())
+if __name__ == '__main__':
+    main()
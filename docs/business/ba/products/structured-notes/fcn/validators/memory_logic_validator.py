@@ -10,34 +10,32 @@ Usage:
 """
 
 import sys
-import yaml
-import re
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from corpus import Corpus, get_corpus
+from incremental import IncrementalCache, finish, from_args
 
 
 class MemoryLogicValidator:
     """Validates memory coupon logic in test vectors."""
     
-    def __init__(self):
+    def __init__(self, corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None):
         self.errors = []
         self.warnings = []
+        self.corpus = corpus if corpus is not None else get_corpus()
+        self.incremental = incremental
         self.tolerance = 0.0001
     
     def extract_test_vector_data(self, file_path: Path) -> Tuple[Dict, Dict, Dict]:
         """Extract parameters, market scenario, and expected outputs from test vector."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract YAML front matter
-            pattern = r'^---\s*\n(.*?)\n---\s*\n'
-            match = re.match(pattern, content, re.DOTALL)
+            document = self.corpus.document(file_path)
+            data, _ = document.load()
             
-            if not match:
+            if not document.has_front_matter:
                 return None, None, None
             
-            data = yaml.safe_load(match.group(1))
             parameters = data.get('parameters', {})
             market_scenario = data.get('market_scenario', {})
             expected_outputs = data.get('expected_outputs', {})
@@ -106,6 +104,12 @@ class MemoryLogicValidator:
             self.errors = []
             self.warnings = []
             
+            key = self.incremental.document_key(vector_file) if self.incremental else None
+            cached = self.incremental.get('memory_logic', str(vector_file.resolve()), key) if key else None
+            if cached is not None:
+                results[vector_file.name] = cached
+                continue
+            
             is_valid = self.validate_memory_logic(vector_file)
             
             results[vector_file.name] = {
@@ -113,6 +117,8 @@ class MemoryLogicValidator:
                 'errors': self.errors.copy(),
                 'warnings': self.warnings.copy()
             }
+            if key:
+                self.incremental.put('memory_logic', str(vector_file.resolve()), key, results[vector_file.name])
         
         return results
     
@@ -152,24 +158,31 @@ class MemoryLogicValidator:
                 print()
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python memory_logic_validator.py <test_vectors_dir>")
-        sys.exit(1)
+def run(args: List[str], corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None) -> int:
+    """Run Phase 4 with CLI-style arguments; return the exit code."""
+    args, incremental, owned = from_args(args, corpus, incremental)
+    if len(args) < 1:
+        print("Usage: python memory_logic_validator.py <test_vectors_dir> [--incremental]")
+        return 1
     
-    test_vectors_dir = Path(sys.argv[1])
+    test_vectors_dir = Path(args[0])
     
     if not test_vectors_dir.is_dir():
         print(f"Error: Test vectors directory not found: {test_vectors_dir}")
-        sys.exit(1)
+        return 1
     
-    validator = MemoryLogicValidator()
+    validator = MemoryLogicValidator(corpus, incremental)
     results = validator.validate_test_vectors(test_vectors_dir)
     validator.print_results(results)
+    finish(incremental, owned)
     
     # Exit with error if any memory vectors failed
     memory_results = {k: v for k, v in results.items() if 'mem' in k.lower() and 'nomem' not in k.lower()}
-    sys.exit(0 if all(r['valid'] for r in memory_results.values()) else 1)
+    return 0 if all(r['valid'] for r in memory_results.values()) else 1
+
+
+def main():
+    sys.exit(run(sys.argv[1:]))
 
 
 if __name__ == '__main__':
@@ -10,10 +10,12 @@ Usage:
 """
 
 import sys
-import yaml
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from corpus import Corpus, get_corpus
+from incremental import IncrementalCache, finish, from_args
 
 
 class MetadataValidator:
@@ -29,41 +31,35 @@ class MetadataValidator:
     VALID_STATUSES = ['Draft', 'In Review', 'Approved', 'Published', 'Superseded', 'Archived', 'Proposed', 'Active', 'Deprecated', 'Removed']
     VALID_CLASSIFICATIONS = ['Public', 'Internal', 'Confidential', 'Restricted']
     
-    def __init__(self):
+    def __init__(self, corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None):
         self.errors = []
         self.warnings = []
+        self.corpus = corpus if corpus is not None else get_corpus()
+        self.incremental = incremental
     
     def extract_front_matter(self, content: str) -> Tuple[Dict, str]:
         """Extract YAML front matter from markdown content."""
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, content, re.DOTALL)
-        
-        if not match:
-            return None, content
+        document = self.corpus.parse(content)
         
-        front_matter_str = match.group(1)
-        body = content[match.end():]
+        if document.yaml_error is not None:
+            self.errors.append(f"Invalid YAML in front matter: {document.yaml_error}")
+            return None, document.body
         
-        try:
-            front_matter = yaml.safe_load(front_matter_str)
-            return front_matter, body
-        except yaml.YAMLError as e:
-            self.errors.append(f"Invalid YAML in front matter: {e}")
-            return None, body
+        return document.front_matter, document.body
     
     def validate_metadata(self, file_path: Path) -> bool:
         """Validate metadata for a single file."""
         self.errors = []
         self.warnings = []
         
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            self.errors.append(f"Failed to read file: {e}")
+        document = self.corpus.document(file_path)
+        if document.read_error is not None:
+            self.errors.append(f"Failed to read file: {document.read_error}")
             return False
         
-        front_matter, body = self.extract_front_matter(content)
+        if document.yaml_error is not None:
+            self.errors.append(f"Invalid YAML in front matter: {document.yaml_error}")
+        front_matter = document.front_matter
         
         if front_matter is None:
             self.errors.append("No YAML front matter found")
@@ -113,12 +109,20 @@ class MetadataValidator:
             if '_templates' in str(md_file) or 'archive' in str(md_file):
                 continue
             
+            key = self.incremental.document_key(md_file) if self.incremental else None
+            cached = self.incremental.get('metadata', str(md_file.resolve()), key) if key else None
+            if cached is not None:
+                results[str(md_file)] = cached
+                continue
+            
             is_valid = self.validate_metadata(md_file)
             results[str(md_file)] = {
                 'valid': is_valid,
                 'errors': self.errors.copy(),
                 'warnings': self.warnings.copy()
             }
+            if key:
+                self.incremental.put('metadata', str(md_file.resolve()), key, results[str(md_file)])
         
         return results
     
@@ -157,13 +161,15 @@ class MetadataValidator:
             print(f"\n✅ {len(passed_files)} files passed without warnings")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python metadata_validator.py <file_or_directory>")
-        sys.exit(1)
+def run(args: List[str], corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None) -> int:
+    """Run Phase 0 with CLI-style arguments; return the exit code."""
+    args, incremental, owned = from_args(args, corpus, incremental)
+    if len(args) < 1:
+        print("Usage: python metadata_validator.py <file_or_directory> [--incremental]")
+        return 1
     
-    path = Path(sys.argv[1])
-    validator = MetadataValidator()
+    path = Path(args[0])
+    validator = MetadataValidator(corpus, incremental)
     
     if path.is_file():
         is_valid = validator.validate_metadata(path)
@@ -176,15 +182,17 @@ def main():
         results = validator.validate_directory(path)
     else:
         print(f"Error: {path} is not a valid file or directory")
-        sys.exit(1)
+        return 1
     
     validator.print_results(results)
+    finish(incremental, owned)
     
     # Exit with error code if any validations failed
-    if any(not r['valid'] for r in results.values()):
-        sys.exit(1)
-    else:
-        sys.exit(0)
+    return 1 if any(not r['valid'] for r in results.values()) else 0
+
+
+def main():
+    sys.exit(run(sys.argv[1:]))
 
 
 if __name__ == '__main__':
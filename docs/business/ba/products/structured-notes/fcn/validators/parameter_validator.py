@@ -14,32 +14,61 @@ import json
 import yaml
 import re
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+from corpus import Corpus, get_corpus
+from incremental import ISSUER_WHITELIST_PATH, IncrementalCache, finish, from_args
 
 
 try:
     import jsonschema
-    from jsonschema import validate, ValidationError
+    from jsonschema.exceptions import best_match
+    from jsonschema.validators import validator_for
 except ImportError:
     print("Error: jsonschema library required. Install with: pip install jsonschema")
     sys.exit(1)
 
 
+# Process-wide caches keyed by (path, mtime_ns) so repeated runs in one
+# process (aggregator in-process / --watch) reuse the parsed schema, its
+# validator instance and the issuer whitelist until the file changes.
+_SCHEMA_CACHE: Dict[Tuple[str, int], Tuple[Dict, object]] = {}
+_SCHEMA_CHECKED = set()
+# Schemas that fail their metaschema: key -> error message
+_SCHEMA_ERRORS: Dict[Tuple[str, int], str] = {}
+_WHITELIST_CACHE: Dict[Tuple[str, int], List[str]] = {}
+
+
+def _file_key(path: Path) -> Tuple[str, int]:
+    """Cache key for a file: resolved path and modification time."""
+    resolved = Path(path).resolve()
+    return str(resolved), resolved.stat().st_mtime_ns
+
+
 class ParameterValidator:
     """Validates parameter conformance to JSON schema."""
     
-    def __init__(self, schema_path: Path):
-        self.schema = self._load_schema(schema_path)
+    def __init__(self, schema_path: Path, corpus: Optional[Corpus] = None,
+                 incremental: Optional[IncrementalCache] = None):
+        self.schema_path = schema_path
+        self.schema, self.schema_validator = self._load_schema(schema_path)
         self.errors = []
         self.warnings = []
+        self.corpus = corpus if corpus is not None else get_corpus()
+        self.incremental = incremental
         self.issuer_whitelist = None
         self.issuer_whitelist_loaded = False
     
-    def _load_schema(self, schema_path: Path) -> Dict:
-        """Load JSON schema."""
+    def _load_schema(self, schema_path: Path) -> Tuple[Dict, object]:
+        """Load JSON schema; return (schema, validator), cached per mtime."""
         try:
-            with open(schema_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            key = _file_key(schema_path)
+            if key not in _SCHEMA_CACHE:
+                with open(schema_path, 'r', encoding='utf-8') as f:
+                    schema = json.load(f)
+                _SCHEMA_CACHE[key] = (schema, validator_for(schema)(schema))
+            self.schema_key = key
+            return _SCHEMA_CACHE[key]
         except Exception as e:
             print(f"Error loading schema: {e}")
             sys.exit(1)
@@ -64,11 +93,17 @@ class ParameterValidator:
             return None
         
         try:
+            key = _file_key(whitelist_path)
+            if key in _WHITELIST_CACHE:
+                self.issuer_whitelist = _WHITELIST_CACHE[key]
+                return self.issuer_whitelist
+            
             with open(whitelist_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 # Extract issuer IDs from whitelist
                 if isinstance(data, list):
                     self.issuer_whitelist = [issuer.get('id') for issuer in data if 'id' in issuer]
+                    _WHITELIST_CACHE[key] = self.issuer_whitelist
                 else:
                     self.warnings.append(
                         f"Issuer whitelist format unexpected (expected list). "
@@ -87,15 +122,11 @@ class ParameterValidator:
     def extract_parameters_from_vector(self, file_path: Path) -> Dict:
         """Extract parameters from test vector file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            document = self.corpus.document(file_path)
+            front_matter, content = document.load()
             
             # Try YAML front matter first
-            pattern = r'^---\s*\n(.*?)\n---\s*\n'
-            match = re.match(pattern, content, re.DOTALL)
-            
-            if match:
-                front_matter = yaml.safe_load(match.group(1))
+            if document.has_front_matter:
                 return front_matter.get('parameters', {})
             
             # Try finding parameters section in markdown
@@ -112,14 +143,39 @@ class ParameterValidator:
     
     def validate_parameters(self, parameters: Dict, context: str) -> bool:
         """Validate parameters against schema."""
-        try:
-            validate(instance=parameters, schema=self.schema)
-            return True
-        except ValidationError as e:
-            self.errors.append(f"{context}: Schema validation failed: {e.message}")
-            if e.path:
-                self.errors.append(f"  Path: {' -> '.join(str(p) for p in e.path)}")
+        # Same checks as jsonschema.validate(), but the schema itself is only
+        # checked once per file version rather than on every call
+        if self.schema_key not in _SCHEMA_CHECKED:
+            validator_class = type(self.schema_validator)
+            # Metaschema errors arrive in hash-seed dependent order; report
+            # the first by schema path so every process prints the same one
+            schema_errors = sorted(
+                validator_class(validator_class.META_SCHEMA).iter_errors(self.schema),
+                key=lambda e: [str(p) for p in e.absolute_path],
+            )
+            if schema_errors:
+                cause = best_match(schema_errors[0].context) or schema_errors[0]
+                location = '/'.join(str(p) for p in cause.absolute_path) or '(root)'
+                more = f" (and {len(schema_errors) - 1} more)" if len(schema_errors) > 1 else ""
+                _SCHEMA_ERRORS[self.schema_key] = f"{location}: {cause.message}{more}"
+            _SCHEMA_CHECKED.add(self.schema_key)
+        
+        schema_error = _SCHEMA_ERRORS.get(self.schema_key)
+        if schema_error is not None:
+            # A schema its own $schema rejects cannot be applied reliably
+            self.errors.append(
+                f"{context}: Not checked: {self.schema_path.name} is not a valid schema: {schema_error}"
+            )
             return False
+        
+        e = best_match(self.schema_validator.iter_errors(parameters))
+        if e is None:
+            return True
+        
+        self.errors.append(f"{context}: Schema validation failed: {e.message}")
+        if e.path:
+            self.errors.append(f"  Path: {' -> '.join(str(p) for p in e.path)}")
+        return False
     
     def validate_naming_conventions(self, parameters: Dict, context: str) -> bool:
         """Validate parameter naming conventions."""
@@ -187,11 +243,23 @@ class ParameterValidator:
     def validate_test_vectors(self, test_vectors_dir: Path) -> Dict[str, bool]:
         """Validate all test vectors in directory."""
         results = {}
+        dependencies = ()
+        if self.incremental:
+            dependencies = (
+                f"schema={self.incremental.file_hash(self.schema_path)}",
+                f"issuer_whitelist={self.incremental.file_hash(ISSUER_WHITELIST_PATH)}",
+            )
         
         for vector_file in test_vectors_dir.glob('*.md'):
             self.errors = []
             self.warnings = []
             
+            key = self.incremental.document_key(vector_file, dependencies) if self.incremental else None
+            cached = self.incremental.get('parameter', str(vector_file.resolve()), key) if key else None
+            if cached is not None:
+                results[vector_file.name] = cached
+                continue
+            
             parameters = self.extract_parameters_from_vector(vector_file)
             
             if not parameters:
@@ -201,6 +269,8 @@ class ParameterValidator:
                     'errors': self.errors.copy(),
                     'warnings': self.warnings.copy()
                 }
+                if key:
+                    self.incremental.put('parameter', str(vector_file.resolve()), key, results[vector_file.name])
                 continue
             
             context = f"Test vector '{vector_file.name}'"
@@ -212,6 +282,8 @@ class ParameterValidator:
                 'errors': self.errors.copy(),
                 'warnings': self.warnings.copy()
             }
+            if key:
+                self.incremental.put('parameter', str(vector_file.resolve()), key, results[vector_file.name])
         
         return results
     
@@ -244,27 +316,34 @@ class ParameterValidator:
                 print()
 
 
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: python parameter_validator.py <schema_path> <test_vectors_dir>")
-        sys.exit(1)
+def run(args: List[str], corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None) -> int:
+    """Run Phase 2 with CLI-style arguments; return the exit code."""
+    args, incremental, owned = from_args(args, corpus, incremental)
+    if len(args) < 2:
+        print("Usage: python parameter_validator.py <schema_path> <test_vectors_dir> [--incremental]")
+        return 1
     
-    schema_path = Path(sys.argv[1])
-    test_vectors_dir = Path(sys.argv[2])
+    schema_path = Path(args[0])
+    test_vectors_dir = Path(args[1])
     
     if not schema_path.exists():
         print(f"Error: Schema file not found: {schema_path}")
-        sys.exit(1)
+        return 1
     
     if not test_vectors_dir.is_dir():
         print(f"Error: Test vectors directory not found: {test_vectors_dir}")
-        sys.exit(1)
+        return 1
     
-    validator = ParameterValidator(schema_path)
+    validator = ParameterValidator(schema_path, corpus, incremental)
     results = validator.validate_test_vectors(test_vectors_dir)
     validator.print_results(results)
+    finish(incremental, owned)
     
-    sys.exit(0 if all(r['valid'] for r in results.values()) else 1)
+    return 0 if all(r['valid'] for r in results.values()) else 1
+
+
+def main():
+    sys.exit(run(sys.argv[1:]))
 
 
 if __name__ == '__main__':
@@ -10,10 +10,11 @@ Usage:
 """
 
 import sys
-import yaml
-import re
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+
+from corpus import Corpus, get_corpus
+from incremental import IncrementalCache, finish, from_args
 
 
 class TaxonomyValidator:
@@ -29,17 +30,17 @@ class TaxonomyValidator:
     
     REQUIRED_DIMENSIONS = ['barrier_type', 'settlement', 'coupon_memory', 'step_feature', 'recovery_mode']
     
-    def __init__(self):
+    def __init__(self, corpus: Optional[Corpus] = None):
         self.errors = []
         self.warnings = []
+        self.corpus = corpus if corpus is not None else get_corpus()
         self.branches_from_manifest = {}
         self.test_vectors_taxonomy = {}
     
     def load_manifest(self, manifest_path: Path) -> bool:
         """Load and parse manifest.yaml."""
         try:
-            with open(manifest_path, 'r', encoding='utf-8') as f:
-                manifest = yaml.safe_load(f)
+            manifest = self.corpus.load_yaml(manifest_path)
             
             branches = manifest.get('branches', [])
             for branch in branches:
@@ -89,17 +90,11 @@ class TaxonomyValidator:
     def extract_test_vector_taxonomy(self, file_path: Path) -> Dict:
         """Extract taxonomy from test vector markdown file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract YAML front matter
-            pattern = r'^---\s*\n(.*?)\n---\s*\n'
-            match = re.match(pattern, content, re.DOTALL)
+            front_matter, _ = self.corpus.document(file_path).load()
             
-            if not match:
+            if front_matter is None:
                 return None
             
-            front_matter = yaml.safe_load(match.group(1))
             return front_matter.get('taxonomy')
         except Exception as e:
             self.warnings.append(f"Failed to parse {file_path.name}: {e}")
@@ -206,22 +201,50 @@ class TaxonomyValidator:
         print(f"{'='*70}\n")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python taxonomy_validator.py <fcn_base_directory>")
-        sys.exit(1)
+def run(args: List[str], corpus: Optional[Corpus] = None, incremental: Optional[IncrementalCache] = None) -> int:
+    """Run Phase 1 with CLI-style arguments; return the exit code."""
+    args, incremental, owned = from_args(args, corpus, incremental)
+    if len(args) < 1:
+        print("Usage: python taxonomy_validator.py <fcn_base_directory> [--incremental]")
+        return 1
     
-    fcn_base_dir = Path(sys.argv[1])
+    fcn_base_dir = Path(args[0])
     
     if not fcn_base_dir.is_dir():
         print(f"Error: {fcn_base_dir} is not a valid directory")
-        sys.exit(1)
+        return 1
+    
+    validator = TaxonomyValidator(corpus)
+    
+    # Corpus-wide phase: cached as a whole, keyed by every vector plus manifest branches
+    key = None
+    if incremental:
+        key = incremental.corpus_key(
+            (fcn_base_dir / 'test-vectors').glob('*.md'),
+            [f"branches={incremental.manifest_branches_hash()}"]
+        )
+    cached = incremental.get('taxonomy', str(fcn_base_dir.resolve()), key) if key else None
+    
+    if cached is not None:
+        validator.errors, validator.warnings = cached['errors'], cached['warnings']
+        is_valid = cached['valid']
+    else:
+        is_valid = validator.validate(fcn_base_dir)
+        if key:
+            incremental.put('taxonomy', str(fcn_base_dir.resolve()), key, {
+                'valid': is_valid,
+                'errors': validator.errors,
+                'warnings': validator.warnings
+            })
     
-    validator = TaxonomyValidator()
-    is_valid = validator.validate(fcn_base_dir)
     validator.print_results()
+    finish(incremental, owned)
     
-    sys.exit(0 if is_valid else 1)
+    return 0 if is_valid else 1
+
+
+def main():
+    sys.exit(run(sys.argv[1:]))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+FCN Test Vector Tables
+
+Reads the markdown tables test vectors publish their scenario in into the
+`parameters` / `market_scenario` / `expected_outputs` shape the Phase 4
+engine replays (schemas/test-vector.schema.json):
+
+- `## Parameters`: name | value rows. Vectors that say "Same as N1 except
+  ..." (or have no Parameters section) take a base vector's parameters
+  with any `name = value` overrides from that sentence.
+- `## Underlying Path`: observation date and one level column per
+  underlying (or a single `level` column), plus the "Maturity ... level"
+  line below the table as the fixing on maturity_date.
+- `## Expected Events` / `## Outcome Summary`: `key: value` bullets for
+  the knock-in / autocall flags, worst_of_final_ratio and the selected
+  worst performer.
+- `## Cash Flows`: coupon, principal, loss, shares and cash rows.
+- A trace table with a `coupon_paid` column: per-observation coupons and
+  the missed coupons each one releases (accrued_unpaid start) or carries
+  after a miss (accrued_unpaid end).
+
+Only what a vector states is compared; derived columns (ratios, Yes/No
+flags) are ignored.
+
+Part of the FCN v1.0 governance framework.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+
+HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+?)\s*$', re.MULTILINE)
+DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+NUMBER_PATTERN = re.compile(r'^\(?-?\$?[\d_,]*\.?\d+\)?$')
+BULLET_PATTERN = re.compile(r'^\s*-\s*(\w+):\s*(.+)$', re.MULTILINE)
+MATURITY_PATTERN = re.compile(r'^Maturity\b.*$', re.MULTILINE)
+OVERRIDE_PATTERN = re.compile(r'\b(\w+)\s*=\s*([^\s,;]+?)\.?(?=$|[\s,;])')
+SHARES_PATTERN = re.compile(r'([\d,]+)\s+(\S+)\s+shares')
+
+# Expected Events / Outcome Summary bullet keys and their expected_outputs names
+EVENT_KEYS = {
+    'ki_triggered': 'knock_in_triggered',
+    'autocall_triggered': 'autocall_triggered',
+    'worst_of_final_ratio': 'worst_of_final_ratio',
+    'worst_performer_selected_symbol': 'worst_performer_selected_symbol',
+}
+EVENT_DATES = {'knock_in_triggered': 'knock_in_date', 'autocall_triggered': 'autocall_date'}
+
+
+def sections(body: str) -> Dict[str, str]:
+    """Map each heading (lower-cased, trailing parenthetical dropped) to its text."""
+    headings = list(HEADING_PATTERN.finditer(body))
+    result = {}
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(body)
+        title = re.sub(r'\s*\(.*\)$', '', heading.group(1)).strip().lower()
+        result.setdefault(title, body[heading.end():end])
+    return result
+
+
+def tables(text: str) -> List[List[Dict[str, str]]]:
+    """Parse every pipe table in text into rows keyed by lower-cased header."""
+    result = []
+    header = None
+    for line in text.splitlines():
+        line = line.strip()
+        if not line.startswith('|'):
+            header = None
+            continue
+        cells = [cell.replace('**', '').strip() for cell in line.strip('|').split('|')]
+        if header is None:
+            header = [re.sub(r'\s+', ' ', cell.lower()) for cell in cells]
+            result.append([])
+        elif not all(set(cell) <= set('-: ') for cell in cells):
+            result[-1].append(dict(zip(header, cells)))
+    return result
+
+
+def number(text: str) -> Optional[float]:
+    """Parse 1_000_000, 40,000, $8.00 or (107,500); None if text is not a number."""
+    text = text.replace('**', '').strip()
+    if not NUMBER_PATTERN.match(text):
+        return None
+    value = float(text.strip('()').replace('$', '').replace(',', '').replace('_', ''))
+    return -value if text.startswith('(') else value
+
+
+def scalar(text: str) -> Any:
+    """Parse a Parameters table value."""
+    text = text.strip()
+    lowered = text.lower()
+    if lowered in ('', 'null', 'none'):
+        return None
+    if lowered in ('true', 'false'):
+        return lowered == 'true'
+    if text.startswith('[') and text.endswith(']'):
+        return [scalar(item.strip().strip('"\'')) for item in text[1:-1].split(',') if item.strip()]
+    parts = [part.strip() for part in text.split(',')]
+    if len(parts) > 1 and all(DATE_PATTERN.match(part) for part in parts):
+        return parts
+    if DATE_PATTERN.match(text):
+        return text
+    value = number(text)
+    if value is None:
+        return text
+    return int(value) if value.is_integer() and '.' not in text else value
+
+
+def parameter_table(section: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Return the name | value table of a Parameters section, or None if it has none."""
+    for rows in tables(section or ''):
+        if rows and 'name' in rows[0] and 'value' in rows[0]:
+            return {row['name']: scalar(row['value']) for row in rows}
+    return None
+
+
+def inherited_overrides(section: Optional[str]) -> Dict[str, Any]:
+    """`name = value` overrides from a "Same as N1 except ..." Parameters section."""
+    text = (section or '').split('except', 1)
+    if len(text) < 2:
+        return {}
+    return {name: scalar(value) for name, value in OVERRIDE_PATTERN.findall(text[1])}
+
+
+def symbol_of(text: str, symbols: List[str]) -> Optional[str]:
+    """Resolve a symbol as written in prose (PLTR or PLTR.US) to the trade's symbol."""
+    for symbol in symbols:
+        if text == symbol or text == str(symbol).split('.')[0]:
+            return symbol
+    return None
+
+
+def market_path(section: str, parameters: Dict[str, Any]) -> Tuple[List[Dict], Dict[int, str]]:
+    """
+    Return underlying_levels rows from an Underlying Path section.
+
+    Returns:
+        (rows, {obs #: observation_date}); rows is empty if the section has
+        no path table. The maturity fixing, when stated, is the last row.
+    """
+    symbols = [str(s) for s in parameters.get('underlying_symbols') or []]
+    for rows in tables(section):
+        header = list(rows[0]) if rows else []
+        date_column = next((h for h in header if 'date' in h), None)
+        level_columns = [h for h in header if h in [s.lower() for s in symbols]]
+        if not level_columns:
+            level_columns = [h for h in header if h.startswith('level') and '/' not in h]
+        if date_column is None or not level_columns:
+            continue
+
+        path = []
+        dates = {}
+        for i, row in enumerate(rows, 1):
+            path.append({
+                'observation_date': row[date_column],
+                'levels': [number(row[column]) for column in level_columns],
+            })
+            obs = number(row.get('obs #', '')) or i
+            dates[int(obs)] = row[date_column]
+
+        maturity = maturity_levels(section, symbols, len(level_columns))
+        if maturity is not None and parameters.get('maturity_date'):
+            path.append({'observation_date': str(parameters['maturity_date']), 'levels': maturity})
+        return path, dates
+    return [], {}
+
+
+def maturity_levels(section: str, symbols: List[str], count: int) -> Optional[List[float]]:
+    """Levels from the "Maturity final levels: AMZN 172.0 (0.956), ..." line, if any."""
+    match = MATURITY_PATTERN.search(section)
+    if match is None:
+        return None
+    line = match.group(0)
+    if count == 1:
+        values = re.findall(r'\d+(?:\.\d+)?', re.sub(r'\([^)]*\)', '', line))
+        return [float(values[0])] if values else None
+    levels = []
+    for symbol in symbols:
+        found = re.search(rf'\b{re.escape(symbol.split(".")[0])}(?:\.\w+)?\s+(\d+(?:\.\d+)?)', line)
+        if found is None:
+            return None
+        levels.append(float(found.group(1)))
+    return levels
+
+
+def expected_outputs(parts: Dict[str, str], symbols: List[str], dates: Dict[int, str]) -> Dict[str, Any]:
+    """Collect the outcomes a vector states in its events, cash flows and traces."""
+    expected = {}
+    for title in ('expected events', 'outcome summary'):
+        for key, value in BULLET_PATTERN.findall(parts.get(title, '')):
+            name = EVENT_KEYS.get(key)
+            token = re.match(r'[\w.\-]+', value.replace('**', '').strip())
+            if name is None or token is None or name in expected:
+                continue
+            token = token.group(0)
+            if name in EVENT_DATES and token in ('true', 'false'):
+                expected[name] = token == 'true'
+                obs = re.search(r'\b(?:obs|period)\s+(\d+)', value)
+                if expected[name] and obs and int(obs.group(1)) in dates:
+                    expected[EVENT_DATES[name]] = dates[int(obs.group(1))]
+            elif name == 'worst_of_final_ratio' and number(token) is not None:
+                expected[name] = number(token)
+            elif name == 'worst_performer_selected_symbol' and symbol_of(token, symbols):
+                expected[name] = symbol_of(token, symbols)
+
+    for rows in tables(parts.get('cash flows', '')):
+        if not rows or 'type' not in rows[0] or 'amount' not in rows[0]:
+            continue
+        coupons = [number(row['amount']) for row in rows if row['type'] == 'coupon']
+        if coupons and None not in coupons:
+            expected['total_coupon_paid'] = sum(coupons)
+        principal = [number(row['amount']) for row in rows if row['type'] == 'principal']
+        if len(principal) == 1 and principal[0] is not None:
+            expected['redemption_amount'] = principal[0]
+        loss = [number(row['amount']) for row in rows if row['type'] == 'loss']
+        if len(loss) == 1 and loss[0] is not None:
+            expected['loss_amount'] = abs(loss[0])
+        details = {}
+        for row in rows:
+            shares = SHARES_PATTERN.search(row['amount']) if row['type'] == 'shares' else None
+            if shares and symbol_of(shares.group(2), symbols):
+                details['physical_delivery'] = {
+                    'asset': symbol_of(shares.group(2), symbols),
+                    'quantity': number(shares.group(1)),
+                }
+            elif row['type'] == 'cash' and number(row['amount']) is not None:
+                details['cash_amount'] = number(row['amount'])
+        if details:
+            expected['settlement_details'] = details
+
+    for title, text in parts.items():
+        for rows in tables(text):
+            if not rows or 'coupon_paid' not in rows[0] or 'obs #' not in rows[0]:
+                continue
+            # missed_coupons_accumulated is the count of prior missed coupons a
+            # payment releases (er-fcn-v1.0.md), or the count carried after a miss
+            start = next((h for h in rows[0] if h.startswith('accrued_unpaid') and 'start' in h), None)
+            end = next((h for h in rows[0] if h.startswith('accrued_unpaid') and 'end' in h), None)
+            decisions = []
+            for row in rows:
+                decision = {'coupon_paid': number(row['coupon_paid'])}
+                accrued = start if decision['coupon_paid'] else end
+                if start and end:
+                    decision['missed_coupons_accumulated'] = number(row[accrued])
+                decisions.append(decision)
+            expected['coupon_decisions'] = decisions
+    return expected
+
+
+def table_vector(body: str, base_parameters: Optional[Dict[str, Any]] = None) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Build parameters / market_scenario / expected_outputs from a vector's tables.
+
+    Args:
+        body: Markdown body (front matter removed)
+        base_parameters: Parameters a "Same as N1 ..." vector inherits
+
+    Returns:
+        (vector, None), or (None, reason) when the tables are not enough to
+        replay the vector
+    """
+    parts = sections(body)
+    parameters = parameter_table(parts.get('parameters'))
+    if parameters is None:
+        if base_parameters is None:
+            return None, "no Parameters table and no base vector to inherit from"
+        parameters = dict(base_parameters, **inherited_overrides(parts.get('parameters')))
+
+    if 'underlying path' not in parts:
+        return None, "no Underlying Path table"
+    rows, dates = market_path(parts['underlying path'], parameters)
+    if not rows:
+        return None, "Underlying Path has no observation date and level columns"
+
+    expected = expected_outputs(parts, [str(s) for s in parameters.get('underlying_symbols') or []], dates)
+    if not expected:
+        return None, "no expected events, cash flows or coupon trace"
+    return {
+        'parameters': parameters,
+        'market_scenario': {'underlying_levels': rows},
+        'expected_outputs': expected,
+    }, None
@@ -24,7 +24,10 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 import requests
-import yaml
+
+# Shared, cached front matter parser (fcn/validators/corpus.py)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "business/ba/products/structured-notes/fcn/validators"))
+from corpus import parse_front_matter as corpus_parse_front_matter  # noqa: E402
 
 
 def parse_front_matter(file_path: Path) -> Tuple[Dict[str, Any], str]:
@@ -38,25 +41,7 @@ def parse_front_matter(file_path: Path) -> Tuple[Dict[str, Any], str]:
         Tuple of (front_matter_dict, error_message)
         error_message is empty string if successful
     """
-    try:
-        content = file_path.read_text(encoding='utf-8')
-    except Exception as e:
-        return {}, f"Failed to read file: {e}"
-    
-    # Match YAML front matter between --- delimiters
-    match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-    if not match:
-        return {}, "No YAML front matter found (expected content between --- delimiters)"
-    
-    yaml_content = match.group(1)
-    
-    try:
-        front_matter = yaml.safe_load(yaml_content)
-        if not isinstance(front_matter, dict):
-            return {}, "Front matter is not a valid YAML dictionary"
-        return front_matter, ""
-    except yaml.YAMLError as e:
-        return {}, f"Failed to parse YAML front matter: {e}"
+    return corpus_parse_front_matter(file_path, "No YAML front matter found (expected content between --- delimiters)")
 
 
 def validate_required_fields(front_matter: Dict[str, Any]) -> List[str]:
@@ -18,8 +18,9 @@ Requirements:
 import json
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import jsonschema
 from jsonschema import Draft7Validator
@@ -47,19 +48,28 @@ def load_json_file(file_path: Path) -> Tuple[Dict[str, Any], str]:
         return {}, f"Error reading {file_path.name}: {e}"
 
 
-def validate_json_schema(payload: Dict[str, Any], schema: Dict[str, Any]) -> List[Dict[str, str]]:
+@lru_cache(maxsize=4096)
+def parse_date(value: str) -> datetime:
+    """Parse an ISO-8601 date or datetime string, keeping the time (memoized across payloads)."""
+    return datetime.fromisoformat(value)
+
+
+def validate_json_schema(payload: Dict[str, Any], schema: Dict[str, Any],
+                         validator: Optional[Draft7Validator] = None) -> List[Dict[str, str]]:
     """
     Validate payload against JSON Schema.
     
     Args:
         payload: Payload data to validate
         schema: JSON Schema definition
+        validator: Pre-built validator for schema (built once per run)
         
     Returns:
         List of violation dictionaries
     """
     violations = []
-    validator = Draft7Validator(schema)
+    if validator is None:
+        validator = Draft7Validator(schema)
     
     for error in validator.iter_errors(payload):
         path = "$.{}".format(".".join(str(p) for p in error.path)) if error.path else "$"
@@ -101,13 +111,11 @@ def validate_cross_field_rules(payload: Dict[str, Any]) -> List[Dict[str, str]]:
     
     if observation_dates and maturity_date_str:
         try:
-            maturity_date = datetime.fromisoformat(maturity_date_str)
+            maturity_date = parse_date(maturity_date_str)
+            obs_dates = [parse_date(d) for d in observation_dates]
             
             # Check strictly increasing
-            for i in range(len(observation_dates) - 1):
-                date1 = datetime.fromisoformat(observation_dates[i])
-                date2 = datetime.fromisoformat(observation_dates[i + 1])
-                
+            for i, (date1, date2) in enumerate(zip(obs_dates, obs_dates[1:])):
                 if date1 >= date2:
                     violations.append({
                         "path": f"$.observation_dates[{i + 1}]",
@@ -116,13 +124,12 @@ def validate_cross_field_rules(payload: Dict[str, Any]) -> List[Dict[str, str]]:
                     })
             
             # Check all < maturity_date
-            for i, obs_date_str in enumerate(observation_dates):
-                obs_date = datetime.fromisoformat(obs_date_str)
+            for i, obs_date in enumerate(obs_dates):
                 if obs_date >= maturity_date:
                     violations.append({
                         "path": f"$.observation_dates[{i}]",
                         "rule": "before_maturity",
-                        "message": f"observation_dates[{i}] ({obs_date_str}) must be before maturity_date ({maturity_date_str})"
+                        "message": f"observation_dates[{i}] ({observation_dates[i]}) must be before maturity_date ({maturity_date_str})"
                     })
         except (ValueError, TypeError) as e:
             violations.append({
@@ -146,10 +153,10 @@ def validate_cross_field_rules(payload: Dict[str, Any]) -> List[Dict[str, str]]:
     
     if issue_date_str and coupon_payment_dates:
         try:
-            issue_date = datetime.fromisoformat(issue_date_str)
+            issue_date = parse_date(issue_date_str)
             
             for i, payment_date_str in enumerate(coupon_payment_dates):
-                payment_date = datetime.fromisoformat(payment_date_str)
+                payment_date = parse_date(payment_date_str)
                 if payment_date < issue_date:
                     violations.append({
                         "path": f"$.coupon_payment_dates[{i}]",
@@ -178,7 +185,8 @@ def validate_cross_field_rules(payload: Dict[str, Any]) -> List[Dict[str, str]]:
 
 
 def validate_payload(payload: Dict[str, Any], schema: Dict[str, Any], 
-                     payload_name: str) -> Tuple[List[Dict[str, str]], int, int]:
+                     payload_name: str,
+                     validator: Optional[Draft7Validator] = None) -> Tuple[List[Dict[str, str]], int, int]:
     """
     Validate a single payload against schema and cross-field rules.
     
@@ -186,6 +194,7 @@ def validate_payload(payload: Dict[str, Any], schema: Dict[str, Any],
         payload: Payload data
         schema: JSON Schema
         payload_name: Name/identifier for the payload
+        validator: Pre-built validator for schema
         
     Returns:
         Tuple of (violations, error_count, warning_count)
@@ -193,7 +202,7 @@ def validate_payload(payload: Dict[str, Any], schema: Dict[str, Any],
     violations = []
     
     # Schema validation
-    schema_violations = validate_json_schema(payload, schema)
+    schema_violations = validate_json_schema(payload, schema, validator)
     violations.extend(schema_violations)
     
     # Cross-field validation
@@ -256,6 +265,7 @@ def validate_fcn_parameters(payload_dir: Path, schema_path: Path) -> Dict[str, A
     
     total_errors = 0
     total_warnings = 0
+    validator = Draft7Validator(schema)
     
     for payload_file in payload_files:
         # Load payload
@@ -271,7 +281,7 @@ def validate_fcn_parameters(payload_dir: Path, schema_path: Path) -> Dict[str, A
         
         # Validate payload
         violations, error_count, warning_count = validate_payload(
-            payload, schema, payload_file.name
+            payload, schema, payload_file.name, validator
         )
         
         # Add payload identifier to violations
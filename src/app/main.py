@@ -3,57 +3,139 @@ FCN API main application.
 
 FastAPI application with idempotency middleware, health endpoints,
 and observability integration.
+
+create_app() builds the application from Settings. The database engine,
+idempotency store, caches and validation metadata are created in the
+lifespan hook, so importing this module loads no DB driver and opens no
+connection. `src.app.main:app` is built from the environment on first
+access; `uvicorn --factory src.app.main:create_app` works as well.
 """
-from fastapi import FastAPI, Depends
-from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-import os
+from typing import Optional
+
+from fastapi import APIRouter, Depends, FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from src.app.middleware.admission import AdmissionController, AdmissionMiddleware
 from src.app.middleware.idempotency import IdempotencyMiddleware
-from src.domain.services.idempotency import IdempotencyService
-from src.infra.idempotency.mssql_store import MSSQLIdempotencyStore
-from src.infra.db.base import SessionLocal
+from src.app.middleware.metrics import MetricsMiddleware
+from src.app.middleware.profiling import ProfilingMiddleware
+from src.app.routers import profiling, trades
+from src.app.routers.trades import error_response
+from src.app.serialization import CodecRoute, ORJSONResponse, negotiated_response
+from src.app.settings import Settings
+from src.domain.services.templates import TemplateValidationError
+from src.observability import metrics
+from src.observability.tracing import configure_tracing, instrument_engine
 
 
 def utcnow():
     """Return current UTC time as timezone-aware datetime."""
     return datetime.now(timezone.utc)
 
-# Create FastAPI application
-app = FastAPI(
-    title="FCN API Service",
-    description="Fixed Coupon Note API with idempotency and tracing",
-    version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Create the engine, idempotency store and caches before serving.
+
+    Compiles parameter schemas and loads parameter definitions so the first
+    request does not pay for them, unless the app was given reference data
+    preloaded by the prefork server. Starts the parameter definition poller
+    and the admission controller's event-loop lag monitor. Disposes the
+    engine's pool on shutdown.
+    """
+    # Imported here rather than at module level: only needed once serving
+    from src.app.reference_data import ReferenceData
+    from src.domain.services.idempotency import CircuitBreaker, IdempotencyService
+    from src.infra.cache.template_cache import TemplateCache
+    from src.infra.db.base import SessionLocal, dispose_engine, init_engine
+    from src.infra.idempotency.instrumented import InstrumentedIdempotencyStore
+    from src.infra.idempotency.mssql_store import MSSQLIdempotencyStore
+
+    settings: Settings = app.state.settings
+    engine = init_engine(settings.database_url)
+
+    # Expose primary DB pool gauges at scrape time; span per SQL statement
+    metrics.register_pool("primary", engine.pool)
+    instrument_engine(app.state.tracing, engine)
+
+    # Idempotency service with MSSQL backend (read by IdempotencyMiddleware);
+    # store calls are bounded by deadlines and a circuit breaker
+    breaker = None
+    if settings.idempotency_breaker_failures > 0:
+        breaker = CircuitBreaker(
+            failure_threshold=settings.idempotency_breaker_failures,
+            reset_timeout_seconds=settings.idempotency_breaker_reset_seconds,
+            slow_call_seconds=settings.idempotency_slow_call_ms / 1000 or None,
+        )
+        metrics.register_idempotency_breaker(breaker)
+    app.state.idempotency_service = IdempotencyService(
+        store=InstrumentedIdempotencyStore(
+            MSSQLIdempotencyStore(session_factory=SessionLocal),
+            backend="mssql",
+            tracer=app.state.tracing.get_tracer("src.infra.idempotency.instrumented"),
+        ),
+        get_timeout_seconds=settings.idempotency_get_timeout_ms / 1000 or None,
+        set_timeout_seconds=settings.idempotency_set_timeout_ms / 1000 or None,
+        breaker=breaker,
+    )
+
+    # Seeded parameter bounds and compiled schemas, hot-reloaded on change
+    reference = app.state.reference_data or ReferenceData.load(settings)
+    metrics.ACTIVE_VERSIONS.set(len(reference.validation_service.schemas.schema_files))
+    app.state.parameter_definitions = reference.parameter_definitions
+    app.state.validation_service = reference.validation_service.with_tracer(
+        app.state.tracing.get_tracer("src.validation.service")
+    )
+
+    # Read-through template cache used by booking; templates are checked
+    # against the schemas and bounds above before they are cached
+    app.state.template_cache = TemplateCache(
+        session_factory=SessionLocal,
+        poll_interval_seconds=settings.template_cache_poll_seconds,
+        validator=app.state.validation_service.validate_template,
+    )
+
+    # Parameter definition polls run in a background task, not in requests
+    reference.parameter_definitions.start()
+
+    # Event-loop lag sampling for load shedding
+    if app.state.admission is not None:
+        app.state.admission.loop_monitor.start()
+
+    try:
+        yield
+    finally:
+        await reference.parameter_definitions.stop()
+        if app.state.admission is not None:
+            await app.state.admission.loop_monitor.stop()
+        dispose_engine()
 
 
-# Initialize idempotency service with MSSQL backend
-def get_session_factory():
-    """Return session factory for dependency injection."""
-    return SessionLocal
+# Booking envelope fields; everything else in the body is a trade parameter
+BOOKING_FIELDS = frozenset({"trade_id", "template_id"})
 
 
-idempotency_store = MSSQLIdempotencyStore(session_factory=get_session_factory)
-idempotency_service = IdempotencyService(store=idempotency_store)
+def get_template_cache(request: Request):
+    """Return template cache for dependency injection."""
+    return request.app.state.template_cache
 
-# Register idempotency middleware
-app.add_middleware(
-    IdempotencyMiddleware,
-    idempotency_service=idempotency_service,
-    ttl_hours=24
-)
 
+router = APIRouter(route_class=CodecRoute)
 
-@app.get("/health")
+
+@router.get("/health")
 async def health_check():
     """
     Health check endpoint.
     
     Returns basic service health status.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "status": "healthy",
@@ -64,7 +146,7 @@ async def health_check():
     )
 
 
-@app.get("/health/ready")
+@router.get("/health/ready")
 async def readiness_check():
     """
     Readiness check endpoint.
@@ -72,7 +154,7 @@ async def readiness_check():
     Verifies service is ready to accept requests (DB connectivity, etc.).
     """
     # TODO: Add DB connectivity check
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "status": "ready",
@@ -82,7 +164,47 @@ async def readiness_check():
     )
 
 
-@app.post("/api/v1/templates")
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """
+    Prometheus scrape endpoint.
+    
+    Returns the FCN metrics registry in the Prometheus text exposition
+    format, summed across workers under the prefork server.
+    """
+    return Response(
+        content=generate_latest(metrics.scrape_registry()),
+        media_type=CONTENT_TYPE_LATEST
+    )
+
+
+@router.get("/internal/cache/templates")
+async def template_cache_stats(request: Request):
+    """
+    Template cache statistics endpoint.
+    
+    Returns hit/miss counters and hit rate for the in-process template cache.
+    """
+    return ORJSONResponse(
+        status_code=200,
+        content=request.app.state.template_cache.snapshot()
+    )
+
+
+@router.get("/internal/cache/parameters")
+async def parameter_cache_stats(request: Request):
+    """
+    Parameter-definition index statistics endpoint.
+    
+    Returns load/poll counters and the number of indexed definitions.
+    """
+    return ORJSONResponse(
+        status_code=200,
+        content=request.app.state.parameter_definitions.snapshot()
+    )
+
+
+@router.post("/api/v1/templates")
 async def create_template():
     """
     Create FCN template endpoint (stub).
@@ -90,7 +212,7 @@ async def create_template():
     This endpoint will be implemented with full business logic.
     For now, it serves as a test endpoint for idempotency middleware.
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=201,
         content={
             "template_id": "TPL-001",
@@ -100,46 +222,168 @@ async def create_template():
     )
 
 
-@app.post("/api/v1/trades")
-async def book_trade():
+@router.post("/api/v1/trades")
+async def book_trade(request: Request, template_cache=Depends(get_template_cache)):
     """
     Book FCN trade endpoint (stub).
     
     This endpoint will be implemented with full business logic.
     For now, it serves as a test endpoint for idempotency middleware.
+    Accepts and returns JSON or MessagePack (Content-Type / Accept).
+    A `template_id` in the body must name an active, valid template
+    (resolved through the template cache); otherwise the response is 422.
+    The trade's parameters (the body's, over the template's defaults) must
+    pass the validation service for their spec version; otherwise the
+    response is 422 with the violations. A body that does not decode
+    (empty, malformed JSON or MessagePack) is 400.
     """
-    return JSONResponse(
-        status_code=201,
-        content={
+    try:
+        payload = await request.json()
+    except ValueError as e:
+        # orjson and msgpack decode errors are both ValueErrors
+        return error_response(400, "INVALID_BODY", f"Request body does not decode: {e}")
+    if not isinstance(payload, dict):
+        return error_response(400, "INVALID_BODY", "Request body must be an object")
+    template_id = payload.get("template_id")
+    parameters = {name: value for name, value in payload.items() if name not in BOOKING_FIELDS}
+    spec_version = None
+    if template_id is not None:
+        # Cache misses query the database: keep them off the event loop
+        try:
+            template = await run_in_threadpool(template_cache.get, str(template_id))
+        except TemplateValidationError as e:
+            return error_response(422, "INVALID_TEMPLATE", str(e), {"template_id": template_id})
+        if template is None:
+            return error_response(422, "UNKNOWN_TEMPLATE", f"Template '{template_id}' not found",
+                                  {"template_id": template_id})
+        if not template.is_active:
+            return error_response(422, "TEMPLATE_NOT_ACTIVE", f"Template '{template_id}' is {template.status}",
+                                  {"template_id": template_id, "status": template.status})
+        parameters = {**template.parameters, **parameters}
+        spec_version = template.spec_version
+
+    # Compiled schema, seeded bounds, issuer whitelist and cross-field rules;
+    # a version stated in the body overrides the template's
+    result = request.app.state.validation_service.validate(
+        parameters, parameters.get("spec_version") or parameters.get("documentation_version") or spec_version,
+    )
+    if not result.valid:
+        return error_response(422, "VALIDATION_FAILED", "Trade parameters failed validation", {
+            "spec_version": result.spec_version,
+            "violations": [v.as_dict() for v in result.violations],
+        })
+
+    metrics.TRADES_CREATED.inc()
+    return negotiated_response(
+        request,
+        {
             "trade_id": "TRD-001",
             "status": "booked",
             "message": "Trade booked successfully"
-        }
+        },
+        status_code=201,
     )
 
 
-@app.post("/api/v1/observations")
-async def record_observation():
+@router.post("/api/v1/observations")
+async def record_observation(request: Request):
     """
     Record observation endpoint (stub).
     
     This endpoint will be implemented with full business logic.
     For now, it serves as a test endpoint for idempotency middleware.
+    Accepts and returns JSON or MessagePack (Content-Type / Accept).
     """
-    return JSONResponse(
-        status_code=201,
-        content={
-            "observation_id": "OBS-001",
-            "status": "recorded",
-            "message": "Observation recorded successfully"
-        }
+    with metrics.OBSERVATION_LATENCY.time():
+        response = negotiated_response(
+            request,
+            {
+                "observation_id": "OBS-001",
+                "status": "recorded",
+                "message": "Observation recorded successfully"
+            },
+            status_code=201,
+        )
+    metrics.OBSERVATIONS_PROCESSED.inc()
+    return response
+
+
+def create_app(settings: Optional[Settings] = None, reference_data=None) -> FastAPI:
+    """
+    Build the FCN API application.
+
+    Args:
+        settings: Application settings (default: Settings.from_env())
+        reference_data: Preloaded ReferenceData (default: loaded in lifespan)
+
+    Returns:
+        FastAPI app; the engine and stores are created when its lifespan starts
+    """
+    settings = settings or Settings.from_env()
+
+    app = FastAPI(
+        title="FCN API Service",
+        description="Fixed Coupon Note API with idempotency and tracing",
+        version="0.1.0",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
+    app.state.settings = settings
+    app.state.reference_data = reference_data
+
+    # Register idempotency middleware (service created in lifespan)
+    app.add_middleware(
+        IdempotencyMiddleware,
+        ttl_hours=settings.idempotency_ttl_hours,
+        fail_open_paths=settings.idempotency_fail_open_paths,
+    )
+
+    # Root span per request, idempotency store and DB statement child spans
+    app.state.tracing = configure_tracing(app=app, mode=settings.traces_exporter)
+
+    # Opt-in request profiling (idle unless started via /internal/profiling)
+    app.add_middleware(ProfilingMiddleware)
+
+    # Shed load with 503 before any work (inside metrics so rejections are counted)
+    app.state.admission = None
+    if settings.admission_enabled:
+        app.state.admission = AdmissionController.from_settings(settings)
+        metrics.register_admission(app.state.admission)
+        app.add_middleware(AdmissionMiddleware, controller=app.state.admission)
+
+    # Register metrics middleware last so it is outermost and times the full stack
+    app.add_middleware(MetricsMiddleware)
+
+    # Health, metrics, cache statistics and booking stubs
+    app.include_router(router)
+
+    # Register query routers
+    app.include_router(trades.router)
+
+    # Register admin profiling endpoints (enabled by PROFILING_ADMIN_TOKEN)
+    app.include_router(profiling.router)
+
+    return app
+
+
+def __getattr__(name: str):
+    # `src.app.main:app` (uvicorn, scripts) is built from environment
+    # settings on first access rather than at import
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
+    # Development server; production uses the prefork launcher (src.app.server)
     import uvicorn
     uvicorn.run(
-        "src.app.main:app",
+        "src.app.main:create_app",
+        factory=True,
         host="0.0.0.0",
         port=8000,
         reload=True,
@@ -0,0 +1,230 @@
+"""
+Admission control middleware for FastAPI.
+
+Pure ASGI middleware that rejects requests early with 503 and Retry-After
+instead of letting them queue for a database connection or the event
+loop. Queued requests make latency grow for everyone, and their client
+retries add more load through the idempotency path.
+
+Requests are classified by priority:
+
+    health    /health*, /metrics, /internal/*     never shed
+    replay    POST with an Idempotency-Key        shed at 3x pressure
+    query     other requests (GET)                shed at 2x pressure
+    booking   POST without a key, or a keyed      shed at 1x pressure
+              POST the idempotency store missed
+
+Keyed POSTs are admitted as replays; the idempotency middleware moves them
+to the booking class after a store miss (AdmissionTicket.reclassify).
+Under moderate pressure, retries of work already done are served while
+new bookings are shed after one store lookup. Under severe pressure,
+everything but health checks is shed before any work is done.
+Every class except health also has an in-flight limit.
+
+Pressure is the larger of the standing pool checkout wait and event-loop
+lag, each relative to its limit (src.observability.saturation).
+
+All state is touched from the event loop thread only, so no locking.
+"""
+from typing import Dict, Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.app.serialization import ORJSONResponse
+from src.observability.metrics import ADMISSION_REJECTIONS
+from src.observability.saturation import POOL_WAIT, LoopLagMonitor, StandingDelay
+
+
+HEALTH = "health"
+REPLAY = "replay"
+QUERY = "query"
+BOOKING = "booking"
+
+ROUTE_CLASSES = (HEALTH, REPLAY, QUERY, BOOKING)
+
+# Pressure at which a class is shed; health checks never are
+SHED_AT_PRESSURE = {BOOKING: 1.0, QUERY: 2.0, REPLAY: 3.0}
+
+HEALTH_PATH_PREFIXES = ("/health", "/metrics", "/internal/")
+
+RETRY_AFTER_SECONDS = 1
+
+# Scope key holding the request's AdmissionTicket
+TICKET_SCOPE_KEY = "fcn.admission"
+
+
+class AdmissionController:
+    """
+    Tracks in-flight requests per route class and decides admission.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, int],
+        max_pool_wait_seconds: float,
+        max_loop_lag_seconds: float,
+        pool_wait: StandingDelay = POOL_WAIT,
+        loop_monitor: Optional[LoopLagMonitor] = None,
+    ):
+        """
+        Initialize admission controller.
+
+        Args:
+            limits: In-flight limit per route class (classes absent: unlimited)
+            max_pool_wait_seconds: Pool checkout wait at pressure 1.0
+            max_loop_lag_seconds: Event-loop lag at pressure 1.0
+            pool_wait: Standing pool checkout wait
+            loop_monitor: Loop lag monitor (started in the app's lifespan)
+
+        Raises:
+            ValueError: If a signal limit is not positive
+        """
+        for name, limit in (("max_pool_wait", max_pool_wait_seconds), ("max_loop_lag", max_loop_lag_seconds)):
+            if not limit > 0:
+                raise ValueError(f"Admission {name} must be positive, got {limit!r}")
+        self.limits = limits
+        self.max_pool_wait = max_pool_wait_seconds
+        self.max_loop_lag = max_loop_lag_seconds
+        self.pool_wait = pool_wait
+        self.loop_monitor = loop_monitor or LoopLagMonitor()
+        self.in_flight: Dict[str, int] = {name: 0 for name in ROUTE_CLASSES}
+
+    @classmethod
+    def from_settings(cls, settings) -> "AdmissionController":
+        """
+        Build a controller from application settings.
+
+        Args:
+            settings: Settings (admission_* fields)
+
+        Returns:
+            AdmissionController
+        """
+        return cls(
+            limits={
+                BOOKING: settings.admission_booking_limit,
+                QUERY: settings.admission_query_limit,
+                REPLAY: settings.admission_replay_limit,
+            },
+            max_pool_wait_seconds=settings.admission_max_pool_wait_ms / 1000,
+            max_loop_lag_seconds=settings.admission_max_loop_lag_ms / 1000,
+        )
+
+    def classify(self, scope: Scope) -> str:
+        """Return the route class of a request."""
+        if scope["path"].startswith(HEALTH_PATH_PREFIXES):
+            return HEALTH
+        if scope["method"] != "POST":
+            return QUERY
+        for name, _ in scope["headers"]:
+            if name == b"idempotency-key":
+                return REPLAY
+        return BOOKING
+
+    def signals(self) -> Dict[str, float]:
+        """Return each saturation signal relative to its limit."""
+        return {
+            "pool_wait": self.pool_wait.value() / self.max_pool_wait,
+            "loop_lag": self.loop_monitor.lag.value() / self.max_loop_lag,
+        }
+
+    def try_acquire(self, route_class: str) -> Optional[str]:
+        """
+        Admit one request of a route class.
+
+        Args:
+            route_class: Route class
+
+        Returns:
+            None if admitted (release() when done), else the rejection
+            reason: "in_flight", "pool_wait" or "loop_lag"
+        """
+        limit = self.limits.get(route_class)
+        if limit is not None and self.in_flight[route_class] >= limit:
+            return "in_flight"
+        shed_at = SHED_AT_PRESSURE.get(route_class)
+        if shed_at is not None:
+            signal, pressure = max(self.signals().items(), key=lambda item: item[1])
+            if pressure >= shed_at:
+                return signal
+        self.in_flight[route_class] += 1
+        return None
+
+    def release(self, route_class: str) -> None:
+        """Release a request admitted by try_acquire()."""
+        self.in_flight[route_class] -= 1
+
+    def rejection(self, route_class: str, reason: str) -> ORJSONResponse:
+        """Build the 503 response for a shed request and count it."""
+        ADMISSION_REJECTIONS.labels(route_class, reason).inc()
+        return ORJSONResponse(
+            status_code=503,
+            content={
+                "error": {
+                    "code": "SERVICE_OVERLOADED",
+                    "message": "Service is at capacity; retry after the indicated delay",
+                    "details": {"route_class": route_class, "reason": reason},
+                }
+            },
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
+
+
+class AdmissionTicket:
+    """
+    One admitted request's hold on its route class.
+    """
+    __slots__ = ("controller", "route_class")
+
+    def __init__(self, controller: AdmissionController, route_class: str):
+        self.controller = controller
+        self.route_class = route_class
+
+    def reclassify(self, route_class: str) -> Optional[str]:
+        """
+        Move the request to another route class if that class admits it.
+
+        Returns:
+            None if moved, else the rejection reason (the current class is kept)
+        """
+        reason = self.controller.try_acquire(route_class)
+        if reason is None:
+            self.controller.release(self.route_class)
+            self.route_class = route_class
+        return reason
+
+
+class AdmissionMiddleware:
+    """
+    Middleware admitting or shedding requests by route class.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController):
+        """
+        Initialize admission middleware.
+
+        Args:
+            app: ASGI application
+            controller: Admission controller
+        """
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        controller = self.controller
+        route_class = controller.classify(scope)
+        reason = controller.try_acquire(route_class)
+        if reason is not None:
+            await controller.rejection(route_class, reason)(scope, receive, send)
+            return
+
+        ticket = AdmissionTicket(controller, route_class)
+        scope[TICKET_SCOPE_KEY] = ticket
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release(ticket.route_class)
@@ -3,17 +3,56 @@ Idempotency middleware for FastAPI.
 
 Intercepts POST requests with Idempotency-Key header and ensures
 idempotent processing with response capture.
+
+Snapshots hold the response body exactly as sent (MessagePack responses
+are stored as the equivalent JSON). Replays re-encode it with
+src.app.serialization in the format the retry asks for, so a replay in the
+original format is byte-identical to the original response (older snapshots
+written with stdlib json are normalized to the same compact form).
+
+Fingerprints hash the decoded request payload, not its bytes, so a retry
+sent as JSON or MessagePack matches the original in either encoding.
+
+When the store misses its deadline, fails, or its circuit is open
+(IdempotencyUnavailableError), the lookup fails closed with 503
+IDEMPOTENCY_UNAVAILABLE and Retry-After. Paths configured as safe to
+repeat (fail_open_paths) are instead handled without deduplication. A
+failed write never fails the request: the response has been produced.
+
+Keys are not reserved while a request is in flight. A second request with
+the same key that arrives before the first one's record is written also
+misses and is handled (whatever its payload); the later write then fails
+on the key's unique index and is counted as a store_error.
 """
 from datetime import datetime, timedelta, timezone
-from typing import Callable
-import json
+from typing import Callable, Iterable, Optional
+import logging
+import math
 from fastapi import Request, Response
-from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message
 import io
 
-from src.domain.services.idempotency import IdempotencyService, IdempotencyRecord
+from src.app.middleware.admission import BOOKING, TICKET_SCOPE_KEY
+from src.app.serialization import (
+    ORJSONResponse,
+    canonical_body,
+    dumps,
+    is_msgpack,
+    loads,
+    negotiated_response,
+    unpackb,
+)
+from src.domain.services.idempotency import (
+    IdempotencyRecord,
+    IdempotencyService,
+    IdempotencyUnavailableError,
+)
+from src.observability.metrics import IDEMPOTENCY_DEGRADED, IDEMPOTENCY_LOOKUPS, IDEMPOTENCY_OUTCOMES
+from src.observability.profiling import phase
+
+
+logger = logging.getLogger(__name__)
 
 
 def utcnow():
@@ -21,19 +60,45 @@ def utcnow():
     return datetime.now(timezone.utc)
 
 
+def replay_body(request: Request, body: bytes) -> None:
+    """
+    Hand a body already read by middleware to the handler.
+
+    BaseHTTPMiddleware (Starlette < 0.28) passes the original receive
+    channel downstream, so a handler reading the consumed body would wait
+    forever. The body is replayed once; later receives (disconnect) go to
+    the original channel.
+    """
+    receive = request.receive
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    request._receive = replay
+
+
 class IdempotencyMiddleware(BaseHTTPMiddleware):
     """
     Middleware for handling idempotent POST requests.
     
     Captures request/response and replays cached responses for duplicate
     idempotency keys. Returns 409 Conflict if same key used with different payload.
+    
+    The service may be passed directly or, when built in the app's lifespan
+    hook, read per request from `app.state.idempotency_service`.
     """
     
     def __init__(
         self,
         app: ASGIApp,
-        idempotency_service: IdempotencyService,
-        ttl_hours: int = 24
+        idempotency_service: Optional[IdempotencyService] = None,
+        ttl_hours: int = 24,
+        fail_open_paths: Iterable[str] = ()
     ):
         """
         Initialize idempotency middleware.
@@ -41,13 +106,32 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         Args:
             app: ASGI application
             idempotency_service: Service for idempotency key management
+                (default: request.app.state.idempotency_service)
             ttl_hours: Time-to-live for idempotency records in hours
+            fail_open_paths: Paths handled without deduplication when the
+                store is unavailable (others get 503)
         """
         super().__init__(app)
         self.idempotency_service = idempotency_service
         self.ttl_hours = ttl_hours
+        self.fail_open_paths = frozenset(fail_open_paths)
         self.idempotency_header = "Idempotency-Key"
     
+    @staticmethod
+    def unavailable_response(error: IdempotencyUnavailableError) -> ORJSONResponse:
+        """Build the 503 response for a lookup the store could not answer."""
+        return ORJSONResponse(
+            status_code=503,
+            content={
+                "error": {
+                    "code": "IDEMPOTENCY_UNAVAILABLE",
+                    "message": "Idempotency store unavailable; retry after the indicated delay",
+                    "details": {"reason": error.reason}
+                }
+            },
+            headers={"Retry-After": str(max(1, math.ceil(error.retry_after_seconds)))}
+        )
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
         Process request with idempotency handling.
@@ -61,29 +145,54 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
         """
         # Only process POST requests with idempotency key
         if request.method != "POST":
-            return await call_next(request)
+            with phase("handler"):
+                return await call_next(request)
         
         idempotency_key = request.headers.get(self.idempotency_header)
         if not idempotency_key:
-            return await call_next(request)
+            with phase("handler"):
+                return await call_next(request)
+        
+        service = self.idempotency_service or request.app.state.idempotency_service
         
         # Read request body for fingerprint computation
         body = await request.body()
+        replay_body(request, body)
         
-        # Compute request fingerprint
-        request_fingerprint = self.idempotency_service.compute_fingerprint(
-            method=request.method,
-            path=str(request.url.path),
-            body=body
-        )
+        # Compute request fingerprint over the encoding-independent payload
+        with phase("fingerprint"):
+            request_fingerprint = service.compute_fingerprint(
+                method=request.method,
+                path=str(request.url.path),
+                body=canonical_body(body, request.headers.get("content-type"))
+            )
         
         # Check for existing record
-        existing = await self.idempotency_service.get_record(idempotency_key)
+        try:
+            with phase("store_get"):
+                existing = await service.get_record(idempotency_key)
+        except IdempotencyUnavailableError as e:
+            fail_open = request.url.path in self.fail_open_paths
+            IDEMPOTENCY_DEGRADED.labels("get", e.reason, "fail_open" if fail_open else "fail_closed").inc()
+            # Refusals by the open circuit are only counted, not logged
+            if e.reason != "circuit_open":
+                logger.warning("Idempotency lookup failed %s: %s", "open" if fail_open else "closed", e)
+            if not fail_open:
+                return self.unavailable_response(e)
+            # Safe to repeat: handle as new work, without deduplication
+            existing = None
         
         if existing:
-            # Check for conflict (same key, different payload)
-            if self.idempotency_service.check_conflict(existing, request_fingerprint):
-                return JSONResponse(
+            IDEMPOTENCY_LOOKUPS.labels("hit").inc()
+            
+            # Check for conflict (same key, different payload). Records stored
+            # before fingerprints were canonical hash the raw body.
+            if service.check_conflict(existing, request_fingerprint) and service.check_conflict(
+                existing,
+                service.compute_fingerprint(method=request.method, path=str(request.url.path), body=body),
+            ):
+                IDEMPOTENCY_OUTCOMES.labels("conflict").inc()
+                return ORJSONResponse(
                     status_code=409,
                     content={
                         "error": {
@@ -101,38 +210,59 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
                     }
                 )
             
-            # Replay cached response
-            cached_response = json.loads(existing.response_snapshot)
-            return JSONResponse(
-                status_code=existing.response_status,
-                content=cached_response,
-                headers={"X-Idempotency-Replay": "true"}
-            )
+            # Replay cached response in the format this request accepts
+            IDEMPOTENCY_OUTCOMES.labels("replay").inc()
+            with phase("serialization"):
+                cached_response = loads(existing.response_snapshot)
+                return negotiated_response(
+                    request,
+                    cached_response,
+                    status_code=existing.response_status,
+                    headers={"X-Idempotency-Replay": "true"}
+                )
+        
+        IDEMPOTENCY_LOOKUPS.labels("miss").inc()
+        
+        # A miss is new work: admitted as a replay, it must now fit the
+        # booking class (see src.app.middleware.admission)
+        ticket = request.scope.get(TICKET_SCOPE_KEY)
+        if ticket is not None:
+            reason = ticket.reclassify(BOOKING)
+            if reason is not None:
+                return ticket.controller.rejection(BOOKING, reason)
         
         # Process request and capture response
-        response = await call_next(request)
+        with phase("handler"):
+            response = await call_next(request)
         
         # Only cache successful responses (2xx)
         if 200 <= response.status_code < 300:
-            # Read response body
-            response_body = b""
-            async for chunk in response.body_iterator:
-                response_body += chunk
-            
-            # Parse JSON response
-            try:
-                response_json = json.loads(response_body.decode('utf-8'))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # If response is not JSON, don't cache
-                return Response(
-                    content=response_body,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    media_type=response.media_type
-                )
+            with phase("serialization"):
+                # Read response body
+                response_body = b""
+                async for chunk in response.body_iterator:
+                    response_body += chunk
+                
+                # Only JSON and MessagePack responses are cached
+                try:
+                    if is_msgpack(response.headers.get("content-type")):
+                        # Snapshots are JSON whichever format was sent
+                        response_snapshot = dumps(unpackb(response_body)).decode("utf-8")
+                    else:
+                        loads(response_body)
+                        # Snapshot the bytes sent, not a re-encoding of them
+                        response_snapshot = response_body.decode("utf-8")
+                except ValueError:
+                    # If response does not decode, don't cache
+                    return Response(
+                        content=response_body,
+                        status_code=response.status_code,
+                        headers=dict(response.headers),
+                        media_type=response.media_type
+                    )
             
             # Store idempotency record
-            key_hash = self.idempotency_service.hash_key(idempotency_key)
+            key_hash = service.hash_key(idempotency_key)
             now = utcnow()
             record = IdempotencyRecord(
                 key_hash=key_hash,
@@ -140,21 +270,26 @@ class IdempotencyMiddleware(BaseHTTPMiddleware):
                 request_method=request.method,
                 request_path=str(request.url.path),
                 response_status=response.status_code,
-                response_snapshot=json.dumps(response_json),
+                response_snapshot=response_snapshot,
                 created_at=now,
                 expires_at=now + timedelta(hours=self.ttl_hours)
             )
             
             try:
-                await self.idempotency_service.store_record(record)
-            except Exception as e:
+                with phase("store_set"):
+                    await service.store_record(record)
+                IDEMPOTENCY_OUTCOMES.labels("stored").inc()
+            except IdempotencyUnavailableError as e:
                 # Log error but don't fail request
-                print(f"Failed to store idempotency record: {e}")
+                IDEMPOTENCY_OUTCOMES.labels("store_error").inc()
+                IDEMPOTENCY_DEGRADED.labels("set", e.reason, "fail_open").inc()
+                if e.reason != "circuit_open":
+                    logger.warning("Failed to store idempotency record: %s", e, exc_info=e.reason == "error")
             
             # Return response with captured body
-            return JSONResponse(
+            return Response(
+                content=response_body,
                 status_code=response.status_code,
-                content=response_json,
                 headers=dict(response.headers)
             )
         
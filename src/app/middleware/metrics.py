@@ -0,0 +1,95 @@
+"""
+HTTP metrics middleware for FastAPI.
+
+Pure ASGI middleware (no BaseHTTPMiddleware task/stream wrapping) recording
+per-route latency, status counts and request/response sizes on the
+Prometheus registry in src.observability.metrics.
+"""
+from time import perf_counter
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.observability.metrics import route_metrics
+
+
+# Label for requests that matched no route (404s, scanners) so raw paths
+# never become label values
+UNMATCHED_ROUTE = "__unmatched__"
+
+
+class MetricsMiddleware:
+    """
+    Middleware recording HTTP request metrics.
+
+    The route label is the matched route template (scope["route"].path, set
+    by FastAPI's router), not the raw URL path. Responses produced before
+    routing (idempotent replays and conflicts) are matched against the
+    application's routes after the fact.
+    """
+
+    def __init__(self, app: ASGIApp, exclude_paths: tuple = ("/metrics",)):
+        """
+        Initialize metrics middleware.
+
+        Args:
+            app: ASGI application
+            exclude_paths: Paths not instrumented (scrape endpoint by default)
+        """
+        self.app = app
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        response_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, response_size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_size += len(message.get("body", b""))
+            await send(message)
+
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            route = scope.get("route")
+            metrics = route_metrics(
+                scope["method"],
+                route.path if route is not None else _route_template(scope),
+            )
+            metrics.latency.observe(elapsed)
+            metrics.requests(status).inc()
+            metrics.response_size.observe(response_size)
+
+            request_size = _content_length(scope)
+            if request_size is not None:
+                metrics.request_size.observe(request_size)
+
+
+def _route_template(scope: Scope) -> str:
+    """Return the template of the first application route matching the request."""
+    router = getattr(scope.get("app"), "router", None)
+    for route in getattr(router, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ROUTE)
+    return UNMATCHED_ROUTE
+
+
+def _content_length(scope: Scope):
+    """Return the request Content-Length header value, if present."""
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
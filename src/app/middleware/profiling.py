@@ -0,0 +1,35 @@
+"""
+Profiling middleware for FastAPI.
+
+Pure ASGI middleware scoping each request for the opt-in sampling profiler
+in src.observability.profiling. Outside a profiling session it costs one
+clock read.
+"""
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.observability.profiling import StackSampler, profiler
+
+
+class ProfilingMiddleware:
+    """
+    Middleware selecting requests for profiling and collecting phase timers.
+    """
+
+    def __init__(self, app: ASGIApp, sampler: StackSampler = profiler):
+        """
+        Initialize profiling middleware.
+
+        Args:
+            app: ASGI application
+            sampler: Sampler owning the profiling session
+        """
+        self.app = app
+        self.sampler = sampler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.sampler.active:
+            await self.app(scope, receive, send)
+            return
+
+        with self.sampler.request():
+            await self.app(scope, receive, send)
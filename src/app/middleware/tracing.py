@@ -0,0 +1,75 @@
+"""
+Tracing middleware for FastAPI.
+
+Pure ASGI middleware opening the ADR-006 §10 root span (`http.request`) for
+each request. Incoming W3C trace context is continued; 5xx responses and
+unhandled exceptions mark the span as an error so the tail sampler keeps
+them. Deliberately leaner than FastAPIInstrumentor, which adds a span per
+ASGI send/receive message.
+"""
+from opentelemetry import propagate
+from opentelemetry.trace import SpanKind, Status, StatusCode, Tracer
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.middleware.metrics import _route_template
+from src.observability.tracing import EXCLUDED_URLS
+
+
+SPAN_HTTP_REQUEST = "http.request"
+
+
+class TracingMiddleware:
+    """
+    Middleware opening a server span per HTTP request.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer, excluded_prefixes: tuple = tuple(EXCLUDED_URLS.split(","))):
+        """
+        Initialize tracing middleware.
+
+        Args:
+            app: ASGI application
+            tracer: Tracer from the app's TracingSetup
+            excluded_prefixes: Path prefixes not traced (scrapes and probes)
+        """
+        self.app = app
+        self.tracer = tracer
+        self.excluded_prefixes = excluded_prefixes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.excluded_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        with self.tracer.start_as_current_span(
+            SPAN_HTTP_REQUEST,
+            context=_extract_context(scope),
+            kind=SpanKind.SERVER,
+            attributes={"http.method": scope["method"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                span.set_attributes({
+                    "http.route": route.path if route is not None else _route_template(scope),
+                    "http.status_code": status,
+                })
+                if status >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
+
+
+def _extract_context(scope: Scope):
+    """Return the caller's trace context, or None when none was propagated."""
+    headers = scope["headers"]
+    if not any(name == b"traceparent" for name, _ in headers):
+        return None
+    return propagate.extract({name.decode("latin-1"): value.decode("latin-1") for name, value in headers})
@@ -0,0 +1,60 @@
+"""
+Read-only reference data used by request handling.
+
+Parameter definitions, the issuer whitelist and the compiled parameter
+schemas. The app's
+lifespan hook loads them per process; the prefork server (src.app.server)
+loads them once in the master before forking so workers share the pages
+copy-on-write.
+"""
+from dataclasses import dataclass
+
+from src.app.settings import Settings
+from src.infra.cache.parameter_definitions import ParameterDefinitionCache
+from src.validation.issuers import IssuerWhitelist
+from src.validation.service import ValidationService
+
+
+@dataclass
+class ReferenceData:
+    """
+    Preloaded parameter definitions, issuer whitelist and validation service.
+    """
+    parameter_definitions: ParameterDefinitionCache
+    issuer_whitelist: IssuerWhitelist
+    validation_service: ValidationService
+
+    @classmethod
+    def load(cls, settings: Settings) -> "ReferenceData":
+        """
+        Compile parameter schemas, read the issuer whitelist and load
+        parameter definitions.
+
+        Args:
+            settings: Application settings
+
+        Returns:
+            Loaded ReferenceData
+        """
+        parameter_definitions = ParameterDefinitionCache(
+            poll_interval_seconds=settings.parameter_cache_poll_seconds,
+        )
+        issuer_whitelist = IssuerWhitelist()
+        issuer_whitelist.load()
+        validation_service = ValidationService(parameters=parameter_definitions, issuers=issuer_whitelist)
+        validation_service.schemas.preload()
+        parameter_definitions.load()
+        return cls(
+            parameter_definitions=parameter_definitions,
+            issuer_whitelist=issuer_whitelist,
+            validation_service=validation_service,
+        )
+
+    def release_connections(self) -> None:
+        """
+        Close pooled connections opened while loading.
+
+        Call before fork so no connection is shared between processes; each
+        worker reconnects on its first version poll.
+        """
+        self.parameter_definitions.engine.dispose()
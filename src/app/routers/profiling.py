@@ -0,0 +1,98 @@
+"""
+Profiling endpoints (admin only).
+
+Start/stop a sampling-profiler session and download its collapsed stacks
+and per-phase timers. Disabled unless Settings.profiling_admin_token
+(PROFILING_ADMIN_TOKEN) is set; callers must send the token in the
+X-Admin-Token header.
+"""
+from typing import Optional
+import hmac
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import PlainTextResponse
+
+from src.app.routers.trades import error_response
+from src.app.serialization import ORJSONResponse, CodecRoute
+from src.observability.profiling import MAX_SESSION_SECONDS, ProfilingBusyError, profiler
+
+
+ADMIN_TOKEN_HEADER = "X-Admin-Token"
+
+router = APIRouter(prefix="/internal/profiling", tags=["Profiling"], include_in_schema=False,
+                   route_class=CodecRoute)
+
+
+def authorize(request: Request) -> Optional[ORJSONResponse]:
+    """Return an error response unless the request carries the admin token."""
+    token = request.app.state.settings.profiling_admin_token
+    if not token:
+        return error_response(404, "PROFILING_DISABLED", "Profiling is not enabled on this instance")
+    supplied = request.headers.get(ADMIN_TOKEN_HEADER, "")
+    if not hmac.compare_digest(supplied.encode("utf-8"), token.encode("utf-8")):
+        return error_response(403, "ADMIN_TOKEN_INVALID", f"Missing or invalid {ADMIN_TOKEN_HEADER} header")
+    return None
+
+
+@router.post("/start")
+def start_profiling(
+    request: Request,
+    seconds: float = Query(30.0, gt=0, le=MAX_SESSION_SECONDS, description="Session length"),
+    one_in: Optional[int] = Query(None, ge=1, description="Profile only every K-th request"),
+    interval_ms: float = Query(10.0, ge=1, le=1000, description="Sampling interval"),
+):
+    """
+    Start a profiling session.
+
+    Samples the whole process for `seconds`, or only while every `one_in`-th
+    request is in flight. Starting discards the previous session's data.
+    """
+    denied = authorize(request)
+    if denied:
+        return denied
+
+    try:
+        session = profiler.start(seconds, one_in=one_in, interval_seconds=interval_ms / 1000)
+    except ProfilingBusyError as e:
+        return error_response(409, "PROFILING_IN_PROGRESS", str(e))
+    return ORJSONResponse(status_code=202, content=session.as_dict(session.started_at))
+
+
+@router.post("/stop")
+def stop_profiling(request: Request):
+    """Stop the running session early."""
+    denied = authorize(request)
+    if denied:
+        return denied
+
+    profiler.stop()
+    return ORJSONResponse(status_code=200, content=profiler.snapshot())
+
+
+@router.get("/phases")
+def profiling_phases(request: Request):
+    """Return the session summary and per-phase timers."""
+    denied = authorize(request)
+    if denied:
+        return denied
+
+    return ORJSONResponse(status_code=200, content=profiler.snapshot())
+
+
+@router.get("/stacks")
+def profiling_stacks(request: Request):
+    """
+    Download collapsed stacks (`frame;frame;frame count` per line).
+
+    Render with flamegraph.pl, speedscope or inferno-flamegraph.
+    """
+    denied = authorize(request)
+    if denied:
+        return denied
+
+    if profiler.session is None:
+        return error_response(404, "PROFILE_NOT_FOUND", "No profiling session has been started")
+    return PlainTextResponse(
+        profiler.collapsed(),
+        headers={"Content-Disposition": 'attachment; filename="fcn-api.collapsed.txt"'},
+    )
@@ -0,0 +1,183 @@
+"""
+Trade query endpoints.
+
+Trade listing and lifecycle history with keyset pagination and an NDJSON
+streaming mode for bulk export. Paths follow the OpenAPI contract
+(docs/business/sa/interfaces/openapi/fcn-openapi-starter.yaml): the
+`/api/fcn/trades` operations under its `/v1` server base. Pages are JSON, or MessagePack with
+`format=msgpack` / `Accept: application/msgpack`.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.app.serialization import CodecRoute, ORJSONResponse, dumps, negotiated_response
+from src.infra.db.base import get_db
+from src.infra.db.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    InvalidCursorError,
+    decode_cursor,
+)
+from src.infra.db.repositories import (
+    LifecycleEventRepository,
+    TradeRepository,
+    trade_exists,
+)
+
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Cursors are opaque: a bad one gets this fixed message, never the decoder's
+INVALID_CURSOR_MESSAGE = "Invalid pagination cursor"
+
+router = APIRouter(prefix="/v1/api/fcn/trades", tags=["Trades"], route_class=CodecRoute)
+
+
+def wants_ndjson(request: Request, format: Optional[str]) -> bool:
+    """Return True if the client asked for NDJSON streaming output."""
+    if format is not None:
+        return format.lower() == "ndjson"
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def repository_tracer(request: Request):
+    """Return the app's tracer for repository.query spans."""
+    return request.app.state.tracing.get_tracer("src.infra.db.repositories")
+
+
+def error_response(status_code: int, code: str, message: str, details: Optional[Dict] = None) -> ORJSONResponse:
+    """Build an ADR-006 error envelope response."""
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if details:
+        error["details"] = details
+    return ORJSONResponse(status_code=status_code, content={"error": error})
+
+
+def ndjson_stream(rows: Iterator[Dict[str, Any]], session: Session) -> Iterator[bytes]:
+    """
+    Encode rows as newline-delimited JSON.
+
+    `session` is the request's get_db session. FastAPI closes it only after
+    the response is sent, so it stays open for the server-side cursor;
+    closing it here as well releases the connection as soon as the stream
+    ends, and keeps the stream correct where dependency teardown runs
+    before the body is sent.
+    """
+    try:
+        for row in rows:
+            yield dumps(row) + b"\n"
+    finally:
+        session.close()
+
+
+@router.get("")
+def list_trades(
+    request: Request,
+    spec_version: Optional[str] = Query(None, description="Filter by spec version"),
+    status: Optional[str] = Query(None, description="Filter by trade status"),
+    template_id: Optional[str] = Query(None, description="Filter by template ID"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    format: Optional[str] = Query(None, pattern="^(json|ndjson|msgpack)$"),
+    db: Session = Depends(get_db),
+):
+    """
+    List FCN trades.
+
+    Keyset-paginated on the primary key (see src.infra.db.repositories
+    for the index each filter combination uses). Pass the returned
+    `next_cursor` to fetch the following page. With
+    `format=ndjson` (or `Accept: application/x-ndjson`) every matching
+    trade is streamed from a server-side cursor instead. `format=msgpack`
+    (or `Accept: application/msgpack`) returns the page as MessagePack.
+    """
+    try:
+        after_id = decode_cursor(cursor)
+    except InvalidCursorError:
+        return error_response(400, "VALIDATION_FAILED", INVALID_CURSOR_MESSAGE, {"parameter": "cursor"})
+
+    if wants_ndjson(request, format):
+        rows = TradeRepository(db, repository_tracer(request)).stream(
+            spec_version=spec_version,
+            status=status,
+            template_id=template_id,
+            after_id=after_id,
+        )
+        return StreamingResponse(ndjson_stream(rows, db), media_type=NDJSON_MEDIA_TYPE)
+
+    page = TradeRepository(db, repository_tracer(request)).list_page(
+        spec_version=spec_version,
+        status=status,
+        template_id=template_id,
+        after_id=after_id,
+        limit=limit,
+    )
+    return negotiated_response(
+        request,
+        {"trades": page.items, "pagination": page.pagination()},
+        format=format,
+    )
+
+
+@router.get("/{trade_id}/lifecycle")
+def get_trade_lifecycle(
+    request: Request,
+    trade_id: str,
+    event_type: Optional[str] = Query(None, description="Filter by event type"),
+    from_date: Optional[datetime] = Query(None, description="Events on or after this date"),
+    to_date: Optional[datetime] = Query(None, description="Events on or before this date"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    format: Optional[str] = Query(None, pattern="^(json|ndjson|msgpack)$"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get lifecycle events for a trade.
+
+    Keyset-paginated on the primary key within ix_fcn_lifecycle_trade_type
+    (or ix_fcn_lifecycle_event_trade_id without event_type). With
+    `format=ndjson` (or `Accept: application/x-ndjson`) the full event
+    history is streamed in constant memory. `format=msgpack` (or
+    `Accept: application/msgpack`) returns the page as MessagePack.
+    """
+    try:
+        after_id = decode_cursor(cursor)
+    except InvalidCursorError:
+        return error_response(400, "VALIDATION_FAILED", INVALID_CURSOR_MESSAGE, {"parameter": "cursor"})
+
+    if wants_ndjson(request, format):
+        rows = LifecycleEventRepository(db, repository_tracer(request)).stream(
+            trade_id=trade_id,
+            event_type=event_type,
+            from_date=from_date,
+            to_date=to_date,
+            after_id=after_id,
+        )
+        return StreamingResponse(ndjson_stream(rows, db), media_type=NDJSON_MEDIA_TYPE)
+
+    page = LifecycleEventRepository(db, repository_tracer(request)).list_page(
+        trade_id=trade_id,
+        event_type=event_type,
+        from_date=from_date,
+        to_date=to_date,
+        after_id=after_id,
+        limit=limit,
+    )
+
+    # Only pay for the existence check when the first page is empty
+    if not page.items and after_id is None and not trade_exists(db, trade_id, repository_tracer(request)):
+        return error_response(404, "NOT_FOUND", f"Trade '{trade_id}' not found")
+
+    return negotiated_response(
+        request,
+        {
+            "trade_id": trade_id,
+            "events": page.items,
+            "pagination": page.pagination(),
+        },
+        format=format,
+    )
@@ -0,0 +1,210 @@
+"""
+Wire serialization for the API: JSON (orjson) and MessagePack (ormsgpack).
+
+One encoder for response bodies, NDJSON streams and idempotency snapshots,
+so a replayed response is byte-for-byte the response first sent. Output is
+compact UTF-8 JSON, matching Starlette's JSONResponse for plain values.
+
+MessagePack (`application/msgpack`) carries the same schema: values that
+are strings in JSON (dates, Decimal amounts) are the same strings in
+MessagePack, so a payload converts between the two
+formats without loss. ormsgpack encodes datetimes and UUIDs natively in
+the same form as orjson. Request bodies are decoded by Content-Type and
+responses encoded by Accept (negotiated_response).
+
+Native types:
+    datetime / date   ISO-8601, identical to .isoformat()
+    Decimal           JSON string in fixed-point notation keeping the
+                      column scale ("1000000.5000" for DECIMAL(18,4)
+                      BR-019 amounts), whatever the magnitude: a double
+                      cannot hold every DECIMAL(18,4) value, and a field
+                      whose type depended on its digit count would break
+                      typed clients
+"""
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+import orjson
+import ormsgpack
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+# Scope key marking a request whose body is MessagePack (see CodecRoute)
+BODY_FORMAT_KEY = "fcn.body_format"
+
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def _default(value: Any) -> Any:
+    """Encode types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        # "f" never switches to exponent notation and keeps trailing zeros
+        return format(value, "f")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    return orjson.dumps(value, default=_default)
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON from bytes or str.
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON (a json.JSONDecodeError)
+    """
+    return orjson.loads(data)
+
+
+def packb(value: Any) -> bytes:
+    """Serialize to MessagePack bytes (same schema as dumps())."""
+    return ormsgpack.packb(value, default=_default)
+
+
+def unpackb(data: bytes) -> Any:
+    """
+    Parse MessagePack bytes.
+
+    Bytes after the first complete object are ignored.
+
+    Raises:
+        ValueError: If data does not start with a valid MessagePack object
+            (ormsgpack.MsgpackDecodeError)
+    """
+    return ormsgpack.unpackb(data)
+
+
+def media_type(content_type: Optional[str]) -> str:
+    """Return the bare media type of a Content-Type header value."""
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def is_msgpack(content_type: Optional[str]) -> bool:
+    """Return True if a Content-Type header value denotes MessagePack."""
+    return media_type(content_type) in MSGPACK_MEDIA_TYPES
+
+
+def wants_msgpack(request: Request, format: Optional[str] = None) -> bool:
+    """Return True if the client asked for a MessagePack response."""
+    if format is not None:
+        return format.lower() == "msgpack"
+    accept = request.headers.get("accept", "")
+    return any(t in accept for t in MSGPACK_MEDIA_TYPES)
+
+
+def decode_body(body: bytes, content_type: Optional[str]) -> Any:
+    """
+    Decode a request body by its Content-Type (MessagePack, else JSON).
+
+    Raises:
+        ValueError: If the body does not decode
+    """
+    return unpackb(body) if is_msgpack(content_type) else loads(body)
+
+
+def canonical_body(body: bytes, content_type: Optional[str]) -> bytes:
+    """
+    Encoding-independent form of a request body, for fingerprinting.
+
+    The decoded content as compact JSON with sorted keys, so the same
+    payload sent as JSON or MessagePack (or with different key order or
+    whitespace) yields the same bytes. Bodies that do not decode are
+    returned unchanged.
+    """
+    if not body:
+        return body
+    try:
+        return orjson.dumps(decode_body(body, content_type), option=orjson.OPT_SORT_KEYS)
+    except (ValueError, TypeError):
+        return body
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with dumps().
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class MsgPackResponse(Response):
+    """
+    MessagePack response rendered with packb().
+    """
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return packb(content)
+
+
+def negotiated_response(
+    request: Request,
+    content: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None,
+    format: Optional[str] = None,
+) -> Response:
+    """
+    Build a MessagePack or JSON response as the client asked.
+
+    Args:
+        request: Incoming request (its Accept header is consulted)
+        content: Response content
+        status_code: HTTP status code
+        headers: Extra response headers
+        format: Explicit `format` query value, overriding Accept
+
+    Returns:
+        MsgPackResponse if MessagePack was requested, else ORJSONResponse
+    """
+    response_class = MsgPackResponse if wants_msgpack(request, format) else ORJSONResponse
+    return response_class(content=content, status_code=status_code, headers=headers)
+
+
+class CodecRequest(Request):
+    """
+    Request whose body is parsed with loads(), or unpackb() for MessagePack.
+    """
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            body = await self.body()
+            self._json = unpackb(body) if self.scope.get(BODY_FORMAT_KEY) == "msgpack" else loads(body)
+        return self._json
+
+
+class CodecRoute(APIRoute):
+    """
+    Route decoding JSON and MessagePack request bodies with CodecRequest.
+
+    For parameters FastAPI parses from the body, invalid JSON still
+    surfaces as its 422 (orjson's decode error is a json.JSONDecodeError)
+    and undecodable MessagePack as its 400. Handlers that call
+    request.json() themselves get the ValueError and must answer it
+    (book_trade returns a 400 INVALID_BODY envelope).
+    """
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request):
+            scope = request.scope
+            if is_msgpack(request.headers.get("content-type")):
+                # FastAPI hands only JSON content types to Request.json();
+                # present MessagePack bodies as JSON and decode them there
+                scope = dict(scope, headers=[
+                    (name, JSON_MEDIA_TYPE.encode("latin-1") if name == b"content-type" else value)
+                    for name, value in scope["headers"]
+                ])
+                scope[BODY_FORMAT_KEY] = "msgpack"
+            return await handler(CodecRequest(scope, request.receive))
+
+        return route_handler
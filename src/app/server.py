@@ -0,0 +1,290 @@
+"""
+Production server: prefork uvicorn workers sharing one listening socket.
+
+The master loads the application code and read-only reference data
+(compiled parameter schemas, parameter definitions, issuer whitelist) once,
+runs gc.freeze() and forks the workers. Workers share those pages
+copy-on-write. Each worker builds its own app, so the DB engine and its pool,
+tracing exporter threads and caches are created after fork in the worker's
+lifespan hook.
+
+SIGTERM or SIGINT drains: workers stop accepting, finish in-flight requests
+(up to --graceful-timeout) and exit. Workers that exit are respawned, e.g.
+after serving --max-requests requests (recycling bounds per-worker memory
+growth).
+
+Prometheus metrics run in multiprocess mode: each worker writes its values
+to PROMETHEUS_MULTIPROC_DIR (a temporary directory unless set) and /metrics
+sums them, so a scrape answered by any worker covers all of them, and
+counters survive worker recycling. The sampling profiler stays per process:
+use --workers 1 when profiling.
+
+Usage:
+    python -m src.app.server [--host 0.0.0.0] [--port 8000] [--workers N]
+                             [--max-requests N] [--max-requests-jitter N]
+                             [--graceful-timeout S]
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import random
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+
+import uvicorn
+
+from src.app.settings import Settings
+
+
+logger = logging.getLogger("fcn.server")
+
+# Workers that die sooner than this after spawning are respawned with a delay
+MIN_WORKER_UPTIME_SECONDS = 1.0
+
+# How long a stopping worker keeps serving connections it accepted just
+# before closing its listener (their request may not have arrived yet)
+ACCEPT_GRACE_SECONDS = 0.25
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """Bind the listening socket shared by all workers."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def prepare_metrics_dir() -> Tuple[str, bool]:
+    """
+    Point prometheus_client at a clean multiprocess directory.
+
+    Must run before prometheus_client is imported, which picks file-backed
+    metric values at import time. Uses PROMETHEUS_MULTIPROC_DIR if set,
+    removing metric files left by a previous run, else a new temporary
+    directory.
+
+    Returns:
+        (directory, created): created is True for a temporary directory
+    """
+    if "prometheus_client" in sys.modules:
+        raise RuntimeError("prometheus_client was imported before PROMETHEUS_MULTIPROC_DIR was set")
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        path = os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="fcn-metrics-")
+        return path, True
+    os.makedirs(path, exist_ok=True)
+    for name in os.listdir(path):
+        if name.endswith(".db"):
+            os.unlink(os.path.join(path, name))
+    return path, False
+
+
+class WorkerServer(uvicorn.Server):
+    """
+    uvicorn server that stops accepting before closing idle connections.
+
+    uvicorn closes connections without an active request at shutdown. With
+    a shared listening socket, a connection accepted just before a worker
+    recycles has usually not sent its request yet, so it would be dropped
+    unanswered. Waiting ACCEPT_GRACE_SECONDS after closing the listener lets
+    those requests start and drain normally.
+    """
+
+    async def shutdown(self, sockets: Optional[List[socket.socket]] = None) -> None:
+        for server in self.servers:
+            server.close()
+        await asyncio.sleep(ACCEPT_GRACE_SECONDS)
+        await super().shutdown(sockets)
+
+
+class PreforkServer:
+    """
+    Master process supervising forked uvicorn workers.
+    """
+
+    def __init__(self, args: argparse.Namespace, settings: Settings):
+        """
+        Initialize server.
+
+        Args:
+            args: Parsed command-line arguments
+            settings: Application settings
+        """
+        self.args = args
+        self.settings = settings
+        self.reference_data = None
+        self.sock: Optional[socket.socket] = None
+        self.workers: Dict[int, float] = {}  # pid -> spawn time
+        self.stopping = False
+        self.metrics_dir: Optional[str] = None
+        self._metrics_dir_created = False
+
+    def preload(self) -> None:
+        """Import the app and load reference data in the master."""
+        # No collections while loading; gc.freeze() below then moves every
+        # object to the permanent generation so workers' collections never
+        # write to (and un-share) the master's pages
+        gc.disable()
+        self.metrics_dir, self._metrics_dir_created = prepare_metrics_dir()
+        import src.app.main  # noqa: F401  (FastAPI, routers, middleware)
+        from src.app.reference_data import ReferenceData
+
+        started = time.perf_counter()
+        self.reference_data = ReferenceData.load(self.settings)
+        self.reference_data.release_connections()
+        logger.info("Reference data preloaded in %.0f ms", (time.perf_counter() - started) * 1000)
+
+        gc.collect()
+        gc.freeze()
+        # Frozen objects are never scanned, so collection can resume: it only
+        # sees what the master allocates from here on (and workers inherit it)
+        gc.enable()
+
+    def run(self) -> int:
+        """Bind, fork workers and supervise them until signalled."""
+        self.preload()
+        self.sock = bind_socket(self.args.host, self.args.port, self.args.backlog)
+        logger.info(
+            "Master %d listening on %s:%d with %d workers",
+            os.getpid(), self.args.host, self.args.port, self.args.workers,
+        )
+        if self.args.workers > 1 and self.settings.profiling_admin_token:
+            logger.warning("Profiling is per worker; /internal/profiling calls reach any worker. "
+                           "Use --workers 1 to profile")
+
+        signal.signal(signal.SIGTERM, self._on_stop)
+        signal.signal(signal.SIGINT, self._on_stop)
+
+        for _ in range(self.args.workers):
+            self.spawn()
+
+        while not self.stopping:
+            self.reap(respawn=True)
+            time.sleep(0.2)
+
+        return self.drain()
+
+    def spawn(self) -> None:
+        """Fork one worker."""
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                self.run_worker()
+                code = 0
+            except BaseException:
+                logger.exception("Worker %d crashed", os.getpid())
+            finally:
+                os._exit(code)
+        self.workers[pid] = time.monotonic()
+        logger.info("Spawned worker %d", pid)
+
+    def run_worker(self) -> None:
+        """Worker body: build the app and serve the shared socket."""
+        from src.app.main import create_app
+
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        max_requests = None
+        if self.args.max_requests:
+            # Jitter so workers do not all recycle at the same moment
+            max_requests = self.args.max_requests + random.randint(0, self.args.max_requests_jitter)
+
+        config = uvicorn.Config(
+            create_app(self.settings, reference_data=self.reference_data),
+            log_level=self.args.log_level,
+            access_log=False,
+            limit_max_requests=max_requests,
+            timeout_graceful_shutdown=self.args.graceful_timeout,
+        )
+        WorkerServer(config).run(sockets=[self.sock])
+
+    def reap(self, respawn: bool) -> None:
+        """Collect exited workers, respawning them unless stopping."""
+        while self.workers:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            started = self.workers.pop(pid, None)
+            if started is None:
+                continue
+            logger.info("Worker %d exited (status %d)", pid, os.waitstatus_to_exitcode(status))
+            self.mark_dead(pid)
+            if respawn and not self.stopping:
+                if time.monotonic() - started < MIN_WORKER_UPTIME_SECONDS:
+                    time.sleep(MIN_WORKER_UPTIME_SECONDS)
+                self.spawn()
+
+    def drain(self) -> int:
+        """Ask workers to finish in-flight requests, then force-stop stragglers."""
+        logger.info("Draining %d workers", len(self.workers))
+        for pid in list(self.workers):
+            _signal(pid, signal.SIGTERM)
+
+        deadline = time.monotonic() + self.args.graceful_timeout + 5
+        while self.workers and time.monotonic() < deadline:
+            self.reap(respawn=False)
+            time.sleep(0.1)
+
+        for pid in list(self.workers):
+            logger.warning("Worker %d did not drain in time; killing", pid)
+            _signal(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            self.mark_dead(pid)
+        self.workers.clear()
+        self.sock.close()
+        if self._metrics_dir_created:
+            shutil.rmtree(self.metrics_dir, ignore_errors=True)
+        return 0
+
+    def mark_dead(self, pid: int) -> None:
+        """Drop an exited worker's live gauges from the metrics directory."""
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid, self.metrics_dir)
+
+    def _on_stop(self, signum, frame) -> None:
+        self.stopping = True
+
+
+def _signal(pid: int, signum: int) -> None:
+    """Send a signal, ignoring workers that already exited."""
+    try:
+        os.kill(pid, signum)
+    except ProcessLookupError:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FCN API prefork server")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+                        help="Worker processes (default: WEB_CONCURRENCY or CPU count)")
+    parser.add_argument("--max-requests", type=int, default=int(os.getenv("MAX_REQUESTS", "0")),
+                        help="Recycle a worker after this many requests (0: never)")
+    parser.add_argument("--max-requests-jitter", type=int, default=int(os.getenv("MAX_REQUESTS_JITTER", "0")),
+                        help="Random extra requests per worker before recycling")
+    parser.add_argument("--graceful-timeout", type=int, default=int(os.getenv("GRACEFUL_TIMEOUT_SECONDS", "30")),
+                        help="Seconds workers get to finish in-flight requests on shutdown")
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument("--log-level", default=os.getenv("LOG_LEVEL", "info"))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(levelname)s [%(process)d] %(message)s")
+    sys.exit(PreforkServer(args, Settings.from_env()).run())
+
+
+if __name__ == "__main__":
+    main()
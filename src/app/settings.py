@@ -0,0 +1,70 @@
+"""
+Application settings.
+
+Plain values read from the environment once, passed to create_app(). Nothing
+here touches the database or network.
+"""
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+import os
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    FCN API settings.
+    """
+    # None: DATABASE_URL, or the default MSSQL URL
+    database_url: Optional[str] = None
+    idempotency_ttl_hours: int = 24
+    # Idempotency store deadlines and circuit breaker (0: no deadline / breaker)
+    idempotency_get_timeout_ms: float = 100.0
+    idempotency_set_timeout_ms: float = 250.0
+    # Successful calls this slow also count as breaker failures
+    idempotency_slow_call_ms: float = 0.0
+    idempotency_breaker_failures: int = 5
+    idempotency_breaker_reset_seconds: float = 5.0
+    # Paths served without deduplication when the store is unavailable;
+    # all others fail closed with 503
+    idempotency_fail_open_paths: Tuple[str, ...] = ("/api/v1/observations",)
+    template_cache_poll_seconds: float = 5.0
+    parameter_cache_poll_seconds: float = 30.0
+    # None: OTEL_TRACES_EXPORTER, or "otlp"
+    traces_exporter: Optional[str] = None
+    # Admission control (src.app.middleware.admission)
+    admission_enabled: bool = True
+    admission_booking_limit: int = 16
+    admission_query_limit: int = 32
+    admission_replay_limit: int = 64
+    admission_max_pool_wait_ms: float = 50.0
+    admission_max_loop_lag_ms: float = 100.0
+    # None: /internal/profiling is disabled (kept out of repr so it is never logged)
+    profiling_admin_token: Optional[str] = field(default=None, repr=False)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables (see .env.example)."""
+        return cls(
+            database_url=os.getenv("DATABASE_URL"),
+            idempotency_ttl_hours=int(os.getenv("IDEMPOTENCY_TTL_HOURS", "24")),
+            template_cache_poll_seconds=float(os.getenv("TEMPLATE_CACHE_POLL_SECONDS", "5")),
+            parameter_cache_poll_seconds=float(os.getenv("PARAMETER_CACHE_POLL_SECONDS", "30")),
+            traces_exporter=os.getenv("OTEL_TRACES_EXPORTER"),
+            idempotency_get_timeout_ms=float(os.getenv("IDEMPOTENCY_GET_TIMEOUT_MS", "100")),
+            idempotency_set_timeout_ms=float(os.getenv("IDEMPOTENCY_SET_TIMEOUT_MS", "250")),
+            idempotency_slow_call_ms=float(os.getenv("IDEMPOTENCY_SLOW_CALL_MS", "0")),
+            idempotency_breaker_failures=int(os.getenv("IDEMPOTENCY_BREAKER_FAILURES", "5")),
+            idempotency_breaker_reset_seconds=float(os.getenv("IDEMPOTENCY_BREAKER_RESET_SECONDS", "5")),
+            idempotency_fail_open_paths=tuple(
+                path.strip()
+                for path in os.getenv("IDEMPOTENCY_FAIL_OPEN_PATHS", "/api/v1/observations").split(",")
+                if path.strip()
+            ),
+            admission_enabled=os.getenv("ADMISSION_ENABLED", "true").lower() in ("1", "true", "yes"),
+            admission_booking_limit=int(os.getenv("ADMISSION_BOOKING_LIMIT", "16")),
+            admission_query_limit=int(os.getenv("ADMISSION_QUERY_LIMIT", "32")),
+            admission_replay_limit=int(os.getenv("ADMISSION_REPLAY_LIMIT", "64")),
+            admission_max_pool_wait_ms=float(os.getenv("ADMISSION_MAX_POOL_WAIT_MS", "50")),
+            admission_max_loop_lag_ms=float(os.getenv("ADMISSION_MAX_LOOP_LAG_MS", "100")),
+            profiling_admin_token=os.getenv("PROFILING_ADMIN_TOKEN") or None,
+        )
@@ -2,15 +2,32 @@
 Idempotency service domain abstraction.
 
 Provides interface for idempotency key management and request deduplication.
+
+Store calls can be bounded by per-operation deadlines and a circuit
+breaker, so a slow backend cannot hold a request indefinitely. A call that
+misses its deadline, fails, or is refused by the open circuit raises
+IdempotencyUnavailableError. The caller decides whether to fail open or
+closed.
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from time import monotonic
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+import asyncio
 import hashlib
 import json
 
 
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CIRCUIT_STATES = (CLOSED, OPEN, HALF_OPEN)
+
+
 @dataclass
 class IdempotencyRecord:
     """
@@ -26,6 +43,115 @@ class IdempotencyRecord:
     expires_at: datetime
 
 
+class IdempotencyUnavailableError(RuntimeError):
+    """
+    Raised when the idempotency store cannot be used for a call.
+    
+    `reason` is "timeout" (deadline missed), "error" (the store raised) or
+    "circuit_open" (call refused without reaching the store).
+    """
+    
+    def __init__(self, operation: str, reason: str, retry_after_seconds: float = 0.0):
+        super().__init__(f"idempotency store {operation} unavailable: {reason}")
+        self.operation = operation
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for store calls.
+    
+    Closed: calls pass. `failure_threshold` consecutive failures (errors,
+    missed deadlines, or calls slower than `slow_call_seconds`) open it.
+    Open: calls are refused for `reset_timeout_seconds`. After that it is
+    half-open: a single probe call is let through. The probe's success
+    closes the circuit and its failure reopens it. A probe that never
+    reports back (its request was cancelled) is replaced after another
+    `reset_timeout_seconds`.
+    
+    Every transition starts a new `generation`. Callers read it once
+    `allow()` admits them and pass it back to `record()`; outcomes of calls
+    admitted in an earlier generation are ignored, so a slow call that
+    started while the circuit was closed cannot close it after a trip, and
+    only the half-open probe decides whether it closes.
+    
+    Used from the event loop thread only, so no locking.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 5.0,
+        slow_call_seconds: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout_seconds: Time open before a probe call
+            slow_call_seconds: Successful calls at least this slow count as
+                failures (None: only errors and timeouts do)
+            clock: Monotonic time source
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout_seconds
+        self.slow_call = slow_call_seconds
+        self.clock = clock
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.transitions: Dict[str, int] = {state: 0 for state in CIRCUIT_STATES}
+        self.generation = 0
+        self._changed_at = clock()
+    
+    def _transition(self, state: str) -> None:
+        self.state = state
+        self.generation += 1
+        self.transitions[state] += 1
+        self._changed_at = self.clock()
+    
+    def allow(self) -> bool:
+        """Return True if a call may go to the store now."""
+        if self.state == CLOSED:
+            return True
+        if self.clock() - self._changed_at < self.reset_timeout:
+            return False
+        # Open long enough, or the last probe went silent: probe again
+        self._transition(HALF_OPEN)
+        return True
+    
+    def retry_after(self) -> float:
+        """Return seconds until the circuit lets a call through (0 if closed)."""
+        if self.state == CLOSED:
+            return 0.0
+        return max(0.0, self._changed_at + self.reset_timeout - self.clock())
+    
+    def record(self, ok: bool, seconds: float, generation: int) -> None:
+        """
+        Record the outcome of an allowed call.
+        
+        Args:
+            ok: The call returned (no error, deadline met)
+            seconds: Call duration
+            generation: `generation` when the call was admitted; outcomes
+                from an earlier generation are ignored
+        """
+        if generation != self.generation:
+            return
+        if ok and (self.slow_call is None or seconds < self.slow_call):
+            self.consecutive_failures = 0
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+            return
+        self.consecutive_failures += 1
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._transition(OPEN)
+
+
 class IdempotencyStore(ABC):
     """
     Abstract interface for idempotency key storage backend.
@@ -73,14 +199,54 @@ class IdempotencyService:
     idempotency keys with pluggable storage backends.
     """
     
-    def __init__(self, store: IdempotencyStore):
+    def __init__(
+        self,
+        store: IdempotencyStore,
+        get_timeout_seconds: Optional[float] = None,
+        set_timeout_seconds: Optional[float] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
         """
         Initialize idempotency service.
         
         Args:
             store: Storage backend for idempotency records
+            get_timeout_seconds: Deadline for record lookups (None: unbounded)
+            set_timeout_seconds: Deadline for record writes (None: unbounded)
+            breaker: Circuit breaker shared by all store calls (None: none)
         """
         self.store = store
+        self.get_timeout = get_timeout_seconds
+        self.set_timeout = set_timeout_seconds
+        self.breaker = breaker
+    
+    async def _call(self, operation: str, timeout: Optional[float], call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run one store call under its deadline and the circuit breaker.
+        
+        Raises:
+            IdempotencyUnavailableError: Deadline missed, store error, or
+                circuit open
+        """
+        breaker = self.breaker
+        if breaker is not None and not breaker.allow():
+            raise IdempotencyUnavailableError(operation, "circuit_open", breaker.retry_after())
+        generation = breaker.generation if breaker is not None else 0
+        
+        start = monotonic()
+        try:
+            result = await asyncio.wait_for(call(), timeout) if timeout is not None else await call()
+        except asyncio.TimeoutError:
+            if breaker is not None:
+                breaker.record(False, monotonic() - start, generation)
+            raise IdempotencyUnavailableError(operation, "timeout") from None
+        except Exception as e:
+            if breaker is not None:
+                breaker.record(False, monotonic() - start, generation)
+            raise IdempotencyUnavailableError(operation, "error") from e
+        if breaker is not None:
+            breaker.record(True, monotonic() - start, generation)
+        return result
     
     @staticmethod
     def hash_key(idempotency_key: str) -> str:
@@ -125,9 +291,12 @@ class IdempotencyService:
             
         Returns:
             IdempotencyRecord if found, None otherwise
+            
+        Raises:
+            IdempotencyUnavailableError: Store unavailable (see _call)
         """
         key_hash = self.hash_key(idempotency_key)
-        return await self.store.get(key_hash)
+        return await self._call("get", self.get_timeout, lambda: self.store.get(key_hash))
     
     async def store_record(self, record: IdempotencyRecord) -> None:
         """
@@ -135,8 +304,11 @@ class IdempotencyService:
         
         Args:
             record: IdempotencyRecord to store
+            
+        Raises:
+            IdempotencyUnavailableError: Store unavailable (see _call)
         """
-        await self.store.set(record)
+        await self._call("set", self.set_timeout, lambda: self.store.set(record))
     
     def check_conflict(
         self,
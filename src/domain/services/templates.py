@@ -0,0 +1,96 @@
+"""
+Template domain model.
+
+Parsed, validated representation of an fcn_template row as used by trade
+booking.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Mapping
+import json
+
+
+VALID_TEMPLATE_STATUSES = ("active", "deprecated")
+
+
+class TemplateValidationError(ValueError):
+    """Raised when a stored template cannot be parsed or is invalid."""
+
+
+@dataclass(frozen=True)
+class TemplateDefinition:
+    """
+    Immutable, parsed FCN template.
+
+    `parameters` is a read-only mapping so cached instances can be shared
+    across requests without defensive copies.
+    """
+    template_id: str
+    name: str
+    spec_version: str
+    status: str
+    issuer: str
+    parameters: Mapping[str, Any]
+    updated_at: datetime
+
+    @property
+    def is_active(self) -> bool:
+        """Return True if the template can be used for new bookings."""
+        return self.status == "active"
+
+
+def parse_template(
+    template_id: str,
+    name: str,
+    spec_version: str,
+    status: str,
+    issuer: str,
+    parameters: str,
+    updated_at: datetime,
+) -> TemplateDefinition:
+    """
+    Parse and validate a stored template.
+
+    Args:
+        template_id: Template identifier
+        name: Template display name
+        spec_version: Product spec version the template conforms to
+        status: Template status (active, deprecated)
+        issuer: Issuer identifier
+        parameters: JSON text of template parameters
+        updated_at: Last modification timestamp
+
+    Returns:
+        TemplateDefinition
+
+    Raises:
+        TemplateValidationError: If parameters are not a JSON object or
+            status is unknown
+    """
+    try:
+        parsed = json.loads(parameters)
+    except (json.JSONDecodeError, TypeError) as e:
+        raise TemplateValidationError(
+            f"Template '{template_id}' parameters are not valid JSON: {e}"
+        ) from e
+
+    if not isinstance(parsed, dict):
+        raise TemplateValidationError(
+            f"Template '{template_id}' parameters must be a JSON object"
+        )
+
+    if status not in VALID_TEMPLATE_STATUSES:
+        raise TemplateValidationError(
+            f"Template '{template_id}' has invalid status '{status}'"
+        )
+
+    return TemplateDefinition(
+        template_id=template_id,
+        name=name,
+        spec_version=spec_version,
+        status=status,
+        issuer=issuer,
+        parameters=MappingProxyType(parsed),
+        updated_at=updated_at,
+    )
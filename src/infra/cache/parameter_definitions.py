@@ -0,0 +1,215 @@
+"""
+In-process parameter-definition index with hot reload.
+
+Loads the seeded `parameter_definitions` table (the SQLite file written by
+db/seeds/seed_fcn_v1_parameters.py, or the equivalent MSSQL table) once at
+start-up into an immutable ParameterIndex keyed by
+(product_type, spec_version, name). Validators read bounds from the index
+with plain dictionary lookups.
+
+Reload uses a table version stamp polled at most once per
+`poll_interval_seconds`: the trigger-maintained counter in
+`parameter_definitions_version` (db/migrations/m0003), which moves on every
+insert, update and delete. Tables without the counter fall back to
+(COUNT(*), MAX(id), MAX(updated_at)), which misses an in-place update made
+within the same `updated_at` second. When the stamp moves the whole table is
+re-read into a new index and the reference is swapped, so readers never
+observe a partially built index.
+
+A poll is claimed under a lock, so concurrent readers never run the same
+interval's poll twice, and loads are serialized. Served apps call start():
+a background task then polls in a worker thread and readers never touch
+the database. Without it (scripts, tests) readers poll inline when due.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import time
+
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.validation.bounds import ParameterDefinition, ParameterIndex, definition_from_row
+
+
+logger = logging.getLogger(__name__)
+
+# Default source: the SQLite file produced by the seeder, opened read-only so
+# a missing file is reported rather than created empty
+PARAMETER_DB_URL = os.getenv(
+    "PARAMETER_DEFINITIONS_URL",
+    f"sqlite:///file:{Path(__file__).resolve().parents[3] / 'db' / 'fcn_parameters.db'}?mode=ro&uri=true",
+)
+
+VERSION_TABLE = "parameter_definitions_version"
+
+COLUMNS = (
+    "name", "data_type", "required_flag", "enum_domain", "min_value",
+    "max_value", "pattern", "constraints", "product_type", "spec_version",
+)
+
+
+@dataclass
+class IndexStats:
+    """
+    Parameter index counters.
+    """
+    loads: int = 0
+    polls: int = 0
+    failures: int = 0
+
+    def as_dict(self, size: int) -> Dict[str, Any]:
+        """Return counters with current index size."""
+        return {
+            "loads": self.loads,
+            "polls": self.polls,
+            "failures": self.failures,
+            "size": size,
+        }
+
+
+class ParameterDefinitionCache:
+    """
+    Immutable parameter-definition index with versioned hot reload.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        url: str = PARAMETER_DB_URL,
+        poll_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize parameter-definition cache.
+
+        Args:
+            engine: SQLAlchemy engine (default: created from `url`)
+            url: Database URL of the parameter_definitions table
+            poll_interval_seconds: Minimum interval between version polls
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.engine = engine or create_engine(url)
+        self.poll_interval_seconds = poll_interval_seconds
+        self.clock = clock
+        self.stats = IndexStats()
+
+        self._index = ParameterIndex()
+        self._version: Optional[Tuple] = None
+        self._versioned: Optional[bool] = None
+        self._last_poll = float("-inf")
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._poller: Optional[asyncio.Task] = None
+
+    @property
+    def index(self) -> ParameterIndex:
+        """Return the current index, reloading first if the table changed (unless started)."""
+        if self._poller is None:
+            self._maybe_poll()
+        return self._index
+
+    def get(self, product_type: str, spec_version: str, name: str) -> Optional[ParameterDefinition]:
+        """Return the definition for (product_type, spec_version, name)."""
+        return self.index.get(product_type, spec_version, name)
+
+    def for_version(self, product_type: str, spec_version: Optional[str]) -> Mapping[str, ParameterDefinition]:
+        """Return the name -> definition mapping for a spec version."""
+        return self.index.for_version(product_type, spec_version)
+
+    def load(self) -> ParameterIndex:
+        """
+        Read the whole table into a new index and swap it in.
+
+        Call at start-up so the first request does not pay for the load. A
+        missing or unreadable table keeps the previous index (empty on first
+        load) and is retried on the next poll.
+        """
+        with self._load_lock:
+            try:
+                with self.engine.connect() as conn:
+                    version = self._stamp(conn)
+                    rows = conn.execute(
+                        text(f"SELECT {', '.join(COLUMNS)} FROM parameter_definitions")
+                    ).mappings().all()
+            except SQLAlchemyError as e:
+                with self._lock:
+                    self.stats.failures += 1
+                logger.warning("parameter_definitions unavailable: %s", e)
+                return self._index
+
+            index = ParameterIndex(definition_from_row(row) for row in rows)
+            with self._lock:
+                self._index = index
+                self._version = version
+                self._last_poll = self.clock()
+                self.stats.loads += 1
+            return index
+
+    def start(self) -> None:
+        """Poll from a background task on the running loop instead of in readers."""
+        if self._poller is None:
+            self._poller = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background polling; readers poll inline again."""
+        if self._poller is not None:
+            self._poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poller
+            self._poller = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return index statistics."""
+        return self.stats.as_dict(len(self._index))
+
+    def _stamp(self, conn) -> Tuple:
+        """Return the table version stamp."""
+        if not self._versioned:
+            # Re-checked until found, so a migration applied under a running
+            # process switches it over to the counter
+            self._versioned = inspect(conn).has_table(VERSION_TABLE)
+        if self._versioned:
+            return tuple(conn.execute(text(f"SELECT version FROM {VERSION_TABLE}")).one())
+        return tuple(conn.execute(text(
+            "SELECT COUNT(*), MAX(id), MAX(updated_at) FROM parameter_definitions"
+        )).one())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval_seconds)
+            # Connecting and reading block: keep them off the event loop
+            await asyncio.to_thread(self._poll)
+
+    def _maybe_poll(self) -> None:
+        """Poll the table version stamp if the poll interval has elapsed."""
+        now = self.clock()
+        with self._lock:
+            if now - self._last_poll < self.poll_interval_seconds:
+                return
+            # Claimed: concurrent callers skip this interval's poll
+            self._last_poll = now
+        self._poll()
+
+    def _poll(self) -> None:
+        """Read the table version stamp and reload if it moved."""
+        try:
+            with self.engine.connect() as conn:
+                version = self._stamp(conn)
+        except SQLAlchemyError as e:
+            with self._lock:
+                self.stats.failures += 1
+            logger.warning("parameter_definitions poll failed: %s", e)
+            return
+
+        with self._lock:
+            self.stats.polls += 1
+            changed = version != self._version
+        if changed:
+            self.load()
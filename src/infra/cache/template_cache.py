@@ -0,0 +1,212 @@
+"""
+In-process read-through cache for FCN templates.
+
+Templates change rarely but are resolved on every trade booking. The cache
+holds parsed and validated TemplateDefinition objects so a booking on a hot
+template skips both the DB read and the JSON parse.
+
+At most once per `poll_interval_seconds` the cache reads (template_id,
+updated_at) for the cached IDs and evicts every entry whose row is gone or
+carries a different updated_at. Deletions are found by ID, so a delete plus
+an insert within one poll window (same row count, possibly a reused
+primary key) still evicts the deleted template.
+
+Every poll and eviction bumps a generation counter. A load records the
+generation before reading its row and is returned but not cached if the
+generation moved meanwhile, so a row read before a change can never be
+cached after the poll that should have evicted it.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Optional
+import threading
+import time
+
+from sqlalchemy import select
+
+from src.domain.services.templates import TemplateDefinition, parse_template
+from src.infra.db.models import TemplateORM
+
+
+TemplateValidator = Callable[[TemplateDefinition], None]
+
+# Cached IDs per poll query (SQL Server allows 2100 parameters)
+POLL_BATCH_SIZE = 500
+
+
+@dataclass
+class CacheStats:
+    """
+    Template cache counters.
+    """
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    invalidations: int = 0
+    polls: int = 0
+
+    def as_dict(self, size: int) -> Dict[str, float]:
+        """Return counters with derived hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "invalidations": self.invalidations,
+            "polls": self.polls,
+            "size": size,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+        }
+
+
+class TemplateCache:
+    """
+    Read-through template cache with versioned invalidation.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        poll_interval_seconds: float = 5.0,
+        max_entries: int = 1024,
+        validator: Optional[TemplateValidator] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize template cache.
+
+        Args:
+            session_factory: Callable that returns SQLAlchemy Session
+            poll_interval_seconds: Minimum interval between version polls
+            max_entries: LRU capacity
+            validator: Optional callable raising on invalid templates;
+                invoked once per load, never on cache hits
+            clock: Monotonic clock (injectable for tests)
+        """
+        self.session_factory = session_factory
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_entries = max_entries
+        self.validator = validator
+        self.clock = clock
+        self.stats = CacheStats()
+
+        self._entries: "OrderedDict[str, TemplateDefinition]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._last_poll = float("-inf")
+
+    def get(self, template_id: str) -> Optional[TemplateDefinition]:
+        """
+        Resolve template by ID, loading from the database on miss.
+
+        Args:
+            template_id: Template identifier
+
+        Returns:
+            TemplateDefinition if found, None otherwise
+
+        Raises:
+            TemplateValidationError: If the stored template is invalid
+        """
+        self._maybe_poll()
+
+        with self._lock:
+            template = self._entries.get(template_id)
+            if template is not None:
+                self._entries.move_to_end(template_id)
+                self.stats.hits += 1
+                return template
+            self.stats.misses += 1
+            generation = self._generation
+
+        template = self._load(template_id)
+        if template is None:
+            return None
+
+        with self._lock:
+            if generation != self._generation:
+                # Evicted while loading: the row read may predate the change
+                return template
+            self._entries[template_id] = template
+            self._entries.move_to_end(template_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return template
+
+    def invalidate(self, template_id: Optional[str] = None) -> None:
+        """
+        Evict one template, or all templates when no ID is given.
+
+        Write paths (create/update/deprecate) should call this so the
+        local process sees its own writes before the next poll.
+        """
+        with self._lock:
+            self._generation += 1
+            if template_id is None:
+                self.stats.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(template_id, None) is not None:
+                self.stats.invalidations += 1
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return cache statistics including hit rate."""
+        with self._lock:
+            return self.stats.as_dict(len(self._entries))
+
+    def _load(self, template_id: str) -> Optional[TemplateDefinition]:
+        """Load, parse and validate a single template from the database."""
+        with self.session_factory() as session:
+            row = session.execute(
+                select(
+                    TemplateORM.template_id,
+                    TemplateORM.name,
+                    TemplateORM.spec_version,
+                    TemplateORM.status,
+                    TemplateORM.issuer,
+                    TemplateORM.parameters,
+                    TemplateORM.updated_at,
+                ).where(TemplateORM.template_id == template_id)
+            ).first()
+
+        if row is None:
+            return None
+
+        template = parse_template(*row)
+        if self.validator is not None:
+            self.validator(template)
+
+        with self._lock:
+            self.stats.loads += 1
+        return template
+
+    def _maybe_poll(self) -> None:
+        """Check cached templates against the table if the poll interval has elapsed."""
+        now = self.clock()
+        with self._lock:
+            if now - self._last_poll < self.poll_interval_seconds:
+                return
+            # Claimed: concurrent callers skip this interval's poll
+            self._last_poll = now
+            self.stats.polls += 1
+            # Loads in flight may have read a row changed before this poll
+            # but insert after its snapshot: discard them
+            self._generation += 1
+            cached = {template_id: template.updated_at for template_id, template in self._entries.items()}
+
+        if not cached:
+            return
+
+        ids = list(cached)
+        current: Dict[str, datetime] = {}
+        with self.session_factory() as session:
+            for offset in range(0, len(ids), POLL_BATCH_SIZE):
+                current.update(session.execute(
+                    select(TemplateORM.template_id, TemplateORM.updated_at)
+                    .where(TemplateORM.template_id.in_(ids[offset:offset + POLL_BATCH_SIZE]))
+                ).all())
+
+        # Deleted rows are missing from `current`; updated rows carry a new stamp
+        for template_id, updated_at in cached.items():
+            if current.get(template_id) != updated_at:
+                self.invalidate(template_id)
@@ -0,0 +1,88 @@
+"""
+Keyset (seek) pagination helpers.
+
+Pages are addressed by an opaque cursor that encodes the primary key of the
+last row returned, so every page is an index seek (`WHERE id > :last_id`)
+rather than an OFFSET scan that gets slower the deeper a client pages.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import base64
+import json
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class KeysetPage:
+    """
+    One page of a keyset-paginated query.
+    """
+    items: List[Dict[str, Any]]
+    limit: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    filters: Dict[str, Any] = field(default_factory=dict)
+
+    def pagination(self) -> Dict[str, Any]:
+        """Return the pagination block for API responses."""
+        return {
+            "limit": self.limit,
+            "next_cursor": self.next_cursor,
+            "has_more": self.has_more,
+        }
+
+
+def encode_cursor(last_id: int) -> str:
+    """
+    Encode the last seen primary key as an opaque cursor.
+
+    Args:
+        last_id: Primary key of the last row on the current page
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Decode an opaque cursor back into the last seen primary key.
+
+    Args:
+        cursor: Cursor string from a previous page (or None for first page)
+
+    Returns:
+        Last seen primary key, or None when no cursor was supplied
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = payload["id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorError(f"Malformed pagination cursor: {e}") from e
+
+    if not isinstance(last_id, int) or isinstance(last_id, bool) or last_id < 0:
+        raise InvalidCursorError("Malformed pagination cursor: invalid id")
+    return last_id
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Clamp requested page size to [1, MAX_PAGE_SIZE]."""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
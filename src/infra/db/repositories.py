@@ -0,0 +1,322 @@
+"""
+Read repositories for trade and lifecycle queries.
+
+All list queries use keyset pagination on the primary key
+(`id > :last_id ORDER BY id`), so no OFFSET is ever issued. On SQL Server
+a nonclustered index carries the clustered key (id). When a query's
+equality filters are exactly an index's key columns, each page is a single
+ordered range seek that reads only that page, however deep it is:
+
+- fcn_trade: no filter (clustered index); spec_version, status or
+  template_id alone (their single-column indexes); spec_version and status
+  (ix_fcn_trade_spec_version_status)
+- fcn_lifecycle_event: trade_id (ix_fcn_lifecycle_event_trade_id); trade_id
+  and event_type (ix_fcn_lifecycle_trade_type)
+
+Other filter combinations (template_id with spec_version or status, and
+the lifecycle from_date / to_date bounds) still seek one of those indexes
+in id order. The remaining predicates are residual filters, though, so a
+page also reads every non-matching row between its matches, and its cost
+follows the filters' selectivity.
+
+Each statement runs inside a `repository.query` span (ADR-006 §10); the
+SQLAlchemy instrumentation adds the per-statement DB span beneath it.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+import orjson
+from opentelemetry.trace import Tracer
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.infra.db.models import TradeORM, LifecycleEventORM
+from src.infra.db.pagination import KeysetPage, encode_cursor, clamp_limit
+from src.observability.tracing import SPAN_REPOSITORY_QUERY, get_tracer
+
+
+default_tracer = get_tracer(__name__)
+
+
+# Rows fetched per round trip when streaming from a server-side cursor
+STREAM_BATCH_SIZE = 1000
+
+TRADE_COLUMNS = (
+    TradeORM.id,
+    TradeORM.trade_id,
+    TradeORM.template_id,
+    TradeORM.spec_version,
+    TradeORM.trade_date,
+    TradeORM.maturity_date,
+    TradeORM.notional,
+    TradeORM.currency,
+    TradeORM.status,
+    TradeORM.autocall_triggered,
+    TradeORM.ki_triggered,
+    TradeORM.created_at,
+    TradeORM.updated_at,
+)
+
+LIFECYCLE_COLUMNS = (
+    LifecycleEventORM.id,
+    LifecycleEventORM.trade_id,
+    LifecycleEventORM.event_type,
+    LifecycleEventORM.event_date,
+    LifecycleEventORM.event_payload,
+    LifecycleEventORM.created_at,
+)
+
+
+def trade_row_to_dict(row: Any) -> Dict[str, Any]:
+    """
+    Map a fcn_trade row mapping to its API representation.
+
+    Dates stay datetime and notional stays Decimal; src.app.serialization
+    renders them (ISO-8601 strings, fixed-point strings at the column scale
+    such as "1000000.5000") without per-field conversion here.
+    """
+    return {
+        "trade_id": row["trade_id"],
+        "template_id": row["template_id"],
+        "spec_version": row["spec_version"],
+        "status": row["status"],
+        "trade_date": row["trade_date"],
+        "maturity_date": row["maturity_date"],
+        "notional": row["notional"],
+        "currency": row["currency"],
+        "knocked_out": bool(row["autocall_triggered"]),
+        "knocked_in": bool(row["ki_triggered"]),
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+    }
+
+
+def lifecycle_row_to_dict(row: Any) -> Dict[str, Any]:
+    """Map a fcn_lifecycle_event row mapping to its API representation."""
+    try:
+        data = orjson.loads(row["event_payload"]) if row["event_payload"] else {}
+    except (orjson.JSONDecodeError, TypeError):
+        data = {"raw": row["event_payload"]}
+
+    return {
+        "event_id": str(row["id"]),
+        "trade_id": row["trade_id"],
+        "event_type": row["event_type"],
+        "event_date": row["event_date"],
+        "timestamp": row["created_at"],
+        "data": data,
+    }
+
+
+class TradeRepository:
+    """
+    Query access to fcn_trade.
+    """
+
+    def __init__(self, session: Session, tracer: Optional[Tracer] = None):
+        """
+        Initialize trade repository.
+
+        Args:
+            session: SQLAlchemy session
+            tracer: Tracer for repository.query spans (default: global provider)
+        """
+        self.session = session
+        self.tracer = tracer or default_tracer
+
+    def _filtered(
+        self,
+        spec_version: Optional[str] = None,
+        status: Optional[str] = None,
+        template_id: Optional[str] = None,
+        after_id: Optional[int] = None,
+    ):
+        """Build the keyset-filtered select ordered by primary key."""
+        stmt = select(*TRADE_COLUMNS)
+        if spec_version is not None:
+            stmt = stmt.where(TradeORM.spec_version == spec_version)
+        if status is not None:
+            stmt = stmt.where(TradeORM.status == status)
+        if template_id is not None:
+            stmt = stmt.where(TradeORM.template_id == template_id)
+        if after_id is not None:
+            stmt = stmt.where(TradeORM.id > after_id)
+        return stmt.order_by(TradeORM.id)
+
+    def list_page(
+        self,
+        spec_version: Optional[str] = None,
+        status: Optional[str] = None,
+        template_id: Optional[str] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> KeysetPage:
+        """
+        Fetch one page of trades.
+
+        Fetches limit + 1 rows to detect whether another page exists
+        without issuing a COUNT(*).
+
+        Args:
+            spec_version: Optional spec version filter
+            status: Optional status filter
+            template_id: Optional template filter
+            after_id: Last primary key from the previous page
+            limit: Page size (clamped to MAX_PAGE_SIZE)
+
+        Returns:
+            KeysetPage of trade dictionaries
+        """
+        limit = clamp_limit(limit)
+        stmt = self._filtered(spec_version, status, template_id, after_id).limit(limit + 1)
+        with _query_span(self.tracer, "trade.list_page"):
+            rows = self.session.execute(stmt).mappings().all()
+        return _build_page(rows, limit, trade_row_to_dict)
+
+    def stream(
+        self,
+        spec_version: Optional[str] = None,
+        status: Optional[str] = None,
+        template_id: Optional[str] = None,
+        after_id: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all matching trades from a server-side cursor.
+
+        Memory use is bounded by STREAM_BATCH_SIZE rows regardless of
+        result size.
+
+        Yields:
+            Trade dictionaries in primary key order
+        """
+        stmt = self._filtered(spec_version, status, template_id, after_id)
+        yield from _stream_rows(self.session, stmt, trade_row_to_dict, "trade.stream", self.tracer)
+
+
+class LifecycleEventRepository:
+    """
+    Query access to fcn_lifecycle_event.
+    """
+
+    def __init__(self, session: Session, tracer: Optional[Tracer] = None):
+        """
+        Initialize lifecycle event repository.
+
+        Args:
+            session: SQLAlchemy session
+            tracer: Tracer for repository.query spans (default: global provider)
+        """
+        self.session = session
+        self.tracer = tracer or default_tracer
+
+    def _filtered(
+        self,
+        trade_id: str,
+        event_type: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+    ):
+        """Build the keyset-filtered select ordered by primary key."""
+        stmt = select(*LIFECYCLE_COLUMNS).where(LifecycleEventORM.trade_id == trade_id)
+        if event_type is not None:
+            stmt = stmt.where(LifecycleEventORM.event_type == event_type)
+        if from_date is not None:
+            stmt = stmt.where(LifecycleEventORM.event_date >= from_date)
+        if to_date is not None:
+            stmt = stmt.where(LifecycleEventORM.event_date <= to_date)
+        if after_id is not None:
+            stmt = stmt.where(LifecycleEventORM.id > after_id)
+        return stmt.order_by(LifecycleEventORM.id)
+
+    def list_page(
+        self,
+        trade_id: str,
+        event_type: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> KeysetPage:
+        """
+        Fetch one page of lifecycle events for a trade.
+
+        Args:
+            trade_id: Trade identifier
+            event_type: Optional event type filter
+            from_date: Optional inclusive lower bound on event_date
+            to_date: Optional inclusive upper bound on event_date
+            after_id: Last primary key from the previous page
+            limit: Page size (clamped to MAX_PAGE_SIZE)
+
+        Returns:
+            KeysetPage of lifecycle event dictionaries
+        """
+        limit = clamp_limit(limit)
+        stmt = self._filtered(trade_id, event_type, from_date, to_date, after_id).limit(limit + 1)
+        with _query_span(self.tracer, "lifecycle.list_page"):
+            rows = self.session.execute(stmt).mappings().all()
+        return _build_page(rows, limit, lifecycle_row_to_dict)
+
+    def stream(
+        self,
+        trade_id: str,
+        event_type: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        after_id: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all matching lifecycle events from a server-side cursor.
+
+        Yields:
+            Lifecycle event dictionaries in primary key order
+        """
+        stmt = self._filtered(trade_id, event_type, from_date, to_date, after_id)
+        yield from _stream_rows(self.session, stmt, lifecycle_row_to_dict, "lifecycle.stream", self.tracer)
+
+
+def trade_exists(session: Session, trade_id: str, tracer: Optional[Tracer] = None) -> bool:
+    """Return True if a trade with the given identifier exists."""
+    stmt = select(TradeORM.id).where(TradeORM.trade_id == trade_id).limit(1)
+    with _query_span(tracer or default_tracer, "trade.exists"):
+        return session.execute(stmt).first() is not None
+
+
+def _query_span(tracer: Tracer, operation: str):
+    """Start a repository.query span for one repository operation."""
+    return tracer.start_as_current_span(
+        SPAN_REPOSITORY_QUERY,
+        attributes={"fcn.repository.operation": operation},
+    )
+
+
+def _build_page(rows: List[Any], limit: int, to_dict) -> KeysetPage:
+    """Trim the look-ahead row and compute the next cursor."""
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(rows[-1]["id"]) if has_more and rows else None
+    return KeysetPage(
+        items=[to_dict(row) for row in rows],
+        limit=limit,
+        next_cursor=next_cursor,
+        has_more=has_more,
+    )
+
+
+def _stream_rows(session: Session, stmt, to_dict, operation: str, tracer: Tracer) -> Iterator[Dict[str, Any]]:
+    """
+    Execute statement with a server-side cursor and yield mapped rows.
+
+    The span covers opening the cursor only; a span held open across
+    yields would outlive the request's context.
+    """
+    with _query_span(tracer, operation):
+        result = session.execute(
+            stmt.execution_options(stream_results=True, yield_per=STREAM_BATCH_SIZE)
+        )
+    try:
+        for row in result.mappings():
+            yield to_dict(row)
+    finally:
+        result.close()
@@ -0,0 +1,697 @@
+"""
+Columnar Parquet export of trades, observations and coupon cashflows.
+
+Moves analytics reads off the booking database. Each source table is read
+in keyset chunks (`WHERE id > :last_id ORDER BY id LIMIT :chunk`), every
+chunk executed on a server-side cursor, and written to Parquet files
+partitioned by spec_version and trade month:
+
+    <output>/fcn_trade/spec_version=1.1.0/trade_month=2025-10/part-<run>.parquet
+
+`trade_params` JSON is flattened into typed `param_<name>` columns whose
+Arrow types come from the parameter schemas trades are validated against
+at booking (CompiledSchemaRegistry's per-version files; the column set is
+the union over versions), so analytics queries never parse JSON blobs. A
+trade fills only the columns its own spec version's schema defines. Keys
+outside that schema, unknown spec versions and values that do not fit
+their column go to a `param_extra` JSON column and are counted in the
+`unmapped_params` / `coerce_errors` stats, never dropped.
+
+Incremental mode reads only rows past the stored watermark
+(`updated_at` for trades and cashflows, the append-only `id` for
+observations) and writes them as new part files. Updated trades therefore
+appear once per export run; consumers take the latest `updated_at` per key.
+Files are written under an `.inprogress` suffix and renamed only once every
+table of the run has exported; watermarks are then committed to
+`<output>/_watermarks.json`. A failed run leaves no visible files and no
+watermark movement, so it can simply be retried.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from sqlalchemy import column, inspect, select, table
+from sqlalchemy.orm import Session
+
+from src.infra.db.models import ObservationORM, TradeORM
+from src.validation.rules import version_key
+from src.validation.schema import SCHEMA_DIR, SCHEMA_FILES
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional analytics dependency
+    pa = None
+    pq = None
+
+
+DEFAULT_CHUNK_SIZE = 10000
+DEFAULT_ROW_GROUP_SIZE = 100000
+
+WATERMARK_FILE = "_watermarks.json"
+
+# fcn_coupon_cashflow lives in the consolidated SQL Server schema
+# (fcn_schema_consolidated_v1_1.sql), not in the ORM models
+CouponCashflowTable = table(
+    "fcn_coupon_cashflow",
+    column("cashflow_id"),
+    column("trade_id"),
+    column("period_index"),
+    column("observation_date"),
+    column("payment_date"),
+    column("coupon_amount"),
+    column("coupon_status"),
+    column("worst_performance"),
+    column("memory_accumulated_amount"),
+    column("created_at"),
+    column("updated_at"),
+)
+
+
+class ExportDependencyError(RuntimeError):
+    """Raised when pyarrow is not installed."""
+
+
+def _json_type(node: Dict[str, Any]) -> Optional[str]:
+    """Return the single non-null JSON type of a schema node."""
+    types = node.get("type")
+    if isinstance(types, list):
+        types = [t for t in types if t != "null"]
+        return types[0] if len(types) == 1 else None
+    return types
+
+
+def arrow_type(node: Dict[str, Any]):
+    """
+    Map a parameter schema property to an Arrow type.
+
+    Scalars map directly (date-formatted strings to date32); arrays of
+    scalars become lists; anything else is stored as a JSON string.
+    """
+    json_type = _json_type(node)
+    if json_type == "number":
+        return pa.float64()
+    if json_type == "integer":
+        return pa.int64()
+    if json_type == "boolean":
+        return pa.bool_()
+    if json_type == "string":
+        return pa.date32() if node.get("format") == "date" else pa.string()
+    if json_type == "array":
+        items = node.get("items") or {}
+        if isinstance(items, dict) and _json_type(items) in ("number", "integer", "boolean", "string"):
+            return pa.list_(arrow_type(items))
+    return pa.string()
+
+
+def parameter_properties(schema_dir: Path = SCHEMA_DIR,
+                         schema_files: Optional[Dict[str, str]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the top-level parameter properties of each spec version's schema.
+
+    Defaults to SCHEMA_FILES, the mapping CompiledSchemaRegistry validates
+    trade payloads with, so columns follow the shape stored trades have.
+
+    Returns:
+        Mapping of major.minor version to {parameter name: schema node}
+    """
+    versions = {}
+    for version, filename in (schema_files or SCHEMA_FILES).items():
+        with open(Path(schema_dir) / filename, "r", encoding="utf-8") as f:
+            versions[version] = json.load(f).get("properties", {})
+    return versions
+
+
+def parameter_fields(versions: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the flattened parameter column types from per-version properties.
+
+    A parameter whose type differs between spec versions falls back to a
+    string column.
+
+    Returns:
+        Ordered mapping of parameter name to Arrow type
+    """
+    fields: Dict[str, Any] = {}
+    for properties in versions.values():
+        for name, node in properties.items():
+            arrow = arrow_type(node)
+            if name in fields and fields[name] != arrow:
+                arrow = pa.string()
+            fields[name] = arrow
+    return fields
+
+
+def converter(arrow) -> Callable[[Any], Any]:
+    """
+    Build a function converting a JSON value to what Arrow expects for `arrow`.
+
+    Type dispatch happens once per column, not per value. The returned
+    function passes None through and raises ValueError or TypeError when a
+    value does not fit the column type.
+    """
+    if pa.types.is_list(arrow):
+        item = converter(arrow.value_type)
+
+        def convert(value):
+            if not isinstance(value, list):
+                raise ValueError(f"expected list, got {type(value).__name__}")
+            return [item(v) for v in value]
+    elif pa.types.is_date32(arrow):
+        def convert(value):
+            return date.fromisoformat(str(value)[:10])
+    elif pa.types.is_floating(arrow):
+        def convert(value):
+            if isinstance(value, bool):
+                raise ValueError("expected number, got boolean")
+            return float(value)
+    elif pa.types.is_integer(arrow):
+        def convert(value):
+            if isinstance(value, bool) or float(value) != int(value):
+                raise ValueError(f"expected integer, got {value!r}")
+            return int(value)
+    elif pa.types.is_boolean(arrow):
+        def convert(value):
+            if not isinstance(value, bool):
+                raise ValueError(f"expected boolean, got {value!r}")
+            return value
+    else:
+        def convert(value):
+            if isinstance(value, (dict, list)):
+                return json.dumps(value, separators=(",", ":"), default=str)
+            return str(value)
+
+    def convert_nullable(value):
+        return None if value is None else convert(value)
+
+    return convert_nullable
+
+
+def _decimal(value: Any, scale: int) -> Optional[Decimal]:
+    """Quantize a numeric value to a fixed decimal scale."""
+    if value is None:
+        return None
+    try:
+        return Decimal(str(value)).quantize(Decimal(1).scaleb(-scale))
+    except InvalidOperation as e:
+        raise ValueError(f"invalid decimal {value!r}") from e
+
+
+def _month(value: Any) -> str:
+    """Render the trade month partition value (YYYY-MM)."""
+    if value is None:
+        return "unknown"
+    if isinstance(value, (date, datetime)):
+        return value.strftime("%Y-%m")
+    return str(value)[:7]
+
+
+@dataclass
+class ExportSource:
+    """
+    One exported table: query, keyset and watermark columns, row mapping.
+    """
+    name: str
+    columns: Tuple
+    key: Any
+    watermark: Any
+    fields: List[Tuple[str, Any]]
+    to_row: Callable[[Any, "ExportStats"], Dict[str, Any]]
+    join_trade: bool = False
+    from_table: Any = None
+
+    def statement(self, after_key: Any, since: Any, limit: int):
+        """Build one keyset chunk query."""
+        stmt = select(*self.columns)
+        if self.join_trade:
+            stmt = stmt.select_from(self.from_table).join(
+                TradeORM, TradeORM.trade_id == self.from_table.c.trade_id
+            )
+        if since is not None:
+            stmt = stmt.where(self.watermark > since)
+        if after_key is not None:
+            stmt = stmt.where(self.key > after_key)
+        return stmt.order_by(self.key).limit(limit)
+
+
+@dataclass
+class ExportStats:
+    """
+    Per-table export counters.
+    """
+    rows: int = 0
+    files: int = 0
+    row_groups: int = 0
+    chunks: int = 0
+    coerce_errors: int = 0
+    unmapped_params: int = 0
+    skipped: bool = False
+    elapsed: float = 0.0
+    watermark: Any = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return counters as a JSON-serializable dict."""
+        return {
+            "rows": self.rows,
+            "files": self.files,
+            "row_groups": self.row_groups,
+            "chunks": self.chunks,
+            "coerce_errors": self.coerce_errors,
+            "unmapped_params": self.unmapped_params,
+            "skipped": self.skipped,
+            "elapsed": round(self.elapsed, 3),
+            "watermark": _json_watermark(self.watermark),
+        }
+
+
+def _json_watermark(value: Any) -> Any:
+    """Render a watermark for the watermark file."""
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+class PartitionedParquetWriter:
+    """
+    Buffers rows per partition and flushes them as Parquet row groups.
+
+    One file per partition per run; memory is bounded by `row_group_size`
+    rows per open partition. Files stay hidden under an `.inprogress`
+    suffix until `commit()`.
+    """
+
+    def __init__(self, root: Path, schema, partition_keys: Tuple[str, ...], run_id: str,
+                 row_group_size: int, stats: ExportStats):
+        self.root = root
+        self.schema = schema
+        self.partition_keys = partition_keys
+        self.run_id = run_id
+        self.row_group_size = row_group_size
+        self.stats = stats
+        self._buffers: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        self._writers: Dict[Tuple[str, ...], Any] = {}
+        self._paths: List[Path] = []
+
+    def write(self, partition: Tuple[str, ...], row: Dict[str, Any]) -> None:
+        """Add a row to its partition, flushing a full row group."""
+        buffer = self._buffers.setdefault(partition, [])
+        buffer.append(row)
+        if len(buffer) >= self.row_group_size:
+            self._flush(partition)
+
+    def close(self) -> None:
+        """Flush remaining rows and close every file."""
+        for partition in list(self._buffers):
+            self._flush(partition)
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def commit(self) -> None:
+        """Publish closed files under their final names."""
+        for path in self._paths:
+            os.replace(path, path.with_suffix(""))
+        self._paths.clear()
+
+    def discard(self) -> None:
+        """Close and delete this run's files."""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+        for path in self._paths:
+            path.unlink(missing_ok=True)
+        self._paths.clear()
+
+    def _flush(self, partition: Tuple[str, ...]) -> None:
+        rows = self._buffers.get(partition)
+        if not rows:
+            return
+        writer = self._writers.get(partition)
+        if writer is None:
+            directory = self.root.joinpath(*(
+                f"{key}={value}" for key, value in zip(self.partition_keys, partition)
+            ))
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"part-{self.run_id}.parquet.inprogress"
+            writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+            self._paths.append(path)
+            self._writers[partition] = writer
+            self.stats.files += 1
+        writer.write_table(pa.Table.from_pylist(rows, schema=self.schema), row_group_size=self.row_group_size)
+        self.stats.row_groups += 1
+        self._buffers[partition] = []
+
+
+class ParquetExporter:
+    """
+    Keyset-chunked, partitioned Parquet export with updated_at watermarks.
+    """
+
+    PARTITION_KEYS = ("spec_version", "trade_month")
+
+    def __init__(
+        self,
+        session_factory,
+        output_dir: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ):
+        """
+        Initialize Parquet exporter.
+
+        Args:
+            session_factory: Callable that returns SQLAlchemy Session
+            output_dir: Root directory of the Parquet dataset
+            chunk_size: Rows per keyset chunk query
+            row_group_size: Rows per Parquet row group
+
+        Raises:
+            ExportDependencyError: If pyarrow is not installed
+        """
+        if pa is None:
+            raise ExportDependencyError("Parquet export requires pyarrow (pip install pyarrow)")
+        self.session_factory = session_factory
+        self.output_dir = Path(output_dir)
+        self.chunk_size = chunk_size
+        self.row_group_size = row_group_size
+        versions = parameter_properties()
+        self.param_fields = parameter_fields(versions)
+        self.param_converters = [
+            (name, f"param_{name}", converter(arrow)) for name, arrow in self.param_fields.items()
+        ]
+        # Parameters each spec version defines; others go to param_extra
+        self.version_params = {version: frozenset(properties) for version, properties in versions.items()}
+        self.sources = {source.name: source for source in self._sources()}
+
+    def _sources(self) -> List[ExportSource]:
+        """Describe the exported tables."""
+        timestamp = pa.timestamp("us", tz="UTC")
+        partition_fields = [("spec_version", pa.string()), ("trade_month", pa.string())]
+
+        trade_fields = [
+            ("id", pa.int64()),
+            ("trade_id", pa.string()),
+            ("template_id", pa.string()),
+            ("trade_date", pa.timestamp("us")),
+            ("maturity_date", pa.timestamp("us")),
+            ("notional", pa.decimal128(18, 4)),
+            ("currency", pa.string()),
+            ("status", pa.string()),
+            ("autocall_triggered", pa.bool_()),
+            ("ki_triggered", pa.bool_()),
+            ("created_at", timestamp),
+            ("updated_at", timestamp),
+        ]
+        self._trade_columns = self._plain_row(trade_fields)
+        trade_fields = trade_fields + [(f"param_{name}", arrow) for name, arrow in self.param_fields.items()]
+        trade_fields.append(("param_extra", pa.string()))
+
+        observation_fields = [
+            ("id", pa.int64()),
+            ("trade_id", pa.string()),
+            ("observation_date", pa.timestamp("us")),
+            ("observation_type", pa.string()),
+            ("underlying_prices", pa.string()),
+            ("autocall_triggered", pa.bool_()),
+            ("coupon_eligible", pa.bool_()),
+            ("ki_triggered", pa.bool_()),
+            ("observation_data", pa.string()),
+            ("created_at", timestamp),
+        ]
+
+        cashflow_fields = [
+            ("cashflow_id", pa.string()),
+            ("trade_id", pa.string()),
+            ("period_index", pa.int32()),
+            ("observation_date", pa.date32()),
+            ("payment_date", pa.date32()),
+            ("coupon_amount", pa.decimal128(20, 4)),
+            ("coupon_status", pa.string()),
+            ("worst_performance", pa.decimal128(12, 8)),
+            ("memory_accumulated_amount", pa.decimal128(20, 4)),
+            ("created_at", pa.timestamp("us")),
+            ("updated_at", pa.timestamp("us")),
+        ]
+
+        c = CouponCashflowTable.c
+        return [
+            ExportSource(
+                name="fcn_trade",
+                columns=(
+                    TradeORM.id, TradeORM.trade_id, TradeORM.template_id, TradeORM.spec_version,
+                    TradeORM.trade_date, TradeORM.maturity_date, TradeORM.notional, TradeORM.currency,
+                    TradeORM.status, TradeORM.autocall_triggered, TradeORM.ki_triggered,
+                    TradeORM.trade_params, TradeORM.created_at, TradeORM.updated_at,
+                ),
+                key=TradeORM.id,
+                watermark=TradeORM.updated_at,
+                fields=trade_fields + partition_fields,
+                to_row=self._trade_row,
+            ),
+            ExportSource(
+                name="fcn_observation",
+                columns=(
+                    ObservationORM.id, ObservationORM.trade_id, ObservationORM.observation_date,
+                    ObservationORM.observation_type, ObservationORM.underlying_prices,
+                    ObservationORM.autocall_triggered, ObservationORM.coupon_eligible,
+                    ObservationORM.ki_triggered, ObservationORM.observation_data,
+                    ObservationORM.created_at, TradeORM.spec_version, TradeORM.trade_date,
+                ),
+                key=ObservationORM.id,
+                # Observations are append-only: the key is the watermark
+                watermark=ObservationORM.id,
+                fields=observation_fields + partition_fields,
+                to_row=self._plain_row(observation_fields),
+                join_trade=True,
+                from_table=ObservationORM.__table__,
+            ),
+            ExportSource(
+                name="fcn_coupon_cashflow",
+                columns=(
+                    c.cashflow_id, c.trade_id, c.period_index, c.observation_date, c.payment_date,
+                    c.coupon_amount, c.coupon_status, c.worst_performance,
+                    c.memory_accumulated_amount, c.created_at, c.updated_at,
+                    TradeORM.spec_version, TradeORM.trade_date,
+                ),
+                key=c.cashflow_id,
+                watermark=c.updated_at,
+                fields=cashflow_fields + partition_fields,
+                to_row=self._plain_row(cashflow_fields),
+                join_trade=True,
+                from_table=CouponCashflowTable,
+            ),
+        ]
+
+    def _trade_row(self, row: Any, stats: ExportStats) -> Dict[str, Any]:
+        """
+        Map a fcn_trade row, flattening trade_params into param_ columns.
+
+        Only parameters the row's spec version defines fill param_ columns.
+        Everything else, including values that do not convert, is kept in
+        param_extra as JSON.
+        """
+        out = self._trade_columns(row, stats)
+        try:
+            params = json.loads(row["trade_params"]) if row["trade_params"] else {}
+        except (json.JSONDecodeError, TypeError):
+            params = None
+        if not isinstance(params, dict):
+            # Not a JSON object: keep the stored text as is
+            stats.coerce_errors += 1
+            out.update({column_name: None for _, column_name, _ in self.param_converters})
+            out["param_extra"] = json.dumps({"_raw": row["trade_params"]}, default=str)
+            return out
+
+        defined = self.version_params.get(version_key(row["spec_version"]), frozenset())
+        extra = {name: value for name, value in params.items() if name not in defined}
+        stats.unmapped_params += len(extra)
+        for name, column_name, convert in self.param_converters:
+            value = params.get(name) if name in defined else None
+            try:
+                out[column_name] = convert(value)
+            except (TypeError, ValueError):
+                out[column_name] = None
+                extra[name] = value
+                stats.coerce_errors += 1
+        out["param_extra"] = json.dumps(extra, separators=(",", ":"), default=str) if extra else None
+        return out
+
+    @staticmethod
+    def _plain_row(fields: List[Tuple[str, Any]]) -> Callable[[Any, ExportStats], Dict[str, Any]]:
+        """Build a mapper copying columns, normalizing typed values and adding partitions."""
+        def passthrough(value):
+            return value
+
+        def decimal_of(scale):
+            return lambda value: _decimal(value, scale)
+
+        def parse_date(value):
+            return date.fromisoformat(value[:10]) if isinstance(value, str) else value
+
+        def parse_timestamp(value):
+            return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+        columns = []
+        for name, arrow in fields:
+            if pa.types.is_decimal(arrow):
+                convert = decimal_of(arrow.scale)
+            elif pa.types.is_date32(arrow):
+                convert = parse_date
+            elif pa.types.is_timestamp(arrow):
+                convert = parse_timestamp
+            else:
+                convert = passthrough
+            columns.append((name, convert))
+
+        def to_row(row: Any, stats: ExportStats) -> Dict[str, Any]:
+            out = {}
+            for name, convert in columns:
+                try:
+                    out[name] = convert(row[name])
+                except ValueError:
+                    out[name] = None
+                    stats.coerce_errors += 1
+            out["spec_version"] = row["spec_version"]
+            out["trade_month"] = _month(row["trade_date"])
+            return out
+
+        return to_row
+
+    def load_watermarks(self) -> Dict[str, Any]:
+        """Read committed watermarks (empty on first run)."""
+        path = self.output_dir / WATERMARK_FILE
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_watermarks(self, watermarks: Dict[str, Any]) -> None:
+        """Commit watermarks atomically."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(watermarks, f, indent=2)
+        os.replace(tmp_path, self.output_dir / WATERMARK_FILE)
+
+    def export(self, tables: Optional[List[str]] = None, full: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Export tables, incrementally unless `full` is set.
+
+        Args:
+            tables: Table names to export (default: all)
+            full: Ignore stored watermarks and export every row
+
+        Returns:
+            Per-table statistics
+        """
+        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+        watermarks = {} if full else self.load_watermarks()
+        results: Dict[str, ExportStats] = {}
+        writers: List[PartitionedParquetWriter] = []
+
+        try:
+            with self.session_factory() as session:
+                existing = set(inspect(session.get_bind()).get_table_names())
+                for name in tables or list(self.sources):
+                    source = self.sources[name]
+                    stats = ExportStats()
+                    results[name] = stats
+                    if name not in existing:
+                        stats.skipped = True
+                        continue
+                    since = self._parse_watermark(source, watermarks.get(name))
+                    writers.append(self._export_source(session, source, since, run_id, stats))
+        except BaseException:
+            for writer in writers:
+                writer.discard()
+            raise
+
+        for writer in writers:
+            writer.commit()
+        committed = self.load_watermarks()
+        for name, stats in results.items():
+            if stats.watermark is not None:
+                committed[name] = _json_watermark(stats.watermark)
+        self.save_watermarks(committed)
+        return {name: stats.as_dict() for name, stats in results.items()}
+
+    @staticmethod
+    def _parse_watermark(source: ExportSource, value: Any) -> Any:
+        """Restore a stored watermark to the column's Python type."""
+        if value is None or source.watermark is source.key:
+            return value
+        return datetime.fromisoformat(value)
+
+    def _export_source(self, session: Session, source: ExportSource, since: Any,
+                       run_id: str, stats: ExportStats) -> PartitionedParquetWriter:
+        """Stream one table in keyset chunks into partitioned Parquet files (uncommitted)."""
+        start = time.perf_counter()
+        schema = pa.schema(source.fields)
+        writer = PartitionedParquetWriter(
+            self.output_dir / source.name, schema, self.PARTITION_KEYS,
+            run_id, self.row_group_size, stats,
+        )
+        watermark_name = source.watermark.key if source.watermark is not source.key else None
+        stats.watermark = since
+        try:
+            for row in self._chunks(session, source, since, stats):
+                record = source.to_row(row, stats)
+                writer.write((record["spec_version"], record["trade_month"]), record)
+                stats.rows += 1
+                mark = row[watermark_name] if watermark_name else row[source.key.key]
+                if mark is not None and (stats.watermark is None or mark > stats.watermark):
+                    stats.watermark = mark
+            writer.close()
+        except BaseException:
+            writer.discard()
+            raise
+        stats.elapsed = time.perf_counter() - start
+        return writer
+
+    def _chunks(self, session: Session, source: ExportSource, since: Any, stats: ExportStats) -> Iterator[Any]:
+        """Yield rows chunk by chunk, each chunk from a server-side cursor."""
+        after_key = None
+        while True:
+            result = session.execute(
+                source.statement(after_key, since, self.chunk_size)
+                .execution_options(stream_results=True, yield_per=self.chunk_size)
+            )
+            count = 0
+            try:
+                for row in result.mappings():
+                    count += 1
+                    after_key = row[source.key.key]
+                    yield row
+            finally:
+                result.close()
+            stats.chunks += 1
+            if count < self.chunk_size:
+                return
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Export FCN trades, observations and cashflows to Parquet")
+    parser.add_argument("output_dir", type=Path, help="Root directory of the Parquet dataset")
+    parser.add_argument("--full", action="store_true", help="Ignore watermarks and export every row")
+    parser.add_argument("--table", action="append", choices=["fcn_trade", "fcn_observation", "fcn_coupon_cashflow"],
+                        help="Table to export (repeatable; default: all)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per keyset chunk")
+    parser.add_argument("--row-group-size", type=int, default=DEFAULT_ROW_GROUP_SIZE, help="Rows per Parquet row group")
+    args = parser.parse_args(argv)
+
+    from src.infra.db.base import SessionLocal
+
+    exporter = ParquetExporter(SessionLocal, args.output_dir, args.chunk_size, args.row_group_size)
+    results = exporter.export(args.table, full=args.full)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
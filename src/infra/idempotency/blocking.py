@@ -0,0 +1,42 @@
+"""
+Thread offloading for idempotency stores.
+
+The SQLAlchemy session and the Redis client block. Store calls run on a
+dedicated thread pool, so a slow backend stalls only the requests waiting
+for it, not the event loop. A deadline in IdempotencyService can then
+abandon the wait: the thread finishes in the background while the request
+moves on.
+
+The pool is bounded, so a hung backend holds at most STORE_THREADS threads
+and never the threads other code gets from asyncio.to_thread.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+import asyncio
+import contextvars
+import functools
+
+
+STORE_THREADS = 16
+
+_executor = ThreadPoolExecutor(max_workers=STORE_THREADS, thread_name_prefix="idempotency-store")
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a blocking call on the store thread pool.
+
+    The caller's context is copied into the thread, so the call's database
+    spans nest under the current span.
+
+    Args:
+        fn: Blocking callable
+        *args: Positional arguments for fn
+
+    Returns:
+        fn's return value
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _executor, functools.partial(context.run, fn, *args)
+    )
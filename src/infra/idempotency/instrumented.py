@@ -0,0 +1,86 @@
+"""
+Instrumented idempotency store wrapper.
+
+Records per-backend operation latency for any IdempotencyStore on the
+Prometheus registry in src.observability.metrics and wraps each call in an
+`idempotency.store.<operation>` span.
+"""
+from time import perf_counter
+from typing import Optional
+
+from opentelemetry.trace import Tracer
+
+from src.domain.services.idempotency import IdempotencyStore, IdempotencyRecord
+from src.observability.metrics import IDEMPOTENCY_STORE_LATENCY
+from src.observability.tracing import get_tracer
+
+
+default_tracer = get_tracer(__name__)
+
+
+class InstrumentedIdempotencyStore(IdempotencyStore):
+    """
+    IdempotencyStore decorator timing and tracing get/set/delete calls.
+    """
+
+    def __init__(self, store: IdempotencyStore, backend: str, tracer: Optional[Tracer] = None):
+        """
+        Initialize instrumented store.
+
+        Args:
+            store: Wrapped store (MSSQLIdempotencyStore, RedisIdempotencyStore)
+            backend: Backend label value (e.g. "mssql", "redis")
+            tracer: Tracer from the app's TracingSetup (default: global provider)
+        """
+        self.store = store
+        self.backend = backend
+        self.tracer = tracer or default_tracer
+        self._get_latency = IDEMPOTENCY_STORE_LATENCY.labels(backend, "get")
+        self._set_latency = IDEMPOTENCY_STORE_LATENCY.labels(backend, "set")
+        self._delete_latency = IDEMPOTENCY_STORE_LATENCY.labels(backend, "delete")
+        self._span_attributes = {"fcn.idempotency.backend": backend}
+
+    async def get(self, key_hash: str) -> Optional[IdempotencyRecord]:
+        """
+        Retrieve idempotency record from the wrapped store.
+
+        Args:
+            key_hash: SHA256 hash of idempotency key
+
+        Returns:
+            IdempotencyRecord if found, None otherwise
+        """
+        start = perf_counter()
+        try:
+            with self.tracer.start_as_current_span("idempotency.store.get", attributes=self._span_attributes):
+                return await self.store.get(key_hash)
+        finally:
+            self._get_latency.observe(perf_counter() - start)
+
+    async def set(self, record: IdempotencyRecord) -> None:
+        """
+        Store idempotency record in the wrapped store.
+
+        Args:
+            record: IdempotencyRecord to store
+        """
+        start = perf_counter()
+        try:
+            with self.tracer.start_as_current_span("idempotency.store.set", attributes=self._span_attributes):
+                await self.store.set(record)
+        finally:
+            self._set_latency.observe(perf_counter() - start)
+
+    async def delete(self, key_hash: str) -> None:
+        """
+        Delete idempotency record from the wrapped store.
+
+        Args:
+            key_hash: SHA256 hash of idempotency key
+        """
+        start = perf_counter()
+        try:
+            with self.tracer.start_as_current_span("idempotency.store.delete", attributes=self._span_attributes):
+                await self.store.delete(key_hash)
+        finally:
+            self._delete_latency.observe(perf_counter() - start)
@@ -2,12 +2,14 @@
 MSSQL-backed idempotency store implementation.
 
 Provides durable storage for idempotency keys using Microsoft SQL Server.
+Session work runs on the store thread pool (src.infra.idempotency.blocking).
 """
 from datetime import datetime, timezone
 from typing import Optional
 from sqlalchemy.orm import Session
 from src.domain.services.idempotency import IdempotencyStore, IdempotencyRecord
 from src.infra.db.models import IdempotencyKeyORM
+from src.infra.idempotency.blocking import run_blocking
 
 
 def utcnow():
@@ -41,6 +43,9 @@ class MSSQLIdempotencyStore(IdempotencyStore):
         Returns:
             IdempotencyRecord if found and not expired, None otherwise
         """
+        return await run_blocking(self._get, key_hash)
+    
+    def _get(self, key_hash: str) -> Optional[IdempotencyRecord]:
         with self.session_factory() as session:
             orm_record = session.query(IdempotencyKeyORM).filter(
                 IdempotencyKeyORM.key_hash == key_hash,
@@ -68,6 +73,9 @@ class MSSQLIdempotencyStore(IdempotencyStore):
         Args:
             record: IdempotencyRecord to store
         """
+        await run_blocking(self._set, record)
+    
+    def _set(self, record: IdempotencyRecord) -> None:
         with self.session_factory() as session:
             orm_record = IdempotencyKeyORM(
                 key_hash=record.key_hash,
@@ -89,6 +97,9 @@ class MSSQLIdempotencyStore(IdempotencyStore):
         Args:
             key_hash: SHA256 hash of idempotency key
         """
+        await run_blocking(self._delete, key_hash)
+    
+    def _delete(self, key_hash: str) -> None:
         with self.session_factory() as session:
             session.query(IdempotencyKeyORM).filter(
                 IdempotencyKeyORM.key_hash == key_hash
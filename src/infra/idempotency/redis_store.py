@@ -2,12 +2,14 @@
 Redis-backed idempotency store implementation.
 
 Provides fast, ephemeral storage for idempotency keys using Redis.
+Client calls run on the store thread pool (src.infra.idempotency.blocking).
 """
 from datetime import datetime, timezone
 from typing import Optional
 import json
 import redis
 from src.domain.services.idempotency import IdempotencyStore, IdempotencyRecord
+from src.infra.idempotency.blocking import run_blocking
 
 
 def utcnow():
@@ -47,7 +49,7 @@ class RedisIdempotencyStore(IdempotencyStore):
             IdempotencyRecord if found, None otherwise
         """
         redis_key = self._make_key(key_hash)
-        data = self.redis.get(redis_key)
+        data = await run_blocking(self.redis.get, redis_key)
         
         if not data:
             return None
@@ -88,7 +90,8 @@ class RedisIdempotencyStore(IdempotencyStore):
         # Calculate TTL in seconds
         ttl_seconds = int((record.expires_at - utcnow()).total_seconds())
         if ttl_seconds > 0:
-            self.redis.setex(
+            await run_blocking(
+                self.redis.setex,
                 redis_key,
                 ttl_seconds,
                 json.dumps(record_dict)
@@ -102,4 +105,4 @@ class RedisIdempotencyStore(IdempotencyStore):
             key_hash: SHA256 hash of idempotency key
         """
         redis_key = self._make_key(key_hash)
-        self.redis.delete(redis_key)
+        await run_blocking(self.redis.delete, redis_key)
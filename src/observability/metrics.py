@@ -0,0 +1,437 @@
+"""
+Prometheus metrics for the FCN API (ADR-006 §10).
+
+All metrics live in a dedicated registry exposed at `/metrics`. Request-path
+instrumentation is limited to pre-resolved counter/histogram children (one
+dictionary lookup per request, no label parsing); pool gauges are computed
+at scrape time by a collector, so they cost nothing per request.
+
+Under the prefork server (src/app/server.py) workers share one socket, so
+a scrape reaches one worker at a time. The server sets
+PROMETHEUS_MULTIPROC_DIR before prometheus_client is imported: counters,
+histograms and gauges are then written to per-process files and
+`scrape_registry()` sums them across workers. Scrape-time collectors
+(pool, admission, circuit breaker) describe the answering worker only and
+carry its `pid` label.
+"""
+from typing import Dict, Iterable, Optional, Tuple
+import os
+import threading
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.metrics_core import Metric
+from prometheus_client.registry import Collector
+
+
+REGISTRY = CollectorRegistry(auto_describe=True)
+
+# Request latency buckets (seconds): sub-millisecond through the 500 ms P95 target
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Store round-trip buckets (seconds)
+STORE_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+# Payload size buckets (bytes)
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Saturation wait buckets (seconds): pool checkout wait up to the 30 s pool timeout
+WAIT_BUCKETS = (0.0001, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+
+# --- HTTP ---------------------------------------------------------------------
+
+HTTP_REQUESTS = Counter(
+    "fcn_http_requests_total",
+    "HTTP requests by route template, method and status code",
+    ["method", "route", "status"],
+    registry=REGISTRY,
+)
+HTTP_LATENCY = Histogram(
+    "fcn_http_request_duration_seconds",
+    "HTTP request latency by route template and method",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+HTTP_REQUEST_SIZE = Histogram(
+    "fcn_http_request_size_bytes",
+    "HTTP request body size (Content-Length) by route template",
+    ["route"],
+    buckets=SIZE_BUCKETS,
+    registry=REGISTRY,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "fcn_http_response_size_bytes",
+    "HTTP response body size by route template",
+    ["route"],
+    buckets=SIZE_BUCKETS,
+    registry=REGISTRY,
+)
+
+# --- Idempotency --------------------------------------------------------------
+
+IDEMPOTENCY_LOOKUPS = Counter(
+    "fcn_idempotency_lookups_total",
+    "Idempotency key lookups by result (hit, miss)",
+    ["result"],
+    registry=REGISTRY,
+)
+IDEMPOTENCY_OUTCOMES = Counter(
+    "fcn_idempotency_outcomes_total",
+    "Idempotent request outcomes (replay, conflict, stored, store_error)",
+    ["outcome"],
+    registry=REGISTRY,
+)
+IDEMPOTENCY_STORE_LATENCY = Histogram(
+    "fcn_idempotency_store_latency_seconds",
+    "Idempotency store operation latency by backend and operation",
+    ["backend", "operation"],
+    buckets=STORE_LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+IDEMPOTENCY_DEGRADED = Counter(
+    "fcn_idempotency_degraded_total",
+    "Requests served without the idempotency store by operation, "
+    "reason (timeout, error, circuit_open) and policy (fail_open, fail_closed)",
+    ["operation", "reason", "policy"],
+    registry=REGISTRY,
+)
+
+# --- Saturation and admission control ----------------------------------------
+
+DB_POOL_WAIT = Histogram(
+    "fcn_db_pool_wait_seconds",
+    "Time waiting for a connection from the database pool",
+    buckets=WAIT_BUCKETS,
+    registry=REGISTRY,
+)
+EVENT_LOOP_LAG = Histogram(
+    "fcn_event_loop_lag_seconds",
+    "Event-loop scheduling lag (timer overshoot)",
+    buckets=WAIT_BUCKETS,
+    registry=REGISTRY,
+)
+ADMISSION_REJECTIONS = Counter(
+    "fcn_admission_rejections_total",
+    "Requests shed with 503 by route class and reason (in_flight, pool_wait, loop_lag)",
+    ["route_class", "reason"],
+    registry=REGISTRY,
+)
+
+# --- ADR-006 §10 business metrics ---------------------------------------------
+
+TRADES_CREATED = Counter(
+    "fcn_trades_created_total",
+    "FCN trades booked",
+    registry=REGISTRY,
+)
+OBSERVATIONS_PROCESSED = Counter(
+    "fcn_observations_processed_total",
+    "FCN observations processed",
+    registry=REGISTRY,
+)
+VALIDATION_ERRORS = Counter(
+    "fcn_validation_errors_total",
+    "Validation violations by rule code (BR-xxx, schema, governance)",
+    ["code"],
+    registry=REGISTRY,
+)
+OBSERVATION_LATENCY = Histogram(
+    "fcn_observation_latency_seconds",
+    "Observation processing latency",
+    buckets=LATENCY_BUCKETS,
+    registry=REGISTRY,
+)
+ACTIVE_VERSIONS = Gauge(
+    "fcn_active_versions_count",
+    "Spec versions with a registered parameter schema",
+    # Same value in every worker; without this each would add a pid series
+    multiprocess_mode="livemax",
+    registry=REGISTRY,
+)
+
+
+class RouteMetrics:
+    """
+    Pre-resolved HTTP metric children for one (method, route) pair.
+    """
+    __slots__ = ("latency", "request_size", "response_size", "_method", "_route", "_by_status")
+
+    def __init__(self, method: str, route: str):
+        self._method = method
+        self._route = route
+        self.latency = HTTP_LATENCY.labels(method, route)
+        self.request_size = HTTP_REQUEST_SIZE.labels(route)
+        self.response_size = HTTP_RESPONSE_SIZE.labels(route)
+        self._by_status: Dict[int, Counter] = {}
+
+    def requests(self, status: int):
+        """Return the request counter child for a status code."""
+        counter = self._by_status.get(status)
+        if counter is None:
+            counter = HTTP_REQUESTS.labels(self._method, self._route, str(status))
+            self._by_status[status] = counter
+        return counter
+
+
+_route_metrics: Dict[Tuple[str, str], RouteMetrics] = {}
+_route_lock = threading.Lock()
+
+
+def route_metrics(method: str, route: str) -> RouteMetrics:
+    """
+    Return the cached metric children for a (method, route template) pair.
+
+    Args:
+        method: HTTP method
+        route: Route template (e.g. /v1/api/fcn/trades/{trade_id}/lifecycle),
+            never the raw path, to keep label cardinality bounded
+
+    Returns:
+        RouteMetrics
+    """
+    key = (method, route)
+    metrics = _route_metrics.get(key)
+    if metrics is None:
+        with _route_lock:
+            metrics = _route_metrics.get(key)
+            if metrics is None:
+                metrics = RouteMetrics(method, route)
+                _route_metrics[key] = metrics
+    return metrics
+
+
+class PoolCollector(Collector):
+    """
+    Scrape-time SQLAlchemy connection pool gauges.
+    """
+
+    def __init__(self, pools: Dict[str, object]):
+        """
+        Initialize pool collector.
+
+        Args:
+            pools: Mapping of pool name to SQLAlchemy pool (engine.pool)
+        """
+        self.pools = pools
+
+    def describe(self) -> Iterable:
+        return []
+
+    def collect(self) -> Iterable:
+        connections = GaugeMetricFamily(
+            "fcn_db_pool_connections",
+            "Database pool connections by state",
+            labels=["pool", "state"],
+        )
+        size = GaugeMetricFamily(
+            "fcn_db_pool_size",
+            "Configured database pool size",
+            labels=["pool"],
+        )
+        for name, pool in self.pools.items():
+            # QueuePool exposes these; other pool classes are skipped
+            if not hasattr(pool, "checkedout"):
+                continue
+            size.add_metric([name], pool.size())
+            connections.add_metric([name, "checked_out"], pool.checkedout())
+            connections.add_metric([name, "checked_in"], pool.checkedin())
+            connections.add_metric([name, "overflow"], max(pool.overflow(), 0))
+        yield size
+        yield connections
+
+
+# One PoolCollector per registry, keyed by id(registry)
+_pool_collectors: Dict[int, PoolCollector] = {}
+
+
+def register_pool(name: str, pool: object, registry: Optional[CollectorRegistry] = None) -> None:
+    """
+    Expose a connection pool's gauges on the metrics registry.
+
+    Registering a name again replaces its pool, so an app re-created in
+    the same process (tests, engine re-initialisation) does not duplicate
+    the series.
+
+    Args:
+        name: Pool label value (e.g. "primary")
+        pool: SQLAlchemy pool (engine.pool)
+        registry: Registry (default: REGISTRY)
+    """
+    registry = registry or REGISTRY
+    collector = _pool_collectors.get(id(registry))
+    if collector is None:
+        collector = _pool_collectors[id(registry)] = PoolCollector({})
+        registry.register(collector)
+    collector.pools[name] = pool
+
+
+class AdmissionCollector(Collector):
+    """
+    Scrape-time admission controller gauges.
+    """
+
+    def __init__(self, controller: object):
+        """
+        Initialize admission collector.
+
+        Args:
+            controller: AdmissionController (src.app.middleware.admission)
+        """
+        self.controller = controller
+
+    def describe(self) -> Iterable:
+        return []
+
+    def collect(self) -> Iterable:
+        in_flight = GaugeMetricFamily(
+            "fcn_admission_in_flight",
+            "Requests in flight by admission route class",
+            labels=["route_class"],
+        )
+        limit = GaugeMetricFamily(
+            "fcn_admission_limit",
+            "In-flight limit by admission route class",
+            labels=["route_class"],
+        )
+        pressure = GaugeMetricFamily(
+            "fcn_admission_pressure",
+            "Saturation signal relative to its shedding threshold (>= 1: shedding bookings)",
+            labels=["signal"],
+        )
+        for route_class, count in self.controller.in_flight.items():
+            in_flight.add_metric([route_class], count)
+        for route_class, value in self.controller.limits.items():
+            limit.add_metric([route_class], value)
+        for signal, value in self.controller.signals().items():
+            pressure.add_metric([signal], value)
+        yield in_flight
+        yield limit
+        yield pressure
+
+
+# One AdmissionCollector per registry, keyed by id(registry)
+_admission_collectors: Dict[int, AdmissionCollector] = {}
+
+
+def register_admission(controller: object, registry: Optional[CollectorRegistry] = None) -> None:
+    """
+    Expose an admission controller's gauges on the metrics registry.
+
+    Registering again replaces the controller (one app per process serves).
+
+    Args:
+        controller: AdmissionController
+        registry: Registry (default: REGISTRY)
+    """
+    registry = registry or REGISTRY
+    collector = _admission_collectors.get(id(registry))
+    if collector is None:
+        collector = _admission_collectors[id(registry)] = AdmissionCollector(controller)
+        registry.register(collector)
+    collector.controller = controller
+
+
+class CircuitBreakerCollector(Collector):
+    """
+    Scrape-time idempotency store circuit breaker state.
+    """
+
+    def __init__(self, breaker: object):
+        """
+        Initialize circuit breaker collector.
+
+        Args:
+            breaker: CircuitBreaker (src.domain.services.idempotency)
+        """
+        self.breaker = breaker
+
+    def describe(self) -> Iterable:
+        return []
+
+    def collect(self) -> Iterable:
+        state = GaugeMetricFamily(
+            "fcn_idempotency_circuit_state",
+            "Idempotency store circuit state (1 for the current state)",
+            labels=["state"],
+        )
+        transitions = CounterMetricFamily(
+            "fcn_idempotency_circuit_transitions",
+            "Idempotency store circuit transitions by state entered",
+            labels=["state"],
+        )
+        for name, count in self.breaker.transitions.items():
+            state.add_metric([name], 1 if name == self.breaker.state else 0)
+            transitions.add_metric([name], count)
+        yield state
+        yield transitions
+
+
+# One CircuitBreakerCollector per registry, keyed by id(registry)
+_breaker_collectors: Dict[int, CircuitBreakerCollector] = {}
+
+
+def register_idempotency_breaker(breaker: object, registry: Optional[CollectorRegistry] = None) -> None:
+    """
+    Expose the idempotency store circuit breaker on the metrics registry.
+
+    Registering again replaces the breaker (one app per process serves).
+
+    Args:
+        breaker: CircuitBreaker
+        registry: Registry (default: REGISTRY)
+    """
+    registry = registry or REGISTRY
+    collector = _breaker_collectors.get(id(registry))
+    if collector is None:
+        collector = _breaker_collectors[id(registry)] = CircuitBreakerCollector(breaker)
+        registry.register(collector)
+    collector.breaker = breaker
+
+
+class WorkerCollector(Collector):
+    """
+    Adds this process's `pid` label to another collector's samples.
+    """
+
+    def __init__(self, collector: Collector):
+        """
+        Initialize worker collector.
+
+        Args:
+            collector: Scrape-time collector reading per-process state
+        """
+        self.collector = collector
+
+    def describe(self) -> Iterable:
+        return []
+
+    def collect(self) -> Iterable:
+        pid = str(os.getpid())
+        for family in self.collector.collect():
+            labelled = Metric(family.name, family.documentation, family.type, family.unit)
+            for sample in family.samples:
+                labelled.add_sample(sample.name, {**sample.labels, "pid": pid}, sample.value,
+                                    sample.timestamp, sample.exemplar)
+            yield labelled
+
+
+def scrape_registry() -> CollectorRegistry:
+    """
+    Return the registry to render for a scrape.
+
+    REGISTRY in a single process. With PROMETHEUS_MULTIPROC_DIR set, a
+    fresh registry that aggregates every worker's metric files plus this
+    worker's scrape-time collectors.
+    """
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not path:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path)
+    for collectors in (_pool_collectors, _admission_collectors, _breaker_collectors):
+        collector = collectors.get(id(REGISTRY))
+        if collector is not None:
+            registry.register(WorkerCollector(collector))
+    return registry
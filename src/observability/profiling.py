@@ -0,0 +1,323 @@
+"""
+Opt-in sampling profiler and per-phase request timers (stdlib only).
+
+StackSampler is a background thread that snapshots every thread's Python
+stack with sys._current_frames() at a low fixed rate and aggregates the
+stacks into collapsed-stack lines (`frame;frame;frame count`), the input
+format of flamegraph.pl, speedscope and inferno.
+
+A profiling session runs for a bounded number of seconds. Either every
+request is profiled, or only 1 in K. In 1-in-K mode the sampler only takes
+samples while a selected request is in flight. Async requests share the
+event loop thread, so concurrent requests can appear in those samples too.
+
+Phase timers attribute each profiled request's wall time to `fingerprint`,
+`store_get`, `handler`, `serialization`, `store_set` and the remaining
+`middleware` time. Outside a session, phase() costs one ContextVar lookup.
+"""
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+import itertools
+import os
+import sys
+import threading
+import time
+
+
+# Hard cap on a session so a forgotten toggle cannot profile forever
+MAX_SESSION_SECONDS = 300
+
+DEFAULT_INTERVAL_SECONDS = 0.01
+
+# Leaf frames of parked threads (event loop select, pool workers, exporters);
+# stacks ending in one of these are idle, not hot-path time
+IDLE_LEAVES = frozenset({
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+})
+
+PHASES = ("middleware", "fingerprint", "store_get", "handler", "serialization", "store_set")
+
+_NULL_PHASE = nullcontext()
+
+# Per-request phase accumulator; None outside profiled requests
+_request_phases: ContextVar[Optional[Dict[str, float]]] = ContextVar("fcn_profile_phases", default=None)
+
+
+class ProfilingBusyError(RuntimeError):
+    """Raised when a session is started while another is running."""
+
+
+@dataclass
+class PhaseStats:
+    """
+    Aggregated timings of one phase.
+    """
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return stats in milliseconds."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+@dataclass
+class ProfileSession:
+    """
+    State of one profiling session.
+    """
+    seconds: float
+    one_in: Optional[int]
+    interval_seconds: float
+    started_at: float
+    deadline: float
+    stacks: Counter = field(default_factory=Counter)
+    phases: Dict[str, PhaseStats] = field(default_factory=lambda: {name: PhaseStats() for name in PHASES})
+    samples: int = 0
+    requests: int = 0
+
+    def as_dict(self, now: float) -> Dict[str, Any]:
+        """Return session summary."""
+        return {
+            "seconds": self.seconds,
+            "one_in": self.one_in,
+            "interval_ms": self.interval_seconds * 1000,
+            "elapsed_seconds": round(min(now, self.deadline) - self.started_at, 3),
+            "running": now < self.deadline,
+            "samples": self.samples,
+            "profiled_requests": self.requests,
+            "distinct_stacks": len(self.stacks),
+        }
+
+
+class StackSampler:
+    """
+    Low-frequency whole-process stack sampler with request-phase timers.
+    """
+
+    def __init__(self, max_depth: int = 64, clock=time.monotonic):
+        """
+        Initialize sampler.
+
+        Args:
+            max_depth: Frames kept per stack (innermost frames are kept)
+            clock: Monotonic clock
+        """
+        self.max_depth = max_depth
+        self.clock = clock
+        self.session: Optional[ProfileSession] = None
+
+        self._counter = itertools.count()
+        self._in_flight = 0
+        self._labels: Dict[Any, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        """True while a session is collecting."""
+        session = self.session
+        return session is not None and self.clock() < session.deadline
+
+    def start(
+        self,
+        seconds: float,
+        one_in: Optional[int] = None,
+        interval_seconds: float = DEFAULT_INTERVAL_SECONDS,
+    ) -> ProfileSession:
+        """
+        Start a profiling session, discarding the previous session's data.
+
+        Args:
+            seconds: Session length (capped at MAX_SESSION_SECONDS)
+            one_in: Profile only every K-th request (None: whole process)
+            interval_seconds: Sampling interval
+
+        Returns:
+            The new ProfileSession
+
+        Raises:
+            ProfilingBusyError: If a session is already running
+        """
+        with self._lock:
+            if self.active:
+                raise ProfilingBusyError("A profiling session is already running")
+            self._join()
+
+            now = self.clock()
+            seconds = min(float(seconds), MAX_SESSION_SECONDS)
+            self.session = ProfileSession(
+                seconds=seconds,
+                one_in=one_in,
+                interval_seconds=interval_seconds,
+                started_at=now,
+                deadline=now + seconds,
+            )
+            self._counter = itertools.count()
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, args=(self.session,), name="fcn-profiler", daemon=True,
+            )
+            self._thread.start()
+            return self.session
+
+    def stop(self) -> Optional[ProfileSession]:
+        """End the current session early; its data stays downloadable."""
+        with self._lock:
+            session = self.session
+            if session is not None and self.clock() < session.deadline:
+                session.deadline = self.clock()
+            self._join()
+            return session
+
+    def _join(self) -> None:
+        """Stop and join the sampler thread."""
+        self._stop.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _run(self, session: ProfileSession) -> None:
+        """Sampler loop."""
+        own = threading.get_ident()
+        while not self._stop.wait(session.interval_seconds):
+            if self.clock() >= session.deadline:
+                break
+            if session.one_in is not None and self._in_flight == 0:
+                continue
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own or _is_idle(frame):
+                    continue
+                session.stacks[self._collapse(frame)] += 1
+            session.samples += 1
+
+    def _collapse(self, frame) -> str:
+        """Render a frame chain root-first as a collapsed-stack key."""
+        labels = []
+        while frame is not None and len(labels) < self.max_depth:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                label = self._labels[code] = f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+            labels.append(label)
+            frame = frame.f_back
+        labels.reverse()
+        return ";".join(labels)
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """
+        Scope one request; profiles it if a session is active and it is selected.
+        """
+        session = self.session
+        if session is None or self.clock() >= session.deadline:
+            yield
+            return
+        if session.one_in is not None and next(self._counter) % session.one_in:
+            yield
+            return
+
+        phases: Dict[str, float] = {}
+        token = _request_phases.set(phases)
+        self._in_flight += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            total = time.perf_counter() - start
+            self._in_flight -= 1
+            _request_phases.reset(token)
+            session.requests += 1
+            for name, seconds in phases.items():
+                session.phases[name].record(seconds)
+            session.phases["middleware"].record(max(total - sum(phases.values()), 0.0))
+
+    def collapsed(self) -> str:
+        """Return the current session's stacks in collapsed-stack format."""
+        session = self.session
+        if session is None:
+            return ""
+        # dict.copy is a single C call, so the sampler thread cannot mutate mid-copy
+        stacks = dict.copy(session.stacks)
+        return "".join(
+            f"{stack} {count}\n"
+            for stack, count in sorted(stacks.items(), key=lambda item: item[1], reverse=True)
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return session summary and phase timers."""
+        session = self.session
+        if session is None:
+            return {"session": None, "phases": {}}
+        return {
+            "session": session.as_dict(self.clock()),
+            "phases": {name: stats.as_dict() for name, stats in session.phases.items()},
+        }
+
+
+def _is_idle(frame) -> bool:
+    """Return True if the innermost frame is a known parking point."""
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_LEAVES
+
+
+def phase(name: str):
+    """
+    Time a request phase when the current request is being profiled.
+
+    Usage:
+        with phase("store_get"):
+            record = await store.get(key)
+    """
+    phases = _request_phases.get()
+    if phases is None:
+        return _NULL_PHASE
+    return _timed(phases, name)
+
+
+@contextmanager
+def _timed(phases: Dict[str, float], name: str) -> Iterator[None]:
+    """Accumulate elapsed time for a phase."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+
+_REPO_ROOT = str(Path(__file__).resolve().parents[2]) + os.sep
+_PREFIXES = tuple(sorted({p + os.sep for p in sys.path if p}, key=len, reverse=True))
+
+
+def _short_path(filename: str) -> str:
+    """Strip the repository or sys.path prefix from a source filename."""
+    if filename.startswith(_REPO_ROOT):
+        return filename[len(_REPO_ROOT):]
+    for prefix in _PREFIXES:
+        if filename.startswith(prefix):
+            return filename[len(prefix):]
+    return filename
+
+
+# Process-wide sampler used by the API
+profiler = StackSampler()
@@ -0,0 +1,112 @@
+"""
+Saturation signals for admission control.
+
+Two signals show that more work would only queue:
+
+- Pool wait: how long checkouts wait for a database connection, recorded by
+  TimedQueuePool (src.infra.db.base) into POOL_WAIT.
+- Event-loop lag: how late a periodic timer fires, measured by
+  LoopLagMonitor. It grows when the loop has more ready work than it can run.
+
+Both are read as a standing delay (StandingDelay): the smallest sample of
+the last window, as in CoDel. A burst or a single slow checkout does not
+raise it; only a delay every sample in a window saw, i.e. a queue that is
+not draining, does. It falls back to zero one window after the pressure,
+and its samples, stop.
+"""
+from time import monotonic
+from typing import Optional
+import asyncio
+import contextlib
+
+from src.observability.metrics import DB_POOL_WAIT, EVENT_LOOP_LAG
+
+
+class StandingDelay:
+    """
+    Smallest sample of the last complete window.
+
+    Updated from request threads without a lock: a racing update may lose
+    one sample, which only delays the signal by a sample.
+    """
+    __slots__ = ("window", "_start", "_current", "_previous")
+
+    def __init__(self, window_seconds: float = 0.5):
+        """
+        Initialize standing delay.
+
+        Args:
+            window_seconds: Window length; the value reflects the samples of
+                the window that ended most recently
+        """
+        self.window = window_seconds
+        self._start = monotonic()
+        self._current: Optional[float] = None
+        self._previous: Optional[float] = None
+
+    def _roll(self, now: float) -> None:
+        elapsed = now - self._start
+        if elapsed >= self.window:
+            self._previous = self._current if elapsed < 2 * self.window else None
+            self._current = None
+            self._start = now
+
+    def record(self, value: float) -> None:
+        """Add a sample."""
+        self._roll(monotonic())
+        if self._current is None or value < self._current:
+            self._current = value
+
+    def value(self) -> float:
+        """Return the last window's smallest sample (0.0 if it had none)."""
+        self._roll(monotonic())
+        return self._previous or 0.0
+
+
+# Process-wide standing pool checkout wait (seconds)
+POOL_WAIT = StandingDelay()
+
+
+def record_pool_wait(seconds: float) -> None:
+    """Record one connection checkout's wait."""
+    POOL_WAIT.record(seconds)
+    DB_POOL_WAIT.observe(seconds)
+
+
+class LoopLagMonitor:
+    """
+    Measures event-loop lag with a periodic timer task.
+    """
+
+    def __init__(self, interval_seconds: float = 0.05):
+        """
+        Initialize loop lag monitor.
+
+        Args:
+            interval_seconds: Timer period
+        """
+        self.interval = interval_seconds
+        self.lag = StandingDelay()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - expected)
+            self.lag.record(lag)
+            EVENT_LOOP_LAG.observe(lag)
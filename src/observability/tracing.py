@@ -0,0 +1,310 @@
+"""
+OpenTelemetry tracing for the FCN API (ADR-006 §10).
+
+Every request is recorded (ALWAYS_ON sampler) so the decision to export can
+be made once the root span has finished and its latency is known.
+TailSamplingSpanProcessor buffers a trace's spans until its local root ends
+and forwards the whole trace to the export processor only when it is:
+
+- an error (root status ERROR),
+- slower than the adaptive threshold (the running `quantile` of recent root
+  latencies) or the fixed `slow_threshold_seconds`, or
+- picked by the `base_ratio` probabilistic baseline.
+
+Recording spans is cheap; serializing and shipping them is not, so tail
+latency stays fully visible while steady-state export volume is roughly
+(1 - quantile) + base_ratio of traffic.
+
+Exporter modes (OTEL_TRACES_EXPORTER): otlp (default), console, memory
+(InMemorySpanExporter with synchronous export, for tests) and none (no
+provider; spans stay no-ops).
+
+Each app gets its own provider; nothing is installed process-wide. The
+request middleware, idempotency store, repositories, validation service and
+SQLAlchemy engine take their tracer from the app's TracingSetup, so a second
+create_app() in the same process records spans on its own provider.
+"""
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List, Optional
+import logging
+import os
+import random
+import threading
+
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+)
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import ALWAYS_ON
+from opentelemetry.trace import StatusCode
+
+
+logger = logging.getLogger(__name__)
+
+# ADR-006 §10 span names
+SPAN_VALIDATION = "validation.run"
+SPAN_REPOSITORY_QUERY = "repository.query"
+
+SERVICE_NAME = "fcn-api"
+
+# Endpoints never traced (scrapes and probes)
+EXCLUDED_URLS = "/metrics,/health,/internal/"
+
+
+def get_tracer(name: str = SERVICE_NAME, tracer_provider: Optional[trace.TracerProvider] = None) -> trace.Tracer:
+    """
+    Return a tracer from a provider, by default the global one.
+
+    configure_tracing never installs a global provider, so the default is
+    a no-op proxy: components built without an app's tracer create spans
+    unconditionally and record nothing.
+    """
+    return trace.get_tracer(name, tracer_provider=tracer_provider)
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    Latency-aware tail sampler in front of an export processor.
+    """
+
+    def __init__(
+        self,
+        delegate: SpanProcessor,
+        base_ratio: float = 0.01,
+        quantile: float = 0.99,
+        slow_threshold_seconds: float = 0.5,
+        window: int = 1024,
+        max_pending_traces: int = 4096,
+        rand: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize tail sampling processor.
+
+        Args:
+            delegate: Processor receiving kept spans (usually BatchSpanProcessor)
+            base_ratio: Probability of keeping an unremarkable trace
+            quantile: Root latency quantile above which traces are kept
+            slow_threshold_seconds: Root latency always kept (ADR-006 §12
+                P95 target), regardless of the adaptive threshold
+            window: Number of recent root latencies the quantile is taken over
+            max_pending_traces: Bound on traces buffered awaiting their root;
+                the oldest is dropped first
+            rand: Uniform [0, 1) source (injectable for tests)
+        """
+        self.delegate = delegate
+        self.base_ratio = base_ratio
+        self.quantile = quantile
+        self.slow_threshold_seconds = slow_threshold_seconds
+        self.max_pending_traces = max_pending_traces
+        self.rand = rand
+
+        self.kept = 0
+        self.dropped = 0
+
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._recompute_every = max(1, window // 8)
+        self._since_recompute = 0
+        self._threshold = slow_threshold_seconds
+        self._pending: "OrderedDict[int, List[ReadableSpan]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def threshold_seconds(self) -> float:
+        """Current adaptive latency threshold."""
+        return self._threshold
+
+    def on_start(self, span, parent_context=None) -> None:
+        pass
+
+    def on_end(self, span: ReadableSpan) -> None:
+        trace_id = span.context.trace_id
+        parent = span.parent
+
+        if parent is not None and not parent.is_remote:
+            with self._lock:
+                spans = self._pending.get(trace_id)
+                if spans is None:
+                    spans = self._pending[trace_id] = []
+                    if len(self._pending) > self.max_pending_traces:
+                        self._pending.popitem(last=False)
+                spans.append(span)
+            return
+
+        duration = (span.end_time - span.start_time) / 1e9
+        with self._lock:
+            spans = self._pending.pop(trace_id, [])
+            keep = (
+                span.status.status_code is StatusCode.ERROR
+                or duration >= self._threshold
+                or duration >= self.slow_threshold_seconds
+                or self.rand() < self.base_ratio
+            )
+            self._observe(duration)
+            if keep:
+                self.kept += 1
+            else:
+                self.dropped += 1
+
+        if keep:
+            for child in spans:
+                self.delegate.on_end(child)
+            self.delegate.on_end(span)
+
+    def _observe(self, duration: float) -> None:
+        """Record a root latency and periodically recompute the threshold."""
+        self._latencies.append(duration)
+        self._since_recompute += 1
+        if self._since_recompute < self._recompute_every:
+            return
+        self._since_recompute = 0
+        ordered = sorted(self._latencies)
+        self._threshold = ordered[int(self.quantile * (len(ordered) - 1))]
+
+    def shutdown(self) -> None:
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
+
+
+@dataclass
+class TracingSetup:
+    """
+    Handles returned by configure_tracing.
+    """
+    provider: Optional[TracerProvider]
+    sampler: Optional[TailSamplingSpanProcessor]
+    exporter: Optional[SpanExporter]
+
+    def __post_init__(self):
+        self._tracers: Dict[str, trace.Tracer] = {}
+
+    def get_tracer(self, name: str = SERVICE_NAME) -> trace.Tracer:
+        """Return this setup's tracer for a component (a no-op tracer without a provider)."""
+        tracer = self._tracers.get(name)
+        if tracer is None:
+            tracer = self._tracers[name] = (
+                self.provider.get_tracer(name) if self.provider is not None else trace.NoOpTracer()
+            )
+        return tracer
+
+
+def build_exporter(mode: str) -> Optional[SpanExporter]:
+    """
+    Build a span exporter for an OTEL_TRACES_EXPORTER mode.
+
+    Args:
+        mode: otlp, console, memory or none
+
+    Returns:
+        SpanExporter, or None for mode "none"
+    """
+    if mode == "otlp":
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter()
+    if mode == "console":
+        return ConsoleSpanExporter()
+    if mode == "memory":
+        return InMemorySpanExporter()
+    if mode == "none":
+        return None
+    raise ValueError(f"Unknown OTEL_TRACES_EXPORTER mode '{mode}'")
+
+
+def configure_tracing(
+    app=None,
+    engine=None,
+    mode: Optional[str] = None,
+    base_ratio: Optional[float] = None,
+    slow_threshold_seconds: Optional[float] = None,
+) -> TracingSetup:
+    """
+    Build a tracer provider and instrument FastAPI and SQLAlchemy with it.
+
+    Args:
+        app: FastAPI application to instrument (TracingMiddleware root span
+            per request)
+        engine: SQLAlchemy engine to instrument (span per statement)
+        mode: Exporter mode (default: OTEL_TRACES_EXPORTER or "otlp")
+        base_ratio: Baseline keep probability (default: TRACE_BASE_RATIO, or
+            0.01; 1.0 in memory mode)
+        slow_threshold_seconds: Always-kept root latency
+            (default: TRACE_SLOW_THRESHOLD_MS or 500 ms)
+
+    Returns:
+        TracingSetup with the provider, tail sampler and exporter (all None
+        for mode "none")
+    """
+    mode = mode or os.getenv("OTEL_TRACES_EXPORTER", "otlp")
+    if base_ratio is None:
+        # Tests asserting on spans need every trace, not a 1% sample
+        default_ratio = "1.0" if mode == "memory" else "0.01"
+        base_ratio = float(os.getenv("TRACE_BASE_RATIO", default_ratio))
+    if slow_threshold_seconds is None:
+        slow_threshold_seconds = float(os.getenv("TRACE_SLOW_THRESHOLD_MS", "500")) / 1000
+
+    exporter = build_exporter(mode)
+    if exporter is None:
+        return TracingSetup(provider=None, sampler=None, exporter=None)
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME}),
+        sampler=ALWAYS_ON,
+    )
+
+    if mode == "memory":
+        # Synchronous export so tests can assert on spans as soon as a request returns
+        delegate = SimpleSpanProcessor(exporter)
+    else:
+        delegate = BatchSpanProcessor(exporter)
+
+    sampler = TailSamplingSpanProcessor(
+        delegate,
+        base_ratio=base_ratio,
+        slow_threshold_seconds=slow_threshold_seconds,
+    )
+    provider.add_span_processor(sampler)
+
+    setup = TracingSetup(provider=provider, sampler=sampler, exporter=exporter)
+    if app is not None:
+        from src.app.middleware.tracing import TracingMiddleware
+        app.add_middleware(TracingMiddleware, tracer=setup.get_tracer("src.app.middleware.tracing"))
+    if engine is not None:
+        instrument_engine(setup, engine)
+
+    logger.info("Tracing configured (exporter=%s, base_ratio=%s)", mode, base_ratio)
+    return setup
+
+
+def instrument_engine(setup: TracingSetup, engine) -> None:
+    """
+    Emit a span per SQL statement on an engine.
+
+    Called from the app's lifespan hook once the engine exists; a no-op when
+    tracing is disabled. Attaches an EngineTracer to this engine only:
+    SQLAlchemyInstrumentor is a process-wide one-shot that ignores every
+    call after the first (and patches create_engine globally). The
+    listeners go away with the engine when the lifespan disposes it.
+
+    Args:
+        setup: Result of configure_tracing()
+        engine: SQLAlchemy engine
+    """
+    if setup.provider is None:
+        return
+    from opentelemetry.instrumentation.sqlalchemy.engine import EngineTracer
+    from opentelemetry.metrics import get_meter
+
+    connections_usage = get_meter(__name__).create_up_down_counter(
+        name="db.client.connections.usage",
+        unit="connections",
+        description="Connections currently in the state given by the state attribute",
+    )
+    EngineTracer(setup.get_tracer("opentelemetry.instrumentation.sqlalchemy"), engine, connections_usage)
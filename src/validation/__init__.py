@@ -0,0 +1 @@
+# Validation layer (schema + cross-field rule registry)
@@ -0,0 +1,225 @@
+"""
+Parameter bounds from the seeded parameter_definitions table.
+
+`ParameterDefinition` is the immutable runtime form of one
+parameter_definitions row (min/max, enum domain, pattern). The bounds check
+runs against a per-version mapping of definitions, so each field costs one
+dictionary lookup and no schema file is touched on the request path.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Tuple
+import re
+
+from src.validation.rules import Violation, version_key
+
+
+DefinitionKey = Tuple[str, str, str]
+
+
+@dataclass(frozen=True)
+class ParameterDefinition:
+    """
+    Validation bounds for one parameter of one product spec version.
+    """
+    product_type: str
+    spec_version: str
+    name: str
+    data_type: str
+    required: bool = False
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    exclusive_min: bool = False
+    exclusive_max: bool = False
+    enum_domain: Optional[FrozenSet[Optional[str]]] = None
+    pattern: Optional[Pattern] = None
+
+    @property
+    def key(self) -> DefinitionKey:
+        """Return the (product_type, spec_version, name) index key."""
+        return (self.product_type, self.spec_version, self.name)
+
+    def check(self, value: Any) -> List[Violation]:
+        """
+        Check a single value against this definition's bounds.
+
+        Args:
+            value: Payload value for the parameter
+
+        Returns:
+            List of violations (empty if the value is within bounds)
+        """
+        path = f"$.{self.name}"
+
+        if self.enum_domain is not None:
+            token = value if value is None or isinstance(value, str) else str(value)
+            if token not in self.enum_domain:
+                allowed = ", ".join(sorted(str(v) for v in self.enum_domain))
+                return [self._violation(path, "enum", f"{self.name} must be one of: {allowed}")]
+
+        if self.pattern is not None and isinstance(value, str):
+            if self.pattern.search(value) is None:
+                return [self._violation(path, "pattern", f"{self.name} must match {self.pattern.pattern}")]
+
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return []
+
+        if self.min_value is not None:
+            if value < self.min_value or (self.exclusive_min and value == self.min_value):
+                op = ">" if self.exclusive_min else ">="
+                return [self._violation(path, "minimum", f"{self.name} must be {op} {self.min_value}")]
+
+        if self.max_value is not None:
+            if value > self.max_value or (self.exclusive_max and value == self.max_value):
+                op = "<" if self.exclusive_max else "<="
+                return [self._violation(path, "maximum", f"{self.name} must be {op} {self.max_value}")]
+
+        return []
+
+    def _violation(self, path: str, constraint: str, message: str) -> Violation:
+        return Violation(
+            rule_id="parameter_definitions",
+            path=path,
+            constraint=constraint,
+            message=message,
+        )
+
+
+def _exclusive(constraints: Optional[str], keyword: str) -> bool:
+    """
+    Return True if a seeded constraints string marks a bound exclusive.
+
+    The seeder records both draft-04 (`exclusiveMinimum: True`) and draft-07
+    (`exclusiveMinimum: 0`) forms; only an explicit `False` is inclusive.
+    """
+    if not constraints:
+        return False
+    for part in constraints.split(";"):
+        label, _, flag = part.strip().partition(":")
+        if label.strip() == keyword:
+            return flag.strip() != "False"
+    return False
+
+
+def definition_from_row(row: Mapping[str, Any]) -> ParameterDefinition:
+    """
+    Build a ParameterDefinition from a parameter_definitions row.
+
+    Args:
+        row: Mapping with the parameter_definitions column names
+
+    Returns:
+        ParameterDefinition
+    """
+    enum_domain = None
+    if row.get("enum_domain"):
+        # Seeder stores enums pipe-separated, with a JSON null rendered as 'None'
+        enum_domain = frozenset(
+            None if token == "None" else token
+            for token in str(row["enum_domain"]).split("|")
+        )
+
+    pattern = re.compile(row["pattern"]) if row.get("pattern") else None
+    min_value = row.get("min_value")
+    max_value = row.get("max_value")
+
+    return ParameterDefinition(
+        product_type=row.get("product_type") or "fcn",
+        spec_version=row.get("spec_version") or "1.0.0",
+        name=row["name"],
+        data_type=row.get("data_type") or "string",
+        required=bool(row.get("required_flag")),
+        min_value=float(min_value) if min_value is not None else None,
+        max_value=float(max_value) if max_value is not None else None,
+        exclusive_min=_exclusive(row.get("constraints"), "exclusiveMinimum"),
+        exclusive_max=_exclusive(row.get("constraints"), "exclusiveMaximum"),
+        enum_domain=enum_domain,
+        pattern=pattern,
+    )
+
+
+class ParameterIndex:
+    """
+    Immutable index of parameter definitions.
+
+    Keyed by (product_type, spec_version, name); per-version mappings are
+    also reachable by major.minor so a payload at '1.1.3' resolves the
+    latest seeded '1.1.x' definitions. Instances are never mutated: a reload
+    builds a new index and swaps the reference.
+    """
+
+    def __init__(self, definitions: Iterable[ParameterDefinition] = ()):
+        """
+        Initialize parameter index.
+
+        Args:
+            definitions: Parameter definitions to index
+        """
+        by_key: Dict[DefinitionKey, ParameterDefinition] = {}
+        by_version: Dict[Tuple[str, str], Dict[str, ParameterDefinition]] = {}
+        for definition in definitions:
+            by_key[definition.key] = definition
+            by_version.setdefault((definition.product_type, definition.spec_version), {})[definition.name] = definition
+
+        versions: Dict[Tuple[str, str], Mapping[str, ParameterDefinition]] = {
+            key: MappingProxyType(names) for key, names in by_version.items()
+        }
+        # Register major.minor aliases in ascending version order so the
+        # latest patch release wins
+        for product_type, spec_version in sorted(by_version, key=lambda k: (k[0], _version_tuple(k[1]))):
+            minor = version_key(spec_version)
+            if (product_type, minor) not in by_version:
+                versions[(product_type, minor)] = versions[(product_type, spec_version)]
+
+        self._by_key = MappingProxyType(by_key)
+        self._by_version = MappingProxyType(versions)
+
+    def get(self, product_type: str, spec_version: str, name: str) -> Optional[ParameterDefinition]:
+        """Return the definition for an exact (product_type, spec_version, name)."""
+        return self._by_key.get((product_type, spec_version, name))
+
+    def for_version(self, product_type: str, spec_version: Optional[str]) -> Mapping[str, ParameterDefinition]:
+        """
+        Return the read-only name -> definition mapping for a spec version.
+
+        Falls back to the major.minor alias; returns an empty mapping when
+        nothing is seeded for the version.
+        """
+        if not spec_version:
+            return _EMPTY
+        definitions = self._by_version.get((product_type, spec_version))
+        if definitions is None:
+            definitions = self._by_version.get((product_type, version_key(spec_version)), _EMPTY)
+        return definitions
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+
+_EMPTY: Mapping[str, ParameterDefinition] = MappingProxyType({})
+
+
+def _version_tuple(spec_version: str) -> Tuple:
+    """Sort key for dotted versions ('1.10.0' after '1.9.0')."""
+    return tuple(int(part) if part.isdigit() else part for part in spec_version.split("."))
+
+
+def check_bounds(payload: Dict[str, Any], definitions: Mapping[str, ParameterDefinition]) -> List[Violation]:
+    """
+    Check every payload field that has a seeded definition.
+
+    Args:
+        payload: Parameter dictionary
+        definitions: Name -> definition mapping for the payload's version
+
+    Returns:
+        List of violations
+    """
+    violations: List[Violation] = []
+    if not definitions:
+        return violations
+    for name, value in payload.items():
+        definition = definitions.get(name)
+        if definition is not None:
+            violations.extend(definition.check(value))
+    return violations
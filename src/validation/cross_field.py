@@ -0,0 +1,194 @@
+"""
+Cross-field business rules (BR-001, BR-003, BR-014, BR-015, BR-024).
+
+Array rules parse each date list once and check ordering with a single
+pairwise pass (`map(operator.lt, seq, seq[1:])`), only falling back to an
+index scan to locate offenders when the fast check fails.
+"""
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence
+import operator
+
+from src.validation.rules import ValidationRule, Violation
+
+
+@lru_cache(maxsize=8192)
+def parse_date(value: str) -> date:
+    """Parse an ISO-8601 date (memoized; schedules repeat across payloads)."""
+    return date.fromisoformat(value)
+
+
+def _number(value: Any) -> Optional[float]:
+    """Return value as float if it is a real number (bool excluded)."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def _dates(values: Any) -> Optional[List[date]]:
+    """Parse a list of ISO dates; None if absent or malformed."""
+    if not isinstance(values, list):
+        return None
+    try:
+        return [parse_date(v) for v in values]
+    except (TypeError, ValueError):
+        return None
+
+
+class TradeDateOrderingRule(ValidationRule):
+    """BR-001: trade_date <= issue_date < maturity_date."""
+    id = "BR-001"
+
+    def evaluate(self, entity: Dict[str, Any]) -> List[Violation]:
+        try:
+            trade = parse_date(entity["trade_date"])
+            issue = parse_date(entity["issue_date"])
+            maturity = parse_date(entity["maturity_date"])
+        except (KeyError, TypeError, ValueError):
+            return []  # presence/format is the schema's job
+
+        violations = []
+        if trade > issue:
+            violations.append(self.violation(
+                "$.issue_date", "date_ordering",
+                f"trade_date ({trade}) must be on or before issue_date ({issue})",
+            ))
+        if issue >= maturity:
+            violations.append(self.violation(
+                "$.maturity_date", "date_ordering",
+                f"issue_date ({issue}) must be before maturity_date ({maturity})",
+            ))
+        return violations
+
+
+class KnockInBarrierRule(ValidationRule):
+    """
+    BR-003: 0 < knock_in_barrier_pct < 1.
+
+    For legacy payloads without put_strike_pct the barrier must also sit
+    below redemption_barrier_pct. Strike ordering for v1.1+ is BR-024.
+    """
+    id = "BR-003"
+
+    def evaluate(self, entity: Dict[str, Any]) -> List[Violation]:
+        ki = _number(entity.get("knock_in_barrier_pct"))
+        if ki is None:
+            return []
+
+        violations = []
+        if not 0 < ki < 1:
+            violations.append(self.violation(
+                "$.knock_in_barrier_pct", "INVALID_STRIKE_ORDER",
+                f"knock_in_barrier_pct ({ki}) must be strictly between 0 and 1",
+            ))
+
+        redemption = _number(entity.get("redemption_barrier_pct"))
+        if entity.get("put_strike_pct") is None and redemption is not None and ki >= redemption:
+            violations.append(self.violation(
+                "$.knock_in_barrier_pct", "INVALID_STRIKE_ORDER",
+                f"knock_in_barrier_pct ({ki}) must be below redemption_barrier_pct ({redemption})",
+            ))
+        return violations
+
+
+class ObservationScheduleRule(ValidationRule):
+    """BR-014: observation_dates strictly increasing and before maturity_date."""
+    id = "BR-014"
+
+    def evaluate(self, entity: Dict[str, Any]) -> List[Violation]:
+        raw = entity.get("observation_dates")
+        observations = _dates(raw)
+        if observations is None:
+            if isinstance(raw, list):
+                return [self.violation(
+                    "$.observation_dates", "date_format",
+                    "observation_dates must contain ISO-8601 dates",
+                )]
+            return []
+
+        violations = []
+        if not all(map(operator.lt, observations, observations[1:])):
+            violations.extend(
+                self.violation(
+                    f"$.observation_dates[{i + 1}]", "strictly_increasing",
+                    f"observation_dates must be strictly increasing: {raw[i]} >= {raw[i + 1]}",
+                )
+                for i in _non_increasing_indices(observations)
+            )
+
+        try:
+            maturity = parse_date(entity["maturity_date"])
+        except (KeyError, TypeError, ValueError):
+            return violations
+
+        # Sorted schedule: only the tail can reach maturity
+        if observations and max(observations) >= maturity:
+            violations.extend(
+                self.violation(
+                    f"$.observation_dates[{i}]", "before_maturity",
+                    f"observation_dates[{i}] ({raw[i]}) must be before maturity_date ({maturity})",
+                )
+                for i, obs in enumerate(observations) if obs >= maturity
+            )
+        return violations
+
+
+class UnderlyingArityRule(ValidationRule):
+    """BR-015: len(underlying_symbols) == len(initial_levels)."""
+    id = "BR-015"
+
+    def applies(self, entity: Dict[str, Any]) -> bool:
+        return "underlying_symbols" in entity or "initial_levels" in entity
+
+    def evaluate(self, entity: Dict[str, Any]) -> List[Violation]:
+        symbols = entity.get("underlying_symbols") or []
+        levels = entity.get("initial_levels") or []
+        if len(symbols) != len(levels):
+            return [self.violation(
+                "$.initial_levels", "array_length_match",
+                f"Length of initial_levels ({len(levels)}) must equal length of underlying_symbols ({len(symbols)})",
+            )]
+        return []
+
+
+class PutStrikeRule(ValidationRule):
+    """BR-024: 0 < put_strike_pct <= 1.0 and knock_in_barrier_pct < put_strike_pct."""
+    id = "BR-024"
+
+    def applies(self, entity: Dict[str, Any]) -> bool:
+        return entity.get("put_strike_pct") is not None
+
+    def evaluate(self, entity: Dict[str, Any]) -> List[Violation]:
+        strike = _number(entity.get("put_strike_pct"))
+        if strike is None:
+            return []
+
+        violations = []
+        if not 0 < strike <= 1.0:
+            violations.append(self.violation(
+                "$.put_strike_pct", "INVALID_STRIKE_ORDER",
+                f"put_strike_pct ({strike}) must be in (0, 1.0]",
+            ))
+
+        ki = _number(entity.get("knock_in_barrier_pct"))
+        if ki is not None and ki >= strike:
+            violations.append(self.violation(
+                "$.put_strike_pct", "INVALID_STRIKE_ORDER",
+                f"knock_in_barrier_pct ({ki}) must be below put_strike_pct ({strike})",
+            ))
+        return violations
+
+
+def _non_increasing_indices(values: Sequence[date]) -> List[int]:
+    """Return indices i where values[i] >= values[i + 1]."""
+    return [i for i, ok in enumerate(map(operator.lt, values, values[1:])) if not ok]
+
+
+CROSS_FIELD_RULES = (
+    TradeDateOrderingRule,
+    KnockInBarrierRule,
+    ObservationScheduleRule,
+    UnderlyingArityRule,
+    PutStrikeRule,
+)
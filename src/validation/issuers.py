@@ -0,0 +1,59 @@
+"""
+Approved issuer whitelist (BR-022).
+
+Read once from data/issuer_whitelist.json, the file the Phase 2 parameter
+validator checks against, and held as a frozenset of issuer ids.
+"""
+from pathlib import Path
+from typing import FrozenSet, List, Optional
+import json
+import os
+
+from src.validation.rules import Violation
+
+
+ISSUER_WHITELIST_PATH = Path(os.getenv(
+    "FCN_ISSUER_WHITELIST",
+    Path(__file__).resolve().parents[2] / "docs/business/ba/products/structured-notes/fcn/data/issuer_whitelist.json",
+))
+
+
+class IssuerWhitelist:
+    """
+    Issuer ids approved for booking.
+    """
+
+    def __init__(self, path: Path = ISSUER_WHITELIST_PATH):
+        """
+        Initialize whitelist.
+
+        Args:
+            path: JSON array of issuer records with an `id` each
+        """
+        self.path = Path(path)
+        self._ids: Optional[FrozenSet[str]] = None
+
+    def load(self) -> FrozenSet[str]:
+        """Read the whitelist file (once) and return the approved ids."""
+        if self._ids is None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, list):
+                raise ValueError(f"{self.path.name}: expected a JSON array of issuers")
+            self._ids = frozenset(entry["id"] for entry in data if isinstance(entry, dict) and "id" in entry)
+        return self._ids
+
+    def __contains__(self, issuer: object) -> bool:
+        return issuer in self.load()
+
+    def check(self, payload: dict) -> List[Violation]:
+        """Return the BR-022 violation for a payload whose issuer is not approved."""
+        issuer = payload.get("issuer")
+        if issuer is None or issuer in self:
+            return []  # presence is the schema's job
+        return [Violation(
+            rule_id="BR-022",
+            path="$.issuer",
+            constraint="ISSUER_NOT_WHITELISTED",
+            message=f"Issuer '{issuer}' is not in the approved issuer whitelist",
+        )]
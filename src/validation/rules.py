@@ -0,0 +1,165 @@
+"""
+Validation rule registry.
+
+Implements the ADR-006 §9 `ValidationRule` interface. Rules are registered
+once at start-up and filtered per spec_version, so the per-request cost is a
+dictionary lookup plus the rule bodies themselves.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+
+
+Severity = Literal["error", "warn"]
+
+
+@dataclass(frozen=True)
+class Violation:
+    """
+    Single validation finding, rendered into the ADR-006 error envelope.
+    """
+    rule_id: str
+    path: str
+    constraint: str
+    message: str
+    severity: Severity = "error"
+
+    def as_dict(self) -> Dict[str, str]:
+        """Return the error envelope representation."""
+        return {
+            "rule_id": self.rule_id,
+            "path": self.path,
+            "constraint": self.constraint,
+            "message": self.message,
+            "severity": self.severity,
+        }
+
+
+@dataclass
+class ValidationResult:
+    """
+    Outcome of validating one payload.
+    """
+    spec_version: Optional[str]
+    violations: List[Violation] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[Violation]:
+        """Return violations with error severity."""
+        return [v for v in self.violations if v.severity == "error"]
+
+    @property
+    def valid(self) -> bool:
+        """Return True if no error-severity violations were found."""
+        return not any(v.severity == "error" for v in self.violations)
+
+
+class ValidationRule:
+    """
+    Base class for validation rules.
+
+    Subclasses set `id`, `severity` and optionally `spec_versions`
+    (major.minor prefixes the rule applies to; empty means all versions),
+    and implement `evaluate`.
+    """
+    id: str = ""
+    severity: Severity = "error"
+    spec_versions: Tuple[str, ...] = ()
+
+    def applies(self, entity: Dict[str, Any]) -> bool:
+        """Return True if the rule should run for this entity."""
+        return True
+
+    def evaluate(self, entity: Dict[str, Any]) -> List[Violation]:
+        """Evaluate the rule and return any violations."""
+        raise NotImplementedError
+
+    def violation(self, path: str, constraint: str, message: str) -> Violation:
+        """Build a violation carrying this rule's id and severity."""
+        return Violation(
+            rule_id=self.id,
+            path=path,
+            constraint=constraint,
+            message=message,
+            severity=self.severity,
+        )
+
+
+def version_key(spec_version: Optional[str]) -> Optional[str]:
+    """Reduce a spec version to its major.minor key (e.g. '1.1.3' -> '1.1')."""
+    if not spec_version:
+        return None
+    parts = str(spec_version).split(".")
+    return ".".join(parts[:2])
+
+
+class RuleRegistry:
+    """
+    Registry of validation rules, indexed by spec version.
+    """
+
+    def __init__(self, rules: Iterable[ValidationRule] = ()):
+        """
+        Initialize rule registry.
+
+        Args:
+            rules: Initial rules to register
+        """
+        self._rules: List[ValidationRule] = []
+        self._by_version: Dict[Optional[str], Tuple[ValidationRule, ...]] = {}
+        for rule in rules:
+            self.register(rule)
+
+    def register(self, rule: ValidationRule) -> None:
+        """
+        Register a rule.
+
+        Args:
+            rule: Rule instance
+
+        Raises:
+            ValueError: If a rule with the same id is already registered
+        """
+        if any(existing.id == rule.id for existing in self._rules):
+            raise ValueError(f"Duplicate validation rule id: {rule.id}")
+        self._rules.append(rule)
+        self._by_version.clear()
+
+    def rules_for(self, spec_version: Optional[str]) -> Tuple[ValidationRule, ...]:
+        """
+        Return rules applicable to a spec version (memoized per version).
+
+        Args:
+            spec_version: Spec version of the payload
+
+        Returns:
+            Tuple of applicable rules in registration order
+        """
+        key = version_key(spec_version)
+        rules = self._by_version.get(key)
+        if rules is None:
+            rules = tuple(
+                rule for rule in self._rules
+                if not rule.spec_versions or key in rule.spec_versions
+            )
+            self._by_version[key] = rules
+        return rules
+
+    def evaluate(self, entity: Dict[str, Any], spec_version: Optional[str]) -> List[Violation]:
+        """
+        Run all applicable rules against an entity.
+
+        Args:
+            entity: Payload dictionary
+            spec_version: Spec version of the payload
+
+        Returns:
+            List of violations
+        """
+        violations: List[Violation] = []
+        for rule in self.rules_for(spec_version):
+            if rule.applies(entity):
+                violations.extend(rule.evaluate(entity))
+        return violations
+
+    def __len__(self) -> int:
+        return len(self._rules)
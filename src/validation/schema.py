@@ -0,0 +1,196 @@
+"""
+Compiled JSON Schema validators per spec version.
+
+Each parameter schema is compiled exactly once per major.minor spec version.
+With fastjsonschema installed the schema is code-generated into a plain
+Python function; otherwise a jsonschema Draft7Validator is built once and
+reused. Either way no per-request schema construction happens.
+"""
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import copy
+import json
+import os
+import threading
+
+from src.validation.rules import Violation, version_key
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional accelerator
+    fastjsonschema = None
+
+
+SCHEMA_DIR = Path(os.getenv(
+    "FCN_SCHEMA_DIR",
+    Path(__file__).resolve().parents[2] / "docs/business/ba/products/structured-notes/fcn/schemas",
+))
+
+# Parameter schema per spec version. v1.0 trades use the flat v1.0 shape
+# (underlying_symbols, initial_levels, notional_amount) that the sample
+# payloads, BR-015 and docs/scripts/validate-fcn-params.py follow;
+# manifest.yaml's fcn-v1.0-parameters.schema.json describes the v1.1-style
+# shape, which no v1.0 payload uses.
+SCHEMA_FILES = {
+    "1.0": "fcn-v1.0-schema.json",
+    "1.1": "fcn-v1.1.0-parameters.schema.json",
+}
+
+SchemaCheck = Callable[[Dict[str, Any]], List[Violation]]
+
+
+class UnknownSpecVersionError(LookupError):
+    """Raised when no parameter schema is registered for a spec version."""
+
+
+def normalize_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize a schema to strict draft-07.
+
+    The FCN schemas carry draft-04 style boolean `exclusiveMinimum` /
+    `exclusiveMaximum` (which draft-07 validators compare numerically
+    against True/False) and a documentation-only `dependencies.comment`
+    string. Both are rewritten so compiled validators enforce the intended
+    bounds.
+
+    Args:
+        schema: Parsed JSON schema
+
+    Returns:
+        Normalized deep copy
+    """
+    def walk(node: Any) -> Any:
+        if isinstance(node, list):
+            return [walk(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+
+        node = {key: walk(value) for key, value in node.items()}
+
+        for bound, exclusive in (("minimum", "exclusiveMinimum"), ("maximum", "exclusiveMaximum")):
+            flag = node.get(exclusive)
+            if isinstance(flag, bool):
+                del node[exclusive]
+                if flag and bound in node:
+                    node[exclusive] = node.pop(bound)
+
+        dependencies = node.get("dependencies")
+        if isinstance(dependencies, dict):
+            cleaned = {
+                key: value for key, value in dependencies.items()
+                if isinstance(value, (list, dict))
+            }
+            if cleaned:
+                node["dependencies"] = cleaned
+            else:
+                del node["dependencies"]
+
+        return node
+
+    return walk(copy.deepcopy(schema))
+
+
+def _format_path(parts) -> str:
+    """Render a schema error path as a JSONPath-like string."""
+    parts = [str(p) for p in parts]
+    return "$." + ".".join(parts) if parts else "$"
+
+
+def compile_schema(schema: Dict[str, Any]) -> SchemaCheck:
+    """
+    Compile a schema into a reusable check function.
+
+    Args:
+        schema: Parsed JSON schema (normalized internally)
+
+    Returns:
+        Callable returning a list of schema violations
+    """
+    schema = normalize_schema(schema)
+
+    if fastjsonschema is not None:
+        validate = fastjsonschema.compile(schema)
+
+        def check(payload: Dict[str, Any]) -> List[Violation]:
+            try:
+                validate(payload)
+            except fastjsonschema.JsonSchemaValueException as e:
+                # Generated code stops at the first failure; path[0] is 'data'
+                return [Violation(
+                    rule_id="schema",
+                    path=_format_path((e.path or [])[1:]),
+                    constraint=str(e.rule or "schema"),
+                    message=e.message,
+                )]
+            return []
+
+        return check
+
+    from jsonschema import Draft7Validator
+
+    validator = Draft7Validator(schema)
+
+    def check(payload: Dict[str, Any]) -> List[Violation]:
+        return [
+            Violation(
+                rule_id="schema",
+                path=_format_path(error.path),
+                constraint=str(error.validator),
+                message=error.message,
+            )
+            for error in validator.iter_errors(payload)
+        ]
+
+    return check
+
+
+class CompiledSchemaRegistry:
+    """
+    Lazily compiled, process-wide schema validators keyed by spec version.
+    """
+
+    def __init__(self, schema_dir: Path = SCHEMA_DIR, schema_files: Optional[Dict[str, str]] = None):
+        """
+        Initialize schema registry.
+
+        Args:
+            schema_dir: Directory containing parameter schema files
+            schema_files: Mapping of major.minor version to schema filename
+        """
+        self.schema_dir = Path(schema_dir)
+        self.schema_files = dict(schema_files or SCHEMA_FILES)
+        self._compiled: Dict[str, SchemaCheck] = {}
+        self._lock = threading.Lock()
+
+    def check_for(self, spec_version: Optional[str]) -> SchemaCheck:
+        """
+        Return the compiled check for a spec version, compiling on first use.
+
+        Raises:
+            UnknownSpecVersionError: If no schema is registered for the version
+        """
+        key = version_key(spec_version)
+        check = self._compiled.get(key)
+        if check is not None:
+            return check
+
+        if key not in self.schema_files:
+            raise UnknownSpecVersionError(f"No parameter schema registered for spec_version '{spec_version}'")
+
+        with self._lock:
+            check = self._compiled.get(key)
+            if check is None:
+                schema_path = self.schema_dir / self.schema_files[key]
+                with open(schema_path, "r", encoding="utf-8") as f:
+                    check = compile_schema(json.load(f))
+                self._compiled[key] = check
+        return check
+
+    def preload(self) -> None:
+        """Compile every registered schema up front (e.g. before forking workers)."""
+        for key in self.schema_files:
+            self.check_for(key)
+
+    def validate(self, payload: Dict[str, Any], spec_version: Optional[str]) -> List[Violation]:
+        """Validate a payload against the schema for its spec version."""
+        return self.check_for(spec_version)(payload)
@@ -0,0 +1,159 @@
+"""
+Validation service.
+
+Runs the compiled structural schema for a payload's spec version, the
+seeded parameter bounds (when a parameter-definition index is supplied),
+the issuer whitelist (BR-022, when supplied) and then the registered
+cross-field rules.
+"""
+from typing import Any, Dict, Mapping, Optional, Protocol
+
+from opentelemetry.trace import Tracer
+
+from src.domain.services.templates import TemplateDefinition, TemplateValidationError
+from src.validation.bounds import ParameterDefinition, check_bounds
+from src.validation.cross_field import CROSS_FIELD_RULES
+from src.validation.issuers import IssuerWhitelist
+from src.validation.rules import RuleRegistry, ValidationResult, Violation
+from src.validation.schema import CompiledSchemaRegistry, UnknownSpecVersionError
+from src.observability.metrics import VALIDATION_ERRORS
+from src.observability.tracing import SPAN_VALIDATION, get_tracer
+
+
+default_tracer = get_tracer(__name__)
+
+
+class ParameterDefinitionSource(Protocol):
+    """Anything that resolves seeded parameter definitions per spec version."""
+
+    def for_version(self, product_type: str, spec_version: Optional[str]) -> Mapping[str, ParameterDefinition]:
+        ...
+
+
+def default_rule_registry() -> RuleRegistry:
+    """Build a registry with the standard FCN cross-field rules."""
+    return RuleRegistry(rule() for rule in CROSS_FIELD_RULES)
+
+
+class ValidationService:
+    """
+    Payload validation against schema and rule registry.
+    """
+
+    def __init__(
+        self,
+        schemas: Optional[CompiledSchemaRegistry] = None,
+        rules: Optional[RuleRegistry] = None,
+        parameters: Optional[ParameterDefinitionSource] = None,
+        tracer: Optional[Tracer] = None,
+        issuers: Optional[IssuerWhitelist] = None,
+    ):
+        """
+        Initialize validation service.
+
+        Args:
+            schemas: Compiled schema registry (default: FCN parameter schemas)
+            rules: Rule registry (default: FCN cross-field rules)
+            parameters: Optional parameter-definition index (e.g.
+                ParameterDefinitionCache); supplies seeded min/max, enum
+                and pattern bounds
+            tracer: Tracer for validation.run spans (default: global provider)
+            issuers: Optional issuer whitelist; payloads naming another
+                issuer fail BR-022
+        """
+        self.schemas = schemas or CompiledSchemaRegistry()
+        self.rules = rules or default_rule_registry()
+        self.parameters = parameters
+        self.tracer = tracer or default_tracer
+        self.issuers = issuers
+
+    def with_tracer(self, tracer: Tracer) -> "ValidationService":
+        """
+        Return a service sharing this one's schemas, rules, parameters and
+        issuers but recording spans with another tracer (e.g. an app's, for
+        reference data loaded before the app existed).
+        """
+        return ValidationService(self.schemas, self.rules, self.parameters, tracer=tracer, issuers=self.issuers)
+
+    def validate(
+        self,
+        payload: Dict[str, Any],
+        spec_version: Optional[str] = None,
+        product_type: str = "fcn",
+    ) -> ValidationResult:
+        """
+        Validate a trade or template parameter payload.
+
+        Args:
+            payload: Parameter dictionary
+            spec_version: Spec version override; defaults to the payload's
+                spec_version or documentation_version
+
+        Returns:
+            ValidationResult with all violations found
+        """
+        spec_version = spec_version or payload.get("spec_version") or payload.get("documentation_version")
+        with self.tracer.start_as_current_span(SPAN_VALIDATION) as span:
+            result = self._validate(payload, spec_version, product_type)
+            span.set_attribute("fcn.spec_version", str(spec_version))
+            span.set_attribute("fcn.validation.violations", len(result.violations))
+        for violation in result.violations:
+            VALIDATION_ERRORS.labels(violation.rule_id).inc()
+        return result
+
+    def validate_template(self, template: TemplateDefinition, product_type: str = "fcn") -> None:
+        """
+        Check a stored template before it is cached (TemplateCache validator).
+
+        Template parameters are partial defaults, so only the spec version
+        and the seeded bounds of the parameters present are checked.
+
+        Args:
+            template: Parsed template
+
+        Raises:
+            TemplateValidationError: Unknown spec version or out-of-bounds
+                parameter
+        """
+        try:
+            self.schemas.check_for(template.spec_version)
+        except UnknownSpecVersionError as e:
+            raise TemplateValidationError(f"Template '{template.template_id}': {e}") from e
+
+        if self.parameters is not None:
+            definitions = self.parameters.for_version(product_type, template.spec_version)
+            violations = check_bounds(dict(template.parameters), definitions)
+            if violations:
+                raise TemplateValidationError(
+                    f"Template '{template.template_id}' parameters out of bounds: "
+                    + "; ".join(f"{v.path} {v.message}" for v in violations)
+                )
+
+    def _validate(self, payload: Dict[str, Any], spec_version: Optional[str], product_type: str) -> ValidationResult:
+        """Run schema, bounds, issuer and cross-field checks."""
+        result = ValidationResult(spec_version=spec_version)
+
+        try:
+            result.violations.extend(self.schemas.validate(payload, spec_version))
+        except UnknownSpecVersionError as e:
+            result.violations.append(Violation(
+                rule_id="governance",
+                path="$.spec_version",
+                constraint="SPEC_VERSION_UNKNOWN",
+                message=str(e),
+            ))
+            return result
+
+        if self.parameters is not None:
+            # Skip fields the schema already reported so one bad value yields one finding
+            reported = {v.path for v in result.violations}
+            definitions = self.parameters.for_version(product_type, spec_version)
+            result.violations.extend(
+                v for v in check_bounds(payload, definitions) if v.path not in reported
+            )
+
+        if self.issuers is not None:
+            result.violations.extend(self.issuers.check(payload))
+
+        result.violations.extend(self.rules.evaluate(payload, spec_version))
+        return result
@@ -0,0 +1,36 @@
+"""
+Shared test setup: import paths, the corpus cache and SQLite DDL.
+
+- The repository root (for `src.*`), the FCN validators directory (for
+  the validator modules, which import each other by bare name), the FCN
+  data-warehouse scripts directory and benchmarks/ (whose scripts import
+  `common` by bare name) go on sys.path.
+- The parsed-YAML corpus cache goes to a throwaway directory instead of the
+  user's home directory.
+- The ORM's SQL Server DATETIMEOFFSET columns are created as DATETIME on
+  SQLite, so tests can build the schema on throwaway databases.
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FCN_BASE_DIR = REPO_ROOT / "docs/business/ba/products/structured-notes/fcn"
+
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(FCN_BASE_DIR / "validators"))
+sys.path.insert(0, str(FCN_BASE_DIR / "data-warehouse"))
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+os.environ["FCN_CORPUS_CACHE_DIR"] = tempfile.mkdtemp()
+
+try:
+    from sqlalchemy.dialects.mssql import DATETIMEOFFSET
+    from sqlalchemy.ext.compiler import compiles
+except ImportError:  # validator tests run without the API dependencies
+    pass
+else:
+    @compiles(DATETIMEOFFSET, "sqlite")
+    def _datetimeoffset(element, compiler, **kw):
+        return "DATETIME"
@@ -0,0 +1,205 @@
+"""
+Admission control tests: classification, shedding by pressure and in-flight
+limits, and what a shed client receives.
+
+Pressure comes from fake pool-wait and loop-lag signals set by each test.
+Middleware tests wrap a bare ASGI app, so only admission decides the status.
+"""
+import asyncio
+import dataclasses
+
+import httpx
+
+from src.app.main import create_app
+from src.app.middleware.admission import (
+    BOOKING,
+    HEALTH,
+    QUERY,
+    REPLAY,
+    RETRY_AFTER_SECONDS,
+    TICKET_SCOPE_KEY,
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionTicket,
+)
+from src.app.settings import Settings
+
+
+class FakeDelay:
+    """Saturation signal with a value set by the test."""
+
+    def __init__(self, value: float = 0.0):
+        self.current = value
+
+    def value(self) -> float:
+        return self.current
+
+
+class FakeLoopMonitor:
+    """Loop lag monitor exposing a FakeDelay as its lag."""
+
+    def __init__(self):
+        self.lag = FakeDelay()
+
+
+def new_controller(limits=None):
+    """Return a controller at pressure 0; each signal reaches 1.0 at 1 s."""
+    return AdmissionController(
+        limits=limits or {BOOKING: 2, QUERY: 2, REPLAY: 2},
+        max_pool_wait_seconds=1.0,
+        max_loop_lag_seconds=1.0,
+        pool_wait=FakeDelay(),
+        loop_monitor=FakeLoopMonitor(),
+    )
+
+
+def scope(method, path, headers=()):
+    """Return a minimal HTTP scope."""
+    return {"type": "http", "method": method, "path": path, "headers": list(headers)}
+
+
+def test_requests_are_classified_by_path_method_and_key():
+    controller = new_controller()
+    key = [(b"idempotency-key", b"k-1")]
+    cases = [
+        (scope("GET", "/health"), HEALTH),
+        (scope("GET", "/health/ready"), HEALTH),
+        (scope("GET", "/metrics"), HEALTH),
+        (scope("POST", "/internal/cache/parameters"), HEALTH),
+        (scope("GET", "/v1/api/fcn/trades"), QUERY),
+        (scope("POST", "/api/v1/trades"), BOOKING),
+        (scope("POST", "/api/v1/trades", key), REPLAY),
+        (scope("PUT", "/api/v1/trades", key), QUERY),
+    ]
+    for request, expected in cases:
+        assert controller.classify(request) == expected, (request, expected)
+    print(f"✓ {len(cases)} requests classified into health/replay/query/booking")
+
+
+def test_classes_are_shed_at_their_pressure_thresholds():
+    controller = new_controller(limits={})
+    for pressure, admitted in (
+        (0.99, {HEALTH, REPLAY, QUERY, BOOKING}),
+        (1.0, {HEALTH, REPLAY, QUERY}),
+        (2.0, {HEALTH, REPLAY}),
+        (3.0, {HEALTH}),
+    ):
+        controller.pool_wait.current = pressure
+        for route_class in (HEALTH, REPLAY, QUERY, BOOKING):
+            reason = controller.try_acquire(route_class)
+            assert (reason is None) == (route_class in admitted), (pressure, route_class, reason)
+            if reason is None:
+                controller.release(route_class)
+            else:
+                assert reason == "pool_wait"
+
+    # The larger signal is the one reported
+    controller.pool_wait.current = 0.5
+    controller.loop_monitor.lag.current = 1.5
+    assert controller.try_acquire(BOOKING) == "loop_lag"
+    assert controller.in_flight == {HEALTH: 0, REPLAY: 0, QUERY: 0, BOOKING: 0}
+    print("✓ booking sheds at 1x pressure, query at 2x, replay at 3x; health never")
+
+
+def test_in_flight_limits_cap_each_class():
+    controller = new_controller(limits={BOOKING: 2, QUERY: 1})
+    assert controller.try_acquire(BOOKING) is None
+    assert controller.try_acquire(BOOKING) is None
+    assert controller.try_acquire(BOOKING) == "in_flight"
+    assert controller.try_acquire(QUERY) is None, "limits are per class"
+    assert controller.try_acquire(QUERY) == "in_flight"
+    for _ in range(5):
+        assert controller.try_acquire(HEALTH) is None, "classes without a limit are unlimited"
+    controller.release(BOOKING)
+    assert controller.try_acquire(BOOKING) is None
+    assert controller.in_flight[BOOKING] == 2
+    print("✓ each class is capped at its in-flight limit and frees a slot on release")
+
+
+def test_non_positive_signal_limits_are_refused_at_startup():
+    # A zero limit would divide by zero in signals() on every request
+    settings = dataclasses.replace(Settings.from_env(), traces_exporter="none")
+    for field in ("admission_max_pool_wait_ms", "admission_max_loop_lag_ms"):
+        for value in (0, -5.0):
+            try:
+                create_app(dataclasses.replace(settings, **{field: value}))
+            except ValueError as e:
+                assert "must be positive" in str(e)
+                continue
+            raise AssertionError(f"{field}={value} accepted")
+    assert create_app(dataclasses.replace(settings, admission_enabled=False, admission_max_loop_lag_ms=0))
+    print("✓ zero or negative pool-wait and loop-lag limits fail create_app() instead of every request")
+
+
+def test_reclassify_moves_the_hold_only_when_admitted():
+    controller = new_controller(limits={BOOKING: 1, REPLAY: 2})
+    assert controller.try_acquire(REPLAY) is None
+    ticket = AdmissionTicket(controller, REPLAY)
+    assert ticket.reclassify(BOOKING) is None
+    assert ticket.route_class == BOOKING
+    assert controller.in_flight[REPLAY] == 0 and controller.in_flight[BOOKING] == 1
+
+    # A second store miss finds the booking class full and keeps its replay hold
+    assert controller.try_acquire(REPLAY) is None
+    other = AdmissionTicket(controller, REPLAY)
+    assert other.reclassify(BOOKING) == "in_flight"
+    assert other.route_class == REPLAY
+    assert controller.in_flight[REPLAY] == 1 and controller.in_flight[BOOKING] == 1
+
+    # Pressure that sheds bookings refuses the move as well
+    controller.release(BOOKING)
+    controller.pool_wait.current = 1.5
+    assert other.reclassify(BOOKING) == "pool_wait"
+    assert controller.in_flight[REPLAY] == 1 and controller.in_flight[BOOKING] == 0
+    print("✓ reclassify moves a ticket's hold to the new class, or leaves it in place when refused")
+
+
+def send_requests(controller, requests):
+    """Send (method, path, headers) requests through AdmissionMiddleware; return the responses."""
+    tickets = []
+
+    async def endpoint(scope, receive, send):
+        tickets.append(scope.get(TICKET_SCOPE_KEY))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    app = AdmissionMiddleware(endpoint, controller=controller)
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+            return [await client.request(method, path, headers=headers) for method, path, headers in requests]
+
+    return asyncio.run(run()), tickets
+
+
+def test_shed_bookings_get_503_while_health_and_replays_pass():
+    controller = new_controller()
+    controller.pool_wait.current = 1.5  # past booking's threshold, below query's and replay's
+    responses, tickets = send_requests(controller, [
+        ("POST", "/api/v1/trades", {}),
+        ("GET", "/health", {}),
+        ("POST", "/api/v1/trades", {"Idempotency-Key": "k-1"}),
+        ("GET", "/v1/api/fcn/trades", {}),
+    ])
+    booking, health, replay, query = responses
+
+    assert booking.status_code == 503
+    assert booking.headers["Retry-After"] == str(RETRY_AFTER_SECONDS)
+    assert booking.json()["error"] == {
+        "code": "SERVICE_OVERLOADED",
+        "message": "Service is at capacity; retry after the indicated delay",
+        "details": {"route_class": BOOKING, "reason": "pool_wait"},
+    }
+    for response in (health, replay, query):
+        assert response.status_code == 200 and "Retry-After" not in response.headers
+    assert [ticket.route_class for ticket in tickets] == [HEALTH, REPLAY, QUERY]
+    assert controller.in_flight == {HEALTH: 0, REPLAY: 0, QUERY: 0, BOOKING: 0}, "every admission released"
+
+    # Severe pressure leaves only health checks
+    controller.pool_wait.current = 3.0
+    responses, _ = send_requests(controller, [
+        ("GET", "/health", {}),
+        ("POST", "/api/v1/trades", {"Idempotency-Key": "k-1"}),
+    ])
+    assert [r.status_code for r in responses] == [200, 503]
+    print("✓ shed bookings get 503 with Retry-After; health and replays are still served")
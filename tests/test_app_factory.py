@@ -0,0 +1,62 @@
+"""
+Application factory tests: nothing touches the database until the app serves.
+
+Import-time checks run in a fresh interpreter so modules other tests
+already imported do not hide an eager import. Lifespan checks run the app
+against a throwaway SQLite database.
+"""
+import asyncio
+import dataclasses
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from src.app.main import create_app
+from src.app.settings import Settings
+from src.infra.db import base
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_CHECK = """
+import sys
+import src.app.main as main
+from src.infra.db import base
+
+app = main.create_app()
+assert base._engine is None, "create_app() built an engine"
+assert "pyodbc" not in sys.modules, "create_app() loaded the MSSQL driver"
+assert not hasattr(app.state, "idempotency_service"), "stores are built in the lifespan"
+assert main.app is main.app, "module-level app is built once, on first access"
+assert base._engine is None and "pyodbc" not in sys.modules
+"""
+
+
+def test_import_and_create_app_do_not_connect():
+    # Default settings point at MSSQL (mssql+pyodbc), which is not reachable here
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK], cwd=REPO_ROOT,
+        capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    print("✓ importing src.app.main and calling create_app() load no driver and create no engine")
+
+
+def test_lifespan_creates_and_disposes_the_engine():
+    database = Path(tempfile.mkdtemp()) / "factory.db"
+    url = f"sqlite:///{database}"
+    app = create_app(dataclasses.replace(Settings.from_env(), database_url=url, traces_exporter="none"))
+    base.dispose_engine()
+
+    async def run():
+        async with app.router.lifespan_context(app):
+            assert base._engine is not None and str(base._engine.url) == url
+            assert app.state.idempotency_service is not None
+            assert app.state.template_cache is not None
+        assert base._engine is None, "shutdown disposes the engine"
+
+    try:
+        asyncio.run(run())
+    finally:
+        database.unlink(missing_ok=True)
+    print("✓ the lifespan builds the engine and stores from settings and disposes the engine on shutdown")
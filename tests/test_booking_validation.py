@@ -0,0 +1,79 @@
+"""
+Booking validation tests: POST /api/v1/trades runs the validation service.
+
+Books the published sample payloads, alone and over a stored template's
+defaults, on a throwaway SQLite database and checks that invalid trades are
+refused with 422 and their violations.
+"""
+import asyncio
+import dataclasses
+import json
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.app.main import create_app
+from src.app.settings import Settings
+from src.infra.db.base import Base, SessionLocal, init_engine
+from src.infra.db.models import TemplateORM
+
+SAMPLE_DIR = (
+    Path(__file__).resolve().parents[1]
+    / "docs/business/ba/products/structured-notes/fcn/test-vectors/sample-payloads"
+)
+N1_PAYLOAD = json.loads((SAMPLE_DIR / "fcn-v1.0-n1-payload.json").read_text(encoding="utf-8"))
+INVALID_PAYLOAD = json.loads((SAMPLE_DIR / "fcn-v1.0-invalid-payload.json").read_text(encoding="utf-8"))
+
+
+def book_all(bodies):
+    """Book each body (with TPL-N1 holding the N1 payload as defaults); return the responses."""
+    import httpx
+
+    database = Path(tempfile.mkdtemp()) / "booking.db"
+    url = f"sqlite:///{database}"
+    Base.metadata.create_all(init_engine(url))
+    now = datetime(2025, 10, 10, tzinfo=timezone.utc)
+    with SessionLocal() as session:
+        session.add(TemplateORM(
+            template_id="TPL-N1", name="FCN", spec_version="1.0.0", status="active",
+            issuer="SAMPLE_BANK_01", parameters=json.dumps(N1_PAYLOAD), created_at=now, updated_at=now,
+        ))
+        session.commit()
+    app = create_app(dataclasses.replace(Settings.from_env(), database_url=url, traces_exporter="none"))
+
+    async def run():
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return [await client.post("/api/v1/trades", json=body) for body in bodies]
+
+    try:
+        return asyncio.run(run())
+    finally:
+        database.unlink(missing_ok=True)
+
+
+def test_invalid_trades_are_refused_with_their_violations():
+    valid, invalid, over_template, from_template, not_an_object = book_all([
+        dict(N1_PAYLOAD, trade_id="TRD-1"),
+        dict(INVALID_PAYLOAD, trade_id="TRD-2"),
+        # One override breaks BR-015 against the template's single underlying
+        {"template_id": "TPL-N1", "initial_levels": [100.0, 95.0]},
+        {"template_id": "TPL-N1", "trade_id": "TRD-3"},
+        [N1_PAYLOAD],
+    ])
+
+    assert valid.status_code == 201, valid.json()
+    assert from_template.status_code == 201, from_template.json()
+
+    assert invalid.status_code == 422
+    error = invalid.json()["error"]
+    assert error["code"] == "VALIDATION_FAILED" and error["details"]["spec_version"] == "1.0.0"
+    rules = {(v["rule_id"], v["path"]) for v in error["details"]["violations"]}
+    assert ("BR-014", "$.observation_dates[3]") in rules and ("BR-015", "$.initial_levels") in rules, rules
+
+    assert over_template.status_code == 422
+    assert [v["rule_id"] for v in over_template.json()["error"]["details"]["violations"]] == ["BR-015"]
+
+    assert not_an_object.status_code == 400 and not_an_object.json()["error"]["code"] == "INVALID_BODY"
+    print("✓ bookings failing schema or business rules get 422 with each violation; valid ones are booked")
@@ -0,0 +1,175 @@
+"""
+Circuit breaker tests: the state machine and stale call outcomes.
+
+Drives CircuitBreaker with an injected clock, and IdempotencyService with
+a store whose calls are released by hand, so overlapping calls finish in
+a chosen order.
+"""
+import asyncio
+
+from src.domain.services.idempotency import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    IdempotencyService,
+    IdempotencyStore,
+    IdempotencyUnavailableError,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def new_breaker(**kwargs):
+    """Return (breaker, clock) with a threshold of 2 and a 5 s reset."""
+    clock = FakeClock()
+    return CircuitBreaker(failure_threshold=2, reset_timeout_seconds=5.0, clock=clock, **kwargs), clock
+
+
+def admit(breaker):
+    """Admit one call and return its generation."""
+    assert breaker.allow()
+    return breaker.generation
+
+
+def trip(breaker):
+    """Open a closed breaker with consecutive failures."""
+    for _ in range(breaker.failure_threshold):
+        breaker.record(False, 0.0, admit(breaker))
+    assert breaker.state == OPEN
+
+
+def test_failures_open_and_success_resets():
+    breaker, _ = new_breaker()
+    breaker.record(False, 0.0, admit(breaker))
+    breaker.record(True, 0.0, admit(breaker))
+    breaker.record(False, 0.0, admit(breaker))
+    assert breaker.state == CLOSED, "a success must reset the failure count"
+    breaker.record(False, 0.0, admit(breaker))
+    assert breaker.state == OPEN
+    print("✓ consecutive failures open the circuit; a success resets the count")
+
+
+def test_slow_success_counts_as_failure():
+    breaker, _ = new_breaker(slow_call_seconds=0.5)
+    breaker.record(True, 1.0, admit(breaker))
+    breaker.record(True, 1.0, admit(breaker))
+    assert breaker.state == OPEN
+    print("✓ successes slower than slow_call_seconds count as failures")
+
+
+def test_open_refuses_until_reset_then_probes():
+    breaker, clock = new_breaker()
+    trip(breaker)
+    assert not breaker.allow()
+    clock.now += 4.9
+    assert not breaker.allow() and breaker.retry_after() > 0
+    clock.now += 0.1
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    assert not breaker.allow(), "half-open admits a single probe"
+    print("✓ open circuit refuses calls until the reset timeout, then admits one probe")
+
+
+def test_probe_outcome_closes_or_reopens():
+    breaker, clock = new_breaker()
+    trip(breaker)
+    clock.now += 5
+    breaker.record(False, 0.0, admit(breaker))
+    assert breaker.state == OPEN and not breaker.allow()
+
+    clock.now += 5
+    breaker.record(True, 0.0, admit(breaker))
+    assert breaker.state == CLOSED and breaker.retry_after() == 0.0
+    assert breaker.transitions == {CLOSED: 1, OPEN: 2, HALF_OPEN: 2}
+    print("✓ the probe's failure reopens the circuit and its success closes it")
+
+
+def test_silent_probe_is_replaced():
+    breaker, clock = new_breaker()
+    trip(breaker)
+    clock.now += 5
+    lost_probe = admit(breaker)
+    clock.now += 5
+    probe = admit(breaker)
+    breaker.record(True, 0.0, lost_probe)
+    assert breaker.state == HALF_OPEN, "the replaced probe's late success closed the circuit"
+    breaker.record(True, 0.0, probe)
+    assert breaker.state == CLOSED
+    print("✓ a silent probe is replaced and its late outcome ignored")
+
+
+def test_calls_from_before_a_trip_are_ignored():
+    breaker, clock = new_breaker()
+    in_flight = [admit(breaker) for _ in range(3)]
+    trip(breaker)
+
+    breaker.record(True, 0.0, in_flight[0])
+    assert breaker.state == OPEN, "a call admitted while closed closed the circuit"
+    assert not breaker.allow()
+
+    clock.now += 5
+    probe = admit(breaker)
+    breaker.record(True, 0.0, in_flight[1])
+    assert breaker.state == HALF_OPEN, "a call admitted while closed closed the circuit"
+    breaker.record(False, 0.0, in_flight[2])
+    assert breaker.state == HALF_OPEN, "a call admitted while closed reopened the circuit"
+    breaker.record(True, 0.0, probe)
+    assert breaker.state == CLOSED
+    print("✓ outcomes of calls admitted before a trip are ignored")
+
+
+class GatedStore(IdempotencyStore):
+    """Store whose get calls block until released, failing or succeeding."""
+
+    def __init__(self):
+        self.pending = []
+
+    async def get(self, key_hash):
+        gate = asyncio.get_running_loop().create_future()
+        self.pending.append(gate)
+        if not await gate:
+            raise ConnectionError("store down")
+        return None
+
+    async def set(self, record):
+        pass
+
+    async def delete(self, key_hash):
+        pass
+
+
+def test_service_ignores_slow_success_after_trip():
+    breaker, _ = new_breaker()
+    store = GatedStore()
+    service = IdempotencyService(store, breaker=breaker)
+
+    async def lookup():
+        try:
+            await service.get_record("key")
+            return "ok"
+        except IdempotencyUnavailableError as e:
+            return e.reason
+
+    async def run():
+        calls = [asyncio.create_task(lookup()) for _ in range(3)]
+        await asyncio.sleep(0)
+        store.pending[1].set_result(False)
+        store.pending[2].set_result(False)
+        await asyncio.sleep(0)
+        assert breaker.state == OPEN
+        store.pending[0].set_result(True)  # slow call admitted while closed
+        results = await asyncio.gather(*calls)
+        return results, await lookup()
+
+    results, refused = asyncio.run(run())
+    assert results == ["ok", "error", "error"]
+    assert breaker.state == OPEN and refused == "circuit_open"
+    print("✓ service: a slow success admitted before the trip does not close the circuit")
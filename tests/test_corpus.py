@@ -0,0 +1,90 @@
+"""
+FCN corpus tests: front matter parsing, memoization and the YAML disk cache.
+
+Covers the docs/scripts error messages returned by
+Document.front_matter_dict, that a Corpus reads each file once until it is
+invalidated, and that a second corpus sharing a cache directory is served
+from disk instead of re-parsing.
+"""
+import tempfile
+from pathlib import Path
+
+from corpus import Corpus, Document, YamlCache
+
+SPEC = "---\ntitle: FCN Spec\nversion: '1.0'\n---\n# Body\n"
+
+
+def write(directory, name, text):
+    path = Path(directory) / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_front_matter_dict_messages():
+    corpus = Corpus(use_disk_cache=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        front_matter, error = corpus.document(write(tmp, "ok.md", SPEC)).front_matter_dict()
+        assert front_matter == {"title": "FCN Spec", "version": "1.0"} and error == ""
+
+        cases = {
+            "plain.md": ("# No front matter\n", "No YAML front matter found"),
+            "broken.md": ("---\ntitle: [unclosed\n---\n", "Failed to parse YAML front matter"),
+            "scalar.md": ("---\njust a string\n---\n", "Front matter is not a valid YAML dictionary"),
+        }
+        for name, (text, message) in cases.items():
+            front_matter, error = corpus.document(write(tmp, name, text)).front_matter_dict()
+            assert front_matter == {} and error.startswith(message), (name, error)
+
+        # A directory cannot be read as a file
+        front_matter, error = corpus.document(Path(tmp)).front_matter_dict()
+        assert front_matter == {} and error.startswith("Failed to read file"), error
+
+    document = Document(None, "# none\n")
+    assert document.front_matter_dict("custom")[1] == "custom"
+    assert document.load() == (None, "# none\n")
+    print("✓ front_matter_dict returns the docs/scripts error messages")
+
+
+def test_documents_are_read_once_until_invalidated():
+    corpus = Corpus(use_disk_cache=False)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write(tmp, "spec.md", SPEC)
+        first = corpus.document(path)
+        path.write_text("---\ntitle: Edited\n---\n", encoding="utf-8")
+        assert corpus.document(path) is first
+        assert corpus.document(Path(tmp) / "." / "spec.md") is first, "paths are not resolved before lookup"
+        assert len(corpus) == 1
+
+        corpus.invalidate(path)
+        assert corpus.document(path).front_matter == {"title": "Edited"}
+
+        manifest = write(tmp, "manifest.yaml", "branches: [a]\n")
+        assert corpus.load_yaml(manifest) == {"branches": ["a"]}
+        manifest.write_text("branches: [b]\n", encoding="utf-8")
+        assert corpus.load_yaml(manifest) == {"branches": ["a"]}
+        corpus.invalidate(manifest)
+        assert corpus.load_yaml(manifest) == {"branches": ["b"]}
+    print("✓ a corpus reads each file once until invalidate()")
+
+
+def test_disk_cache_serves_a_second_corpus():
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory() as cache_dir:
+        for i in range(3):
+            write(tmp, f"spec-{i}.md", SPEC.replace("FCN Spec", f"Spec {i}"))
+
+        cold = Corpus(cache_dir=Path(cache_dir))
+        assert cold.preload(Path(tmp), Path(tmp) / "missing") == 3
+        assert (cold.cache.hits, cold.cache.misses) == (0, 3)
+
+        warm = Corpus(cache_dir=Path(cache_dir))
+        warm.preload(Path(tmp))
+        assert (warm.cache.hits, warm.cache.misses) == (3, 0)
+        assert warm.document(Path(tmp) / "spec-1.md").front_matter["title"] == "Spec 1"
+
+        # A corrupt entry is re-parsed and rewritten
+        cache = YamlCache(Path(cache_dir))
+        cache._path("key: value").parent.mkdir(parents=True, exist_ok=True)
+        cache._path("key: value").write_bytes(b"not a pickle")
+        assert cache.load("key: value") == {"key": "value"} and cache.misses == 1
+        assert cache.load("key: value") == {"key": "value"} and cache.hits == 1
+    print("✓ parsed YAML is shared across corpora through the disk cache")
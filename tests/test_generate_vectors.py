@@ -0,0 +1,81 @@
+"""
+Synthetic vector generator tests: seeded output, business-rule compliance
+and lossless jsonl/columnar round trips.
+
+Generates a few vectors for every manifest branch, checks they respect the
+BR constraints and replay cleanly through the Phase 4 engine, and reads
+them back from each streaming format (plain and gzip).
+"""
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+
+from generate_vectors import (
+    VectorGenerator,
+    constraint_violations,
+    read_vectors,
+    validate_stream,
+    write_vectors,
+)
+
+COUNT = 3
+
+
+def generate(seed=0, branches=None):
+    return list(VectorGenerator(seed=seed).generate(branches, COUNT))
+
+
+def test_seeded_generation_is_reproducible():
+    branches = list(VectorGenerator().branches)
+    vectors = generate()
+    assert len(vectors) == COUNT * len(branches)
+    assert vectors == generate(), "same seed produced different vectors"
+    assert vectors != generate(seed=1)
+
+    # A branch's vectors do not depend on which other branches are generated
+    assert generate(branches=branches[-1:]) == vectors[-COUNT:]
+
+    try:
+        generate(branches=["fcn-no-such-branch"])
+    except ValueError as e:
+        assert "Unknown branch_id" in str(e)
+    else:
+        raise AssertionError("unknown branch was accepted")
+    print("✓ the same seed yields the same vectors, per branch")
+
+
+def test_vectors_respect_business_rules_and_replay():
+    vectors = generate()
+    for vector in vectors:
+        assert constraint_violations(vector["parameters"]) == [], vector["vector_id"]
+        assert vector["expected_outputs"], vector["vector_id"]
+
+    stats = {"constraint_violations": 0, "passed": 0, "failed": 0}
+    with contextlib.redirect_stdout(io.StringIO()):
+        replayed = list(validate_stream(iter(vectors), stats))
+    assert replayed == vectors
+    assert stats == {"constraint_violations": 0, "passed": len(vectors), "failed": 0}, stats
+
+    broken = dict(vectors[0]["parameters"], observation_dates=[vectors[0]["parameters"]["maturity_date"]])
+    assert "BR-014" in constraint_violations(broken)
+    print("✓ generated vectors satisfy BR constraints and match the Phase 4 engine")
+
+
+def test_streaming_formats_round_trip():
+    vectors = generate()
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("vectors.jsonl", "vectors.jsonl.gz", "vectors.columnar", "vectors.columnar.gz"):
+            fmt = "jsonl" if ".jsonl" in name else "columnar"
+            output = Path(tmp) / name
+            assert write_vectors(iter(vectors), output, fmt) == len(vectors)
+            assert list(read_vectors(output)) == vectors, f"{name} did not round-trip"
+
+        # Branches with optional features leave sparse columns in a row group
+        columnar = Path(tmp) / "vectors.columnar"
+        first_line = columnar.read_text(encoding="utf-8").splitlines()[0]
+        assert '"absent":{"' in first_line, "expected sparse columns across mixed branches"
+
+        written = write_vectors(iter(vectors[:2]), Path(tmp) / "md", "md")
+        assert written == 2 and len(list((Path(tmp) / "md").glob("*.md"))) == 2
+    print("✓ jsonl and columnar outputs (plain and gzip) read back unchanged")
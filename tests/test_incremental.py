@@ -0,0 +1,89 @@
+"""
+Incremental validation tests: cached results survive a reload and are
+dropped when anything they depend on changes.
+
+Builds a throwaway FCN tree (one schema, a spec linking another through
+`related:`) and checks the persisted manifest against edits to the
+document, its related link and the schema.
+"""
+import json
+import tempfile
+from pathlib import Path
+
+from corpus import Corpus
+from incremental import IncrementalCache
+
+RESULT = {"passed": True, "errors": []}
+
+
+def build_tree(base):
+    (base / "schemas").mkdir()
+    (base / "specs").mkdir()
+    (base / "schemas" / "fcn-v1.0-parameters.schema.json").write_text('{"type": "object"}')
+    (base / "specs" / "spec.md").write_text("---\ntitle: Spec\nrelated:\n  - other.md\n---\n")
+    (base / "specs" / "other.md").write_text("---\ntitle: Other\n---\n")
+    return base / "specs" / "spec.md"
+
+
+def open_cache(base):
+    return IncrementalCache(Corpus(use_disk_cache=False), base / "manifest.json", fcn_base_dir=base)
+
+
+def test_results_survive_a_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        spec = build_tree(base)
+        cache = open_cache(base)
+        key = cache.document_key(spec, extra=["schema=1"])
+        assert cache.get("metadata", "spec.md", key) is None
+        cache.put("metadata", "spec.md", key, RESULT)
+        cache.save()
+
+        cache = open_cache(base)
+        assert cache.get("metadata", "spec.md", cache.document_key(spec, extra=["schema=1"])) == RESULT
+        assert cache.get("metadata", "spec.md", cache.document_key(spec, extra=["schema=2"])) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.summary() == "Incremental: 1 cached, 1 re-validated"
+    print("✓ a saved result is served after reload while its key matches")
+
+
+def test_edits_to_a_document_or_its_related_link_change_the_key():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        spec = build_tree(base)
+        cache = open_cache(base)
+        original = cache.document_key(spec)
+        assert cache.related_paths(spec) == [(base / "specs" / "other.md").resolve()]
+
+        (base / "specs" / "other.md").write_text("---\ntitle: Other, edited\n---\n")
+        cache.reset()
+        assert cache.document_key(spec) != original
+
+        key = cache.corpus_key([spec])
+        spec.write_text("---\ntitle: Spec, edited\n---\n")
+        cache.reset()
+        assert cache.corpus_key([spec]) != key
+    print("✓ document and related-link edits produce new keys")
+
+
+def test_schema_change_drops_every_entry():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        spec = build_tree(base)
+        cache = open_cache(base)
+        cache.put("parameter", "spec.md", cache.document_key(spec), RESULT)
+        cache.save()
+        assert open_cache(base).entries, "manifest was not written"
+
+        (base / "schemas" / "fcn-v1.0-parameters.schema.json").write_text('{"type": "array"}')
+        assert open_cache(base).entries == {}
+
+        # A manifest written by another validator version is discarded too
+        cache = open_cache(base)
+        cache.put("parameter", "spec.md", cache.document_key(spec), RESULT)
+        cache.save()
+        data = json.loads((base / "manifest.json").read_text())
+        data["validator_version"] = "0.0.0"
+        (base / "manifest.json").write_text(json.dumps(data))
+        assert open_cache(base).entries == {}
+    print("✓ a schema or validator change discards cached results")
@@ -0,0 +1,193 @@
+"""
+Test vector ingestion tests: hash-diffed batched upserts on SQLite.
+
+Ingests the repository's test vectors into the documented test_vector
+schema (built here as SQLite DDL), re-ingests them unchanged and with one
+edit, checks batching, duplicate and missing codes, that a failure
+mid-stream rolls the whole transaction back, that the script refuses a
+database without the migration, and that JSON array exports stream back
+across read-chunk boundaries.
+"""
+import contextlib
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import sqlalchemy as sa
+
+import ingest_vectors
+from ingest_vectors import VectorIngester, VectorStore, content_hash, iter_json_array
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FCN_BASE_DIR = REPO_ROOT / "docs/business/ba/products/structured-notes/fcn"
+
+
+# migrations/archive/m0001-fcn-baseline.sql (product catalog and section 7)
+# plus content_hash, in SQLite types
+DOCUMENTED_SCHEMA = [
+    """CREATE TABLE product (
+        product_id CHAR(36) PRIMARY KEY, product_code VARCHAR(50) NOT NULL UNIQUE)""",
+    """CREATE TABLE product_version (
+        version_id CHAR(36) PRIMARY KEY, product_id CHAR(36) NOT NULL REFERENCES product(product_id),
+        version VARCHAR(20) NOT NULL, UNIQUE (product_id, version))""",
+    """CREATE TABLE branch (
+        branch_id CHAR(36) PRIMARY KEY, product_id CHAR(36) NOT NULL REFERENCES product(product_id),
+        version_id CHAR(36) NOT NULL REFERENCES product_version(version_id),
+        branch_code VARCHAR(100) NOT NULL, UNIQUE (product_id, version_id, branch_code))""",
+    """CREATE TABLE test_vector (
+        vector_id CHAR(36) PRIMARY KEY,
+        product_id CHAR(36) NOT NULL REFERENCES product(product_id),
+        version_id CHAR(36) NOT NULL REFERENCES product_version(version_id),
+        branch_id CHAR(36) REFERENCES branch(branch_id),
+        vector_code VARCHAR(200) NOT NULL UNIQUE,
+        description TEXT NOT NULL,
+        normative BOOLEAN NOT NULL DEFAULT 0,
+        parameters_json TEXT NOT NULL,
+        market_scenario_json TEXT,
+        expected_outputs_json TEXT NOT NULL,
+        tags TEXT,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        content_hash CHAR(64))""",
+    "INSERT INTO product VALUES ('p-fcn', 'FCN')",
+    "INSERT INTO product_version VALUES ('v-100', 'p-fcn', '1.0.0'), ('v-110', 'p-fcn', '1.1.0')",
+    "INSERT INTO branch VALUES ('b-base-mem', 'p-fcn', 'v-100', 'fcn-base-mem')",
+]
+
+
+def documented_database(tmp, statements=DOCUMENTED_SCHEMA):
+    """Return the URL of a SQLite database with the migrated test_vector schema."""
+    url = f"sqlite:///{tmp}/vectors.db"
+    engine = sa.create_engine(url)
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.execute(sa.text(statement))
+    engine.dispose()
+    return url
+
+
+def vector(code, **fields):
+    return {"vector_code": code, "spec_version": "1.1.0", "parameters": {"notional": 1_000_000},
+            "expected_outputs": {"coupon": 0.01}, **fields}
+
+
+def stored_rows(url):
+    engine = sa.create_engine(url)
+    try:
+        with engine.connect() as conn:
+            return dict(conn.execute(sa.text("SELECT vector_code, description FROM test_vector")).all())
+    finally:
+        engine.dispose()
+
+
+def test_upsert_inserts_updates_and_skips_unchanged():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = documented_database(tmp)
+        store = VectorStore(url, batch_size=2)
+        vectors = [vector(f"v-{i}", description=f"Vector {i}") for i in range(5)]
+
+        stats = store.upsert(iter(vectors))
+        assert (stats["inserted"], stats["updated"], stats["unchanged"], stats["batches"]) == (5, 0, 0, 3)
+
+        stats = store.upsert(iter(vectors))
+        assert (stats["inserted"], stats["updated"], stats["unchanged"]) == (0, 0, 5)
+
+        vectors[3] = vector("v-3", description="Edited")
+        stats = store.upsert(iter(vectors + [{"description": "no code"}, vector("v-x", spec_version="9.9.9")]))
+        assert (stats["inserted"], stats["updated"], stats["unchanged"], stats["skipped"], stats["unlinked"]) == (
+            0, 1, 4, 1, 1)
+
+        # The last occurrence of a code within a batch wins
+        stats = VectorStore(url, batch_size=10).upsert(
+            [vector("v-9", description="first"), vector("v-9", description="last")])
+        assert stats["inserted"] == 1
+        rows = stored_rows(url)
+        assert rows["v-3"] == "Edited" and rows["v-9"] == "last" and len(rows) == 6
+        store.engine.dispose()
+
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1})
+    print("✓ batched upserts insert new, update changed and skip unchanged vectors")
+
+
+def test_failure_mid_stream_rolls_back():
+    def vectors():
+        yield vector("v-1")
+        yield vector("v-2")
+        raise RuntimeError("source went away")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = documented_database(tmp)
+        ingester = VectorIngester(url, batch_size=1)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            assert ingester.save_to_database(vectors()) is False
+        assert "rolled back" in output.getvalue()
+        assert stored_rows(url) == {}, "a failed ingestion left rows behind"
+    print("✓ an error mid-stream rolls back every batch")
+
+
+def test_unmigrated_database_is_refused():
+    without_hash = DOCUMENTED_SCHEMA[:3] + [DOCUMENTED_SCHEMA[3].replace(",\n        content_hash CHAR(64))", ")")]
+    for statements, message in (([], "missing table(s)"), (without_hash, "no content_hash column")):
+        with tempfile.TemporaryDirectory() as tmp:
+            url = documented_database(tmp, statements)
+            try:
+                VectorStore(url)
+            except RuntimeError as e:
+                assert message in str(e) and "m0014" in str(e), e
+            else:
+                raise AssertionError(f"VectorStore accepted a database with {message}")
+            engine = sa.create_engine(url)
+            assert len(sa.inspect(engine).get_table_names()) == (4 if statements else 0)
+            engine.dispose()
+    print("✓ ingestion refuses a database without the test_vector migration instead of creating tables")
+
+
+def test_directory_ingest_and_json_export_round_trip():
+    original_chunk = ingest_vectors.JSON_READ_CHUNK
+    ingest_vectors.JSON_READ_CHUNK = 64  # force objects to straddle read chunks
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            url = documented_database(tmp)
+            ingester = VectorIngester(url)
+            with contextlib.redirect_stdout(io.StringIO()):
+                count = ingester.ingest_directory(FCN_BASE_DIR / "test-vectors")
+                assert count == len(ingester.vectors) > 0
+                assert ingester.export_to_json(Path(tmp) / "vectors.json")
+                assert ingester.save_to_database()
+
+            streamed = list(iter_json_array(Path(tmp) / "vectors.json"))
+            assert streamed == json.loads(json.dumps(ingester.vectors, default=str))
+            assert set(stored_rows(url)) == {v["vector_code"] for v in streamed}
+            engine = sa.create_engine(url)
+            with engine.connect() as conn:
+                links = dict(conn.execute(sa.text("SELECT vector_code, branch_id FROM test_vector")).all())
+            engine.dispose()
+            assert links["fcn-v1.0-base-mem-baseline"] == "b-base-mem"
+
+            (Path(tmp) / "object.json").write_text('{"vector_code": "v-1"}')
+            try:
+                list(iter_json_array(Path(tmp) / "object.json"))
+            except ValueError as e:
+                assert "expected a JSON array" in str(e)
+            else:
+                raise AssertionError("a JSON object was accepted as an export")
+    finally:
+        ingest_vectors.JSON_READ_CHUNK = original_chunk
+    print("✓ test vectors ingest from markdown and stream back from a JSON export")
+
+
+def test_json_array_separators_are_strict():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "vectors.json"
+        for text, expected in (("[]", []), ('[ {"a": 1} ,\n {"a": 2} ]', [{"a": 1}, {"a": 2}])):
+            path.write_text(text)
+            assert list(iter_json_array(path)) == expected, text
+        for text in ('[,{"a": 1}]', '[{"a": 1},,{"a": 2}]', '[{"a": 1},]', '[{"a": 1} {"a": 2}]', '[{"a": 1}', "[,]"):
+            path.write_text(text)
+            try:
+                list(iter_json_array(path))
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f"malformed array accepted: {text}")
+    print("✓ leading, doubled, trailing and missing commas are parse errors")
@@ -0,0 +1,89 @@
+"""
+Load-test harness tests: the run exits 1 exactly when an SLO is missed.
+
+check_slos() is driven with hand-built stage results. The end-to-end tests
+run benchmarks/loadtest.py for one short in-process stage, once with SLOs
+any run meets and once with a booking SLO no run can meet.
+"""
+import argparse
+import json
+import socket
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from loadtest import SLO_BOOKING_MS, SLO_COLD_START_SECONDS, SLO_OBSERVATION_MS, check_slos
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def free_port() -> int:
+    """Return a port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def slo_args(**overrides):
+    """Return the SLO options with their defaults."""
+    values = dict(slo_booking_ms=SLO_BOOKING_MS, slo_observation_ms=SLO_OBSERVATION_MS,
+                  slo_cold_start_s=SLO_COLD_START_SECONDS, max_error_rate=0.01)
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def stage(rate, booking_p95, observations_p95, error_rate=0.0):
+    """Return a stage result carrying only what check_slos() reads."""
+    return {
+        "rate": rate,
+        "error_rate": error_rate,
+        "slo_groups": {"booking": {"p95_ms": booking_p95}, "observations": {"p95_ms": observations_p95}},
+    }
+
+
+def test_check_slos_reports_every_miss():
+    assert check_slos([stage(25, 120.0, 80.0), stage(50, 499.9, 349.9)], 1.9, slo_args()) == []
+
+    missed = check_slos(
+        [stage(25, 120.0, 80.0), stage(100, 500.0, 410.0, error_rate=0.05)], 2.0, slo_args(),
+    )
+    assert missed == [
+        "booking P95 500.0 ms >= 500 ms at 100 req/s",
+        "observations P95 410.0 ms >= 350 ms at 100 req/s",
+        "error rate 5.00% > 1.00% at 100 req/s",
+        "cold start 2.00 s >= 2 s",
+    ], missed
+
+    # A stage without samples for a group is not judged on it; no cold start when --url is used
+    empty = {"rate": 10, "error_rate": 0.0, "slo_groups": {"booking": {"count": 0}, "observations": {"count": 0}}}
+    assert check_slos([empty], None, slo_args()) == []
+    print("✓ check_slos reports P95, error-rate and cold-start misses, each against its own target")
+
+
+def run_loadtest(*slo_options):
+    """Run one short in-process stage; return (exit code, results JSON, output)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "results.json"
+        result = subprocess.run(
+            [sys.executable, "benchmarks/loadtest.py", "--target", "inprocess",
+             "--port", str(free_port()), "--database", str(Path(tmp) / "loadtest.db"),
+             "--rates", "20", "--duration", "0.5", "--batch-size", "5",
+             "--slo-cold-start-s", "60", "--output", str(output), *slo_options],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=180,
+        )
+        results = json.loads(output.read_text(encoding="utf-8")) if output.exists() else None
+    return result.returncode, results, result.stdout + result.stderr
+
+
+def test_loadtest_exit_code_follows_the_slos():
+    code, results, output = run_loadtest("--slo-booking-ms", "60000", "--slo-observation-ms", "60000")
+    assert code == 0, output
+    assert results["slo_missed"] == [] and results["stages"][0]["requests"] > 0
+    assert "✅ All ADR-006 §12 SLOs met" in output
+
+    code, results, output = run_loadtest("--slo-booking-ms", "0", "--slo-observation-ms", "60000")
+    assert code == 1, output
+    assert len(results["slo_missed"]) == 1 and results["slo_missed"][0].startswith("booking P95")
+    assert "❌ SLO missed: booking P95" in output
+    print("✓ loadtest.py exits 0 when every SLO is met and 1 when the booking SLO is missed")
@@ -0,0 +1,69 @@
+"""
+Phase 4 tests: published vectors replay from their markdown tables.
+
+Replays the repository's test vectors through the payoff engine and checks
+that a normative vector the engine cannot replay fails the phase instead of
+being reported as skipped.
+"""
+import contextlib
+import io
+import tempfile
+from pathlib import Path
+
+from corpus import Corpus
+from logic_validator import LogicValidator, run
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+VECTOR_DIR = REPO_ROOT / "docs/business/ba/products/structured-notes/fcn/test-vectors"
+
+NO_PATH_VECTOR = """---
+title: No path
+doc_type: test-vector
+normative: {normative}
+spec_version: 1.1.0
+---
+# No path
+
+## Parameters
+| name | value |
+|------|-------|
+| notional | 1_000_000 |
+| underlying_symbols | ["AMZN.US"] |
+| initial_levels | [180.00] |
+
+## Expected Events
+- ki_triggered: false
+"""
+
+
+def test_table_form_vectors_replay_and_pass():
+    results = LogicValidator(Corpus(use_disk_cache=False)).validate_test_vectors_files(VECTOR_DIR.glob("*.md"))
+    executed = {name for name, result in results.items() if result["status"] in ("pass", "fail")}
+    failed = {name: result["errors"] for name, result in results.items() if result["status"] in ("fail", "error")}
+    assert not failed, failed
+    # "Same as N1" vectors inherit N1's parameters; v1.1 vectors publish their own
+    assert "fcn-v1.0-base-mem-single-miss.md" in executed
+    assert "fcn-v1.1-caprisk-nomem-ki-loss.md" in executed
+    assert "fcn-v1.1-caprisk-nomem-ki-loss-physical-tiebreak.md" in executed
+    print(f"✓ {len(executed)} of {len(results)} published vectors replay and match their tables")
+
+
+def test_ki_loss_settles_on_the_published_ratio():
+    validator = LogicValidator(Corpus(use_disk_cache=False))
+    result = validator.validate_test_vector(VECTOR_DIR / "fcn-v1.1-caprisk-nomem-ki-loss.md")
+    assert result["status"] == "pass", result["errors"]
+    print("✓ ki-loss replays to its published 107,500 loss")
+
+
+def test_unreplayable_normative_vector_fails_the_phase():
+    for normative, expected_exit in (("true", 1), ("false", 0)):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "no-path.md").write_text(NO_PATH_VECTOR.format(normative=normative), encoding="utf-8")
+            (Path(directory) / "n1.md").write_text(
+                (VECTOR_DIR / "fcn-v1.0-base-mem-baseline.md").read_text(encoding="utf-8"), encoding="utf-8")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                exit_code = run([directory], Corpus(use_disk_cache=False))
+        assert exit_code == expected_exit, output.getvalue()
+        assert ("NOT REPLAYABLE: no Underlying Path table" in output.getvalue()) == (normative == "true")
+    print("✓ a normative vector without a path fails Phase 4; a non-normative one is only reported")
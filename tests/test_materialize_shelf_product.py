@@ -0,0 +1,143 @@
+"""
+Shelf product materialization tests: incremental refresh and derived columns.
+
+Builds the three fcn_template source tables on a throwaway SQLite database,
+materializes them, then edits and deletes templates and checks that each
+refresh rewrites only what changed.
+"""
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import sqlalchemy as sa
+
+from materialize_shelf_product import TEMPLATE_COLUMNS, ShelfProductMaterializer
+
+SOURCE_DDL = [
+    f"CREATE TABLE fcn_template ({', '.join(TEMPLATE_COLUMNS)})",
+    "CREATE TABLE fcn_template_underlying (template_id, underlying_code)",
+    "CREATE TABLE fcn_template_observation_schedule (template_id, observation_offset_months)",
+]
+
+T0 = "2026-10-01 09:00:00"
+
+# template_id -> (template columns, basket, schedule offsets)
+TEMPLATES = {
+    # Capital-at-risk, annual 12% coupon paid quarterly, autocall
+    "TPL-CAR": (dict(
+        recovery_mode="capital-at-risk", put_strike_pct=0.8, knock_in_barrier_pct=0.6,
+        coupon_rate_pct=0.12, coupon_rate_type="annual", coupon_condition_threshold_pct=0.8,
+        knock_out_barrier_pct=1.0, auto_call_observation_logic="all-underlyings",
+        effective_date="2026-01-15",
+    ), ["NVDA.US", "AMZN.US"], [3, 6, 9, 12]),
+    # Par recovery, 2% per quarterly period, coupon threshold below the KI barrier
+    "TPL-PAR": (dict(
+        recovery_mode="par-recovery", put_strike_pct=None, knock_in_barrier_pct=0.6,
+        coupon_rate_pct=0.02, coupon_rate_type="per_period", coupon_condition_threshold_pct=0.5,
+        knock_out_barrier_pct=None, auto_call_observation_logic=None,
+        effective_date="2026-01-15",
+    ), ["SPX"], [3, 6]),
+    # Capital-at-risk without a strike, irregular schedule, autocall without logic
+    "TPL-BAD": (dict(
+        recovery_mode="capital-at-risk", put_strike_pct=None, knock_in_barrier_pct=0.6,
+        coupon_rate_pct=0.01, coupon_rate_type="per_period", coupon_condition_threshold_pct=None,
+        knock_out_barrier_pct=1.05, auto_call_observation_logic=None,
+        effective_date="2026-01-31",
+    ), [], [1, 3, 4]),
+}
+
+
+def build_source(url):
+    """Create and fill the source tables."""
+    engine = sa.create_engine(url)
+    with engine.begin() as conn:
+        for statement in SOURCE_DDL:
+            conn.exec_driver_sql(statement)
+        for tid, (columns, basket, schedule) in TEMPLATES.items():
+            row = dict.fromkeys(TEMPLATE_COLUMNS)
+            row.update(columns, template_id=tid, template_code=tid.lower(), spec_version="1.1.0",
+                       issuer="HSBC-UK-001", status="Active", currency="USD", coupon_memory=0,
+                       settlement_type="physical-settlement", created_at=T0, updated_at=T0)
+            conn.execute(sa.text(
+                f"INSERT INTO fcn_template ({', '.join(row)}) VALUES ({', '.join(':' + name for name in row)})"
+            ), row)
+            for code in basket:
+                conn.exec_driver_sql("INSERT INTO fcn_template_underlying VALUES (?, ?)", (tid, code))
+            for offset in schedule:
+                conn.exec_driver_sql("INSERT INTO fcn_template_observation_schedule VALUES (?, ?)", (tid, offset))
+    return engine
+
+
+def shelf(materializer):
+    """Return the materialized rows keyed by template_id."""
+    with materializer.engine.connect() as conn:
+        return {row["template_id"]: dict(row) for row in conn.execute(sa.select(materializer.table)).mappings()}
+
+
+def test_derived_columns_follow_the_dictionary():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'dw.db'}"
+        build_source(url)
+        materializer = ShelfProductMaterializer(url)
+        materializer.refresh()
+        rows = shelf(materializer)
+        materializer.engine.dispose()
+
+    car, par, bad = rows["TPL-CAR"], rows["TPL-PAR"], rows["TPL-BAD"]
+    assert car["underlying_symbols"] == "AMZN.US,NVDA.US" and car["underlying_count"] == 2
+    assert car["observation_frequency_months"] == 3 and car["observation_count"] == 4
+    assert car["first_observation_date"] == date(2026, 4, 15) and car["last_observation_date"] == date(2027, 1, 15)
+    assert car["coupon_rate_pct_period"] == 0.03 and car["coupon_rate_pct_annualized"] == 0.12
+    assert car["protection_buffer_pct"] == 0.2 and car["downside_slope_factor"] == 1.25
+    assert car["risk_profile_bucket"] == "Buffered-Deep"
+    assert (car["has_autocall_flag"], car["is_capital_at_risk_flag"], car["normative_coupon_flag"]) == (1, 1, 1)
+    assert car["status"] == "active" and car["data_quality_warnings"] is None
+
+    assert par["coupon_rate_pct_period"] == 0.02 and par["coupon_rate_pct_annualized"] == 0.08
+    assert par["downside_slope_factor"] == 0.0 and par["risk_profile_bucket"] == "Protected"
+    assert (par["has_autocall_flag"], par["is_capital_at_risk_flag"], par["normative_coupon_flag"]) == (0, 0, 0)
+    assert par["data_quality_warnings"] == "INCONSISTENT_THRESHOLDS"
+
+    # Month-end effective date clamps to shorter months
+    assert bad["first_observation_date"] == date(2026, 2, 28) and bad["last_observation_date"] == date(2026, 5, 31)
+    assert bad["observation_frequency_months"] is None and bad["coupon_rate_pct_annualized"] is None
+    assert bad["underlying_count"] == 0 and bad["underlying_symbols"] is None
+    assert bad["risk_profile_bucket"] == "Unknown"
+    assert bad["data_quality_warnings"] == (
+        "MISSING_STRIKE;MISSING_AUTOCALL_LOGIC;MISSING_FREQ;UNKNOWN_CLASSIFICATION"
+    )
+    print("✓ rates, buffers, buckets, flags and data quality warnings match the dictionary")
+
+
+def test_refresh_rewrites_only_changed_and_removed_templates():
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'dw.db'}"
+        source = build_source(url)
+        materializer = ShelfProductMaterializer(url, batch_size=2)
+
+        first = materializer.refresh()
+        assert (first["refreshed"], first["deleted"], first["unchanged"], first["batches"]) == (3, 0, 0, 2)
+        materialized_at = {tid: row["materialized_at"] for tid, row in shelf(materializer).items()}
+
+        idle = materializer.refresh()
+        assert (idle["refreshed"], idle["deleted"], idle["unchanged"], idle["batches"]) == (0, 0, 3, 0)
+
+        # An edit that moves updated_at is picked up; a removed template is deleted
+        with source.begin() as conn:
+            conn.exec_driver_sql(
+                "UPDATE fcn_template SET coupon_rate_pct = 0.03, updated_at = '2026-10-02 09:00:00'"
+                " WHERE template_id = 'TPL-PAR'"
+            )
+            conn.exec_driver_sql("DELETE FROM fcn_template WHERE template_id = 'TPL-BAD'")
+        changed = materializer.refresh()
+        assert (changed["refreshed"], changed["deleted"], changed["unchanged"]) == (1, 1, 1)
+        rows = shelf(materializer)
+        assert sorted(rows) == ["TPL-CAR", "TPL-PAR"]
+        assert rows["TPL-PAR"]["coupon_rate_pct_annualized"] == 0.12
+        assert rows["TPL-CAR"]["materialized_at"] == materialized_at["TPL-CAR"], "unchanged rows are not rewritten"
+
+        full = materializer.refresh(full=True)
+        assert (full["refreshed"], full["unchanged"]) == (2, 0)
+        materializer.engine.dispose()
+        source.dispose()
+    print("✓ refresh rewrites new and changed templates, deletes removed ones and leaves the rest")
@@ -0,0 +1,114 @@
+"""
+MessagePack negotiation tests: request bodies decode by Content-Type and
+responses encode by Accept or `format`, with the same content either way.
+
+Serves the app on a throwaway SQLite database. Keyed bookings go through the
+idempotency middleware, so a replay can be requested in the other format.
+"""
+import asyncio
+import dataclasses
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from src.app.main import create_app
+from src.app.serialization import MSGPACK_MEDIA_TYPE, packb, unpackb
+from src.app.settings import Settings
+from src.infra.db import base
+from src.infra.db.models import LifecycleEventORM, TradeORM
+
+MSGPACK = {"Content-Type": MSGPACK_MEDIA_TYPE, "Accept": MSGPACK_MEDIA_TYPE}
+
+N1_PAYLOAD = json.loads((
+    Path(__file__).resolve().parents[1]
+    / "docs/business/ba/products/structured-notes/fcn/test-vectors/sample-payloads/fcn-v1.0-n1-payload.json"
+).read_text(encoding="utf-8"))
+
+
+def seed(session_factory) -> None:
+    """Insert three trades and two lifecycle events for TRD-0."""
+    with session_factory() as session:
+        for n in range(3):
+            session.add(TradeORM(
+                trade_id=f"TRD-{n}", template_id="TPL-A", spec_version="1.1.0",
+                trade_date=datetime(2025, 10, 10), maturity_date=datetime(2026, 10, 15),
+                notional=1000000, currency="USD", trade_params="{}",
+            ))
+        for month in (1, 4):
+            session.add(LifecycleEventORM(
+                trade_id="TRD-0", event_type="coupon_payment",
+                event_date=datetime(2026, month, 15), event_payload="{}",
+            ))
+        session.commit()
+
+
+def serve(requests):
+    """Send (method, path, kwargs) requests to the app; return the responses."""
+    import httpx
+
+    database = Path(tempfile.mkdtemp()) / "msgpack.db"
+    url = f"sqlite:///{database}"
+    base.Base.metadata.create_all(base.init_engine(url))
+    seed(base.SessionLocal)
+    app = create_app(dataclasses.replace(Settings.from_env(), database_url=url, traces_exporter="none"))
+
+    async def run():
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return [await client.request(method, path, **kwargs) for method, path, kwargs in requests]
+
+    try:
+        return asyncio.run(run())
+    finally:
+        database.unlink(missing_ok=True)
+
+
+def test_queries_answer_in_the_negotiated_format():
+    trades = "/v1/api/fcn/trades"
+    lifecycle = "/v1/api/fcn/trades/TRD-0/lifecycle"
+    responses = serve([
+        ("GET", trades, {}),
+        ("GET", trades, {"headers": {"Accept": MSGPACK_MEDIA_TYPE}}),
+        ("GET", trades, {"params": {"format": "msgpack"}}),
+        ("GET", trades, {"params": {"format": "json"}, "headers": {"Accept": MSGPACK_MEDIA_TYPE}}),
+        ("GET", lifecycle, {}),
+        ("GET", lifecycle, {"headers": {"Accept": "application/x-msgpack"}}),
+    ])
+    as_json, by_accept, by_format, format_wins, events_json, events_msgpack = responses
+
+    assert as_json.headers["content-type"].startswith("application/json")
+    for response in (by_accept, by_format, events_msgpack):
+        assert response.status_code == 200
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert unpackb(by_accept.content) == unpackb(by_format.content) == as_json.json()
+    assert len(as_json.json()["trades"]) == 3
+    assert format_wins.headers["content-type"].startswith("application/json"), "format overrides Accept"
+    assert unpackb(events_msgpack.content) == events_json.json()
+    print("✓ trade and lifecycle queries return the same content as JSON or MessagePack")
+
+
+def test_bookings_decode_msgpack_and_replay_in_either_format():
+    booking = dict(N1_PAYLOAD, trade_id="TRD-9")
+    first, replay_json, replay_msgpack, observation = serve([
+        ("POST", "/api/v1/trades", {"content": packb(booking), "headers": dict(MSGPACK, **{"Idempotency-Key": "k-1"})}),
+        # Same payload sent as JSON: same fingerprint, so a replay, not a conflict
+        ("POST", "/api/v1/trades", {"json": booking, "headers": {"Idempotency-Key": "k-1"}}),
+        ("POST", "/api/v1/trades", {"json": booking, "headers": {"Idempotency-Key": "k-1", "Accept": MSGPACK_MEDIA_TYPE}}),
+        ("POST", "/api/v1/observations", {"content": packb({"trade_id": "TRD-9"}), "headers": MSGPACK}),
+    ])
+
+    assert first.status_code == 201 and first.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    expected = {"trade_id": "TRD-001", "status": "booked", "message": "Trade booked successfully"}
+    assert unpackb(first.content) == expected
+
+    assert replay_json.status_code == 201 and replay_json.headers["X-Idempotency-Replay"] == "true"
+    assert replay_json.headers["content-type"].startswith("application/json")
+    assert replay_json.json() == expected
+    assert replay_msgpack.headers["X-Idempotency-Replay"] == "true"
+    assert replay_msgpack.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert unpackb(replay_msgpack.content) == expected
+
+    assert observation.status_code == 201 and unpackb(observation.content)["status"] == "recorded"
+    print("✓ MessagePack bookings are accepted, and their replays are served as JSON or MessagePack")
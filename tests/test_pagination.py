@@ -0,0 +1,133 @@
+"""
+Keyset pagination tests: cursors round-trip, tampered cursors are refused
+and the last page ends the walk.
+
+Cursor tests call the helpers directly; page walks go through the trade
+query endpoint on a throwaway SQLite database.
+"""
+import asyncio
+import base64
+import dataclasses
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from src.app.main import create_app
+from src.app.settings import Settings
+from src.infra.db import base
+from src.infra.db.models import TradeORM
+from src.infra.db.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+TRADES = 25
+
+
+def cursor_of(raw: bytes) -> str:
+    """Encode arbitrary bytes the way encode_cursor() does."""
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def test_cursor_round_trips():
+    for last_id in (0, 1, 7, 2**31, 2**63 - 1):
+        cursor = encode_cursor(last_id)
+        assert "=" not in cursor and "/" not in cursor and "+" not in cursor, cursor
+        assert decode_cursor(cursor) == last_id
+    assert decode_cursor(None) is None and decode_cursor("") is None
+    print("✓ cursors are unpadded URL-safe base64 and round-trip; no cursor means the first page")
+
+
+def test_tampered_cursors_are_rejected():
+    tampered = [
+        "not a cursor!",
+        "é",
+        cursor_of(b"not json"),
+        cursor_of(b"{}"),
+        cursor_of(b"[1]"),
+        cursor_of(b'"abc"'),
+        cursor_of(b'{"id":-1}'),
+        cursor_of(b'{"id":"5"}'),
+        cursor_of(b'{"id":1.5}'),
+        cursor_of(b'{"id":null}'),
+        cursor_of(b'{"id":true}'),
+        encode_cursor(5)[:-2],
+    ]
+    for cursor in tampered:
+        try:
+            decode_cursor(cursor)
+        except InvalidCursorError:
+            continue
+        raise AssertionError(f"tampered cursor accepted: {cursor!r}")
+    print(f"✓ {len(tampered)} tampered cursors raise InvalidCursorError")
+
+
+def seed(session_factory) -> None:
+    """Insert TRADES trades."""
+    with session_factory() as session:
+        for n in range(TRADES):
+            session.add(TradeORM(
+                trade_id=f"TRD-{n}", template_id="TPL-A", spec_version="1.1.0",
+                trade_date=datetime(2025, 10, 10), maturity_date=datetime(2026, 10, 15),
+                notional=1000000, currency="USD", trade_params="{}",
+            ))
+        session.commit()
+
+
+def walk_pages(limits, extra=()):
+    """Page through /v1/api/fcn/trades once per limit; return the pages and the extra responses."""
+    import httpx
+
+    database = Path(tempfile.mkdtemp()) / "pages.db"
+    url = f"sqlite:///{database}"
+    base.Base.metadata.create_all(base.init_engine(url))
+    seed(base.SessionLocal)
+    app = create_app(dataclasses.replace(Settings.from_env(), database_url=url, traces_exporter="none"))
+
+    async def walk(client, limit):
+        pages, cursor = [], None
+        while True:
+            params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+            page = (await client.get("/v1/api/fcn/trades", params=params)).json()
+            pages.append(page)
+            cursor = page["pagination"]["next_cursor"]
+            if cursor is None:
+                return pages
+
+    async def run():
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            walks = [await walk(client, limit) for limit in limits]
+            responses = [await client.get("/v1/api/fcn/trades", params=params) for params in extra]
+            return walks, responses
+
+    try:
+        return asyncio.run(run())
+    finally:
+        database.unlink(missing_ok=True)
+
+
+def test_pages_end_on_the_last_row():
+    past_end = encode_cursor(10**9)
+    (uneven, even), (tampered, garbled, beyond) = walk_pages(
+        [10, 5], extra=[{"cursor": cursor_of(b'{"id":true}')}, {"cursor": "not-base64!"}, {"cursor": past_end}]
+    )
+
+    for pages, sizes in ((uneven, [10, 10, 5]), (even, [5] * 5)):
+        assert [len(p["trades"]) for p in pages] == sizes, [len(p["trades"]) for p in pages]
+        assert [p["pagination"]["has_more"] for p in pages] == [True] * (len(sizes) - 1) + [False]
+        ids = [t["trade_id"] for p in pages for t in p["trades"]]
+        assert ids == [f"TRD-{n}" for n in range(TRADES)], ids
+
+    # A full last page (25 = 5 x 5) still ends the walk: no empty sixth page
+    assert even[-1]["pagination"] == {"limit": 5, "next_cursor": None, "has_more": False}
+
+    # Decoder details never reach the client
+    for response in (tampered, garbled):
+        assert response.status_code == 400
+        assert response.json()["error"] == {
+            "code": "VALIDATION_FAILED",
+            "message": "Invalid pagination cursor",
+            "details": {"parameter": "cursor"},
+        }, response.json()
+    assert beyond.status_code == 200
+    assert beyond.json() == {"trades": [], "pagination": {"limit": 20, "next_cursor": None, "has_more": False}}
+    print("✓ page walks return every trade once; the last page, even a full one, has no next_cursor")
@@ -0,0 +1,181 @@
+"""
+Parameter-definition cache tests: every table change is picked up on the next poll.
+
+Builds the table with the seeder's own migrations in a temporary SQLite file
+and drives polls with an injected clock. Edits share one `updated_at` value,
+as edits made within the same second do, so only the m0003 change counter can
+tell them apart. The concurrency tests check that racing readers share one
+poll and that a started cache polls in a worker thread, not in its readers.
+"""
+import asyncio
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, event
+
+from db.seeds.seed_fcn_v1_parameters import apply_migrations
+from src.infra.cache.parameter_definitions import ParameterDefinitionCache
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MIGRATIONS_DIR = REPO_ROOT / "db/migrations"
+UPDATED_AT = "2026-10-19 09:00:00"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def execute(db_path, sql, *params):
+    """Run one statement against the database file and commit."""
+    conn = sqlite3.connect(db_path)
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+def add_definition(db_path, name, max_value):
+    """Insert a 1.1.0 decimal parameter with a fixed updated_at."""
+    execute(
+        db_path,
+        "INSERT INTO parameter_definitions (name, data_type, required_flag, min_value, max_value,"
+        " product_type, spec_version, created_at, updated_at)"
+        " VALUES (?, 'decimal', 1, 0, ?, 'fcn', '1.1.0', ?, ?)",
+        name, max_value, UPDATED_AT, UPDATED_AT,
+    )
+
+
+def cache_over(db_path, migrations_dir=MIGRATIONS_DIR):
+    """Return (cache, clock) over a freshly migrated database file."""
+    conn, _ = apply_migrations(db_path, migrations_dir)
+    conn.close()
+    add_definition(db_path, "notional", 1_000_000)
+    add_definition(db_path, "coupon_rate_pa", 0.5)
+    clock = FakeClock()
+    cache = ParameterDefinitionCache(engine=create_engine(f"sqlite:///{db_path}"), poll_interval_seconds=30, clock=clock)
+    cache.load()
+    return cache, clock
+
+
+def test_in_place_update_within_the_same_second_reloads():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "params.db"
+        cache, clock = cache_over(db_path)
+        assert cache.get("fcn", "1.1.0", "coupon_rate_pa").max_value == 0.5
+
+        # Same row count, same MAX(id), same MAX(updated_at)
+        execute(db_path, "UPDATE parameter_definitions SET max_value = 0.25 WHERE name = 'coupon_rate_pa'")
+        clock.now = 10
+        assert cache.get("fcn", "1.1.0", "coupon_rate_pa").max_value == 0.5  # not due yet
+        clock.now = 31
+        assert cache.get("fcn", "1.1.0", "coupon_rate_pa").max_value == 0.25
+        assert cache.stats.loads == 2
+    print("✓ an in-place update that keeps COUNT/MAX(id)/MAX(updated_at) is reloaded on the next poll")
+
+
+def test_insert_delete_and_update_each_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "params.db"
+        cache, clock = cache_over(db_path)
+
+        add_definition(db_path, "strike_barrier_pct", 1.0)
+        clock.now += 31
+        assert cache.get("fcn", "1.1.0", "strike_barrier_pct") is not None
+
+        execute(db_path, "DELETE FROM parameter_definitions WHERE name = 'notional'")
+        clock.now += 31
+        assert cache.get("fcn", "1.1.0", "notional") is None
+
+        execute(db_path, "UPDATE parameter_definitions SET max_value = 0.9 WHERE name = 'strike_barrier_pct'")
+        clock.now += 31
+        assert cache.get("fcn", "1.1.0", "strike_barrier_pct").max_value == 0.9
+
+        # An unchanged table is polled but not reloaded
+        clock.now += 31
+        cache.index
+        assert cache.stats.loads == 4
+        assert cache.stats.polls == 4
+        assert len(cache.index) == 2
+    print("✓ insert, delete and update each swap in a new index; an idle poll does not")
+
+
+def test_table_without_change_counter_falls_back_to_row_stamp():
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = Path(tmp) / "migrations"
+        legacy.mkdir()
+        for migration in sorted(MIGRATIONS_DIR.glob("m*.sql"))[:2]:
+            (legacy / migration.name).write_text(migration.read_text(encoding="utf-8"), encoding="utf-8")
+        db_path = Path(tmp) / "params.db"
+        cache, clock = cache_over(db_path, legacy)
+
+        add_definition(db_path, "strike_barrier_pct", 1.0)
+        clock.now += 31
+        assert cache.get("fcn", "1.1.0", "strike_barrier_pct") is not None
+    print("✓ a database seeded before m0003 still reloads on inserts")
+
+
+def test_concurrent_readers_share_one_poll():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "params.db"
+        cache, clock = cache_over(db_path)
+        execute(db_path, "UPDATE parameter_definitions SET max_value = 0.25 WHERE name = 'coupon_rate_pa'")
+
+        # Slow every statement down so unguarded readers would overlap
+        event.listen(cache.engine, "before_cursor_execute", lambda *args: time.sleep(0.01))
+        clock.now = 31
+        start = threading.Barrier(8)
+
+        def read():
+            start.wait()
+            cache.index
+
+        readers = [threading.Thread(target=read) for _ in range(8)]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+
+        assert (cache.stats.polls, cache.stats.loads) == (1, 2)
+        assert cache.get("fcn", "1.1.0", "coupon_rate_pa").max_value == 0.25
+        cache.engine.dispose()
+    print("✓ eight readers racing past a due poll run one poll and one reload")
+
+
+def test_started_cache_polls_in_the_background():
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "params.db"
+        cache, _ = cache_over(db_path)
+        cache.clock = time.monotonic
+        cache.poll_interval_seconds = 0.05
+        threads = set()
+        event.listen(cache.engine, "engine_connect", lambda conn: threads.add(threading.get_ident()))
+
+        async def run():
+            cache.start()
+            try:
+                execute(db_path, "UPDATE parameter_definitions SET max_value = 0.25 WHERE name = 'coupon_rate_pa'")
+                time.sleep(0.1)
+                # Due, but readers of a started cache never poll
+                assert cache.get("fcn", "1.1.0", "coupon_rate_pa").max_value == 0.5
+                assert not threads
+                for _ in range(100):
+                    await asyncio.sleep(0.02)
+                    if cache.get("fcn", "1.1.0", "coupon_rate_pa").max_value == 0.25:
+                        break
+            finally:
+                await cache.stop()
+
+        asyncio.run(run())
+        assert cache.get("fcn", "1.1.0", "coupon_rate_pa").max_value == 0.25
+        assert threads and threading.get_ident() not in threads, "polls run off the event loop thread"
+        assert cache._poller is None
+        cache.engine.dispose()
+    print("✓ a started cache reloads from a worker thread while its readers only read")
@@ -0,0 +1,73 @@
+"""
+Parquet export tests: trade_params keys are mapped per spec version or kept.
+"""
+import json
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.infra.db.base import Base
+from src.infra.db.models import TradeORM
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+from src.infra.export.parquet_export import ParquetExporter  # noqa: E402
+
+NOW = datetime(2025, 10, 10, tzinfo=timezone.utc)
+
+
+def export_trades(trades):
+    """Export (trade_id, spec_version, trade_params) rows; return stats and rows by trade_id."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as session:
+        for trade_id, spec_version, params in trades:
+            session.add(TradeORM(
+                trade_id=trade_id, template_id="TPL-A", spec_version=spec_version,
+                trade_date=NOW, maturity_date=NOW, notional=1000000, currency="USD",
+                trade_params=params, created_at=NOW, updated_at=NOW,
+            ))
+        session.commit()
+
+    output = Path(tempfile.mkdtemp())
+    stats = ParquetExporter(factory, output).export(["fcn_trade"])["fcn_trade"]
+    rows = {}
+    for path in output.glob("fcn_trade/**/*.parquet"):
+        rows.update((row["trade_id"], row) for row in pq.read_table(path).to_pylist())
+    return stats, rows
+
+
+def test_params_follow_their_spec_version():
+    stats, rows = export_trades([
+        ("T-10", "1.0.0", json.dumps({"notional_amount": 5000000, "notional": 7, "desk": "EQD"})),
+        ("T-11", "1.1.0", json.dumps({"notional": 7000000, "notional_amount": 5, "trade_date": "2025-10-10"})),
+    ])
+    v10, v11 = rows["T-10"], rows["T-11"]
+
+    # v1.0 trades fill v1.0 columns only; v1.1 keys they carry are kept, not mapped
+    assert v10["param_notional_amount"] == 5000000 and v10["param_notional"] is None
+    assert json.loads(v10["param_extra"]) == {"notional": 7, "desk": "EQD"}
+    assert v11["param_notional"] == 7000000 and v11["param_notional_amount"] is None
+    assert json.loads(v11["param_extra"]) == {"notional_amount": 5}
+    assert stats["unmapped_params"] == 3
+    print("✓ trade_params map to their spec version's columns; other keys go to param_extra")
+
+
+def test_unconvertible_values_are_kept():
+    stats, rows = export_trades([
+        ("T-1", "1.1.0", json.dumps({"trade_date": "not-a-date", "notional": 1})),
+        ("T-2", "9.9.0", json.dumps({"notional": 1})),
+        ("T-3", "1.1.0", "not json"),
+    ])
+    assert rows["T-1"]["param_trade_date"] is None
+    assert json.loads(rows["T-1"]["param_extra"]) == {"trade_date": "not-a-date"}
+    assert json.loads(rows["T-2"]["param_extra"]) == {"notional": 1}  # unknown spec version
+    assert json.loads(rows["T-3"]["param_extra"]) == {"_raw": "not json"}
+    assert stats["coerce_errors"] == 2 and stats["unmapped_params"] == 1
+    print("✓ unconvertible values, unknown versions and invalid JSON are kept in param_extra")
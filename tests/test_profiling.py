@@ -0,0 +1,146 @@
+"""
+Profiling tests: the stack sampler, 1-in-K request selection and the admin
+token on /internal/profiling.
+
+Sampler tests run their own StackSampler against a busy thread; selection
+tests drive request() with an injected clock. Endpoint tests go through
+create_app() on a throwaway SQLite database.
+"""
+import asyncio
+import dataclasses
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from src.app.main import create_app
+from src.app.settings import Settings
+from src.observability.profiling import StackSampler, phase, profiler
+
+TOKEN = "s3cret-admin-token"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def spin_until_profiled(done: threading.Event) -> None:
+    """Burn CPU in a recognisable frame until told to stop."""
+    while not done.is_set():
+        sum(range(1000))
+
+
+def test_sampler_collects_collapsed_stacks_of_busy_threads():
+    sampler = StackSampler()
+    done = threading.Event()
+    worker = threading.Thread(target=spin_until_profiled, args=(done,))
+    worker.start()
+    try:
+        session = sampler.start(5.0, interval_seconds=0.005)
+        time.sleep(0.2)
+        sampler.stop()
+    finally:
+        done.set()
+        worker.join()
+
+    assert session.samples > 0
+    lines = sampler.collapsed().splitlines()
+    hot = [line for line in lines if "spin_until_profiled (tests/test_profiling.py:" in line]
+    assert hot, lines
+    stack, count = hot[0].rsplit(" ", 1)
+    assert int(count) > 0 and stack.split(";")[-1].startswith("spin_until_profiled")
+    assert not sampler.active and sampler.snapshot()["session"]["running"] is False
+    print(f"✓ sampler took {session.samples} samples; the busy thread's frame is in the collapsed stacks")
+
+
+def test_one_in_k_profiles_every_kth_request_only():
+    clock = FakeClock()
+    sampler = StackSampler(clock=clock)
+    sampler.start(60.0, one_in=3, interval_seconds=1.0)
+    try:
+        for _ in range(7):
+            with sampler.request():
+                with phase("handler"):
+                    pass
+        session = sampler.session
+        assert session.requests == 3, "requests 1, 4 and 7 of 7"
+        assert session.phases["handler"].count == 3
+        assert session.phases["middleware"].count == 3
+
+        # Past the deadline nothing is profiled and phase() is a no-op
+        clock.now = 61.0
+        with sampler.request():
+            with phase("handler"):
+                pass
+        assert session.requests == 3 and not sampler.active
+    finally:
+        sampler.stop()
+    print("✓ one_in=3 profiles 3 of 7 requests, and none after the session ends")
+
+
+def test_one_in_k_samples_only_while_a_selected_request_runs():
+    sampler = StackSampler()
+    sampler.start(5.0, one_in=2, interval_seconds=0.005)
+    try:
+        time.sleep(0.1)
+        assert sampler.session.samples == 0, "no selected request in flight"
+        with sampler.request():
+            time.sleep(0.1)
+        assert sampler.session.samples > 0
+    finally:
+        sampler.stop()
+    print("✓ in 1-in-K mode the sampler is idle until a selected request is in flight")
+
+
+def call_profiling(token, requests):
+    """Send (method, path, headers) to an app with the given admin token; return the responses."""
+    import httpx
+
+    database = Path(tempfile.mkdtemp()) / "profiling.db"
+    settings = dataclasses.replace(
+        Settings.from_env(), database_url=f"sqlite:///{database}", traces_exporter="none",
+        profiling_admin_token=token,
+    )
+    app = create_app(settings)
+
+    async def run():
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return [await client.request(method, path, headers=headers) for method, path, headers in requests]
+
+    try:
+        return asyncio.run(run())
+    finally:
+        profiler.stop()
+        database.unlink(missing_ok=True)
+
+
+def test_endpoints_require_the_configured_admin_token():
+    disabled = call_profiling(None, [
+        ("GET", "/internal/profiling/phases", {"X-Admin-Token": TOKEN}),
+        ("POST", "/internal/profiling/start", {}),
+    ])
+    for response in disabled:
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "PROFILING_DISABLED"
+
+    missing, wrong, start, stop = call_profiling(TOKEN, [
+        ("GET", "/internal/profiling/phases", {}),
+        ("GET", "/internal/profiling/stacks", {"X-Admin-Token": TOKEN + "x"}),
+        ("POST", "/internal/profiling/start?seconds=5", {"X-Admin-Token": TOKEN}),
+        ("POST", "/internal/profiling/stop", {"X-Admin-Token": TOKEN}),
+    ])
+    for response in (missing, wrong):
+        assert response.status_code == 403
+        assert response.json()["error"]["code"] == "ADMIN_TOKEN_INVALID"
+    assert start.status_code == 202 and start.json()["seconds"] == 5.0
+    assert stop.status_code == 200 and stop.json()["session"]["running"] is False
+    assert TOKEN not in repr(Settings(profiling_admin_token=TOKEN))
+    print("✓ profiling is 404 without a configured token, 403 without the right header, open with it")
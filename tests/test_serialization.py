@@ -0,0 +1,20 @@
+"""
+Serialization tests: Decimal amounts have one wire type at any magnitude.
+"""
+from decimal import Decimal
+
+from src.app.serialization import dumps, loads, packb, unpackb
+
+
+def test_decimal_is_a_string_with_column_scale():
+    amounts = {
+        "1000000.5000": Decimal("1000000.5000"),
+        "0.0001": Decimal("0.0001"),
+        "99999999999999.9999": Decimal("99999999999999.9999"),  # DECIMAL(18,4) max
+        "-2500.0000": Decimal("-2500.0000"),
+        "1000000": Decimal("1E+6"),
+    }
+    for expected, amount in amounts.items():
+        assert loads(dumps({"notional": amount})) == {"notional": expected}
+        assert unpackb(packb({"notional": amount})) == {"notional": expected}
+    print(f"✓ {len(amounts)} Decimal amounts encode as fixed-point strings in JSON and MessagePack")
@@ -0,0 +1,94 @@
+"""
+Prefork server metrics tests: /metrics covers every worker.
+
+Starts `python -m src.app.server --workers 2` on a throwaway SQLite
+database, sends concurrent requests, and checks that every scrape (each
+answered by whichever worker accepts it) reports all of them.
+"""
+import asyncio
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+from src.infra.db.base import Base
+import src.infra.db.models  # noqa: F401  (registers tables)
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+REQUESTS = 40
+
+HEALTH_REQUESTS = re.compile(
+    r'^fcn_http_requests_total\{method="GET",route="/health",status="200"\} (\S+)$', re.M
+)
+POOL_PIDS = re.compile(r'^fcn_db_pool_size\{pid="(\d+)",pool="primary"\}', re.M)
+
+
+def free_port() -> int:
+    """Return a port nothing is listening on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_healthy(client, process) -> None:
+    """Poll /health until the server answers."""
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited during start-up (code {process.returncode})")
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("server not healthy after 60 s")
+
+
+def test_scrapes_sum_all_workers():
+    import httpx
+
+    database = Path(tempfile.mkdtemp()) / "server.db"
+    url = f"sqlite:///{database}"
+    Base.metadata.create_all(create_engine(url))
+    port = free_port()
+    env = {key: value for key, value in os.environ.items() if key != "PROMETHEUS_MULTIPROC_DIR"}
+    env.update(DATABASE_URL=url, OTEL_TRACES_EXPORTER="none", PYTHONPATH=str(REPO_ROOT))
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.app.server", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", "2", "--log-level", "warning"],
+        cwd=REPO_ROOT, env=env,
+    )
+
+    async def run():
+        # A fresh connection per request, so the workers share the load
+        limits = httpx.Limits(max_keepalive_connections=0)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits) as client:
+            await wait_healthy(client, process)
+            statuses = await asyncio.gather(*(client.get("/health") for _ in range(REQUESTS)))
+            assert {r.status_code for r in statuses} == {200}
+            return [(await client.get("/metrics")).text for _ in range(6)]
+
+    try:
+        scrapes = asyncio.run(run())
+    finally:
+        process.send_signal(signal.SIGTERM)
+        exit_code = process.wait(timeout=60)
+        database.unlink(missing_ok=True)
+
+    assert exit_code == 0
+    pids = set()
+    for text in scrapes:
+        counts = HEALTH_REQUESTS.findall(text)
+        assert counts and float(counts[0]) == REQUESTS, f"scrape saw {counts} of {REQUESTS} /health requests"
+        pids.update(POOL_PIDS.findall(text))
+    assert pids, "scrape-time pool gauges carry no pid label"
+    print(f"✓ every scrape sums {REQUESTS} requests across workers (answered by pids {sorted(pids)})")
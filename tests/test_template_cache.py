@@ -0,0 +1,329 @@
+"""
+Template cache tests: stale entries never survive a poll.
+
+Runs against in-memory SQLite with an injected clock, so each test decides
+exactly when the cache polls. Races are reproduced by running
+database changes and polls from inside a load.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine, delete, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.domain.services.templates import TemplateValidationError
+from src.infra.cache.template_cache import TemplateCache
+from src.infra.db.base import Base
+from src.infra.db.models import TemplateORM
+from src.validation.service import ValidationService
+
+T0 = datetime(2025, 10, 10, 9, 0, tzinfo=timezone.utc)
+
+# A complete, valid v1.0 trade: stored as a template's defaults for booking tests
+N1_PAYLOAD = (
+    Path(__file__).resolve().parents[1]
+    / "docs/business/ba/products/structured-notes/fcn/test-vectors/sample-payloads/fcn-v1.0-n1-payload.json"
+).read_text(encoding="utf-8")
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def session_factory():
+    """Return a sessionmaker over a fresh in-memory database."""
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def add_template(factory, template_id, minute, name="FCN", spec_version="1.1.0", parameters="{}"):
+    """Insert a template row updated `minute` minutes after T0."""
+    with factory() as session:
+        session.add(TemplateORM(
+            template_id=template_id, name=name, spec_version=spec_version, status="active",
+            issuer="SAMPLE_BANK_01", parameters=parameters,
+            created_at=T0, updated_at=T0 + timedelta(minutes=minute),
+        ))
+        session.commit()
+
+
+def rename_template(factory, template_id, name, minute):
+    """Update a template row's name and updated_at."""
+    with factory() as session:
+        session.execute(update(TemplateORM).where(TemplateORM.template_id == template_id).values(
+            name=name, updated_at=T0 + timedelta(minutes=minute),
+        ))
+        session.commit()
+
+
+def delete_template(factory, template_id):
+    """Delete a template row."""
+    with factory() as session:
+        session.execute(delete(TemplateORM).where(TemplateORM.template_id == template_id))
+        session.commit()
+
+
+def new_cache(factory, **kwargs):
+    """Return (cache, clock) with the first poll already done."""
+    clock = FakeClock()
+    cache = TemplateCache(session_factory=factory, poll_interval_seconds=5.0, clock=clock, **kwargs)
+    cache.get("missing")  # first poll
+    return cache, clock
+
+
+def test_load_racing_a_poll_is_not_cached():
+    factory = session_factory()
+    add_template(factory, "TPL-A", 0, name="v1")
+    cache, clock = new_cache(factory)
+
+    load = cache._load
+
+    def racing_load(template_id):
+        # The row is read, then updated and polled before the load returns
+        template = load(template_id)
+        rename_template(factory, template_id, "v2", 1)
+        clock.now += 10
+        cache._maybe_poll()
+        return template
+
+    cache._load = racing_load
+    assert cache.get("TPL-A").name == "v1"  # the caller still gets its read
+    cache._load = load
+
+    assert cache.get("TPL-A").name == "v2", "stale load was cached after the poll"
+    print("✓ load overlapping an evicting poll is not cached")
+
+
+def test_delete_plus_insert_evicts_deleted_template():
+    factory = session_factory()
+    add_template(factory, "TPL-A", 0)
+    cache, clock = new_cache(factory)
+    assert cache.get("TPL-A") is not None
+
+    # Same row count, and SQLite reuses the deleted rowid
+    delete_template(factory, "TPL-A")
+    add_template(factory, "TPL-B", 0)
+    clock.now += 10
+
+    assert cache.get("TPL-A") is None, "deleted template still served from cache"
+    assert cache.get("TPL-B") is not None
+    print("✓ delete plus insert in one poll window evicts the deleted template")
+
+
+def test_deleted_template_is_evicted():
+    factory = session_factory()
+    add_template(factory, "TPL-A", 0)
+    add_template(factory, "TPL-B", 1)
+    cache, clock = new_cache(factory)
+    assert cache.get("TPL-A") is not None and cache.get("TPL-B") is not None
+
+    delete_template(factory, "TPL-A")
+    clock.now += 10
+
+    assert cache.get("TPL-A") is None
+    assert cache.get("TPL-B") is not None
+    assert cache.stats.invalidations == 1
+    print("✓ deleted template is evicted; others stay cached")
+
+
+def test_updated_template_is_evicted_after_poll_interval():
+    factory = session_factory()
+    add_template(factory, "TPL-A", 0, name="v1")
+    cache, clock = new_cache(factory)
+    assert cache.get("TPL-A").name == "v1"
+
+    rename_template(factory, "TPL-A", "v2", 1)
+    assert cache.get("TPL-A").name == "v1"  # within the poll interval
+    clock.now += 10
+    assert cache.get("TPL-A").name == "v2"
+    print("✓ updated template is evicted once the poll interval elapses")
+
+
+def test_validator_rejects_invalid_template():
+    factory = session_factory()
+    add_template(factory, "TPL-OLD", 0, spec_version="0.9.0")
+    cache, _ = new_cache(factory, validator=ValidationService().validate_template)
+    try:
+        cache.get("TPL-OLD")
+    except TemplateValidationError as e:
+        assert "0.9.0" in str(e)
+    else:
+        raise AssertionError("template with unknown spec version was accepted")
+    assert cache.snapshot()["size"] == 0
+    print("✓ validator rejects a template with an unknown spec version")
+
+
+def test_invalidate_evicts_and_bumps_generation():
+    factory = session_factory()
+    add_template(factory, "TPL-A", 0)
+    add_template(factory, "TPL-B", 1)
+    cache, _ = new_cache(factory)
+    cache.get("TPL-A")
+    cache.get("TPL-B")
+    generation = cache._generation
+
+    cache.invalidate("TPL-A")
+    assert cache._generation == generation + 1
+    cache.invalidate("TPL-X")  # not cached: nothing evicted, generation still moves
+    assert cache._generation == generation + 2 and cache.stats.invalidations == 1
+    assert cache.get("TPL-A") is not None and cache.get("TPL-B") is not None
+    assert cache.stats.loads == 3, "only the evicted template is reloaded"
+
+    cache.invalidate()
+    assert cache.snapshot()["size"] == 0 and cache.stats.invalidations == 3
+    print("✓ invalidate() evicts one or all templates and bumps the generation every time")
+
+
+def test_load_racing_an_invalidate_is_not_cached():
+    factory = session_factory()
+    add_template(factory, "TPL-A", 0, name="v1")
+    cache, _ = new_cache(factory)
+
+    load = cache._load
+
+    def racing_load(template_id):
+        # A write path updates the row and invalidates while this load is in flight
+        template = load(template_id)
+        rename_template(factory, template_id, "v2", 1)
+        cache.invalidate(template_id)
+        return template
+
+    cache._load = racing_load
+    assert cache.get("TPL-A").name == "v1"
+    cache._load = load
+
+    assert cache.snapshot()["size"] == 0, "load overlapping an invalidate was cached"
+    assert cache.get("TPL-A").name == "v2"
+    print("✓ load overlapping an invalidate() is returned but not cached")
+
+
+def test_poll_bumps_generation_once_per_interval():
+    factory = session_factory()
+    add_template(factory, "TPL-A", 0)
+    cache, clock = new_cache(factory)
+    generation = cache._generation
+
+    cache.get("TPL-A")
+    clock.now += 4.9
+    cache.get("TPL-A")
+    assert cache._generation == generation and cache.stats.polls == 1
+
+    clock.now += 0.1
+    cache.get("TPL-A")
+    assert cache._generation == generation + 1 and cache.stats.polls == 2
+    assert cache.stats.loads == 1, "an unchanged template was evicted by the poll"
+    print("✓ polls bump the generation once per interval and keep unchanged templates")
+
+
+def test_least_recently_used_template_is_dropped():
+    factory = session_factory()
+    for n, template_id in enumerate(("TPL-A", "TPL-B", "TPL-C")):
+        add_template(factory, template_id, n)
+    cache, _ = new_cache(factory, max_entries=2)
+
+    cache.get("TPL-A")
+    cache.get("TPL-B")
+    cache.get("TPL-A")  # B is now least recently used
+    cache.get("TPL-C")
+    assert list(cache._entries) == ["TPL-A", "TPL-C"]
+    hits = cache.stats.hits
+    cache.get("TPL-A")
+    assert cache.stats.hits == hits + 1
+    print("✓ the least recently used template is dropped at max_entries")
+
+
+def test_booking_resolves_template_through_cache():
+    import dataclasses
+    import tempfile
+
+    import httpx
+
+    from src.app.main import create_app
+    from src.app.settings import Settings
+    from src.infra.db.base import SessionLocal, init_engine
+
+    database = Path(tempfile.mkdtemp()) / "templates.db"
+    url = f"sqlite:///{database}"
+    Base.metadata.create_all(init_engine(url))
+    add_template(SessionLocal, "TPL-A", 0, spec_version="1.0.0", parameters=N1_PAYLOAD)
+    app = create_app(dataclasses.replace(Settings.from_env(), database_url=url, traces_exporter="none"))
+
+    async def book(client, body, key=None):
+        headers = {"Idempotency-Key": key} if key else {}
+        response = await client.post("/api/v1/trades", json=body, headers=headers)
+        return response.status_code, response.json()
+
+    async def run():
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            return [
+                await book(client, {"template_id": "TPL-A"}),
+                # Keyed: the idempotency middleware reads the body first
+                await book(client, {"template_id": "TPL-A"}, key="book-1"),
+                await book(client, {"template_id": "TPL-X"}),
+            ]
+
+    try:
+        first, second, unknown = asyncio.run(run())
+    finally:
+        database.unlink(missing_ok=True)
+
+    assert first[0] == 201 and second[0] == 201
+    assert unknown[0] == 422 and unknown[1]["error"]["code"] == "UNKNOWN_TEMPLATE"
+    stats = app.state.template_cache.snapshot()
+    assert stats["hits"] >= 1 and stats["loads"] == 1, stats
+    print("✓ booking resolves template_id through the cache (unknown -> 422)")
+
+
+def test_undecodable_booking_body_is_400():
+    import dataclasses
+    import tempfile
+
+    import httpx
+
+    from src.app.main import create_app
+    from src.app.settings import Settings
+    from src.infra.db.base import init_engine
+
+    database = Path(tempfile.mkdtemp()) / "templates.db"
+    url = f"sqlite:///{database}"
+    Base.metadata.create_all(init_engine(url))
+    app = create_app(dataclasses.replace(Settings.from_env(), database_url=url, traces_exporter="none"))
+    bodies = [
+        (b"", "application/json"),
+        (b'{"template_id": ', "application/json"),
+        (b"", "application/msgpack"),
+        (b"\xc1", "application/msgpack"),          # reserved type byte
+        (b"\x81\xa1a", "application/msgpack"),     # truncated map
+    ]
+
+    async def run():
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            responses = []
+            for body, content_type in bodies:
+                responses.append(await client.post(
+                    "/api/v1/trades", content=body, headers={"Content-Type": content_type}
+                ))
+            return responses
+
+    try:
+        responses = asyncio.run(run())
+    finally:
+        database.unlink(missing_ok=True)
+
+    for (body, content_type), response in zip(bodies, responses):
+        assert response.status_code == 400, (body, content_type, response.status_code)
+        assert response.json()["error"]["code"] == "INVALID_BODY"
+    print(f"✓ {len(bodies)} empty or malformed JSON/MessagePack booking bodies -> 400 INVALID_BODY")
@@ -0,0 +1,57 @@
+"""
+Tracing tests: every app records spans on its own provider.
+
+Builds two apps one after the other in one process (memory exporter,
+throwaway SQLite databases) and checks each one's exporter receives the
+request, idempotency store, repository, SQL and validation spans.
+"""
+import asyncio
+import dataclasses
+import json
+import tempfile
+from pathlib import Path
+
+from src.app.main import create_app
+from src.app.settings import Settings
+from src.infra.db.base import Base, init_engine
+import src.infra.db.models  # noqa: F401  (registers tables)
+
+N1_PAYLOAD = json.loads((
+    Path(__file__).resolve().parents[1]
+    / "docs/business/ba/products/structured-notes/fcn/test-vectors/sample-payloads/fcn-v1.0-n1-payload.json"
+).read_text(encoding="utf-8"))
+
+
+def traced_app_spans(name: str):
+    """Serve a booking (which is validated) and a trade listing; return span names."""
+    import httpx
+
+    database = Path(tempfile.mkdtemp()) / f"{name}.db"
+    url = f"sqlite:///{database}"
+    Base.metadata.create_all(init_engine(url))
+    app = create_app(dataclasses.replace(Settings.from_env(), database_url=url, traces_exporter="memory"))
+
+    async def run():
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            booked = await client.post("/api/v1/trades", json=N1_PAYLOAD, headers={"Idempotency-Key": name})
+            listed = await client.get("/v1/api/fcn/trades")
+            return booked.status_code, listed.status_code
+
+    try:
+        assert asyncio.run(run()) == (201, 200)
+    finally:
+        database.unlink(missing_ok=True)
+    return {span.name for span in app.state.tracing.exporter.get_finished_spans()}
+
+
+def test_second_app_records_spans():
+    expected = {"http.request", "idempotency.store.get", "idempotency.store.set", "repository.query",
+                "validation.run"}
+    for name in ("first", "second"):
+        spans = traced_app_spans(name)
+        assert expected <= spans, f"{name} app missing spans: {expected - spans}"
+        # Per-statement spans from the SQLAlchemy engine tracer (named by operation)
+        assert any(span.startswith(("SELECT", "INSERT")) for span in spans), f"{name} app: no SQL spans in {spans}"
+    print("✓ two apps in one process each record request, store, repository, SQL and validation spans")
@@ -0,0 +1,88 @@
+"""
+Trade query NDJSON tests: streams use the request's database session.
+
+Serves the app on a throwaway SQLite database with get_db overridden to
+record the sessions it hands out, and checks each NDJSON export streams
+every row through that one session and closes it.
+"""
+import asyncio
+import dataclasses
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+from sqlalchemy import event
+
+from src.app.main import create_app
+from src.app.settings import Settings
+from src.infra.db import base
+from src.infra.db.models import LifecycleEventORM, TradeORM
+
+TRADES = 25
+EVENTS = 12
+
+
+def seed(session_factory) -> None:
+    """Insert TRADES trades and EVENTS lifecycle events for TRD-0."""
+    with session_factory() as session:
+        for n in range(TRADES):
+            session.add(TradeORM(
+                trade_id=f"TRD-{n}", template_id="TPL-A", spec_version="1.1.0",
+                trade_date=datetime(2025, 10, 10), maturity_date=datetime(2026, 10, 15),
+                notional=1000000, currency="USD", trade_params="{}",
+            ))
+        for n in range(EVENTS):
+            session.add(LifecycleEventORM(
+                trade_id="TRD-0", event_type="coupon_payment",
+                event_date=datetime(2026, 1 + n % 12, 15), event_payload="{}",
+            ))
+        session.commit()
+
+
+def test_ndjson_streams_through_request_session():
+    import httpx
+
+    database = Path(tempfile.mkdtemp()) / "trades.db"
+    url = f"sqlite:///{database}"
+    base.Base.metadata.create_all(base.init_engine(url))
+    seed(base.SessionLocal)
+    app = create_app(dataclasses.replace(Settings.from_env(), database_url=url, traces_exporter="none"))
+
+    handed_out = []
+
+    def tracking_get_db():
+        session = base.SessionLocal()
+        record = {"queries": 0, "closed": False}
+        event.listen(session, "do_orm_execute", lambda state: record.update(queries=record["queries"] + 1))
+        handed_out.append(record)
+        try:
+            yield session
+        finally:
+            session.close()
+            record["closed"] = True
+
+    app.dependency_overrides[base.get_db] = tracking_get_db
+
+    async def run():
+        async with app.router.lifespan_context(app), httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            trades = await client.get("/v1/api/fcn/trades", params={"format": "ndjson"})
+            events = await client.get("/v1/api/fcn/trades/TRD-0/lifecycle", headers={"Accept": "application/x-ndjson"})
+            return trades, events
+
+    try:
+        trades, events = asyncio.run(run())
+    finally:
+        database.unlink(missing_ok=True)
+
+    assert trades.status_code == 200 and events.status_code == 200
+    assert [orjson.loads(line)["trade_id"] for line in trades.content.splitlines()] == [
+        f"TRD-{n}" for n in range(TRADES)
+    ]
+    assert len(events.content.splitlines()) == EVENTS
+    # Each stream queried through the get_db session, not a session of its own
+    assert len(handed_out) == 2, handed_out
+    assert all(record["queries"] >= 1 and record["closed"] for record in handed_out), handed_out
+    print("✓ NDJSON exports stream every row through the request's get_db session, then close it")
@@ -0,0 +1,83 @@
+"""
+Validation tests: every sample payload validates as its name says.
+"""
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+from src.observability.metrics import REGISTRY
+from src.validation.issuers import IssuerWhitelist
+from src.validation.service import ValidationService
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SAMPLE_DIR = REPO_ROOT / "docs/business/ba/products/structured-notes/fcn/test-vectors/sample-payloads"
+
+
+def sample_payloads():
+    """Return (name, payload) for every v1.0 sample payload."""
+    return [
+        (path.name, json.loads(path.read_text(encoding="utf-8")))
+        for path in sorted(SAMPLE_DIR.glob("*.json"))
+    ]
+
+
+def test_valid_samples_have_no_violations():
+    service = ValidationService()
+    valid = [(name, payload) for name, payload in sample_payloads() if "invalid" not in name]
+    assert valid, "no valid sample payloads found"
+    for name, payload in valid:
+        result = service.validate(payload, "1.0.0")
+        assert result.violations == [], f"{name}: {result.violations}"
+    print(f"✓ {len(valid)} valid v1.0 sample payloads have no violations")
+
+
+def test_invalid_sample_is_rejected():
+    service = ValidationService()
+    for name, payload in sample_payloads():
+        if "invalid" in name:
+            rule_ids = {v.rule_id for v in service.validate(payload, "1.0.0").violations}
+            assert {"BR-014", "BR-015"} <= rule_ids, f"{name}: {rule_ids}"
+    print("✓ invalid v1.0 sample payload reports BR-014 and BR-015")
+
+
+def test_violations_are_counted_by_code():
+    def count(code):
+        return REGISTRY.get_sample_value("fcn_validation_errors_total", {"code": code}) or 0.0
+
+    service = ValidationService()
+    for name, payload in sample_payloads():
+        if "invalid" in name:
+            before = {code: count(code) for code in ("BR-014", "BR-015")}
+            service.validate(payload, "1.0.0")
+            assert all(count(code) > before[code] for code in before), f"{name}: violations not counted"
+    print("✓ violations are counted in fcn_validation_errors_total by rule code")
+
+
+def test_observation_on_maturity_violates_br014():
+    service = ValidationService()
+    name, payload = next((n, p) for n, p in sample_payloads() if "invalid" not in n)
+
+    on_maturity = dict(payload, observation_dates=payload["observation_dates"][:-1] + [payload["maturity_date"]])
+    violations = service.validate(on_maturity, "1.0.0").violations
+    assert [v.constraint for v in violations if v.rule_id == "BR-014"] == ["before_maturity"], f"{name}: {violations}"
+
+    day_before = (date.fromisoformat(payload["maturity_date"]) - timedelta(days=1)).isoformat()
+    before_maturity = dict(payload, observation_dates=payload["observation_dates"][:-1] + [day_before])
+    violations = service.validate(before_maturity, "1.0.0").violations
+    assert not [v for v in violations if v.rule_id == "BR-014"], f"{name}: {violations}"
+    print("✓ an observation on maturity_date violates BR-014; the day before does not")
+
+
+def test_issuer_outside_whitelist_violates_br022():
+    whitelist = IssuerWhitelist()
+    assert "HSBC-UK-001" in whitelist and "SAMPLE_BANK_01" not in whitelist
+    service = ValidationService(issuers=whitelist)
+    name, payload = next((n, p) for n, p in sample_payloads() if "invalid" not in n)
+
+    violations = service.validate(dict(payload, issuer="SAMPLE_BANK_01"), "1.0.0").violations
+    assert [(v.rule_id, v.path) for v in violations if v.rule_id == "BR-022"] == [("BR-022", "$.issuer")]
+    assert not [v for v in service.validate(dict(payload, issuer="HSBC-UK-001"), "1.0.0").violations
+                if v.rule_id == "BR-022"], name
+    assert not [v for v in service.with_tracer(service.tracer).validate(payload, "1.0.0").violations
+                if v.rule_id == "BR-022"], "a payload without an issuer is the schema's concern"
+    print("✓ an issuer outside the whitelist violates BR-022; a whitelisted or absent issuer does not")
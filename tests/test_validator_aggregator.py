@@ -0,0 +1,69 @@
+"""
+Validator aggregator tests: in-process phases report what subprocesses do.
+
+Runs every phase over the repository's FCN tree in-process (thread and
+fork pools, one shared corpus) and as one interpreter per phase, and
+checks the gate between Phase 0-2 and Phase 3 with stubbed phase results.
+"""
+import contextlib
+import io
+from pathlib import Path
+
+from aggregator import PHASES, ValidatorAggregator
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FCN_BASE_DIR = REPO_ROOT / "docs/business/ba/products/structured-notes/fcn"
+
+
+def run_all(**kwargs):
+    """Run every phase quietly; return {phase: result}."""
+    aggregator = ValidatorAggregator(FCN_BASE_DIR, **kwargs)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return aggregator, {result["phase"]: result for result in aggregator.run_all()}
+
+
+def without_timing(output):
+    """Drop wall-clock lines, the only output allowed to differ between runs."""
+    return [line for line in output.splitlines() if not line.startswith("Elapsed:")]
+
+
+def test_in_process_matches_subprocess():
+    _, expected = run_all(mode="subprocess")
+    for executor in ("thread", "process"):
+        aggregator, results = run_all(mode="in-process", executor=executor)
+        assert sorted(results) == [spec["phase"] for spec in PHASES]
+        for phase, result in results.items():
+            assert result["passed"] == expected[phase]["passed"], (executor, phase)
+            assert without_timing(result["output"]) == without_timing(expected[phase]["output"]), (
+                f"{executor}: phase {phase} output differs")
+    assert len(aggregator.corpus) > 0, "in-process run did not load the shared corpus"
+    print("✓ thread and fork pools report the same pass/fail and output per phase as subprocesses")
+
+
+def gated_run(failing):
+    """Run a gated aggregation whose phases pass unless listed in `failing`."""
+    aggregator = ValidatorAggregator(FCN_BASE_DIR, gated=True)
+    ran = []
+
+    def run_phase(phase):
+        ran.append(phase)
+        return {"phase": phase, "name": PHASES[phase]["name"], "passed": phase not in failing,
+                "output": "", "elapsed": 0.0}
+
+    aggregator.run_phase = run_phase
+    aggregator.load_corpus = lambda: None
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = {result["phase"]: result for result in aggregator.run_all()}
+    return sorted(ran), results
+
+
+def test_gate_skips_phase_3_until_phases_0_to_2_pass():
+    ran, results = gated_run(failing={1})
+    assert ran == [0, 1, 2, 4], ran
+    assert results[3].get("skipped") and not results[3]["passed"]
+    assert "phase(s) 1 failed" in results[3]["output"]
+
+    ran, results = gated_run(failing={4})
+    assert ran == [0, 1, 2, 3, 4], ran
+    assert results[3]["passed"] and not results[3].get("skipped")
+    print("✓ --gated skips Phase 3 when a Phase 0-2 prerequisite fails and runs it otherwise")
@@ -0,0 +1,74 @@
+"""
+Validator watch mode tests: changed files map to the phases they feed and
+only those phases are re-run.
+
+Maps edits across the FCN tree to phases, then runs the aggregator over a
+copy of the tree, edits files and checks snapshot() notices the change and
+run_changed() re-validates only the affected phases.
+"""
+import contextlib
+import io
+import shutil
+import tempfile
+from pathlib import Path
+
+from aggregator import ValidatorAggregator
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FCN_BASE_DIR = REPO_ROOT / "docs/business/ba/products/structured-notes/fcn"
+
+
+def test_changed_files_map_to_phases():
+    aggregator = ValidatorAggregator(FCN_BASE_DIR, incremental=True)
+    base = FCN_BASE_DIR.resolve()
+    cases = {
+        "validators/logic_validator.py": [0, 1, 2, 3, 4],
+        "test-vectors/fcn-v1.0-base-mem-baseline.md": [1, 2, 3, 4],
+        "manifest.yaml": [1, 3],
+        "schemas/fcn-v1.0-parameters.schema.json": [2],
+        "data/issuer_whitelist.json": [2],
+        "specs/SUPERSEDED_INDEX.md": [0],
+        # Linked from test vectors through related:, so their checks are stale too
+        "specs/fcn-v1.1.0.md": [0, 2, 4],
+        "business-rules.md": [2, 4],
+        "glossary.md": [],
+    }
+    for relative, phases in cases.items():
+        assert aggregator.affected_phases([base / relative]) == phases, relative
+
+    combined = aggregator.affected_phases([base / "manifest.yaml", base / "schemas/fcn-v1.0-schema.json"])
+    assert combined == [1, 2, 3]
+    print("✓ changed files map to the phases that read them")
+
+
+def test_run_changed_reruns_only_affected_phases():
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp) / "fcn"
+        shutil.copytree(FCN_BASE_DIR, base, ignore=shutil.ignore_patterns("__pycache__", "validation-report.txt"))
+        aggregator = ValidatorAggregator(base, incremental=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            baseline = {result["phase"]: result for result in aggregator.run_all()}
+
+        before = aggregator.snapshot()
+        spec = base / "specs" / "SUPERSEDED_INDEX.md"
+        spec.write_text(spec.read_text(encoding="utf-8") + "\nTrailing note.\n", encoding="utf-8")
+        after = aggregator.snapshot()
+        changed = sorted(p for p in set(before) | set(after) if before.get(p) != after.get(p))
+        assert changed == [spec.resolve()], changed
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            rerun = aggregator.run_changed(changed)
+        assert [result["phase"] for result in rerun] == [0]
+        assert rerun[0]["passed"] == baseline[0]["passed"]
+        assert aggregator.corpus.document(spec).text.endswith("Trailing note.\n"), "stale corpus entry"
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert aggregator.run_changed([(base / "glossary.md").resolve()]) == []
+
+        # Editing a validator re-imports every phase from source
+        aggregator._load_module("metadata_validator.py")
+        with contextlib.redirect_stdout(io.StringIO()):
+            rerun = aggregator.run_changed([(base / "validators" / "metadata_validator.py").resolve()])
+        assert [result["phase"] for result in rerun] == [0, 1, 2, 3, 4]
+        assert [result["passed"] for result in rerun] == [baseline[p]["passed"] for p in range(5)]
+    print("✓ run_changed re-runs only the phases fed by the changed files")